@@ -11,5 +11,5 @@
 #
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks edit_batch_nudge
+echo "$INPUT" | "$PY" -m little_loops.hooks.client edit_batch_nudge
 exit $?
@@ -7,7 +7,11 @@
 # Backgrounding (&/disown) is intentionally avoided — a single-row INSERT
 # keeps p95 well below the 5 s timeout when analytics is enabled.
 #
+# little_loops.hooks.client forwards the fire to the resident hook daemon
+# (.ll/hookd.sock, opt-in via hooks.daemon.enabled) and otherwise runs the
+# dispatcher in-process, exactly like `python -m little_loops.hooks`.
+#
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks post_tool_use
+echo "$INPUT" | "$PY" -m little_loops.hooks.client post_tool_use
 exit $?
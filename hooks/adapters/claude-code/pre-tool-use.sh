@@ -9,7 +9,11 @@
 #   0 = allow (stderr hint shown to user in warn mode)
 #   2 = block (feedback injected into model context in block mode)
 #
+# little_loops.hooks.client forwards the fire to the resident hook daemon
+# (.ll/hookd.sock, opt-in via hooks.daemon.enabled) and otherwise runs the
+# dispatcher in-process, exactly like `python -m little_loops.hooks`.
+#
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks pre_tool_use
+echo "$INPUT" | "$PY" -m little_loops.hooks.client pre_tool_use
 exit $?
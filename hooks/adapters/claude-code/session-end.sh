@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks session_end
+echo "$INPUT" | "$PY" -m little_loops.hooks.client session_end
 exit $?
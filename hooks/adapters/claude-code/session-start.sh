@@ -10,5 +10,5 @@
 #
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks session_start
+echo "$INPUT" | "$PY" -m little_loops.hooks.client session_start
 exit $?
@@ -9,5 +9,5 @@
 #
 INPUT=$(cat)
 PY="${LL_PYTHON:-$(command -v python3 || command -v python || echo python)}"
-echo "$INPUT" | "$PY" -m little_loops.hooks subagent_start
+echo "$INPUT" | "$PY" -m little_loops.hooks.client subagent_start
 exit $?
@@ -8,5 +8,5 @@
 # 2. Auto-prompt optimization (prompt_optimization.enabled gate)
 #
 INPUT=$(cat)
-echo "$INPUT" | python -m little_loops.hooks user_prompt_submit
+echo "$INPUT" | python -m little_loops.hooks.client user_prompt_submit
 exit $?
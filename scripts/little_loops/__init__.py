@@ -4,68 +4,145 @@ This package provides automation tools for issue management, code quality checks
 and development workflows that can be configured for any software project.
 """
 
-from little_loops.config import BRConfig
-from little_loops.events import EventBus, LLEvent
-from little_loops.extension import (
-    ActionProviderExtension,
-    EvaluatorProviderExtension,
-    ExtensionLoader,
-    InterceptorExtension,
-    LLExtension,
-    LLHookIntentExtension,
-    NoopLoggerExtension,
-    wire_extensions,
-)
-from little_loops.fsm import RouteContext, RouteDecision
-from little_loops.git_operations import check_git_status
-from little_loops.hooks.types import LLHookEvent, LLHookResult
-from little_loops.host_runner import (
-    CapabilityEntry,
-    CapabilityNotSupported,
-    CapabilityReport,
-    HostInvocation,
-    HostNotConfigured,
-    HostRunner,
-    apply_host_cli_from_config,
-)
-from little_loops.issue_lifecycle import (
-    FailureType,
-    classify_failure,
-    close_issue,
-    complete_issue_lifecycle,
-    create_issue_from_failure,
-    verify_issue_completed,
-)
-from little_loops.issue_manager import AutoManager
-from little_loops.learning_tests import LearnTestRecord, check_learning_test
-from little_loops.observability import (
-    OTelAttributes,
-    StampUsageEvent,
-    StreamingParityChecker,
-    vendor_for_runner,
-)
-from little_loops.output_parsing import parse_manage_issue_output, parse_ready_issue_output
-from little_loops.pii import apply_pii_action, detect_pii, redact_pii
-from little_loops.session_store import (
-    SQLiteTransport,
-    record_issue_snapshot,
-    record_session_lifecycle_event,
-)
-from little_loops.sync import GitHubSyncManager, SyncResult, SyncStatus
-from little_loops.testing import LLTestBus
-from little_loops.transport import (
-    JsonlTransport,
-    OTelTransport,
-    Transport,
-    UnixSocketTransport,
-    WebhookTransport,
-    wire_transports,
-)
-from little_loops.work_verification import (
-    EXCLUDED_DIRECTORIES,
-    filter_excluded_files,
-    verify_work_was_done,
-)
+from typing import TYPE_CHECKING, Any
+
+from little_loops._lazy import export_dir, load_export
+
+if TYPE_CHECKING:
+    from little_loops.config import BRConfig
+    from little_loops.events import EventBus, LLEvent
+    from little_loops.extension import (
+        ActionProviderExtension,
+        EvaluatorProviderExtension,
+        ExtensionLoader,
+        InterceptorExtension,
+        LLExtension,
+        LLHookIntentExtension,
+        NoopLoggerExtension,
+        wire_extensions,
+    )
+    from little_loops.fsm import RouteContext, RouteDecision
+    from little_loops.git_operations import check_git_status
+    from little_loops.hooks.types import LLHookEvent, LLHookResult
+    from little_loops.host_runner import (
+        CapabilityEntry,
+        CapabilityNotSupported,
+        CapabilityReport,
+        HostInvocation,
+        HostNotConfigured,
+        HostRunner,
+        apply_host_cli_from_config,
+    )
+    from little_loops.issue_lifecycle import (
+        FailureType,
+        classify_failure,
+        close_issue,
+        complete_issue_lifecycle,
+        create_issue_from_failure,
+        verify_issue_completed,
+    )
+    from little_loops.issue_manager import AutoManager
+    from little_loops.learning_tests import LearnTestRecord, check_learning_test
+    from little_loops.observability import (
+        OTelAttributes,
+        StampUsageEvent,
+        StreamingParityChecker,
+        vendor_for_runner,
+    )
+    from little_loops.output_parsing import parse_manage_issue_output, parse_ready_issue_output
+    from little_loops.pii import apply_pii_action, detect_pii, redact_pii
+    from little_loops.session_store import (
+        SQLiteTransport,
+        record_issue_snapshot,
+        record_session_lifecycle_event,
+    )
+    from little_loops.sync import GitHubSyncManager, SyncResult, SyncStatus
+    from little_loops.testing import LLTestBus
+    from little_loops.transport import (
+        JsonlTransport,
+        OTelTransport,
+        QueuedTransport,
+        Transport,
+        UnixSocketTransport,
+        WebhookTransport,
+        wire_transports,
+    )
+    from little_loops.work_verification import (
+        EXCLUDED_DIRECTORIES,
+        filter_excluded_files,
+        verify_work_was_done,
+    )
+
+# Resolved on first attribute access (see little_loops._lazy).
+_EXPORTS: dict[str, str] = {
+    "BRConfig": "little_loops.config",
+    "EventBus": "little_loops.events",
+    "LLEvent": "little_loops.events",
+    "ActionProviderExtension": "little_loops.extension",
+    "EvaluatorProviderExtension": "little_loops.extension",
+    "ExtensionLoader": "little_loops.extension",
+    "InterceptorExtension": "little_loops.extension",
+    "LLExtension": "little_loops.extension",
+    "LLHookIntentExtension": "little_loops.extension",
+    "NoopLoggerExtension": "little_loops.extension",
+    "wire_extensions": "little_loops.extension",
+    "RouteContext": "little_loops.fsm",
+    "RouteDecision": "little_loops.fsm",
+    "check_git_status": "little_loops.git_operations",
+    "LLHookEvent": "little_loops.hooks.types",
+    "LLHookResult": "little_loops.hooks.types",
+    "CapabilityEntry": "little_loops.host_runner",
+    "CapabilityNotSupported": "little_loops.host_runner",
+    "CapabilityReport": "little_loops.host_runner",
+    "HostInvocation": "little_loops.host_runner",
+    "HostNotConfigured": "little_loops.host_runner",
+    "HostRunner": "little_loops.host_runner",
+    "apply_host_cli_from_config": "little_loops.host_runner",
+    "FailureType": "little_loops.issue_lifecycle",
+    "classify_failure": "little_loops.issue_lifecycle",
+    "close_issue": "little_loops.issue_lifecycle",
+    "complete_issue_lifecycle": "little_loops.issue_lifecycle",
+    "create_issue_from_failure": "little_loops.issue_lifecycle",
+    "verify_issue_completed": "little_loops.issue_lifecycle",
+    "AutoManager": "little_loops.issue_manager",
+    "LearnTestRecord": "little_loops.learning_tests",
+    "check_learning_test": "little_loops.learning_tests",
+    "OTelAttributes": "little_loops.observability",
+    "StampUsageEvent": "little_loops.observability",
+    "StreamingParityChecker": "little_loops.observability",
+    "vendor_for_runner": "little_loops.observability",
+    "parse_manage_issue_output": "little_loops.output_parsing",
+    "parse_ready_issue_output": "little_loops.output_parsing",
+    "apply_pii_action": "little_loops.pii",
+    "detect_pii": "little_loops.pii",
+    "redact_pii": "little_loops.pii",
+    "SQLiteTransport": "little_loops.session_store",
+    "record_issue_snapshot": "little_loops.session_store",
+    "record_session_lifecycle_event": "little_loops.session_store",
+    "GitHubSyncManager": "little_loops.sync",
+    "SyncResult": "little_loops.sync",
+    "SyncStatus": "little_loops.sync",
+    "LLTestBus": "little_loops.testing",
+    "JsonlTransport": "little_loops.transport",
+    "OTelTransport": "little_loops.transport",
+    "QueuedTransport": "little_loops.transport",
+    "Transport": "little_loops.transport",
+    "UnixSocketTransport": "little_loops.transport",
+    "WebhookTransport": "little_loops.transport",
+    "wire_transports": "little_loops.transport",
+    "EXCLUDED_DIRECTORIES": "little_loops.work_verification",
+    "filter_excluded_files": "little_loops.work_verification",
+    "verify_work_was_done": "little_loops.work_verification",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load_export(__name__, _EXPORTS, name)
+
+
+def __dir__() -> list[str]:
+    return export_dir(__name__, _EXPORTS)
+
 
 __version__ = "1.156.0"
 __all__ = [
@@ -106,6 +183,7 @@ __all__ = [
     # transport
     "JsonlTransport",
     "OTelTransport",
+    "QueuedTransport",
     "SQLiteTransport",
     "record_issue_snapshot",
     "record_session_lifecycle_event",
@@ -0,0 +1,42 @@
+"""Lazy (PEP 562) re-exports for package ``__init__`` modules.
+
+The aggregator packages (``little_loops``, ``little_loops.cli``,
+``little_loops.fsm``, ``little_loops.parallel``) re-export names from many
+submodules. Importing them eagerly made every ``ll-*`` console script and hook
+pay for the whole package at startup. Each of those ``__init__`` modules now
+keeps its imports under ``TYPE_CHECKING`` (for type checkers and IDEs) and maps
+every public name to its defining module in an ``_EXPORTS`` table; the module
+``__getattr__`` below imports the defining module on first access and caches
+the value on the package.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+
+def load_export(package: str, exports: Mapping[str, str], name: str) -> Any:
+    """Resolve ``package.name`` from its defining module and cache it on the package.
+
+    Args:
+        package: ``__name__`` of the package whose ``__getattr__`` is calling.
+        exports: Public name -> defining module (absolute dotted path).
+        name: Attribute being looked up.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazy export of ``package``.
+    """
+    module_name = exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    setattr(sys.modules[package], name, value)
+    return value
+
+
+def export_dir(package: str, exports: Mapping[str, str]) -> list[str]:
+    """``dir()`` for a lazily re-exporting package: loaded attributes plus exports."""
+    return sorted(set(vars(sys.modules[package])) | set(exports))
@@ -43,62 +43,132 @@ Provides command-line interfaces for automated issue management:
 - ll-queue: Persisted work-item queue: add/list/status/remove/run commands (FEAT-2682, FEAT-2683)
 """
 
-from little_loops.cli.action import main_action
-from little_loops.cli.adapt import main_adapt
-from little_loops.cli.adapt_agents_for_codex import main_adapt_agents_for_codex
-from little_loops.cli.adapt_skills_for_codex import main_adapt_skills_for_codex
-from little_loops.cli.artifact import main_artifact
-from little_loops.cli.auto import main_auto
-from little_loops.cli.code import main_code
-from little_loops.cli.compact_session import main_compact_session
-from little_loops.cli.config import main_config
-from little_loops.cli.create_extension import main_create_extension
-from little_loops.cli.ctx_stats import main_ctx_stats
-from little_loops.cli.deps import main_deps
-from little_loops.cli.docs import (
-    main_check_links,
-    main_verify_docs,
-    main_verify_skill_budget,
-    main_verify_skills,
-)
-from little_loops.cli.doctor import main_doctor
-from little_loops.cli.generate_skill_descriptions import main_generate_skill_descriptions
-from little_loops.cli.gitignore import main_gitignore
-from little_loops.cli.harness import main_harness
-from little_loops.cli.help import main_help
-from little_loops.cli.history import main_history
-from little_loops.cli.history_context import main_history_context
-from little_loops.cli.issues import main_issues
-from little_loops.cli.learning_tests import main_learning_tests
-from little_loops.cli.logs import main_logs
-from little_loops.cli.loop import main_loop
-from little_loops.cli.messages import main_messages
-from little_loops.cli.migrate import main_migrate
-from little_loops.cli.migrate_labels import main_migrate_labels
-from little_loops.cli.migrate_relationships import main_migrate_relationships
-from little_loops.cli.migrate_status import main_migrate_status
-from little_loops.cli.parallel import main_parallel
-from little_loops.cli.queue import main_queue
-from little_loops.cli.schemas import main_generate_schemas  # internal: dev tooling
-from little_loops.cli.session import main_session
-from little_loops.cli.sprint import (
-    _render_dependency_graph,
-    _render_execution_plan,
-    _render_health_summary,
-    main_sprint,
-)
-from little_loops.cli.sync import main_sync
-from little_loops.cli.verify_cli_allowlist import main_verify_cli_allowlist
-from little_loops.cli.verify_decisions import main_verify_decisions
-from little_loops.cli.verify_des_audit import main_verify_des_audit
-from little_loops.cli.verify_design_tokens import main_verify_design_tokens
-from little_loops.cli.verify_host_map import main_verify_host_map
-from little_loops.cli.verify_kinds import main_verify_kinds
-from little_loops.cli.verify_package_data import main_verify_package_data
-from little_loops.cli.verify_private_refs import main_verify_private_refs
-from little_loops.cli.verify_skill_prose import main_verify_skill_prose
-from little_loops.cli.verify_triggers import main_verify_triggers
-from little_loops.init.cli import main_init
+from typing import TYPE_CHECKING, Any
+
+from little_loops._lazy import export_dir, load_export
+
+if TYPE_CHECKING:
+    from little_loops.cli.action import main_action
+    from little_loops.cli.adapt import main_adapt
+    from little_loops.cli.adapt_agents_for_codex import main_adapt_agents_for_codex
+    from little_loops.cli.adapt_skills_for_codex import main_adapt_skills_for_codex
+    from little_loops.cli.artifact import main_artifact
+    from little_loops.cli.auto import main_auto
+    from little_loops.cli.code import main_code
+    from little_loops.cli.compact_session import main_compact_session
+    from little_loops.cli.config import main_config
+    from little_loops.cli.create_extension import main_create_extension
+    from little_loops.cli.ctx_stats import main_ctx_stats
+    from little_loops.cli.deps import main_deps
+    from little_loops.cli.docs import (
+        main_check_links,
+        main_verify_docs,
+        main_verify_skill_budget,
+        main_verify_skills,
+    )
+    from little_loops.cli.doctor import main_doctor
+    from little_loops.cli.generate_skill_descriptions import main_generate_skill_descriptions
+    from little_loops.cli.gitignore import main_gitignore
+    from little_loops.cli.harness import main_harness
+    from little_loops.cli.help import main_help
+    from little_loops.cli.history import main_history
+    from little_loops.cli.history_context import main_history_context
+    from little_loops.cli.issues import main_issues
+    from little_loops.cli.learning_tests import main_learning_tests
+    from little_loops.cli.logs import main_logs
+    from little_loops.cli.loop import main_loop
+    from little_loops.cli.messages import main_messages
+    from little_loops.cli.migrate import main_migrate
+    from little_loops.cli.migrate_labels import main_migrate_labels
+    from little_loops.cli.migrate_relationships import main_migrate_relationships
+    from little_loops.cli.migrate_status import main_migrate_status
+    from little_loops.cli.parallel import main_parallel
+    from little_loops.cli.queue import main_queue
+    from little_loops.cli.schemas import main_generate_schemas  # internal: dev tooling
+    from little_loops.cli.session import main_session
+    from little_loops.cli.sprint import (
+        _render_dependency_graph,
+        _render_execution_plan,
+        _render_health_summary,
+        main_sprint,
+    )
+    from little_loops.cli.sync import main_sync
+    from little_loops.cli.verify_cli_allowlist import main_verify_cli_allowlist
+    from little_loops.cli.verify_decisions import main_verify_decisions
+    from little_loops.cli.verify_des_audit import main_verify_des_audit
+    from little_loops.cli.verify_design_tokens import main_verify_design_tokens
+    from little_loops.cli.verify_host_map import main_verify_host_map
+    from little_loops.cli.verify_kinds import main_verify_kinds
+    from little_loops.cli.verify_package_data import main_verify_package_data
+    from little_loops.cli.verify_private_refs import main_verify_private_refs
+    from little_loops.cli.verify_skill_prose import main_verify_skill_prose
+    from little_loops.cli.verify_triggers import main_verify_triggers
+    from little_loops.init.cli import main_init
+
+# Resolved on first attribute access (see little_loops._lazy).
+_EXPORTS: dict[str, str] = {
+    "main_action": "little_loops.cli.action",
+    "main_adapt": "little_loops.cli.adapt",
+    "main_adapt_agents_for_codex": "little_loops.cli.adapt_agents_for_codex",
+    "main_adapt_skills_for_codex": "little_loops.cli.adapt_skills_for_codex",
+    "main_artifact": "little_loops.cli.artifact",
+    "main_auto": "little_loops.cli.auto",
+    "main_code": "little_loops.cli.code",
+    "main_compact_session": "little_loops.cli.compact_session",
+    "main_config": "little_loops.cli.config",
+    "main_create_extension": "little_loops.cli.create_extension",
+    "main_ctx_stats": "little_loops.cli.ctx_stats",
+    "main_deps": "little_loops.cli.deps",
+    "main_check_links": "little_loops.cli.docs",
+    "main_verify_docs": "little_loops.cli.docs",
+    "main_verify_skill_budget": "little_loops.cli.docs",
+    "main_verify_skills": "little_loops.cli.docs",
+    "main_doctor": "little_loops.cli.doctor",
+    "main_generate_skill_descriptions": "little_loops.cli.generate_skill_descriptions",
+    "main_gitignore": "little_loops.cli.gitignore",
+    "main_harness": "little_loops.cli.harness",
+    "main_help": "little_loops.cli.help",
+    "main_history": "little_loops.cli.history",
+    "main_history_context": "little_loops.cli.history_context",
+    "main_issues": "little_loops.cli.issues",
+    "main_learning_tests": "little_loops.cli.learning_tests",
+    "main_logs": "little_loops.cli.logs",
+    "main_loop": "little_loops.cli.loop",
+    "main_messages": "little_loops.cli.messages",
+    "main_migrate": "little_loops.cli.migrate",
+    "main_migrate_labels": "little_loops.cli.migrate_labels",
+    "main_migrate_relationships": "little_loops.cli.migrate_relationships",
+    "main_migrate_status": "little_loops.cli.migrate_status",
+    "main_parallel": "little_loops.cli.parallel",
+    "main_queue": "little_loops.cli.queue",
+    "main_generate_schemas": "little_loops.cli.schemas",
+    "main_session": "little_loops.cli.session",
+    "_render_dependency_graph": "little_loops.cli.sprint",
+    "_render_execution_plan": "little_loops.cli.sprint",
+    "_render_health_summary": "little_loops.cli.sprint",
+    "main_sprint": "little_loops.cli.sprint",
+    "main_sync": "little_loops.cli.sync",
+    "main_verify_cli_allowlist": "little_loops.cli.verify_cli_allowlist",
+    "main_verify_decisions": "little_loops.cli.verify_decisions",
+    "main_verify_des_audit": "little_loops.cli.verify_des_audit",
+    "main_verify_design_tokens": "little_loops.cli.verify_design_tokens",
+    "main_verify_host_map": "little_loops.cli.verify_host_map",
+    "main_verify_kinds": "little_loops.cli.verify_kinds",
+    "main_verify_package_data": "little_loops.cli.verify_package_data",
+    "main_verify_private_refs": "little_loops.cli.verify_private_refs",
+    "main_verify_skill_prose": "little_loops.cli.verify_skill_prose",
+    "main_verify_triggers": "little_loops.cli.verify_triggers",
+    "main_init": "little_loops.init.cli",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load_export(__name__, _EXPORTS, name)
+
+
+def __dir__() -> list[str]:
+    return export_dir(__name__, _EXPORTS)
+
 
 __all__ = [
     "main_action",
@@ -7,9 +7,10 @@ transcript file or a project folder whose ``*.jsonl`` files are globbed. Runs
 ``start_new_session=True`` it outlives the short-lived hook subprocess.
 
 ``--rebuild`` (ENH-2581) additionally materializes the JSONL-derived cache
-tables from ``raw_events`` in the same call — passed by the hook only when
-``SCHEMA_VERSION`` has changed since the last rebuild (see
-``session_start.py``). ``--host`` (ENH-3166) names the host whose transcripts
+tables from ``raw_events`` in the same call. The hook always passes it: the
+rebuild is incremental (``rebuild(incremental=True)``), deriving only rows
+past the last rebuild's ``raw_events`` watermark and wiping-and-replaying
+only when ``SCHEMA_VERSION`` has changed. ``--host`` (ENH-3166) names the host whose transcripts
 *path* holds, so ``raw_events`` rows are stamped with the ingested host
 instead of the ambient one. This file has no argparse by design
 (minimal-parsing style); both flags are checked ad hoc to match.
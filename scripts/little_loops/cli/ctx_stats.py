@@ -10,6 +10,7 @@ the SQLite store is absent so first-time users still get useful output.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import sqlite3
 import sys
@@ -754,8 +755,15 @@ def main_ctx_stats(argv: list[str] | None = None) -> int:
         lt_config = _load_lt_config(cwd)
         lt_stats = _compute_learning_tests_stats(cwd, lt_config)
         usage_events = _aggregate_usage_events(db_path)
-        mcp_health = _aggregate_mcp_health(db_path)
-        waste = _aggregate_waste(db_path)
+        # Both history_reader rollups run on one cached read connection and
+        # snapshot; a missing DB is left alone rather than created just to read.
+        with contextlib.ExitStack() as snapshot:
+            if db_path.exists():
+                from little_loops.history_reader import read_connection
+
+                snapshot.enter_context(read_connection(db_path))
+            mcp_health = _aggregate_mcp_health(db_path)
+            waste = _aggregate_waste(db_path)
         pressure = _aggregate_context_pressure(db_path)
 
         if args.json_mode:
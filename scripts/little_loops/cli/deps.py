@@ -7,7 +7,12 @@ import sys
 from pathlib import Path
 
 from little_loops.cli.output import configure_output, print_json, use_color_enabled
-from little_loops.cli_args import add_intent_arg, add_intent_limit_arg, add_json_arg
+from little_loops.cli_args import (
+    add_intent_arg,
+    add_intent_limit_arg,
+    add_json_arg,
+    add_max_workers_arg,
+)
 from little_loops.logger import Logger
 from little_loops.session_store import DEFAULT_DB_PATH, cli_event_context
 
@@ -100,6 +105,7 @@ Examples:
   %(prog)s analyze --format json      # JSON output for programmatic use
   %(prog)s analyze --graph            # Include ASCII dependency graph
   %(prog)s analyze --sprint my-sprint # Analyze only issues in a sprint
+  %(prog)s analyze -w 4               # Score overlapping pairs with 4 processes
   %(prog)s validate                   # Validation only (broken refs, cycles)
   %(prog)s validate --sprint my-sprint # Validate only sprint issue deps
   %(prog)s fix                        # Auto-fix broken refs, stale refs, backlinks
@@ -149,6 +155,7 @@ Examples:
             default=None,
             help="Restrict analysis to issues in the named sprint",
         )
+        add_max_workers_arg(analyze_parser, default=1)
 
         # validate subcommand
         validate_parser = subparsers.add_parser(
@@ -228,6 +235,7 @@ Examples:
             default=None,
             help="Restrict to issues in named sprint",
         )
+        add_max_workers_arg(apply_parser, default=1)
 
         # tree subcommand
         tree_parser = subparsers.add_parser(
@@ -394,7 +402,12 @@ Examples:
 
         if args.command == "analyze":
             report = analyze_dependencies(
-                issues, issue_contents, completed_ids, all_known_ids, config=dep_config
+                issues,
+                issue_contents,
+                completed_ids,
+                all_known_ids,
+                config=dep_config,
+                max_workers=args.max_workers,
             )
 
             if args.format == "json":
@@ -622,7 +635,12 @@ Examples:
 
             # Implicit mode: run analysis and apply proposals above confidence threshold
             report = analyze_dependencies(
-                issues, issue_contents, completed_ids, all_known_ids, config=dep_config
+                issues,
+                issue_contents,
+                completed_ids,
+                all_known_ids,
+                config=dep_config,
+                max_workers=args.max_workers,
             )
             filtered = [p for p in report.proposals if p.confidence >= args.min_confidence]
 
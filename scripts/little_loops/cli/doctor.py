@@ -25,6 +25,7 @@ from little_loops.cli.doctor_trim import (
 from little_loops.cli.output import configure_output, print_json, use_color_enabled
 from little_loops.logger import Logger
 from little_loops.session_store import DEFAULT_DB_PATH, cli_event_context
+from little_loops.startup_budget import ImportProfile, check_startup_budgets
 
 if TYPE_CHECKING:
     from little_loops.host_runner import CapabilityReport, HostRunner
@@ -909,6 +910,63 @@ def _full_section_data() -> dict:
     }
 
 
+def _startup_check_results(profiles: list[ImportProfile]) -> list[CheckResult]:
+    """One error-severity result per console script measured by ``--startup``."""
+    results: list[CheckResult] = []
+    for profile in profiles:
+        if profile.error:
+            note = f"import failed: {profile.error}"
+        elif profile.deferred_leaks:
+            note = f"imports {', '.join(profile.deferred_leaks)} at startup"
+        else:
+            note = f"{profile.total_ms:.0f}ms / {profile.budget_ms:.0f}ms budget"
+        results.append(
+            CheckResult(
+                name=f"startup:{profile.command}",
+                status="full" if profile.ok else "unsupported",
+                note=note,
+                severity="error",
+            )
+        )
+    return results
+
+
+def _startup_section_data(profiles: list[ImportProfile]) -> list[dict]:
+    """`--json --startup`'s per-command import profile rows."""
+    return [
+        {
+            "command": p.command,
+            "target": p.target,
+            "total_ms": round(p.total_ms, 1),
+            "budget_ms": round(p.budget_ms, 1),
+            "ok": p.ok,
+            "deferred_leaks": list(p.deferred_leaks),
+            "slowest": [{"module": name, "ms": round(ms, 1)} for name, ms in p.slowest],
+            "error": p.error,
+        }
+        for p in profiles
+    ]
+
+
+def _print_startup_section(profiles: list[ImportProfile]) -> None:
+    """Print the Startup Budget section (``--startup``)."""
+    print()
+    print("Startup Budget (--startup)")
+    print("─" * 40)
+    if not profiles:
+        print(f"  {_STATUS_SYMBOLS['partial']}  no installed console scripts found")
+        return
+    by_command = {p.command: p for p in profiles}
+    for result in _startup_check_results(profiles):
+        symbol = _STATUS_SYMBOLS.get(result.status, "?")
+        command = result.name.removeprefix("startup:")
+        print(f"  {symbol}  {command:<28} {result.note}")
+        profile = by_command[command]
+        if result.status != "full" and profile.slowest:
+            name, ms = profile.slowest[0]
+            print(f"      slowest import: {name} ({ms:.0f}ms)")
+
+
 def _probe_version(runner: HostRunner) -> str:
     """Probe the host binary's version, swallowing all failures to "".
 
@@ -942,6 +1000,7 @@ def _print_report(
     issues_cfg: object = None,
     full: bool = False,
     trim: object = None,
+    startup: list[ImportProfile] | None = None,
 ) -> None:
     """Print a CapabilityReport in text or JSON format."""
     from little_loops.host_runner import CapabilityReport
@@ -968,6 +1027,8 @@ def _print_report(
             data["full"] = _full_section_data()
         if trim is not None:
             data["trim"] = trim.as_dict()  # type: ignore[attr-defined]
+        if startup is not None:
+            data["startup"] = _startup_section_data(startup)
         print_json(data)
         return
 
@@ -1007,10 +1068,12 @@ Examples:
   %(prog)s           # Print capability table
   %(prog)s --json    # Output as JSON
   %(prog)s --trim    # Report context-residency verdicts (advisory)
+  %(prog)s --startup # Check every ll-* command's import time against its budget
 
 Exit codes:
   0 - All capabilities present
-  1 - One or more capabilities unsupported
+  1 - One or more capabilities unsupported (or, with --startup, a command
+      over its import budget)
 
 --trim never affects the exit code: an unused skill is a cost signal,
 not a broken install.
@@ -1027,6 +1090,14 @@ not a broken install.
             action="store_true",
             help="Also run the full ll-verify-* / ll-check-links checker family",
         )
+        parser.add_argument(
+            "--startup",
+            action="store_true",
+            help=(
+                "Measure each ll-* command's import time (python -X importtime) "
+                "against its startup budget; over-budget commands fail the exit code"
+            ),
+        )
         parser.add_argument(
             "--trim",
             action="store_true",
@@ -1058,6 +1129,7 @@ not a broken install.
             if args.trim
             else None
         )
+        startup_profiles = check_startup_budgets() if args.startup else None
 
         _print_report(
             report,
@@ -1067,6 +1139,7 @@ not a broken install.
             issues_cfg=cfg.issues,
             full=args.full,
             trim=trim_report,
+            startup=startup_profiles,
         )
 
         if not args.json:
@@ -1079,6 +1152,8 @@ not a broken install.
             _print_loop_validity_section()
             if args.full:
                 _print_full_section()
+            if startup_profiles is not None:
+                _print_startup_section(startup_profiles)
             if trim_report is not None:
                 render_trim_report(trim_report)
 
@@ -1089,4 +1164,6 @@ not a broken install.
         results = _capability_check_results(report) + _run_registered_checks()
         if args.full:
             results += _run_full_checks()
+        if startup_profiles is not None:
+            results += _startup_check_results(startup_profiles)
         return _exit_code_for(results)
@@ -10,6 +10,7 @@ import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
@@ -28,6 +29,7 @@ from little_loops.session_store import (
     cli_event_context,
     connect,
     record_harness_event,
+    record_harness_events,
 )
 from little_loops.skill_expander import _find_plugin_root, _resolve_content_path
 
@@ -543,6 +545,22 @@ Exit codes:
         metavar="MODEL",
         help="Override Claude model (e.g. claude-haiku-4-5-20251001)",
     )
+    dsl_p.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N tasks concurrently; reports stay in task order (default: 1)",
+    )
+    dsl_p.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Replay pass/fail results of unchanged tasks from .ll/harness-cache/dsl/ "
+            "(keyed by task file, source file, model and grading flags)"
+        ),
+    )
     _add_evaluator_flags(dsl_p)
 
     return parser
@@ -577,26 +595,49 @@ def _read_prepatch_evidence(issue_id: str | None) -> dict | None:
     return read_prepatch_evidence(issue_id, db=DEFAULT_DB_PATH)
 
 
-def _evaluate_and_report(
-    runner_label: str,
+@dataclass
+class _EvalReport:
+    """Everything `_evaluate_and_report()` decides before printing anything.
+
+    Split out so `cmd_dsl --jobs` can evaluate tasks on worker threads and
+    still print each task's report in task order from the main thread.
+    """
+
+    exit_code: int
+    outcome: HarnessEvalOutcome
+    error_msg: str | None = None
+    exit_code_display: str = ""
+    semantic_display: str = "[not checked]"
+    overall: str = ""
+    expected_display: str | None = None
+    show_output: bool = False
+
+
+def _evaluate(
     result: RunnerResult,
     args: argparse.Namespace,
     *,
     expected_grade: ExpectedGrade | None = None,
-) -> tuple[int, HarnessEvalOutcome]:
-    """Evaluate result against criteria and print the report. Returns (exit_code, outcome)."""
+    eval_result: EvaluationResult | None = None,
+) -> _EvalReport:
+    """Grade *result* against the criteria in *args* without printing.
+
+    *eval_result* short-circuits the ``--semantic`` judge call with a verdict
+    obtained earlier (the `cmd_dsl --cache` replay path).
+    """
     if result.timed_out:
-        _report(runner_label, result, args, error_msg="timeout")
-        return 2, HarnessEvalOutcome(passed=False, verdict=None, eval_result=None)
+        return _EvalReport(
+            2, HarnessEvalOutcome(passed=False, verdict=None, eval_result=None), "timeout"
+        )
     if result.error is not None:
-        _report(runner_label, result, args, error_msg=result.error)
-        return 2, HarnessEvalOutcome(passed=False, verdict=None, eval_result=None)
+        return _EvalReport(
+            2, HarnessEvalOutcome(passed=False, verdict=None, eval_result=None), result.error
+        )
 
     passed = True
     abstained = False
     exit_code_display = str(result.exit_code)
     semantic_display = "[not checked]"
-    eval_result: EvaluationResult | None = None
 
     if args.exit_code is not None:
         if result.exit_code != args.exit_code:
@@ -616,7 +657,8 @@ def _evaluate_and_report(
         passed = False
 
     if args.semantic is not None:
-        eval_result = evaluate_llm_structured(output=result.stdout, prompt=args.semantic)
+        if eval_result is None:
+            eval_result = evaluate_llm_structured(output=result.stdout, prompt=args.semantic)
         semantic_display = eval_result.verdict
         # ENH-3185 AC9: an abstention is neither a pass nor a failure — report
         # it separately rather than folding it into `passed = False`. Precedence
@@ -626,6 +668,8 @@ def _evaluate_and_report(
             abstained = True
         elif eval_result.verdict != "yes":
             passed = False
+    else:
+        eval_result = None
 
     if not passed:
         overall = "FAIL"
@@ -633,11 +677,6 @@ def _evaluate_and_report(
         overall = "ABSTAIN"
     else:
         overall = "PASS"
-    show_output = not passed or args.verbose
-
-    # ENH-2998: additive, read-only pre-patch check evidence lookup -- absent
-    # (not an error) when no --issue-id was given or no bundle exists.
-    prepatch_evidence = _read_prepatch_evidence(getattr(args, "issue_id", None))
 
     expected_display: str | None = None
     if expected_grade is not None:
@@ -656,54 +695,91 @@ def _evaluate_and_report(
             )
             expected_display = f"mismatch ({mismatches})"
 
+    outcome = HarnessEvalOutcome(
+        passed=passed,
+        verdict=eval_result.verdict if eval_result is not None else None,
+        eval_result=eval_result,
+        abstained=abstained,
+    )
+    # ENH-3185 AC9: 0=pass, 1=fail (unchanged), 2=harness/infra error (already
+    # taken above, never reused here), 3=inconclusive (no failure, >=1 abstention).
+    if not passed:
+        exit_code = 1
+    elif abstained:
+        exit_code = 3
+    else:
+        exit_code = 0
+    return _EvalReport(
+        exit_code,
+        outcome,
+        exit_code_display=exit_code_display,
+        semantic_display=semantic_display,
+        overall=overall,
+        expected_display=expected_display,
+        show_output=not passed or args.verbose,
+    )
+
+
+def _print_eval_report(
+    runner_label: str,
+    result: RunnerResult,
+    args: argparse.Namespace,
+    report: _EvalReport,
+) -> None:
+    """Print the report `_evaluate()` produced for *result*."""
+    if report.error_msg is not None:
+        _report(runner_label, result, args, error_msg=report.error_msg)
+        return
+
+    # ENH-2998: additive, read-only pre-patch check evidence lookup -- absent
+    # (not an error) when no --issue-id was given or no bundle exists.
+    prepatch_evidence = _read_prepatch_evidence(getattr(args, "issue_id", None))
+
     if args.output == "json":
         payload = {
             "runner": runner_label,
             "exit_code": result.exit_code,
-            "exit_code_check": exit_code_display,
-            "semantic": semantic_display,
-            "result": overall,
+            "exit_code_check": report.exit_code_display,
+            "semantic": report.semantic_display,
+            "result": report.overall,
             "stdout": result.stdout,
             "stderr": result.stderr,
         }
-        if expected_display is not None:
-            payload["expected"] = expected_display
+        if report.expected_display is not None:
+            payload["expected"] = report.expected_display
         if prepatch_evidence is not None:
             payload["prepatch_evidence"] = prepatch_evidence
         print_json(payload)
     else:
         status_fields = {
             "Runner": runner_label,
-            "Exit": exit_code_display,
-            "Semantic": semantic_display,
+            "Exit": report.exit_code_display,
+            "Semantic": report.semantic_display,
         }
-        if expected_display is not None:
-            status_fields["Expected"] = expected_display
-        status_fields["Result"] = overall
+        if report.expected_display is not None:
+            status_fields["Expected"] = report.expected_display
+        status_fields["Result"] = report.overall
         print(status_block(status_fields))
         if prepatch_evidence is not None:
             print(f"Pre-patch check: {prepatch_evidence.get('verdict', 'unknown')}")
-        if show_output and result.stdout:
+        if report.show_output and result.stdout:
             print("---")
             sys.stdout.write(result.stdout)
             if not result.stdout.endswith("\n"):
                 print()
 
-    outcome = HarnessEvalOutcome(
-        passed=passed,
-        verdict=eval_result.verdict if eval_result is not None else None,
-        eval_result=eval_result,
-        abstained=abstained,
-    )
-    # ENH-3185 AC9: 0=pass, 1=fail (unchanged), 2=harness/infra error (already
-    # taken above, never reused here), 3=inconclusive (no failure, >=1 abstention).
-    if not passed:
-        exit_code = 1
-    elif abstained:
-        exit_code = 3
-    else:
-        exit_code = 0
-    return exit_code, outcome
+
+def _evaluate_and_report(
+    runner_label: str,
+    result: RunnerResult,
+    args: argparse.Namespace,
+    *,
+    expected_grade: ExpectedGrade | None = None,
+) -> tuple[int, HarnessEvalOutcome]:
+    """Evaluate result against criteria and print the report. Returns (exit_code, outcome)."""
+    report = _evaluate(result, args, expected_grade=expected_grade)
+    _print_eval_report(runner_label, result, args, report)
+    return report.exit_code, report.outcome
 
 
 def _report(
@@ -876,6 +952,130 @@ def cmd_prompt(args: argparse.Namespace) -> int:
     return rc
 
 
+DSL_CACHE_DIR = Path(".ll") / "harness-cache" / "dsl"
+
+
+@dataclass
+class _DslTaskRun:
+    """One DSL task's run and grade, produced on a worker thread by `_run_dsl_task`."""
+
+    task_file: Path
+    task_hash: str | None
+    task: DslTask | None = None
+    runner_label: str = ""
+    task_args: argparse.Namespace | None = None
+    result: RunnerResult | None = None
+    duration_ms: int = 0
+    expected_grade: ExpectedGrade | None = None
+    report: _EvalReport | None = None
+    cached: bool = False
+
+
+def _dsl_cache_key(task_hash: str | None, task: DslTask, args: argparse.Namespace) -> str | None:
+    """Return the result-cache key for *task*, or None when it cannot be cached.
+
+    The key covers everything that can change the grade: the task file bytes,
+    the bytes of the task's ``source_file`` (when declared), the model, and the
+    ``--semantic`` / ``--exit-code`` criteria.
+    """
+    if task_hash is None:
+        return None
+    target_hash = _hash_file(Path(task.source_file)) if task.source_file else None
+    material = json.dumps([task_hash, target_hash, args.model, args.semantic, args.exit_code])
+    return _hash_bytes(material.encode())
+
+
+def _load_cached_run(
+    cache_dir: Path, key: str
+) -> tuple[RunnerResult, int, EvaluationResult | None] | None:
+    """Return a cached ``(result, duration_ms, semantic_eval)`` for *key*, or None."""
+    try:
+        entry = json.loads((cache_dir / f"{key}.json").read_text())
+        result = RunnerResult(**entry["result"])
+        semantic = entry.get("semantic")
+        eval_result = EvaluationResult(**semantic) if semantic is not None else None
+        return result, int(entry["duration_ms"]), eval_result
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached_run(cache_dir: Path, key: str, run: _DslTaskRun) -> None:
+    """Persist a graded run under *key*; best-effort, like the history writes."""
+    assert run.result is not None and run.report is not None
+    eval_result = run.report.outcome.eval_result
+    entry = {
+        "result": {
+            "stdout": run.result.stdout,
+            "stderr": run.result.stderr,
+            "exit_code": run.result.exit_code,
+        },
+        "duration_ms": run.duration_ms,
+        "semantic": (
+            {"verdict": eval_result.verdict, "details": eval_result.details}
+            if eval_result is not None
+            else None
+        ),
+    }
+    with contextlib.suppress(OSError, TypeError, ValueError):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{key}.json.tmp"
+        tmp.write_text(json.dumps(entry, default=str))
+        tmp.replace(cache_dir / f"{key}.json")
+
+
+def _run_dsl_task(task_file: Path, args: argparse.Namespace, cache_dir: Path | None) -> _DslTaskRun:
+    """Run and grade one DSL task without printing, so it is safe on a worker thread.
+
+    With *cache_dir*, a pass/fail outcome for an unchanged task (see
+    `_dsl_cache_key`) is replayed instead of re-running the prompt; infra
+    errors and abstentions are never cached.
+    """
+    run = _DslTaskRun(task_file=task_file, task_hash=_hash_file(task_file))
+    task = _load_task(task_file)
+    if task is None:
+        return run
+    run.task = task
+
+    prompt_text = task.prompt + _answer_contract_suffix(task.blanks, task.expected)
+    run.task_args = argparse.Namespace(
+        target=prompt_text,
+        exit_code=args.exit_code,
+        semantic=args.semantic,
+        timeout=args.timeout,
+        output=args.output,
+        verbose=args.verbose,
+        model=args.model,
+        issue_id=None,
+    )
+    label_text = prompt_text[:40] + ("..." if len(prompt_text) > 40 else "")
+    run.runner_label = f"prompt {label_text}"
+
+    key = _dsl_cache_key(run.task_hash, task, args) if cache_dir is not None else None
+    cached = _load_cached_run(cache_dir, key) if cache_dir is not None and key else None
+    eval_result: EvaluationResult | None = None
+    if cached is not None:
+        run.result, run.duration_ms, eval_result = cached
+        run.cached = True
+    else:
+        run.result, run.duration_ms = _run_prompt_action(prompt_text, run.task_args)
+
+    if task.expected:
+        run.expected_grade = _grade_expected(run.result.stdout, task.expected)
+    elif args.semantic is None:
+        # BUG-3196: no `expected:` and no `--semantic` — nothing can grade
+        # this task. Ungraded, not the false pass the bug reported.
+        run.expected_grade = ExpectedGrade(
+            status=GradeStatus.UNGRADED, matched={}, mismatched={}, raw_answer=None
+        )
+
+    run.report = _evaluate(
+        run.result, run.task_args, expected_grade=run.expected_grade, eval_result=eval_result
+    )
+    if cache_dir is not None and key and not run.cached and run.report.exit_code in (0, 1):
+        _store_cached_run(cache_dir, key, run)
+    return run
+
+
 def cmd_dsl(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915 — grading state machine
     """Run a DSL task set, grading each task against its own `expected:` mapping.
 
@@ -897,26 +1097,35 @@ def cmd_dsl(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915 — grad
         print(f"Error: no .yaml task files found in {path}", file=sys.stderr)
         return 2
 
+    jobs = getattr(args, "jobs", 1)
+    if jobs < 1:
+        print(f"Error: --jobs must be at least 1 (got {jobs})", file=sys.stderr)
+        return 2
+    cache_dir = DSL_CACHE_DIR if getattr(args, "cache", False) else None
+
     total = 0
     graded_pass = 0
     graded_total = 0
     ungraded_count = 0
     abstain_count = 0
     errored_count = 0
+    cached_count = 0
     failures: list[str] = []
 
     aggregate_ts = _now_iso()
     aggregate_id: int | None = None
     dirty_val = _git_dirty()
     dirty_int: int | None = None if dirty_val is None else int(dirty_val)
+    head_sha = _git_output("rev-parse", "HEAD")
+    branch = _git_output("rev-parse", "--abbrev-ref", "HEAD")
     with contextlib.suppress(Exception):
         record_harness_event(
             DEFAULT_DB_PATH,
             ts=aggregate_ts,
             runner="dsl",
             target=str(path),
-            head_sha=_git_output("rev-parse", "HEAD"),
-            branch=_git_output("rev-parse", "--abbrev-ref", "HEAD"),
+            head_sha=head_sha,
+            branch=branch,
             target_path=str(path),
             target_content_hash=_hash_file(path),
             dirty=dirty_int,
@@ -928,97 +1137,103 @@ def cmd_dsl(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915 — grad
         finally:
             conn.close()
 
-    for task_file in task_files:
-        total += 1
-        task = _load_task(task_file)
-
-        if task is None:
-            failures.append(f"{task_file.name} (malformed task file)")
-            graded_total += 1
-            _record_harness_event(
-                runner="dsl-task",
-                target=task_file.name,
-                exit_code=1,
-                semantic_verdict=None,
-                semantic_passed=False,
-                timed_out=False,
-                duration_ms=0,
-                parent_id=aggregate_id,
-                target_path=str(task_file),
-                target_content_hash=_hash_file(task_file),
-                dirty=dirty_int,
-            )
-            continue
-
-        has_expected = bool(task.expected)
-        prompt_text = task.prompt + _answer_contract_suffix(task.blanks, task.expected)
-
-        task_args = argparse.Namespace(
-            target=prompt_text,
-            exit_code=args.exit_code,
-            semantic=args.semantic,
-            timeout=args.timeout,
-            output=args.output,
-            verbose=args.verbose,
-            model=args.model,
-            issue_id=None,
-        )
-        result, duration_ms = _run_prompt_action(prompt_text, task_args)
-
-        expected_grade: ExpectedGrade | None
-        if has_expected:
-            expected_grade = _grade_expected(result.stdout, task.expected)
-        elif args.semantic is None:
-            # BUG-3196: no `expected:` and no `--semantic` — nothing can grade
-            # this task. Ungraded, not the false pass the bug reported.
-            expected_grade = ExpectedGrade(
-                status=GradeStatus.UNGRADED, matched={}, mismatched={}, raw_answer=None
-            )
-        else:
-            expected_grade = None
-
-        label_text = prompt_text[:40] + ("..." if len(prompt_text) > 40 else "")
-        runner_label = f"prompt {label_text}"
-        rc, outcome = _evaluate_and_report(
-            runner_label, result, task_args, expected_grade=expected_grade
-        )
+    # Per-task rows are buffered and written in one transaction after the run.
+    task_rows: list[dict[str, Any]] = []
+
+    def _task_row(
+        task_file: Path,
+        task_hash: str | None,
+        *,
+        exit_code: int,
+        semantic_verdict: str | None,
+        semantic_passed: bool | None,
+        timed_out: bool,
+        duration_ms: int,
+    ) -> dict[str, Any]:
+        return {
+            "ts": _now_iso(),
+            "runner": "dsl-task",
+            "target": task_file.name,
+            "exit_code": exit_code,
+            "semantic_verdict": semantic_verdict,
+            "semantic_passed": semantic_passed,
+            "timed_out": timed_out,
+            "duration_ms": duration_ms,
+            "head_sha": head_sha,
+            "branch": branch,
+            "parent_id": aggregate_id,
+            "target_path": str(task_file),
+            "target_content_hash": task_hash,
+            "dirty": dirty_int,
+        }
 
-        if expected_grade is not None and expected_grade.status is GradeStatus.UNGRADED:
-            ungraded_count += 1
-        elif rc == 2:
-            errored_count += 1
-        elif rc == 3:
-            abstain_count += 1
-        else:
-            graded_total += 1
-            if rc == 0:
-                graded_pass += 1
+    # Tasks run on up to `jobs` threads (each is a subprocess wait), but
+    # `Executor.map` yields in submission order, so reports print and tally
+    # exactly as in a serial run.
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="ll-harness-dsl") as pool:
+        for run in pool.map(lambda f: _run_dsl_task(f, args, cache_dir), task_files):
+            total += 1
+            if run.task is None:
+                failures.append(f"{run.task_file.name} (malformed task file)")
+                graded_total += 1
+                task_rows.append(
+                    _task_row(
+                        run.task_file,
+                        run.task_hash,
+                        exit_code=1,
+                        semantic_verdict=None,
+                        semantic_passed=False,
+                        timed_out=False,
+                        duration_ms=0,
+                    )
+                )
+                continue
+
+            assert run.result is not None and run.report is not None
+            assert run.task_args is not None
+            _print_eval_report(run.runner_label, run.result, run.task_args, run.report)
+            rc, outcome = run.report.exit_code, run.report.outcome
+            expected_grade = run.expected_grade
+            if run.cached:
+                cached_count += 1
+
+            if expected_grade is not None and expected_grade.status is GradeStatus.UNGRADED:
+                ungraded_count += 1
+            elif rc == 2:
+                errored_count += 1
+            elif rc == 3:
+                abstain_count += 1
             else:
-                detail = ""
-                if expected_grade is not None:
-                    if expected_grade.status is GradeStatus.UNPARSEABLE:
-                        detail = " (unparseable answer — no JSON object in response)"
-                    elif expected_grade.status is GradeStatus.FAIL:
-                        mismatches = ", ".join(
-                            f"{k}: expected {ev!r} got {av!r}"
-                            for k, (ev, av) in expected_grade.mismatched.items()
-                        )
-                        detail = f" ({mismatches})"
-                failures.append(f"{task_file.name}{detail}")
-
-        _record_harness_event(
-            runner="dsl-task",
-            target=task_file.name,
-            exit_code=result.exit_code,
-            semantic_verdict=outcome.verdict,
-            semantic_passed=None if outcome.abstained else outcome.passed,
-            timed_out=result.timed_out,
-            duration_ms=duration_ms,
-            parent_id=aggregate_id,
-            target_path=str(task_file),
-            target_content_hash=_hash_file(task_file),
-            dirty=dirty_int,
-        )
+                graded_total += 1
+                if rc == 0:
+                    graded_pass += 1
+                else:
+                    detail = ""
+                    if expected_grade is not None:
+                        if expected_grade.status is GradeStatus.UNPARSEABLE:
+                            detail = " (unparseable answer — no JSON object in response)"
+                        elif expected_grade.status is GradeStatus.FAIL:
+                            mismatches = ", ".join(
+                                f"{k}: expected {ev!r} got {av!r}"
+                                for k, (ev, av) in expected_grade.mismatched.items()
+                            )
+                            detail = f" ({mismatches})"
+                    failures.append(f"{run.task_file.name}{detail}")
+
+            task_rows.append(
+                _task_row(
+                    run.task_file,
+                    run.task_hash,
+                    exit_code=run.result.exit_code,
+                    semantic_verdict=outcome.verdict,
+                    semantic_passed=None if outcome.abstained else outcome.passed,
+                    timed_out=run.result.timed_out,
+                    duration_ms=run.duration_ms,
+                )
+            )
+
+    with contextlib.suppress(Exception):
+        record_harness_events(DEFAULT_DB_PATH, task_rows)
 
     def _update_aggregate(exit_code: int, semantic_passed: bool) -> None:
         with contextlib.suppress(Exception):
@@ -1059,6 +1274,8 @@ def cmd_dsl(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915 — grad
             f"  graded {graded_total} of {total} tasks — {ungraded_count} ungradable "
             "(no `expected:` and no --semantic)"
         )
+    if cached_count:
+        lines.append(f"  cached: {cached_count} of {total} task(s) replayed from {DSL_CACHE_DIR}")
     if failures:
         lines.append("  failed: " + "\n          ".join(failures))
     print("\n".join(lines))
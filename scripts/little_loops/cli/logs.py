@@ -30,6 +30,7 @@ from little_loops.session_store import (
     host_layout_for,
     resolve_history_db,
 )
+from little_loops.transcript_index import TranscriptIndex
 from little_loops.user_messages import get_project_folder
 
 _COMMAND_NAME_RE = re.compile(r"<command-name>/ll:")
@@ -91,7 +92,11 @@ def _is_ll_relevant(record: dict) -> bool:
     return False
 
 
-def _has_ll_activity(project_folder: Path, layout: HostLayout | None = None) -> bool:
+def _has_ll_activity(
+    project_folder: Path,
+    layout: HostLayout | None = None,
+    index: TranscriptIndex | None = None,
+) -> bool:
     """Return True if any non-agent JSONL file in project_folder has ll activity.
 
     *layout* supplies the session glob and the record normalizer (ENH-3166):
@@ -99,69 +104,45 @@ def _has_ll_activity(project_folder: Path, layout: HostLayout | None = None) ->
     are normalized into Claude shape before the ``_is_ll_relevant`` test, so
     ``run_shell_command``/``args.command`` reaches the existing
     ``Bash``/``input.command`` predicate. Defaults to the Claude layout.
+    The flag is read from *index* (the default transcript index when None).
     """
     effective = layout if layout is not None else host_layout_for("claude-code")
-    jsonl_files = [
-        f for f in project_folder.glob(effective.session_glob) if not f.name.startswith("agent-")
-    ]
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return _has_ll_activity(project_folder, effective, own_index)
+    return any(summary.ll_activity for summary in index.refresh(project_folder, effective))
 
-    for jsonl_file in jsonl_files:
-        try:
-            with open(jsonl_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if effective.normalize is not None:
-                        record = effective.normalize(record)
-                        if record is None:
-                            continue
-                    if _is_ll_relevant(record):
-                        return True
-        except OSError:
-            continue
 
-    return False
-
-
-def _extract_cwd_from_project(project_dir: Path, layout: HostLayout | None = None) -> Path | None:
+def _extract_cwd_from_project(
+    project_dir: Path,
+    layout: HostLayout | None = None,
+    index: TranscriptIndex | None = None,
+) -> Path | None:
     """Extract the project working directory from cwd fields in JSONL records.
 
     Claude Code encodes project paths by replacing '/' with '-', which is
     lossy for paths containing hyphens. Reading the cwd field from JSONL
     records gives the canonical path without ambiguity. *layout* supplies the
     session glob (ENH-3166) — qwen sessions live under ``chats/``; defaults
-    to the Claude layout.
+    to the Claude layout. The cwd is read from *index* (the default
+    transcript index when None).
     """
     effective = layout if layout is not None else host_layout_for("claude-code")
-    jsonl_files = [
-        f for f in project_dir.glob(effective.session_glob) if not f.name.startswith("agent-")
-    ]
-    for jsonl_file in jsonl_files:
-        try:
-            with open(jsonl_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        cwd = record.get("cwd")
-                        if isinstance(cwd, str) and cwd:
-                            return Path(cwd)
-                    except json.JSONDecodeError:
-                        continue
-        except OSError:
-            continue
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return _extract_cwd_from_project(project_dir, effective, own_index)
+    for summary in index.refresh(project_dir, effective):
+        if summary.cwd:
+            return Path(summary.cwd)
     return None
 
 
 def discover_all_projects(
-    logger: Logger, *, host: str | None = None, existing_only: bool = False
+    logger: Logger,
+    *,
+    host: str | None = None,
+    existing_only: bool = False,
+    index: TranscriptIndex | None = None,
 ) -> list[Path]:
     """Discover all projects with ll activity for the given host.
 
@@ -177,6 +158,8 @@ def discover_all_projects(
         existing_only: When True, silently skip paths that don't exist on disk
             (no debug message). Useful for scripted consumers that want clean
             stderr as well as clean stdout.
+        index: Transcript index to read ``cwd`` and ll-activity from; the
+            default ``~/.ll/`` index when None.
 
     Returns:
         Sorted list of decoded absolute paths for projects with ll activity.
@@ -198,26 +181,34 @@ def discover_all_projects(
     if not projects_root.exists():
         return []
 
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return discover_all_projects(
+                logger, host=host, existing_only=existing_only, index=own_index
+            )
+
     results: list[Path] = []
 
     for project_dir in projects_root.iterdir():
         if not project_dir.is_dir():
             continue
 
+        # One incremental pass yields both the cwd and the ll-activity flag.
+        summaries = index.refresh(project_dir, layout)
+
         # Prefer cwd field from JSONL records; fall back to lossy decode.
         # The lossy decode ("-Users-foo-bar" -> "/Users/foo/bar") breaks for
         # paths that contain hyphens (e.g. "little-loops", macOS per-user
         # temp dirs like /tmp/claude-501/).
-        decoded_path = _extract_cwd_from_project(project_dir, layout) or Path(
-            project_dir.name.replace("-", "/")
-        )
+        cwd = next((summary.cwd for summary in summaries if summary.cwd), None)
+        decoded_path = Path(cwd) if cwd else Path(project_dir.name.replace("-", "/"))
 
         if not decoded_path.exists():
             if not existing_only:
                 logger.debug(f"Decoded path does not exist: {decoded_path}")
             continue
 
-        if _has_ll_activity(project_dir, layout):
+        if any(summary.ll_activity for summary in summaries):
             results.append(decoded_path)
 
     return sorted(results)
@@ -261,6 +252,7 @@ def _extract_ll_event_streams(
     cutoff: datetime | None = None,
     until: datetime | None = None,
     layout: HostLayout | None = None,
+    index: TranscriptIndex | None = None,
 ) -> dict[str, list[InvocationEvent]]:
     """Extract per-session ordered ll-invocation event streams from JSONL files.
 
@@ -269,7 +261,8 @@ def _extract_ll_event_streams(
     timestamp-sorted list of ``InvocationEvent``. *layout* supplies the
     session glob and the record normalizer (ENH-3166) so qwen ``chats/``
     sessions and ``functionCall`` records are recognized; defaults to the
-    Claude layout.
+    Claude layout. Invocations are read from *index* (the default transcript
+    index when None), which only parses what was appended since the last run.
 
     Args:
         project_folder: Path to the host's project session directory.
@@ -279,44 +272,19 @@ def _extract_ll_event_streams(
     Returns:
         Dict of ``{session_id: [InvocationEvent, ...]}`` with events sorted by timestamp.
     """
-    events_by_session: dict[str, list[InvocationEvent]] = {}
-
     effective = layout if layout is not None else host_layout_for("claude-code")
-    jsonl_files = [
-        f for f in project_folder.glob(effective.session_glob) if not f.name.startswith("agent-")
-    ]
-    if not jsonl_files:
-        return events_by_session
-
-    all_events: list[InvocationEvent] = []
-
-    for jsonl_file in jsonl_files:
-        try:
-            with open(jsonl_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    if effective.normalize is not None:
-                        record = effective.normalize(record)
-                        if record is None:
-                            continue
-                    tool_name = _extract_tool_name(record)
-                    if tool_name is None:
-                        continue
-
-                    ts = record.get("timestamp", "")
-                    sid = record.get("sessionId", "")
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return _extract_ll_event_streams(
+                project_folder, cutoff=cutoff, until=until, layout=effective, index=own_index
+            )
 
-                    evt = InvocationEvent(tool_name=tool_name, timestamp=ts, session_id=sid)
-                    all_events.append(evt)
-        except OSError:
-            continue
+    events_by_session: dict[str, list[InvocationEvent]] = {}
+    summaries = index.refresh(project_folder, effective)
+    all_events = [
+        InvocationEvent(tool_name=tool_name, timestamp=ts, session_id=sid)
+        for tool_name, ts, sid in index.invocations([summary.path for summary in summaries])
+    ]
 
     # Apply wall-clock cutoff/until filters
     if cutoff is not None:
@@ -632,31 +600,32 @@ def _cmd_sequences(args: argparse.Namespace, logger: Logger) -> int:
     import os as _os
 
     layout = host_layout_for(_os.environ.get("LL_HOOK_HOST", "claude-code"))
-    if args.project:
-        cwd_path: Path = args.project
-        project_folder = get_project_folder(cwd_path)
-        if project_folder is None:
-            logger.error(f"No session project folder found for: {cwd_path}")
-            return 1
-        project_items = [(cwd_path, project_folder)]
-    else:
-        decoded_paths = discover_all_projects(logger)
-        project_items = []
-        for decoded_path in decoded_paths:
-            folder = get_project_folder(decoded_path)
-            if folder is not None:
-                project_items.append((decoded_path, folder))
-
-    cutoff, until = _resolve_window(args)
-
-    # Aggregate events across all projects
-    all_events: dict[str, list[InvocationEvent]] = {}
-    for _cwd_path, project_folder in project_items:
-        events = _extract_ll_event_streams(
-            project_folder, cutoff=cutoff, until=until, layout=layout
-        )
-        for sid, evt_list in events.items():
-            all_events.setdefault(sid, []).extend(evt_list)
+    with TranscriptIndex.default() as index:
+        if args.project:
+            cwd_path: Path = args.project
+            project_folder = get_project_folder(cwd_path)
+            if project_folder is None:
+                logger.error(f"No session project folder found for: {cwd_path}")
+                return 1
+            project_items = [(cwd_path, project_folder)]
+        else:
+            decoded_paths = discover_all_projects(logger, index=index)
+            project_items = []
+            for decoded_path in decoded_paths:
+                folder = get_project_folder(decoded_path)
+                if folder is not None:
+                    project_items.append((decoded_path, folder))
+
+        cutoff, until = _resolve_window(args)
+
+        # Aggregate events across all projects
+        all_events: dict[str, list[InvocationEvent]] = {}
+        for _cwd_path, project_folder in project_items:
+            events = _extract_ll_event_streams(
+                project_folder, cutoff=cutoff, until=until, layout=layout, index=index
+            )
+            for sid, evt_list in events.items():
+                all_events.setdefault(sid, []).extend(evt_list)
 
     # Sort each session's events by timestamp
     for sid in all_events:
@@ -1115,116 +1084,61 @@ def _cmd_scan_failures(args: argparse.Namespace, logger: Logger) -> int:
 
     _cli_allowlist = _load_cli_allowlist(Path.cwd())
 
-    if args.project:
-        cwd_path: Path = args.project
-        project_folder = get_project_folder(cwd_path)
-        if project_folder is None:
-            logger.error(f"No session project folder found for: {cwd_path}")
-            return 1
-        project_items = [(cwd_path, project_folder)]
-    else:
-        decoded_paths = discover_all_projects(logger)
-        project_items = []
-        for decoded_path in decoded_paths:
-            folder = get_project_folder(decoded_path)
-            if folder is not None:
-                project_items.append((decoded_path, folder))
-
-    # raw_clusters maps (cwd_path, tool_name, normalized_sig) -> (count, sample_error, session_ids, latest_ts)
-    raw_clusters: dict[tuple[Path, str, str], tuple[int, str, list[str], str]] = {}
-
-    for _cwd_path, project_folder in project_items:
-        jsonl_files = [f for f in project_folder.glob("*.jsonl") if not f.name.startswith("agent-")]
-
-        for jsonl_file in jsonl_files:
-            # pending maps tool_use_id -> (ll_tool_name, timestamp)
-            pending: dict[str, tuple[str, str]] = {}
+    # Failed calls are paired with their results and stored by the transcript
+    # index; the allowlist and failure classification depend on this project,
+    # so they are applied here on every run.
+    raw_layout = host_layout_for("claude-code")
+    with TranscriptIndex.default() as index:
+        if args.project:
+            cwd_path: Path = args.project
+            project_folder = get_project_folder(cwd_path)
+            if project_folder is None:
+                logger.error(f"No session project folder found for: {cwd_path}")
+                return 1
+            project_items = [(cwd_path, project_folder)]
+        else:
+            decoded_paths = discover_all_projects(logger, index=index)
+            project_items = []
+            for decoded_path in decoded_paths:
+                folder = get_project_folder(decoded_path)
+                if folder is not None:
+                    project_items.append((decoded_path, folder))
+
+        # raw_clusters maps (cwd_path, tool_name, normalized_sig) -> (count, sample_error, session_ids, latest_ts)
+        raw_clusters: dict[tuple[Path, str, str], tuple[int, str, list[str], str]] = {}
+
+        for _cwd_path, project_folder in project_items:
+            summaries = index.refresh(project_folder, raw_layout)
+            for failure in index.failures([summary.path for summary in summaries]):
+                tool_name = failure.tool_name
+                # Skip tokens that are not real ll CLIs (e.g. ll-labs, ll-marketing)
+                if _cli_allowlist and tool_name not in _cli_allowlist:
+                    continue
+                # Skip ll-verify-* tools — exit 1 is expected gate behavior
+                if _LL_VERIFY_RE.match(tool_name):
+                    continue
 
-            try:
-                with open(jsonl_file, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            record = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
+                error_text = failure.error_text
+                returncode = 1 if failure.is_error else 0
+                failure_type, _reason = classify_failure(error_text, returncode)
+                if failure_type in (
+                    FailureType.TRANSIENT,
+                    FailureType.NON_RECOVERABLE,
+                    FailureType.INFRA_RETRY,
+                ):
+                    continue
 
-                        record_type = record.get("type")
-                        ts = record.get("timestamp", "")
-                        session_id = record.get("sessionId", "")
+                normalized_sig = _normalize_error_sig(error_text)
+                key = (_cwd_path, tool_name, normalized_sig)
+                session_id = failure.session_id
 
-                        if record_type == "assistant":
-                            message = record.get("message", {})
-                            content = message.get("content", [])
-                            if not isinstance(content, list):
-                                continue
-                            for block in content:
-                                if not isinstance(block, dict):
-                                    continue
-                                if block.get("type") != "tool_use" or block.get("name") != "Bash":
-                                    continue
-                                cmd = block.get("input", {}).get("command", "")
-                                m = _LL_BASH_RE.search(cmd)
-                                if not m:
-                                    continue
-                                tool_name = m.group(1)
-                                # Skip tokens that are not real ll CLIs (e.g. ll-labs, ll-marketing)
-                                if _cli_allowlist and tool_name not in _cli_allowlist:
-                                    continue
-                                block_id = block.get("id", "")
-                                if block_id:
-                                    pending[block_id] = (tool_name, ts)
-
-                        elif record_type == "user":
-                            message = record.get("message", {})
-                            content = message.get("content", [])
-                            if not isinstance(content, list) or not content:
-                                continue
-                            for block in content:
-                                if not isinstance(block, dict):
-                                    continue
-                                if block.get("type") != "tool_result":
-                                    continue
-                                tool_use_id = block.get("tool_use_id", "")
-                                if tool_use_id not in pending:
-                                    continue
-                                tool_name, _invoke_ts = pending.pop(tool_use_id)
-
-                                # Skip ll-verify-* tools — exit 1 is expected gate behavior
-                                if _LL_VERIFY_RE.match(tool_name):
-                                    continue
-
-                                is_error_flag = block.get("is_error") is True
-                                raw_content = block.get("content", "")
-                                error_text = _extract_error_text(raw_content)
-                                has_traceback = "Traceback (most recent call last)" in error_text
-
-                                if not (is_error_flag or has_traceback):
-                                    continue
-
-                                returncode = 1 if is_error_flag else 0
-                                failure_type, _reason = classify_failure(error_text, returncode)
-                                if failure_type in (
-                                    FailureType.TRANSIENT,
-                                    FailureType.NON_RECOVERABLE,
-                                    FailureType.INFRA_RETRY,
-                                ):
-                                    continue
-
-                                normalized_sig = _normalize_error_sig(error_text)
-                                key = (_cwd_path, tool_name, normalized_sig)
-
-                                if key in raw_clusters:
-                                    cnt, sample, sids, _lts = raw_clusters[key]
-                                    if session_id not in sids:
-                                        sids.append(session_id)
-                                    raw_clusters[key] = (cnt + 1, sample, sids, ts)
-                                else:
-                                    raw_clusters[key] = (1, error_text[:500], [session_id], ts)
-            except OSError:
-                continue
+                if key in raw_clusters:
+                    cnt, sample, sids, _lts = raw_clusters[key]
+                    if session_id not in sids:
+                        sids.append(session_id)
+                    raw_clusters[key] = (cnt + 1, sample, sids, failure.ts)
+                else:
+                    raw_clusters[key] = (1, error_text[:500], [session_id], failure.ts)
 
     # Apply wall-clock cutoff/until filters
     cutoff, until = _resolve_window(args)
@@ -1857,23 +1771,16 @@ def _derive_loop_outcome(event: dict) -> str:
     return "converged"
 
 
-def _parse_terminal_event(events_file: Path) -> dict | None:
-    """Read events.jsonl and return the loop_complete event, or None if absent."""
-    try:
-        with open(events_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                    if record.get("event") == "loop_complete":
-                        return record
-                except json.JSONDecodeError:
-                    continue
-    except OSError:
-        pass
-    return None
+def _parse_terminal_event(events_file: Path, index: TranscriptIndex | None = None) -> dict | None:
+    """Return the loop_complete event of an archived run's events.jsonl, or None if absent.
+
+    Read through *index* (the default transcript index when None), so a
+    completed run's events file is only ever scanned once.
+    """
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return own_index.loop_terminal(events_file)
+    return index.loop_terminal(events_file)
 
 
 def _collect_loop_runs(
@@ -1883,11 +1790,22 @@ def _collect_loop_runs(
     loop_filter: str | None = None,
     cutoff: datetime | None = None,
     until: datetime | None = None,
+    index: TranscriptIndex | None = None,
 ) -> list[_LoopRunRecord]:
     """Collect archived loop runs from a project's .loops/.history/ directory."""
     history_dir = project_path / ".loops" / ".history"
     if not history_dir.exists():
         return []
+    if index is None:
+        with TranscriptIndex.default() as own_index:
+            return _collect_loop_runs(
+                project_path,
+                builtin_names,
+                loop_filter=loop_filter,
+                cutoff=cutoff,
+                until=until,
+                index=own_index,
+            )
 
     records: list[_LoopRunRecord] = []
     visited: set[Path] = set()
@@ -1906,7 +1824,7 @@ def _collect_loop_runs(
             visited.add(run_dir)
             if loop_filter and loop_name != loop_filter:
                 continue
-            terminal = _parse_terminal_event(events_file)
+            terminal = _parse_terminal_event(events_file, index)
             if terminal is None:
                 continue
             ts = terminal.get("ts", "")
@@ -1942,7 +1860,7 @@ def _collect_loop_runs(
                 events_file = run_subdir / "events.jsonl"
                 if not events_file.exists():
                     continue
-                terminal = _parse_terminal_event(events_file)
+                terminal = _parse_terminal_event(events_file, index)
                 if terminal is None:
                     continue
                 ts = terminal.get("ts", "")
@@ -1977,18 +1895,24 @@ def _cmd_loop_fleet(args: argparse.Namespace, logger: Logger) -> int:
     cutoff, until = _resolve_window(args)
     loop_filter: str | None = getattr(args, "loop", None)
 
-    if args.project:
-        projects = [Path(args.project)]
-    else:
-        projects = discover_all_projects(logger, existing_only=args.existing_only)
-
     all_runs: list[_LoopRunRecord] = []
-    for proj in projects:
-        all_runs.extend(
-            _collect_loop_runs(
-                proj, builtin_names, loop_filter=loop_filter, cutoff=cutoff, until=until
+    with TranscriptIndex.default() as index:
+        if args.project:
+            projects = [Path(args.project)]
+        else:
+            projects = discover_all_projects(logger, existing_only=args.existing_only, index=index)
+
+        for proj in projects:
+            all_runs.extend(
+                _collect_loop_runs(
+                    proj,
+                    builtin_names,
+                    loop_filter=loop_filter,
+                    cutoff=cutoff,
+                    until=until,
+                    index=index,
+                )
             )
-        )
 
     if not all_runs:
         if args.json:
@@ -45,7 +45,7 @@ from little_loops.cli.output import (
 )
 from little_loops.fsm import is_runnable_loop
 from little_loops.fsm.concurrency import resolve_scope
-from little_loops.fsm.fragments import resolve_inheritance
+from little_loops.fsm.fragments import load_loop_spec
 from little_loops.fsm.schema import FSMLoop, StateConfig
 from little_loops.fsm.validation import load_and_validate
 from little_loops.logger import Logger
@@ -61,15 +61,9 @@ def _display_name(name: str) -> str:
 
 def _load_loop_meta(path: Path) -> dict[str, Any]:
     """Return metadata from a loop YAML file (description, category, labels)."""
-    import yaml
-
     try:
-        with open(path) as f:
-            spec = yaml.safe_load(f) or {}
-        try:
-            spec = resolve_inheritance(spec, path.parent)
-        except Exception:
-            pass
+        raw, resolved = load_loop_spec(path)
+        spec = resolved if resolved is not None else (raw or {})
         desc_raw = spec.get("description", "") or ""
         if desc_raw.strip():
             # Collapse newlines so ``ll-loop list`` renders the full description
@@ -727,6 +727,9 @@ def cmd_resume(
         circuit=circuit,
         instance_id=instance_id,
         orchestration_config=config.orchestration,
+        jsonl_config=config.events.jsonl,
+        state_persistence=config.loops.state_persistence,
+        journal_fold_every=config.loops.journal_fold_every,
     )
 
     # Register signal handlers for graceful shutdown (same as cmd_run)
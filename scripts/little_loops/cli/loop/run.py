@@ -590,6 +590,9 @@ def cmd_run(
             run_effort=getattr(args, "run_effort", None) or None,
             compression_config=_config.compression,
             orchestration_config=_config.orchestration,
+            jsonl_config=_config.events.jsonl,
+            state_persistence=_config.loops.state_persistence,
+            journal_fold_every=_config.loops.journal_fold_every,
         )
 
         # Register signal handlers for graceful shutdown
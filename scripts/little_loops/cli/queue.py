@@ -32,17 +32,19 @@ if TYPE_CHECKING:
     from little_loops.runner_spec import ActionSpec, RunnerType
 
 # Default --poll-interval, in seconds, for `ll-queue run --watch` (FEAT-2930):
-# a sleep-poll, not a busy loop. Also the sleep applied to the lost-claim
-# retry path (below), which the one-shot drainer hits only in the rare case
-# of a second, concurrent drainer.
+# a sleep-poll, not a busy loop.
 _DEFAULT_POLL_INTERVAL = 3.0
 
 # The in-flight LOOP entry's subprocess (FEAT-2930), tracked at module scope
 # so the second-signal handler in `_run_watch` can forward SIGTERM to it. A
 # LOOP entry's subprocess.run/Popen call does not inherit the parent's
 # signals (BUG-2928 removed its outer timeout, making this the only way to
-# stop a wedged loop short of killing the whole drainer).
+# stop a wedged loop short of killing the whole drainer). With `--workers N`
+# several LOOP entries can be in flight at once: `_current_loop_proc` is the
+# most recently started one and `_inflight_loop_procs` holds all of them.
 _current_loop_proc: subprocess.Popen[str] | None = None
+_inflight_loop_procs: set[subprocess.Popen[str]] = set()
+_inflight_lock = threading.Lock()
 
 __all__ = ["main_queue"]
 
@@ -358,8 +360,8 @@ def _run_loop_entry(action: Any) -> Any:
     Launched with ``start_new_session=True`` (FEAT-2930) so the child is a
     process-group leader that ``_kill_current_loop_proc`` can target via
     ``os.killpg`` on a second shutdown signal, and tracked in the module-level
-    ``_current_loop_proc`` for the duration of the call so that handler can
-    find it.
+    ``_current_loop_proc``/``_inflight_loop_procs`` for the duration of the
+    call so that handler can find it.
     """
     global _current_loop_proc
 
@@ -382,7 +384,9 @@ def _run_loop_entry(action: Any) -> Any:
     except FileNotFoundError as exc:
         return RunnerResult(stdout="", stderr="", exit_code=-1, error=str(exc))
 
-    _current_loop_proc = proc
+    with _inflight_lock:
+        _inflight_loop_procs.add(proc)
+        _current_loop_proc = proc
     try:
         stdout, stderr = proc.communicate(timeout=action.timeout)
         returncode = proc.returncode
@@ -391,23 +395,35 @@ def _run_loop_entry(action: Any) -> Any:
         stdout, stderr = proc.communicate()
         return RunnerResult(stdout=stdout or "", stderr=stderr or "", exit_code=-1, timed_out=True)
     finally:
-        _current_loop_proc = None
+        with _inflight_lock:
+            _inflight_loop_procs.discard(proc)
+            if _current_loop_proc is proc:
+                _current_loop_proc = None
 
     error = "terminal failure" if returncode == FAILURE_TERMINAL_EXIT_CODE else None
     return RunnerResult(stdout=stdout, stderr=stderr, exit_code=returncode, error=error)
 
 
 def _kill_current_loop_proc() -> bool:
-    """Forward SIGTERM to the in-flight LOOP subprocess's process group, if any (FEAT-2930).
+    """Forward SIGTERM to every in-flight LOOP subprocess's process group (FEAT-2930).
 
-    Returns True iff a live process was actually signaled. Safe to call when
-    no LOOP entry is in flight (returns False). Mirrors
+    Returns True iff at least one live process was actually signaled. Safe to
+    call when no LOOP entry is in flight (returns False). Mirrors
     ``cli/loop/lifecycle.py``'s ``_kill_with_timeout``/``_signal_process_group``
     escalation shape, minus the SIGKILL escalation wait — the drainer exits
     right after this on a second signal rather than babysitting the kill.
     """
-    proc = _current_loop_proc
-    if proc is None or proc.poll() is not None:
+    with _inflight_lock:
+        procs = set(_inflight_loop_procs)
+        if _current_loop_proc is not None:
+            procs.add(_current_loop_proc)
+    signaled = [_signal_loop_proc(proc) for proc in procs]
+    return any(signaled)
+
+
+def _signal_loop_proc(proc: subprocess.Popen[str]) -> bool:
+    """SIGTERM one LOOP subprocess's process group; True iff it was live and signaled."""
+    if proc.poll() is not None:
         return False
     try:
         pgid = os.getpgid(proc.pid)
@@ -429,43 +445,82 @@ def _drain_once(
     stop: threading.Event,
     force_stop: threading.Event,
     *,
-    poll_interval: float = _DEFAULT_POLL_INTERVAL,
+    workers: int = 1,
     on_entry: Callable[[QueueEntry, dict[str, Any]], None] | None = None,
 ) -> list[dict[str, Any]]:
     """Drain currently-pending entries once; the shared body for one-shot and ``--watch``.
 
+    With *workers* > 1 (``ll-queue run --workers N``), N threads each run
+    :func:`_drain_worker` against the same database; :func:`claim_next` hands
+    every worker a distinct entry, so up to N entries run concurrently.
+    *on_entry* calls are serialized, and the returned records are in
+    completion order. An exception (e.g. ``KeyboardInterrupt``) while waiting
+    on the workers sets *stop* first, so no worker claims further entries.
+    """
+    if workers <= 1:
+        return _drain_worker(stop, force_stop, on_entry=on_entry)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    processed: list[dict[str, Any]] = []
+    emit_lock = threading.Lock()
+
+    def _collect(entry: QueueEntry, record: dict[str, Any]) -> None:
+        with emit_lock:
+            processed.append(record)
+            if on_entry is not None:
+                on_entry(entry, record)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ll-queue-worker") as pool:
+        futures = [
+            pool.submit(_drain_worker, stop, force_stop, on_entry=_collect) for _ in range(workers)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            stop.set()
+            raise
+    return processed
+
+
+def _drain_worker(
+    stop: threading.Event,
+    force_stop: threading.Event,
+    *,
+    on_entry: Callable[[QueueEntry, dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Claim and run entries one at a time until none is pending; one drainer worker.
+
     ``RunnerType.LOOP`` entries are intercepted before ``run_action()`` (which
     deliberately never dispatches them, see ``runner_spec.py``) and driven
     via a subprocess ``ll-loop run`` shell-out instead (FEAT-2906). All other
     runner kinds continue through ``run_action()`` unchanged.
 
+    Each iteration claims the highest-precedence pending entry with
+    :func:`~little_loops.queue_store.claim_next` — one atomic statement, so
+    a concurrent drainer (another ``--workers`` thread or another
+    ``ll-queue run`` process) can never win the same entry, and no
+    per-iteration read of the whole table is needed.
+
     *stop* is checked before each claim, so a graceful shutdown (first
     signal) stops claiming new work without interrupting an entry already in
-    flight. The lost-claim path (every currently-pending entry claimed by
-    another drainer between the read and the claim) sleeps *poll_interval*
-    before retrying instead of busy-spinning — a rare race for the one-shot
-    drainer, routine once ``--watch`` makes concurrent drainers normal.
+    flight.
 
     *force_stop*, when set by a second shutdown signal mid-entry, marks that
     entry ``failed`` with ``error: "interrupted by operator"`` regardless of
     its actual result, then stops draining further entries even if more are
     pending.
     """
-    from little_loops.queue_store import claim_entry, list_entries, update_entry_result
+    from little_loops.queue_store import claim_next, update_entry_result
     from little_loops.runner_spec import RunnerType, run_action
 
     processed: list[dict[str, Any]] = []
 
     while not stop.is_set():
-        pending = [e for e in list_entries(QUEUE_DB_PATH) if e.status == "pending"]
-        if not pending:
-            break
-        entry = next((e for e in pending if claim_entry(e.id, db_path=QUEUE_DB_PATH)), None)
+        entry = claim_next(db_path=QUEUE_DB_PATH)
         if entry is None:
-            # Every currently-pending entry lost its claim to another drainer;
-            # re-read on the next iteration rather than treating this as drained.
-            time.sleep(poll_interval)
-            continue
+            break
 
         try:
             if entry.action.runner is RunnerType.LOOP:
@@ -543,7 +598,7 @@ def _reclaim_stale(db_path: Path | str) -> int:
     """
     from little_loops.queue_store import list_entries, reset_to_pending
 
-    running = [e for e in list_entries(db_path) if e.status == "running"]
+    running = list_entries(db_path, status="running")
     reclaimed = 0
     for entry in running:
         if _verify_owner_alive(entry.owner_pid, entry.claimed_at):
@@ -558,15 +613,20 @@ def cmd_run(args: argparse.Namespace) -> int:
 
     Without ``--watch``: drain what's pending, then exit (unchanged one-shot
     behavior). With ``--watch``: drain, then sleep-poll for new work
-    indefinitely (FEAT-2930) — see ``_run_watch``.
+    indefinitely (FEAT-2930) — see ``_run_watch``. ``--workers N`` runs up
+    to N entries concurrently in either mode.
     """
     from little_loops.cli.output import colorize, print_json
 
     json_mode = getattr(args, "json", False)
     poll_interval = getattr(args, "poll_interval", _DEFAULT_POLL_INTERVAL)
+    workers = getattr(args, "workers", 1)
+    if workers < 1:
+        print(f"Error: --workers must be at least 1, got {workers}", file=sys.stderr)
+        return 2
 
     if getattr(args, "watch", False):
-        return _run_watch(json_mode, poll_interval)
+        return _run_watch(json_mode, poll_interval, workers=workers)
 
     stop = threading.Event()
     force_stop = threading.Event()
@@ -580,7 +640,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             f"{entry.action.runner.value}:{entry.action.target}"
         )
 
-    processed = _drain_once(stop, force_stop, poll_interval=poll_interval, on_entry=_print_line)
+    processed = _drain_once(stop, force_stop, workers=workers, on_entry=_print_line)
 
     if json_mode:
         print_json(processed)
@@ -621,13 +681,14 @@ def _make_signal_handler(
     return _handle_signal
 
 
-def _run_watch(json_mode: bool, poll_interval: float) -> int:
+def _run_watch(json_mode: bool, poll_interval: float, *, workers: int = 1) -> int:
     """Long-lived drainer: drain, then sleep-poll for new work indefinitely (FEAT-2930).
 
-    Shutdown semantics: a first ``SIGINT``/``SIGTERM`` lets the in-flight
-    entry finish and records its real result, then exits 0 without claiming
-    further work. A second signal forwards ``SIGTERM`` to an in-flight LOOP
-    child's process group, marks that entry ``failed`` with
+    Shutdown semantics, applied to every one of the *workers*: a first
+    ``SIGINT``/``SIGTERM`` lets each in-flight entry finish and records its
+    real result, then exits 0 without claiming further work. A second signal
+    forwards ``SIGTERM`` to every in-flight LOOP child's process group, marks
+    each in-flight entry ``failed`` with
     ``error: "interrupted by operator"``, and exits 0. An idle wait (no entry
     in flight) exits 0 immediately on either signal — nothing is left
     ``running``.
@@ -665,7 +726,7 @@ def _run_watch(json_mode: bool, poll_interval: float) -> int:
         _report_reclaim(_reclaim_stale(QUEUE_DB_PATH))
 
         while not stop.is_set():
-            _drain_once(stop, force_stop, poll_interval=poll_interval, on_entry=_emit)
+            _drain_once(stop, force_stop, workers=workers, on_entry=_emit)
             if stop.is_set():
                 break
             time.sleep(poll_interval)
@@ -739,6 +800,7 @@ Examples:
   ll-queue remove abcd1234 --force
   ll-queue run
   ll-queue run --watch --poll-interval 5
+  ll-queue run --workers 4
   ll-queue requeue abcd1234
 """,
         )
@@ -823,8 +885,9 @@ Examples:
         run_parser = subparsers.add_parser(
             "run",
             help="Dequeue and execute pending entries in priority/FIFO order",
-            description="Serially dispatch each pending entry: SKILL/CMD/MCP/PROMPT through "
-            "run_action(), LOOP entries via a subprocess `ll-loop run` shell-out",
+            description="Dispatch each pending entry (serially, or --workers at a time): "
+            "SKILL/CMD/MCP/PROMPT through run_action(), LOOP entries via a subprocess "
+            "`ll-loop run` shell-out",
         )
         run_parser.add_argument(
             "--json",
@@ -847,6 +910,13 @@ Examples:
             default=_DEFAULT_POLL_INTERVAL,
             help=f"Seconds between polls under --watch (default: {_DEFAULT_POLL_INTERVAL})",
         )
+        run_parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Run up to N entries concurrently, each claimed atomically (default: 1)",
+        )
 
         requeue_parser = subparsers.add_parser(
             "requeue",
@@ -219,6 +219,19 @@ Examples:
         metavar="PATH",
         help="Path to ll-config.json (default: auto-resolve from cwd)",
     )
+    rebuild_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only derive raw_events rows added since the last rebuild; falls back "
+            "to a full rebuild after a schema-version change"
+        ),
+    )
+    rebuild_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Also print per-extractor wall time for the rebuild pass",
+    )
     add_json_arg(rebuild_parser)
 
     compact_parser = subparsers.add_parser(
@@ -643,9 +656,19 @@ def main_session() -> int:
                 except (OSError, _json.JSONDecodeError):
                     config = None
 
-            counts = rebuild(args.db, config=config)
+            counts = rebuild(args.db, config=config, incremental=args.incremental)
+            timings: dict[str, float] = {}
+            if args.timings:
+                conn = connect(args.db)
+                try:
+                    row = conn.execute(
+                        "SELECT value FROM meta WHERE key = 'last_rebuild_timings'"
+                    ).fetchone()
+                finally:
+                    conn.close()
+                timings = _json.loads(row[0]) if row and row[0] else {}
             if args.json:
-                print_json(counts)
+                print_json({**counts, "timings_ms": timings} if args.timings else counts)
                 return 0
             total = sum(counts.values())
             logger.success(
@@ -655,6 +678,8 @@ def main_session() -> int:
                 f"skill_events={counts.get('skill_events', 0)}, sessions={counts.get('sessions', 0)}, "
                 f"corrections={counts.get('corrections', 0)}, summaries={counts.get('summaries', 0)})"
             )
+            for stage, ms in timings.items():
+                print(f"  {stage:<20} {ms:>10.1f}ms")
             return 0
 
         if args.command == "compact":
@@ -56,6 +56,7 @@ from little_loops.config.features import (
     GoNoGoConfig,
     HistoryConfig,
     IssuesConfig,
+    JsonlEventsConfig,
     LearningTestsConfig,
     LoopRunDefaults,
     LoopsConfig,
@@ -123,6 +124,7 @@ __all__ = [
     "ObservabilityConfig",
     "OTelAttributesConfig",
     "OTelEventsConfig",
+    "JsonlEventsConfig",
     "SocketEventsConfig",
     "StreamingParityConfig",
     "WebhookEventsConfig",
@@ -99,6 +99,7 @@ class ParallelAutomationConfig:
     worktree_copy_files: list[str] = field(
         default_factory=lambda: [".claude/settings.local.json", ".env", ".ll/ll.local.md"]
     )
+    worktree_pool_size: int = 0
     require_code_changes: bool = True
     use_feature_branches: bool = False
     push_feature_branches: bool = False
@@ -139,6 +140,7 @@ class ParallelAutomationConfig:
             worktree_copy_files=data.get(
                 "worktree_copy_files", [".claude/settings.local.json", ".env", ".ll/ll.local.md"]
             ),
+            worktree_pool_size=data.get("worktree_pool_size", 0),
             require_code_changes=data.get("require_code_changes", True),
             use_feature_branches=data.get("use_feature_branches", False),
             push_feature_branches=data.get("push_feature_branches", False),
@@ -660,6 +660,7 @@ class BRConfig:
             type_prefixes=type_prefixes,
             label_filter=label_filter,
             worktree_copy_files=self._parallel.worktree_copy_files,
+            worktree_pool_size=self._parallel.worktree_pool_size,
             require_code_changes=self._parallel.require_code_changes,
             use_feature_branches=(
                 use_feature_branches
@@ -818,6 +819,8 @@ class BRConfig:
                 "loops_dir": self._loops.loops_dir,
                 "queue_wait_timeout_seconds": self._loops.queue_wait_timeout_seconds,
                 "glyphs": self._loops.glyphs.to_dict(),
+                "state_persistence": self._loops.state_persistence,
+                "journal_fold_every": self._loops.journal_fold_every,
             },
             "learning_tests": {
                 "enabled": self._learning_tests.enabled,
@@ -910,6 +913,13 @@ class BRConfig:
             },
             "events": {
                 "transports": list(self._events.transports),
+                "async_transports": list(self._events.async_transports),
+                "async_queue_size": self._events.async_queue_size,
+                "jsonl": {
+                    "durability": self._events.jsonl.durability,
+                    "every_n": self._events.jsonl.every_n,
+                    "interval_ms": self._events.jsonl.interval_ms,
+                },
                 "socket": {
                     "path": self._events.socket.path,
                     "max_clients": self._events.socket.max_clients,
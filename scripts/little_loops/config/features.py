@@ -10,6 +10,8 @@ import fnmatch
 from dataclasses import dataclass, field
 from typing import Any
 
+from little_loops.file_utils import JSONL_DURABILITY_POLICIES
+
 
 def feature_enabled(config_data: dict[str, Any], dot_path: str) -> bool:
     """Return whether the boolean flag at *dot_path* is enabled in *config_data*.
@@ -928,6 +930,9 @@ class LoopRunDefaults:
         )
 
 
+_VALID_STATE_PERSISTENCE: frozenset[str] = frozenset({"snapshot", "journal"})
+
+
 @dataclass
 class LoopsConfig:
     """FSM loop configuration."""
@@ -936,15 +941,25 @@ class LoopsConfig:
     queue_wait_timeout_seconds: int = 86400
     glyphs: LoopsGlyphsConfig = field(default_factory=LoopsGlyphsConfig)
     run_defaults: LoopRunDefaults = field(default_factory=LoopRunDefaults)
+    state_persistence: str = "snapshot"
+    journal_fold_every: int = 200
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LoopsConfig:
-        """Create LoopsConfig from dictionary."""
+        """Create LoopsConfig from dictionary, validating state_persistence."""
+        state_persistence = data.get("state_persistence", "snapshot")
+        if state_persistence not in _VALID_STATE_PERSISTENCE:
+            raise ValueError(
+                f"loops.state_persistence: {state_persistence!r} is not valid. "
+                f"Valid values: {sorted(_VALID_STATE_PERSISTENCE)}"
+            )
         return cls(
             loops_dir=data.get("loops_dir", ".loops"),
             queue_wait_timeout_seconds=data.get("queue_wait_timeout_seconds", 86400),
             glyphs=LoopsGlyphsConfig.from_dict(data.get("glyphs", {})),
             run_defaults=LoopRunDefaults.from_dict(data.get("run_defaults", {})),
+            state_persistence=state_persistence,
+            journal_fold_every=data.get("journal_fold_every", 200),
         )
 
 
@@ -1188,12 +1203,47 @@ class SqliteEventsConfig:
     """SQLiteTransport configuration (unified session store, FEAT-1112)."""
 
     path: str = ".ll/history.db"
+    batch_size: int = 64
+    flush_ms: int = 100
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SqliteEventsConfig:
         """Create SqliteEventsConfig from dictionary."""
         return cls(
             path=data.get("path", ".ll/history.db"),
+            batch_size=data.get("batch_size", 64),
+            flush_ms=data.get("flush_ms", 100),
+        )
+
+
+@dataclass
+class JsonlEventsConfig:
+    """Durability policy for buffered JSONL event logs.
+
+    Applies to the ``jsonl`` transport and to ``ll-loop``'s per-run
+    ``.loops/.running/<instance>.events.jsonl``. FSM transition events are
+    always written (and, for the run log, fsynced) immediately; the policy
+    decides when the rows between them — chiefly per-line ``action_output`` —
+    are written out.
+    """
+
+    durability: str = "every_event"
+    every_n: int = 100
+    interval_ms: int = 250
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> JsonlEventsConfig:
+        """Create JsonlEventsConfig from dictionary, validating durability."""
+        durability = data.get("durability", "every_event")
+        if durability not in JSONL_DURABILITY_POLICIES:
+            raise ValueError(
+                f"events.jsonl.durability: {durability!r} is not valid. "
+                f"Valid values: {sorted(JSONL_DURABILITY_POLICIES)}"
+            )
+        return cls(
+            durability=durability,
+            every_n=data.get("every_n", 100),
+            interval_ms=data.get("interval_ms", 250),
         )
 
 
@@ -1203,10 +1253,15 @@ class EventsConfig:
 
     Lists the transports to wire onto the EventBus at runtime. Names are
     resolved against the registry in `little_loops.transport.wire_transports`;
-    unknown names are skipped with a warning.
+    unknown names are skipped with a warning. Transports also named in
+    ``async_transports`` are dispatched from their own bounded queue of
+    ``async_queue_size`` events instead of inline on the emitting thread.
     """
 
     transports: list[str] = field(default_factory=list)
+    async_transports: list[str] = field(default_factory=list)
+    async_queue_size: int = 1024
+    jsonl: JsonlEventsConfig = field(default_factory=JsonlEventsConfig)
     socket: SocketEventsConfig = field(default_factory=SocketEventsConfig)
     otel: OTelEventsConfig = field(default_factory=OTelEventsConfig)
     webhook: WebhookEventsConfig = field(default_factory=WebhookEventsConfig)
@@ -1217,6 +1272,9 @@ class EventsConfig:
         """Create EventsConfig from dictionary."""
         return cls(
             transports=data.get("transports", []),
+            async_transports=data.get("async_transports", []),
+            async_queue_size=data.get("async_queue_size", 1024),
+            jsonl=JsonlEventsConfig.from_dict(data.get("jsonl", {})),
             socket=SocketEventsConfig.from_dict(data.get("socket", {})),
             otel=OTelEventsConfig.from_dict(data.get("otel", {})),
             webhook=WebhookEventsConfig.from_dict(data.get("webhook", {})),
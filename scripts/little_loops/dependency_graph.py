@@ -37,7 +37,7 @@ class DependencyGraph:
     "blocked by" relationships. Provides methods for:
     - Topological sorting (dependency order)
     - Cycle detection
-    - Ready issue queries (blockers resolved)
+    - Ready issue queries (blockers resolved), one-shot or incremental (ReadySet)
     - Blocking issue queries
 
     Attributes:
@@ -244,30 +244,63 @@ class DependencyGraph:
             - Wave 3: [D]
         """
         completed = completed or set()
+        # Kahn levels in one pass: every issue's in-degree counts its
+        # prerequisites (blocked_by + depends_on) not yet completed, and a wave
+        # is the set of issues whose counter reached zero while the previous
+        # wave was drained. Each edge is visited once — O(N + E) — instead of
+        # rescanning the whole graph per wave.
+        ready = self.ready_set(completed)
         waves: list[list[IssueInfo]] = []
-        processed: set[str] = set(completed)
-
-        while True:
-            # Get issues ready to run (all prerequisites in processed set).
-            # get_ready_issues enforces both blocked_by and depends_on ordering,
-            # so a dependent lands in a strictly later wave than its prereqs.
-            wave = self.get_ready_issues(completed=processed)
-            if not wave:
-                break
-
+        wave = ready.ready()
+        while wave:
             waves.append(wave)
+            next_wave: list[IssueInfo] = []
             for issue in wave:
-                processed.add(issue.issue_id)
+                next_wave.extend(ready.mark_completed(issue.issue_id))
+            next_wave.sort(key=lambda x: (x.priority_int, x.issue_id))
+            wave = next_wave
 
         # Check for cycles - if we have unprocessed issues, there's a cycle
-        remaining = set(self.issues.keys()) - processed
-        if remaining:
+        if ready.remaining():
             cycles = self.detect_cycles()
             cycle_str = ", ".join(" -> ".join(cycle) for cycle in cycles)
             raise ValueError(f"Dependency graph contains cycles: {cycle_str}")
 
         return waves
 
+    def ready_set(self, completed: set[str] | None = None) -> ReadySet:
+        """Return an incremental :class:`ReadySet` seeded with ``completed``.
+
+        Use this instead of calling :meth:`get_ready_issues` after every
+        completion: the ready set updates in O(out-degree) per
+        :meth:`ReadySet.mark_completed` rather than rescanning every issue.
+
+        Args:
+            completed: Set of already-completed issue IDs
+
+        Returns:
+            ReadySet over this graph
+        """
+        return ReadySet(self, completed)
+
+    def dependents(self) -> dict[str, set[str]]:
+        """Return prerequisite -> dependents over both edge kinds.
+
+        ``blocks`` already mirrors ``blocked_by``, but ``depends_on_edges`` is
+        one-directional (no reverse edge is built for it), so the reverse map
+        for soft prerequisites is derived here.
+
+        Returns:
+            Mapping from issue_id to the set of issue IDs that wait on it
+        """
+        dependents: dict[str, set[str]] = {
+            issue_id: set(blocked_ids) for issue_id, blocked_ids in self.blocks.items()
+        }
+        for issue_id, prereqs in self.depends_on_edges.items():
+            for prereq_id in prereqs:
+                dependents.setdefault(prereq_id, set()).add(issue_id)
+        return dependents
+
     def is_blocked(self, issue_id: str, completed: set[str] | None = None) -> bool:
         """Check if an issue is still blocked.
 
@@ -334,15 +367,7 @@ class DependencyGraph:
             for issue_id, blockers in self.blocked_by.items()
         }
 
-        # `blocks` already mirrors `blocked_by`, but `depends_on_edges` is
-        # one-directional (no reverse edge is built for it), so derive the
-        # dependent-of map here for the decrement step below.
-        dependents: dict[str, set[str]] = {
-            issue_id: set(blocked_ids) for issue_id, blocked_ids in self.blocks.items()
-        }
-        for issue_id, prereqs in self.depends_on_edges.items():
-            for prereq_id in prereqs:
-                dependents.setdefault(prereq_id, set()).add(issue_id)
+        dependents = self.dependents()
 
         # Start with nodes that have no blockers, sorted by priority
         zero_degree = [
@@ -448,6 +473,84 @@ class DependencyGraph:
         return issue_id in self.issues
 
 
+class ReadySet:
+    """Incrementally maintained set of issues whose prerequisites are complete.
+
+    Seeds one in-degree counter per issue (its ``blocked_by`` and
+    ``depends_on`` prerequisites not yet completed) and decrements the
+    counters of an issue's dependents when it is marked completed, so each
+    completion costs O(out-degree) instead of a full
+    :meth:`DependencyGraph.get_ready_issues` rescan. Readiness matches
+    ``get_ready_issues(completed)`` for the same completed set.
+
+    Attributes:
+        graph: The DependencyGraph this set was built from
+        completed: Issue IDs marked completed so far (including the seed set)
+
+    Example:
+        >>> ready = graph.ready_set(completed={"FEAT-001"})
+        >>> ready.ready()                       # issues runnable now
+        >>> ready.mark_completed("FEAT-002")    # -> issues it unblocked
+    """
+
+    def __init__(self, graph: DependencyGraph, completed: set[str] | None = None) -> None:
+        self.graph = graph
+        self.completed: set[str] = set(completed or ())
+        self._dependents = graph.dependents()
+        self._in_degree: dict[str, int] = {}
+        self._ready: set[str] = set()
+        for issue_id in graph.issues:
+            if issue_id in self.completed:
+                continue
+            prereqs = graph.blocked_by.get(issue_id, set()) | graph.depends_on_edges.get(
+                issue_id, set()
+            )
+            degree = len(prereqs - self.completed)
+            self._in_degree[issue_id] = degree
+            if degree == 0:
+                self._ready.add(issue_id)
+
+    def ready(self) -> list[IssueInfo]:
+        """Return ready, not-yet-completed issues sorted by priority then issue_id."""
+        issues = [self.graph.issues[issue_id] for issue_id in self._ready]
+        issues.sort(key=lambda x: (x.priority_int, x.issue_id))
+        return issues
+
+    def mark_completed(self, issue_id: str) -> list[IssueInfo]:
+        """Record ``issue_id`` as completed and return the issues it unblocked.
+
+        Marking an ID twice, or an ID outside the graph, is allowed; only the
+        first completion of an ID decrements its dependents.
+
+        Args:
+            issue_id: Completed issue ID
+
+        Returns:
+            Issues that became ready because of this completion, sorted by
+            priority then issue_id
+        """
+        if issue_id in self.completed:
+            return []
+        self.completed.add(issue_id)
+        self._ready.discard(issue_id)
+        self._in_degree.pop(issue_id, None)
+        newly_ready: list[IssueInfo] = []
+        for dependent_id in self._dependents.get(issue_id, ()):
+            degree = self._in_degree.get(dependent_id)
+            if degree is None:
+                continue
+            self._in_degree[dependent_id] = degree - 1
+            if degree == 1:
+                self._ready.add(dependent_id)
+                newly_ready.append(self.graph.issues[dependent_id])
+        newly_ready.sort(key=lambda x: (x.priority_int, x.issue_id))
+        return newly_ready
+
+    def remaining(self) -> set[str]:
+        """Return graph issue IDs not yet marked completed (ready or blocked)."""
+        return set(self._in_degree)
+
+
 def refine_waves_for_contention(
     waves: list[list[IssueInfo]],
     *,
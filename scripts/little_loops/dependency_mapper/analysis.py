@@ -8,6 +8,9 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from little_loops.dependency_graph import DependencyGraph
@@ -91,6 +94,10 @@ _MODIFICATION_TYPES: dict[str, frozenset[str]] = {
 }
 
 
+# Below this many issues, process start-up costs more than it saves.
+_POOL_MIN_ISSUES = 64
+
+
 def _basename(path: str) -> str:
     """Extract the basename from a file path."""
     return path.rsplit("/", 1)[-1] if "/" in path else path
@@ -185,6 +192,55 @@ def _classify_modification_type(content: str) -> str:
     return "enhancement"
 
 
+@dataclass(frozen=True)
+class _ConflictSignals:
+    """Per-issue inputs to :func:`compute_conflict_score`, extracted once."""
+
+    targets: frozenset[str]
+    sections: frozenset[str]
+    modification_type: str
+
+
+def _conflict_signals(content: str) -> _ConflictSignals:
+    """Run the semantic-target, section and modification-type extractors."""
+    return _ConflictSignals(
+        targets=frozenset(_extract_semantic_targets(content)),
+        sections=frozenset(_extract_section_mentions(content)),
+        modification_type=_classify_modification_type(content),
+    )
+
+
+def _score_signals(
+    a: _ConflictSignals,
+    b: _ConflictSignals,
+    *,
+    config: DependencyMappingConfig | None = None,
+) -> float:
+    """Combine two issues' extracted signals into a conflict score."""
+    # Resolve scoring weights from config or defaults
+    w_semantic = config.scoring_weights.semantic if config else 0.5
+    w_section = config.scoring_weights.section if config else 0.3
+    w_type = config.scoring_weights.type if config else 0.2
+
+    # Signal 1: Semantic target overlap (0.0 - 1.0)
+    if a.targets and b.targets:
+        target_union = len(a.targets | b.targets)
+        target_score = len(a.targets & b.targets) / target_union if target_union > 0 else 0.0
+    else:
+        target_score = 0.0  # Unknown — default to no conflict
+
+    # Signal 2: Section overlap (0.0 or 1.0)
+    if a.sections and b.sections:
+        section_score = 1.0 if a.sections & b.sections else 0.0
+    else:
+        section_score = 0.0  # Unknown — default to no conflict
+
+    # Signal 3: Modification type match (0.0 or 1.0)
+    type_score = 1.0 if a.modification_type == b.modification_type else 0.0
+
+    return round(target_score * w_semantic + section_score * w_section + type_score * w_type, 2)
+
+
 def compute_conflict_score(
     content_a: str,
     content_b: str,
@@ -207,37 +263,23 @@ def compute_conflict_score(
     Returns:
         Conflict score from 0.0 (parallel-safe) to 1.0 (definite conflict)
     """
-    targets_a = _extract_semantic_targets(content_a)
-    targets_b = _extract_semantic_targets(content_b)
+    return _score_signals(_conflict_signals(content_a), _conflict_signals(content_b), config=config)
 
-    sections_a = _extract_section_mentions(content_a)
-    sections_b = _extract_section_mentions(content_b)
 
-    type_a = _classify_modification_type(content_a)
-    type_b = _classify_modification_type(content_b)
+def _extract_all_signals(contents: dict[str, str], max_workers: int) -> dict[str, _ConflictSignals]:
+    """Extract conflict signals for every issue in *contents*.
 
-    # Resolve scoring weights from config or defaults
-    w_semantic = config.scoring_weights.semantic if config else 0.5
-    w_section = config.scoring_weights.section if config else 0.3
-    w_type = config.scoring_weights.type if config else 0.2
-
-    # Signal 1: Semantic target overlap (0.0 - 1.0)
-    if targets_a and targets_b:
-        target_union = len(targets_a | targets_b)
-        target_score = len(targets_a & targets_b) / target_union if target_union > 0 else 0.0
-    else:
-        target_score = 0.0  # Unknown — default to no conflict
-
-    # Signal 2: Section overlap (0.0 or 1.0)
-    if sections_a and sections_b:
-        section_score = 1.0 if sections_a & sections_b else 0.0
-    else:
-        section_score = 0.0  # Unknown — default to no conflict
-
-    # Signal 3: Modification type match (0.0 or 1.0)
-    type_score = 1.0 if type_a == type_b else 0.0
-
-    return round(target_score * w_semantic + section_score * w_section + type_score * w_type, 2)
+    With ``max_workers > 1`` and enough issues to amortize worker start-up, the
+    regex extraction runs in a process pool; pair scoring afterwards is cheap
+    set arithmetic on the results.
+    """
+    ids = list(contents)
+    if max_workers > 1 and len(ids) >= _POOL_MIN_ISSUES:
+        chunksize = max(1, len(ids) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            signals = pool.map(_conflict_signals, [contents[i] for i in ids], chunksize=chunksize)
+            return dict(zip(ids, signals, strict=True))
+    return {issue_id: _conflict_signals(contents[issue_id]) for issue_id in ids}
 
 
 def find_file_overlaps(
@@ -245,6 +287,7 @@ def find_file_overlaps(
     issue_contents: dict[str, str],
     *,
     config: DependencyMappingConfig | None = None,
+    max_workers: int = 1,
 ) -> tuple[list[DependencyProposal], list[ParallelSafePair]]:
     """Find issues that reference overlapping files and propose dependencies.
 
@@ -252,13 +295,18 @@ def find_file_overlaps(
     a semantic conflict score. High-conflict pairs get dependency proposals;
     low-conflict pairs are reported as parallel-safe.
 
-    Pairs that already have a dependency relationship are skipped.
+    Pairs that already have a dependency relationship are skipped. Candidate
+    pairs come from a path → issues index, so only issues that reference a
+    common file are ever compared, and each issue's conflict signals are
+    extracted once no matter how many pairs it appears in.
 
     Args:
         issues: List of parsed issue objects
         issue_contents: Mapping from issue_id to file content
         config: Optional dependency mapping config for custom thresholds.
             Falls back to hardcoded defaults when not provided.
+        max_workers: Processes used to extract conflict signals. ``1`` (the
+            default) extracts in-process.
 
     Returns:
         Tuple of (proposed dependencies, parallel-safe pairs)
@@ -300,113 +348,130 @@ def find_file_overlaps(
             if filtered:
                 issue_paths[issue.issue_id] = filtered
 
-    proposals: list[DependencyProposal] = []
-    parallel_safe: list[ParallelSafePair] = []
-    issue_ids = sorted(issue_paths.keys())
-
-    _type_order = {"structural": 0, "infrastructure": 1, "enhancement": 2}
-
-    for i, id_a in enumerate(issue_ids):
-        for id_b in issue_ids[i + 1 :]:
-            overlap = issue_paths[id_a] & issue_paths[id_b]
-            if not overlap:
-                continue
-
+    # Inverted index: path -> issues referencing it. Counting co-references
+    # per issue yields exactly the overlapping pairs, with their overlap size.
+    path_index: dict[str, list[str]] = {}
+    for issue_id in sorted(issue_paths):
+        for path in issue_paths[issue_id]:
+            path_index.setdefault(path, []).append(issue_id)
+
+    candidate_pairs: list[tuple[str, str]] = []
+    for id_a in sorted(issue_paths):
+        shared_counts: Counter[str] = Counter()
+        for path in issue_paths[id_a]:
+            for id_b in path_index[path]:
+                if id_b > id_a:
+                    shared_counts[id_b] += 1
+        for id_b in sorted(shared_counts):
+            overlap_count = shared_counts[id_b]
             # Apply minimum overlap guards (matching FileHints.overlaps_with)
             smaller_set = min(len(issue_paths[id_a]), len(issue_paths[id_b]))
-            ratio = len(overlap) / smaller_set if smaller_set > 0 else 0.0
-            if len(overlap) < min_files or ratio < min_ratio:
+            ratio = overlap_count / smaller_set if smaller_set > 0 else 0.0
+            if overlap_count < min_files or ratio < min_ratio:
                 continue
-
             # Skip if dependency already exists (in either direction)
             if (id_a, id_b) in existing_deps or (id_b, id_a) in existing_deps:
                 continue
+            candidate_pairs.append((id_a, id_b))
 
-            content_a = issue_contents.get(id_a, "")
-            content_b = issue_contents.get(id_b, "")
-            conflict = compute_conflict_score(content_a, content_b, config=config)
+    scored_ids = {i for pair in candidate_pairs for i in pair}
+    signals = _extract_all_signals(
+        {i: issue_contents.get(i, "") for i in sorted(scored_ids)}, max_workers
+    )
+    issue_map: dict[str, IssueInfo] = {}
+    for issue in issues:
+        issue_map.setdefault(issue.issue_id, issue)
 
-            overlap_list = sorted(overlap)
+    proposals: list[DependencyProposal] = []
+    parallel_safe: list[ParallelSafePair] = []
 
-            # Resolve conflict threshold from config or default
-            conflict_threshold = config.conflict_threshold if config else 0.4
+    _type_order = {"structural": 0, "infrastructure": 1, "enhancement": 2}
 
-            # Low-conflict pairs are parallel-safe
-            if conflict < conflict_threshold:
-                sections_a = _extract_section_mentions(content_a)
-                sections_b = _extract_section_mentions(content_b)
-                if sections_a and sections_b:
-                    reason = (
-                        f"Different sections ({', '.join(sorted(sections_a))}"
-                        f" vs {', '.join(sorted(sections_b))})"
-                    )
-                else:
-                    reason = "Low semantic conflict score"
-                parallel_safe.append(
-                    ParallelSafePair(
-                        issue_a=id_a,
-                        issue_b=id_b,
-                        shared_files=overlap_list,
-                        conflict_score=conflict,
-                        reason=reason,
-                    )
+    # Resolve conflict threshold from config or default
+    conflict_threshold = config.conflict_threshold if config else 0.4
+
+    for id_a, id_b in candidate_pairs:
+        overlap = issue_paths[id_a] & issue_paths[id_b]
+        signals_a = signals[id_a]
+        signals_b = signals[id_b]
+        conflict = _score_signals(signals_a, signals_b, config=config)
+
+        overlap_list = sorted(overlap)
+
+        # Low-conflict pairs are parallel-safe
+        if conflict < conflict_threshold:
+            sections_a = signals_a.sections
+            sections_b = signals_b.sections
+            if sections_a and sections_b:
+                reason = (
+                    f"Different sections ({', '.join(sorted(sections_a))}"
+                    f" vs {', '.join(sorted(sections_b))})"
                 )
-                continue
+            else:
+                reason = "Low semantic conflict score"
+            parallel_safe.append(
+                ParallelSafePair(
+                    issue_a=id_a,
+                    issue_b=id_b,
+                    shared_files=overlap_list,
+                    conflict_score=conflict,
+                    reason=reason,
+                )
+            )
+            continue
 
-            # Determine direction for high-conflict pairs
-            issue_a = next(iss for iss in issues if iss.issue_id == id_a)
-            issue_b = next(iss for iss in issues if iss.issue_id == id_b)
+        # Determine direction for high-conflict pairs
+        issue_a = issue_map[id_a]
+        issue_b = issue_map[id_b]
 
-            confidence_modifier = 1.0
+        confidence_modifier = 1.0
 
-            if issue_a.priority_int != issue_b.priority_int:
-                # Different priorities: higher priority blocks lower
-                if issue_a.priority_int < issue_b.priority_int:
+        if issue_a.priority_int != issue_b.priority_int:
+            # Different priorities: higher priority blocks lower
+            if issue_a.priority_int < issue_b.priority_int:
+                target_id, source_id = id_a, id_b
+            else:
+                target_id, source_id = id_b, id_a
+        else:
+            # Same priority: use modification type ordering
+            order_a = _type_order.get(signals_a.modification_type, 2)
+            order_b = _type_order.get(signals_b.modification_type, 2)
+
+            if order_a != order_b:
+                if order_a < order_b:
                     target_id, source_id = id_a, id_b
                 else:
                     target_id, source_id = id_b, id_a
             else:
-                # Same priority: use modification type ordering
-                type_a = _classify_modification_type(content_a)
-                type_b = _classify_modification_type(content_b)
-                order_a = _type_order.get(type_a, 2)
-                order_b = _type_order.get(type_b, 2)
-
-                if order_a != order_b:
-                    if order_a < order_b:
-                        target_id, source_id = id_a, id_b
-                    else:
-                        target_id, source_id = id_b, id_a
+                # Fall back to ID ordering with reduced confidence
+                if id_a < id_b:
+                    target_id, source_id = id_a, id_b
                 else:
-                    # Fall back to ID ordering with reduced confidence
-                    if id_a < id_b:
-                        target_id, source_id = id_a, id_b
-                    else:
-                        target_id, source_id = id_b, id_a
-                    confidence_modifier = config.confidence_modifier if config else 0.5
-
-            min_paths = min(len(issue_paths[id_a]), len(issue_paths[id_b]))
-            confidence = len(overlap) / min_paths if min_paths > 0 else 0.0
-            confidence *= confidence_modifier
-
-            rationale = (
-                f"{source_id} and {target_id} both reference "
-                f"{', '.join(overlap_list[:3])}"
-                f"{' and more' if len(overlap_list) > 3 else ''}. "
-                f"{target_id} has higher priority and should be completed first."
-            )
+                    target_id, source_id = id_b, id_a
+                confidence_modifier = config.confidence_modifier if config else 0.5
 
-            proposals.append(
-                DependencyProposal(
-                    source_id=source_id,
-                    target_id=target_id,
-                    reason="file_overlap",
-                    confidence=round(confidence, 2),
-                    rationale=rationale,
-                    overlapping_files=overlap_list,
-                    conflict_score=conflict,
-                )
+        min_paths = min(len(issue_paths[id_a]), len(issue_paths[id_b]))
+        confidence = len(overlap) / min_paths if min_paths > 0 else 0.0
+        confidence *= confidence_modifier
+
+        rationale = (
+            f"{source_id} and {target_id} both reference "
+            f"{', '.join(overlap_list[:3])}"
+            f"{' and more' if len(overlap_list) > 3 else ''}. "
+            f"{target_id} has higher priority and should be completed first."
+        )
+
+        proposals.append(
+            DependencyProposal(
+                source_id=source_id,
+                target_id=target_id,
+                reason="file_overlap",
+                confidence=round(confidence, 2),
+                rationale=rationale,
+                overlapping_files=overlap_list,
+                conflict_score=conflict,
             )
+        )
 
     # Sort by confidence descending
     proposals.sort(key=lambda p: -p.confidence)
@@ -522,6 +587,7 @@ def analyze_dependencies(
     all_known_ids: set[str] | None = None,
     *,
     config: DependencyMappingConfig | None = None,
+    max_workers: int = 1,
 ) -> DependencyReport:
     """Run full dependency analysis: discovery and validation.
 
@@ -531,11 +597,15 @@ def analyze_dependencies(
         completed_ids: Set of completed issue IDs
         all_known_ids: Set of all issue IDs that exist on disk
         config: Optional dependency mapping config for custom thresholds.
+        max_workers: Processes used for conflict scoring (see
+            :func:`find_file_overlaps`).
 
     Returns:
         Comprehensive dependency report
     """
-    proposals, parallel_safe = find_file_overlaps(issues, issue_contents, config=config)
+    proposals, parallel_safe = find_file_overlaps(
+        issues, issue_contents, config=config, max_workers=max_workers
+    )
     validation = validate_dependencies(issues, completed_ids, all_known_ids)
 
     existing_dep_count = sum(len(issue.blocked_by) for issue in issues)
@@ -14,6 +14,8 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
+import os
+import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -27,6 +29,17 @@ logger = logging.getLogger(__name__)
 # Type for event callback (matches existing EventCallback in fsm/executor.py)
 EventCallback = Callable[[dict[str, Any]], None]
 
+# Upper bound on cached per-event-type dispatch entries. Event types are a small
+# fixed vocabulary in practice; the cap only guards against an emitter that
+# puts unbounded values (ids, paths) in the ``"event"`` key.
+_DISPATCH_CACHE_MAX = 512
+
+
+def _compile_filter(patterns: list[str]) -> Callable[[str], re.Match[str] | None]:
+    """Compile glob *patterns* into one matcher with ``fnmatch.fnmatch`` semantics."""
+    regex = "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    return re.compile(regex or "(?!)").match
+
 
 @dataclass
 class LLEvent:
@@ -72,10 +85,20 @@ class EventBus:
 
     Dispatches event dicts to all registered observers. Exceptions in individual
     observers are caught and logged, not propagated.
+
+    Observer filters are compiled once at registration, and the observers that
+    match a given event type are resolved on the first event of that type and
+    cached until the observer set changes, so ``emit()`` costs one dict lookup
+    plus the callbacks themselves. Registration swaps in new lists rather than
+    mutating them, so emitting from several threads (``ll-parallel`` workers)
+    never observes a half-updated observer list.
     """
 
     def __init__(self) -> None:
-        self._observers: list[tuple[EventCallback, list[str] | None]] = []
+        self._observers: list[
+            tuple[EventCallback, Callable[[str], re.Match[str] | None] | None]
+        ] = []
+        self._dispatch: dict[str, tuple[EventCallback, ...]] = {}
         self._transports: list[Transport] = []
 
     def register(self, callback: EventCallback, filter: str | list[str] | None = None) -> None:
@@ -90,21 +113,43 @@ class EventBus:
                 FSM executor events use bare names (``"state_enter"``, ``"loop_*"``);
                 other subsystems use dotted namespaces (``"issue.*"``, ``"parallel.*"``).
         """
-        patterns: list[str] | None = None
+        matcher = None
         if filter is not None:
-            patterns = [filter] if isinstance(filter, str) else list(filter)
-        self._observers.append((callback, patterns))
+            matcher = _compile_filter([filter] if isinstance(filter, str) else list(filter))
+        self._observers = [*self._observers, (callback, matcher)]
+        self._dispatch = {}
 
     def unregister(self, callback: EventCallback) -> None:
         """Remove an observer. No-op if not registered."""
         for i, (cb, _) in enumerate(self._observers):
             if cb is callback:
-                del self._observers[i]
+                self._observers = self._observers[:i] + self._observers[i + 1 :]
+                self._dispatch = {}
                 return
 
-    def add_transport(self, transport: Transport) -> None:
-        """Register a Transport to receive every emitted event."""
-        self._transports.append(transport)
+    def add_transport(
+        self,
+        transport: Transport,
+        *,
+        async_dispatch: bool = False,
+        max_queue: int = 1024,
+    ) -> None:
+        """Register a Transport to receive every emitted event.
+
+        Args:
+            transport: Sink to register.
+            async_dispatch: When ``True`` the transport is wrapped in a
+                :class:`~little_loops.transport.QueuedTransport`, so ``emit()``
+                only enqueues and delivery happens on the transport's own
+                thread. Use for sinks that may be slow; a full queue drops
+                events for that sink rather than stalling the emitter.
+            max_queue: Queue bound for ``async_dispatch`` transports.
+        """
+        if async_dispatch:
+            from little_loops.transport import QueuedTransport
+
+            transport = QueuedTransport(transport, max_queue=max_queue)
+        self._transports = [*self._transports, transport]
 
     def close_transports(self) -> None:
         """Call ``close()`` on every registered transport, isolating exceptions."""
@@ -114,6 +159,22 @@ class EventBus:
             except Exception:
                 logger.warning("EventBus transport close raised an exception", exc_info=True)
 
+    def _observers_for(self, event_type: str) -> tuple[EventCallback, ...]:
+        """Resolve (and cache) the observers whose filters accept *event_type*."""
+        dispatch = self._dispatch
+        observers = dispatch.get(event_type)
+        if observers is None:
+            name = os.path.normcase(event_type)
+            observers = tuple(
+                callback
+                for callback, matcher in self._observers
+                if matcher is None or matcher(name)
+            )
+            if len(dispatch) >= _DISPATCH_CACHE_MAX:
+                dispatch.clear()
+            dispatch[event_type] = observers
+        return observers
+
     def emit(self, event: dict[str, Any]) -> None:
         """Dispatch event to all observers and transports.
 
@@ -121,11 +182,9 @@ class EventBus:
         sink from blocking others.
         """
         event_type = event.get("event", "")
-        for observer, filter_patterns in self._observers:
-            if filter_patterns is not None and not any(
-                fnmatch.fnmatch(event_type, p) for p in filter_patterns
-            ):
-                continue
+        if not isinstance(event_type, str):
+            event_type = str(event_type)
+        for observer in self._observers_for(event_type):
             try:
                 observer(event)
             except Exception:
@@ -6,11 +6,12 @@ import fcntl
 import json
 import os
 import tempfile
+import threading
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 
 def atomic_write(path: Path, content: str, encoding: str = "utf-8") -> None:
@@ -120,3 +121,172 @@ def acquire_lock(path: Path, timeout: float = 10.0) -> Generator[None, None, Non
                 fcntl.flock(lock_fd, fcntl.LOCK_UN)
             except OSError:
                 pass
+
+
+JSONL_DURABILITY_POLICIES: tuple[str, ...] = (
+    "every_event",
+    "every_n",
+    "interval_ms",
+    "on_state_transition",
+)
+
+
+class BufferedJsonlWriter:
+    """Long-lived append-only JSONL writer with a configurable durability policy.
+
+    Rows are serialized into an in-memory buffer and written to one open file
+    handle (``O_APPEND``) at *sync points*; with ``fsync=True`` every sync point
+    is also ``flush()`` + ``os.fsync()``. The policy decides when a sync point
+    happens:
+
+    - ``every_event``: after every row (the pre-buffering behavior).
+    - ``every_n``: once *every_n* rows are buffered.
+    - ``interval_ms``: *interval_ms* after the first buffered row, driven by a
+      lazily started daemon thread so a quiet writer does not strand rows.
+    - ``on_state_transition``: only at rows whose ``event`` is in
+      *durable_events*.
+
+    Under **every** policy a row whose ``event`` is in *durable_events* is a
+    sync point, so those rows (and everything buffered before them) survive a
+    SIGKILL; only rows between them are at risk. :meth:`sync` and
+    :meth:`close` force a sync point. The handle is reopened if the file is
+    unlinked or replaced underneath it (e.g. an events file cleared by another
+    process), so rows never land in an orphaned inode.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        policy: str = "every_event",
+        every_n: int = 100,
+        interval_ms: int = 250,
+        fsync: bool = False,
+        durable_events: Iterable[str] = (),
+    ) -> None:
+        if policy not in JSONL_DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown JSONL durability policy {policy!r}; "
+                f"expected one of {list(JSONL_DURABILITY_POLICIES)}"
+            )
+        self.path = path
+        self.policy = policy
+        self._every_n = max(1, every_n)
+        self._interval_s = max(0, interval_ms) / 1000.0
+        self._fsync = fsync
+        self._durable_events = frozenset(durable_events)
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._file: IO[str] | None = None
+        self._closed = False
+        self._wake = threading.Event()
+        self._timer: threading.Thread | None = None
+
+    def write(self, entry: dict[str, Any]) -> None:
+        """Buffer one row, writing it out if the policy makes this a sync point."""
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                # Create the file on the first row even when it is buffered, so
+                # "a run has an event log" stays observable from the outside.
+                self._open_locked()
+            self._pending.append(line)
+            if self._closed:
+                # Late rows after close() are written through, like the
+                # open-append-close writes this class replaced.
+                try:
+                    self._sync_locked()
+                finally:
+                    self._close_file_locked()
+                return
+            if (
+                self.policy == "every_event"
+                or entry.get("event") in self._durable_events
+                or (self.policy == "every_n" and len(self._pending) >= self._every_n)
+            ):
+                self._sync_locked()
+                return
+        if self.policy == "interval_ms":
+            self._arm_timer()
+
+    def sync(self) -> None:
+        """Write out every buffered row now (and fsync, if enabled)."""
+        with self._lock:
+            self._sync_locked()
+
+    def close(self) -> None:
+        """Sync buffered rows, stop the interval thread and close the handle."""
+        with self._lock:
+            self._closed = True
+            self._wake.set()
+            try:
+                self._sync_locked()
+            finally:
+                self._close_file_locked()
+
+    def release(self) -> None:
+        """Sync and close the handle but keep accepting rows (reopened on demand).
+
+        Used before the file is copied, moved or unlinked by its owner.
+        """
+        with self._lock:
+            try:
+                self._sync_locked()
+            finally:
+                self._close_file_locked()
+
+    def _sync_locked(self) -> None:
+        if not self._pending:
+            return
+        f = self._open_locked()
+        f.write("".join(self._pending))
+        self._pending.clear()
+        f.flush()
+        if self._fsync:
+            os.fsync(f.fileno())
+
+    def _open_locked(self) -> IO[str]:
+        f = self._file
+        if f is not None:
+            try:
+                stale = os.fstat(f.fileno()).st_nlink == 0
+            except OSError:
+                stale = True
+            if not stale:
+                return f
+            self._close_file_locked()
+        f = self._file = open(self.path, "a", encoding="utf-8")
+        return f
+
+    def _close_file_locked(self) -> None:
+        f, self._file = self._file, None
+        if f is not None:
+            try:
+                f.close()
+            except OSError:
+                pass
+
+    def _arm_timer(self) -> None:
+        if self._timer is None:
+            with self._lock:
+                if self._timer is None and not self._closed:
+                    self._timer = threading.Thread(
+                        target=self._timer_loop, name="jsonl-writer-interval", daemon=True
+                    )
+                    self._timer.start()
+        self._wake.set()
+
+    def _timer_loop(self) -> None:
+        while True:
+            self._wake.wait()
+            if self._closed:
+                return
+            time.sleep(self._interval_s)
+            with self._lock:
+                self._wake.clear()
+                if self._closed:
+                    return
+                try:
+                    self._sync_locked()
+                except OSError:
+                    pass
@@ -147,10 +147,148 @@ def _normalize_loaded_mapping(loaded: dict[Any, Any], *, coerce_types: bool) ->
     return result
 
 
+# libyaml's BaseLoader when PyYAML was built with it. It disagrees with the
+# pure-Python loader on tags, on a comment glued to a block scalar header and
+# on the characters ``_NOT_SIMPLE_RE`` screens for, so text containing any of
+# those always takes the pure loader.
+_BASE_LOADER: Any = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+_LIBYAML_DIVERGES_RE = re.compile(r"!|[|>][-+0-9]*#")
+
+# The strict fast path below handles only the subset of YAML that issue
+# frontmatter is written in — top-level ``key: scalar`` lines (including the
+# wrapped plain scalars ``yaml.dump`` emits for long titles), ``key: []`` /
+# ``key: [a, b]`` flow lists and ``key:`` followed by ``- scalar`` items —
+# where the BaseLoader result is unambiguous. Anything else makes the scanner
+# give up so the real loader decides, keeping the two byte-for-byte equivalent.
+_SIMPLE_KEY_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_.-]*):(?: +(.*))?")
+_SIMPLE_ITEM_RE = re.compile(r"( *)- +(.*)")
+# Plain scalars may not start with a YAML indicator character.
+_PLAIN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+_FLOW_SPECIALS = frozenset(",[]{}:#'\"")
+# Anything PyYAML's reader rejects, plus the characters that change scanning:
+# tab, CR, BOM and the NEL/LS/PS line breaks.
+_NOT_SIMPLE_RE = re.compile(
+    r"[^\n\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD\U00010000-\U0010FFFF]"
+)
+
+
+def _simple_plain(value: str) -> str | None:
+    """Return *value* if it is unambiguously a one-line plain scalar."""
+    if (
+        not value
+        or value[0] in _PLAIN_INDICATORS
+        or ": " in value
+        or " #" in value
+        or value.endswith(":")
+    ):
+        return None
+    return value
+
+
+def _simple_scalar(raw: str) -> str | None:
+    """Return the BaseLoader value of a one-line scalar, or ``None`` if unsure."""
+    value = raw.rstrip(" ")
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        inner = value[1:-1]
+        return None if "'" in inner.replace("''", "") else inner.replace("''", "'")
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        inner = value[1:-1]
+        return None if '"' in inner or "\\" in inner else inner
+    return _simple_plain(value)
+
+
+def _simple_flow_list(value: str) -> list[str] | None:
+    """Return the items of a one-line ``[a, b]`` of plain words, or ``None``."""
+    if value == "[]":
+        return []
+    if not (value.startswith("[") and value.endswith("]")):
+        return None
+    items = [item.strip(" ") for item in value[1:-1].split(",")]
+    for item in items:
+        if (
+            not item
+            or item[0] in _PLAIN_INDICATORS
+            or " #" in item
+            or any(c in _FLOW_SPECIALS for c in item)
+        ):
+            return None
+    return items
+
+
+def _scan_simple_block(text: str) -> dict[str, Any] | None:
+    """Parse *text* if it is in the simple frontmatter subset, else ``None``.
+
+    Returns exactly what ``yaml.load(text, Loader=yaml.BaseLoader)`` would for
+    that subset: every value a ``str`` (``""`` for a bare ``key:``) or a
+    ``list[str]``. Block scalars, nested mappings, inline comments, escapes,
+    anchors, tags and multi-line quoted scalars are all left to the real
+    loader.
+    """
+    if _NOT_SIMPLE_RE.search(text):
+        return None
+    result: dict[str, Any] = {}
+    list_key: str | None = None  # bare ``key:`` that may own ``- item`` lines
+    item_indent: str | None = None
+    plain_key: str | None = None  # key whose plain scalar may wrap onto the next line
+    for line in text.split("\n"):
+        if not line.strip(" ") or line.startswith("#"):
+            # A blank line inside a wrapped scalar means a newline, not a space.
+            plain_key = None
+            continue
+        if list_key is not None:
+            item = _SIMPLE_ITEM_RE.fullmatch(line)
+            if item is not None:
+                if item_indent is None:
+                    item_indent = item.group(1)
+                value = _simple_scalar(item.group(2))
+                if item.group(1) != item_indent or value is None:
+                    return None
+                if not isinstance(result[list_key], list):
+                    result[list_key] = []
+                result[list_key].append(value)
+                continue
+        if plain_key is not None and line.startswith(" "):
+            value = _simple_plain(line.strip(" "))
+            if value is None:
+                return None
+            result[plain_key] += " " + value
+            continue
+        match = _SIMPLE_KEY_RE.fullmatch(line)
+        if match is None:
+            return None
+        key, raw = match.group(1), (match.group(2) or "").rstrip(" ")
+        list_key = plain_key = None
+        if not raw:
+            result[key] = ""
+            list_key, item_indent = key, None
+            continue
+        flow = _simple_flow_list(raw) if raw.startswith("[") else None
+        if flow is not None:
+            result[key] = flow
+            continue
+        value = _simple_scalar(raw)
+        if value is None:
+            return None
+        result[key] = value
+        if raw[0] not in "'\"":
+            plain_key = key
+    return result or None
+
+
+def _load_mapping(text: str) -> Any:
+    """``yaml.load(text, Loader=BaseLoader)``, via the fast path when it applies."""
+    simple = _scan_simple_block(text)
+    if simple is not None:
+        return simple
+    if _NOT_SIMPLE_RE.search(text) or _LIBYAML_DIVERGES_RE.search(text):
+        return yaml.load(text, Loader=yaml.BaseLoader)
+    return yaml.load(text, Loader=_BASE_LOADER)
+
+
 def _parse_block_data(text: str, *, coerce_types: bool) -> dict[str, Any]:
     """Parse one block's raw YAML text, falling back to the permissive line scan."""
     try:
-        loaded = yaml.load(text, Loader=yaml.BaseLoader)
+        loaded = _load_mapping(text)
     except yaml.YAMLError:
         loaded = None
     if not isinstance(loaded, dict):
@@ -203,7 +341,7 @@ def _iter_frontmatter_blocks(content: str, *, coerce_types: bool = False) -> lis
             is_first = False
         else:
             try:
-                loaded = yaml.load(body_text, Loader=yaml.BaseLoader)
+                loaded = _load_mapping(body_text)
             except yaml.YAMLError:
                 continue
             if not isinstance(loaded, dict):
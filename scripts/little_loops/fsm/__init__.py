@@ -73,99 +73,196 @@ Public exports:
     RateLimitCircuit: Shared circuit-breaker state for cross-worktree 429 coordination
 """
 
-from little_loops.ab_writer import ABResults, calculate_ab_summary, write_ab_json
-from little_loops.fsm.concurrency import (
-    LockManager,
-    ScopeLock,
-    resolve_scope,
-)
-from little_loops.fsm.cost_graph import CostReport, PerStateCost
-from little_loops.fsm.evaluators import (
-    DEFAULT_LLM_PROMPT,
-    DEFAULT_LLM_SCHEMA,
-    EvaluationResult,
-    evaluate,
-    evaluate_blind_comparator,
-    evaluate_comparator,
-    evaluate_contract,
-    evaluate_convergence,
-    evaluate_exit_code,
-    evaluate_llm_structured,
-    evaluate_output_contains,
-    evaluate_output_json,
-    evaluate_output_numeric,
-)
-from little_loops.fsm.executor import (
-    PROMPT_SIZE_WARN_EVENT,
-    RATE_LIMIT_EXHAUSTED_EVENT,
-    RATE_LIMIT_STORM_EVENT,
-    RATE_LIMIT_WAITING_EVENT,
-    STALL_DETECTED_EVENT,
-    THROTTLE_HARD_EVENT,
-    THROTTLE_STOP_EVENT,
-    THROTTLE_WARN_EVENT,
-    ActionResult,
-    ActionRunner,
-    EventCallback,
-    ExecutionResult,
-    FSMExecutor,
-    RouteContext,
-    RouteDecision,
-)
-from little_loops.fsm.handoff_handler import (
-    HandoffBehavior,
-    HandoffHandler,
-    HandoffResult,
-)
-from little_loops.fsm.interpolation import (
-    InterpolationContext,
-    InterpolationError,
-    interpolate,
-    interpolate_dict,
-)
-from little_loops.fsm.persistence import (
-    RESUMABLE_STATUSES,
-    LoopState,
-    PersistentExecutor,
-    StatePersistence,
-    get_loop_history,
-    list_running_loops,
-)
-from little_loops.fsm.rate_limit_circuit import RateLimitCircuit
-from little_loops.fsm.schema import (
-    DEFAULT_LLM_MODEL,
-    CircuitConfig,
-    CommandEntry,
-    CostCeilingConfig,
-    EvaluateConfig,
-    FSMLoop,
-    LearningConfig,
-    LLMConfig,
-    ParameterSpec,
-    PromptSizeGuardConfig,
-    RepeatedFailureConfig,
-    RouteConfig,
-    StateConfig,
-    TargetFileSpec,
-    TargetStateSpec,
-    ThrottleConfig,
-)
-from little_loops.fsm.signal_detector import (
-    ERROR_SIGNAL,
-    HANDOFF_SIGNAL,
-    STOP_SIGNAL,
-    DetectedSignal,
-    SignalDetector,
-    SignalPattern,
-)
-from little_loops.fsm.stall_detector import Stall, StallDetector
-from little_loops.fsm.types import Evaluator
-from little_loops.fsm.validation import (
-    ValidationError,
-    is_runnable_loop,
-    load_and_validate,
-    validate_fsm,
-)
+from typing import TYPE_CHECKING, Any
+
+from little_loops._lazy import export_dir, load_export
+
+if TYPE_CHECKING:
+    from little_loops.ab_writer import ABResults, calculate_ab_summary, write_ab_json
+    from little_loops.fsm.concurrency import (
+        LockManager,
+        ScopeLock,
+        resolve_scope,
+    )
+    from little_loops.fsm.cost_graph import CostReport, PerStateCost
+    from little_loops.fsm.evaluators import (
+        DEFAULT_LLM_PROMPT,
+        DEFAULT_LLM_SCHEMA,
+        EvaluationResult,
+        evaluate,
+        evaluate_blind_comparator,
+        evaluate_comparator,
+        evaluate_contract,
+        evaluate_convergence,
+        evaluate_exit_code,
+        evaluate_llm_structured,
+        evaluate_output_contains,
+        evaluate_output_json,
+        evaluate_output_numeric,
+    )
+    from little_loops.fsm.executor import (
+        PROMPT_SIZE_WARN_EVENT,
+        RATE_LIMIT_EXHAUSTED_EVENT,
+        RATE_LIMIT_STORM_EVENT,
+        RATE_LIMIT_WAITING_EVENT,
+        STALL_DETECTED_EVENT,
+        THROTTLE_HARD_EVENT,
+        THROTTLE_STOP_EVENT,
+        THROTTLE_WARN_EVENT,
+        ActionResult,
+        ActionRunner,
+        EventCallback,
+        ExecutionResult,
+        FSMExecutor,
+        RouteContext,
+        RouteDecision,
+    )
+    from little_loops.fsm.handoff_handler import (
+        HandoffBehavior,
+        HandoffHandler,
+        HandoffResult,
+    )
+    from little_loops.fsm.interpolation import (
+        InterpolationContext,
+        InterpolationError,
+        interpolate,
+        interpolate_dict,
+    )
+    from little_loops.fsm.persistence import (
+        RESUMABLE_STATUSES,
+        LoopState,
+        PersistentExecutor,
+        StatePersistence,
+        get_loop_history,
+        list_running_loops,
+    )
+    from little_loops.fsm.rate_limit_circuit import RateLimitCircuit
+    from little_loops.fsm.schema import (
+        DEFAULT_LLM_MODEL,
+        CircuitConfig,
+        CommandEntry,
+        CostCeilingConfig,
+        EvaluateConfig,
+        FSMLoop,
+        LearningConfig,
+        LLMConfig,
+        ParameterSpec,
+        PromptSizeGuardConfig,
+        RepeatedFailureConfig,
+        RouteConfig,
+        StateConfig,
+        TargetFileSpec,
+        TargetStateSpec,
+        ThrottleConfig,
+    )
+    from little_loops.fsm.signal_detector import (
+        ERROR_SIGNAL,
+        HANDOFF_SIGNAL,
+        STOP_SIGNAL,
+        DetectedSignal,
+        SignalDetector,
+        SignalPattern,
+    )
+    from little_loops.fsm.stall_detector import Stall, StallDetector
+    from little_loops.fsm.types import Evaluator
+    from little_loops.fsm.validation import (
+        ValidationError,
+        is_runnable_loop,
+        load_and_validate,
+        validate_fsm,
+    )
+
+# Resolved on first attribute access (see little_loops._lazy).
+_EXPORTS: dict[str, str] = {
+    "ABResults": "little_loops.ab_writer",
+    "calculate_ab_summary": "little_loops.ab_writer",
+    "write_ab_json": "little_loops.ab_writer",
+    "LockManager": "little_loops.fsm.concurrency",
+    "ScopeLock": "little_loops.fsm.concurrency",
+    "resolve_scope": "little_loops.fsm.concurrency",
+    "CostReport": "little_loops.fsm.cost_graph",
+    "PerStateCost": "little_loops.fsm.cost_graph",
+    "DEFAULT_LLM_PROMPT": "little_loops.fsm.evaluators",
+    "DEFAULT_LLM_SCHEMA": "little_loops.fsm.evaluators",
+    "EvaluationResult": "little_loops.fsm.evaluators",
+    "evaluate": "little_loops.fsm.evaluators",
+    "evaluate_blind_comparator": "little_loops.fsm.evaluators",
+    "evaluate_comparator": "little_loops.fsm.evaluators",
+    "evaluate_contract": "little_loops.fsm.evaluators",
+    "evaluate_convergence": "little_loops.fsm.evaluators",
+    "evaluate_exit_code": "little_loops.fsm.evaluators",
+    "evaluate_llm_structured": "little_loops.fsm.evaluators",
+    "evaluate_output_contains": "little_loops.fsm.evaluators",
+    "evaluate_output_json": "little_loops.fsm.evaluators",
+    "evaluate_output_numeric": "little_loops.fsm.evaluators",
+    "PROMPT_SIZE_WARN_EVENT": "little_loops.fsm.executor",
+    "RATE_LIMIT_EXHAUSTED_EVENT": "little_loops.fsm.executor",
+    "RATE_LIMIT_STORM_EVENT": "little_loops.fsm.executor",
+    "RATE_LIMIT_WAITING_EVENT": "little_loops.fsm.executor",
+    "STALL_DETECTED_EVENT": "little_loops.fsm.executor",
+    "THROTTLE_HARD_EVENT": "little_loops.fsm.executor",
+    "THROTTLE_STOP_EVENT": "little_loops.fsm.executor",
+    "THROTTLE_WARN_EVENT": "little_loops.fsm.executor",
+    "ActionResult": "little_loops.fsm.executor",
+    "ActionRunner": "little_loops.fsm.executor",
+    "EventCallback": "little_loops.fsm.executor",
+    "ExecutionResult": "little_loops.fsm.executor",
+    "FSMExecutor": "little_loops.fsm.executor",
+    "RouteContext": "little_loops.fsm.executor",
+    "RouteDecision": "little_loops.fsm.executor",
+    "HandoffBehavior": "little_loops.fsm.handoff_handler",
+    "HandoffHandler": "little_loops.fsm.handoff_handler",
+    "HandoffResult": "little_loops.fsm.handoff_handler",
+    "InterpolationContext": "little_loops.fsm.interpolation",
+    "InterpolationError": "little_loops.fsm.interpolation",
+    "interpolate": "little_loops.fsm.interpolation",
+    "interpolate_dict": "little_loops.fsm.interpolation",
+    "RESUMABLE_STATUSES": "little_loops.fsm.persistence",
+    "LoopState": "little_loops.fsm.persistence",
+    "PersistentExecutor": "little_loops.fsm.persistence",
+    "StatePersistence": "little_loops.fsm.persistence",
+    "get_loop_history": "little_loops.fsm.persistence",
+    "list_running_loops": "little_loops.fsm.persistence",
+    "RateLimitCircuit": "little_loops.fsm.rate_limit_circuit",
+    "DEFAULT_LLM_MODEL": "little_loops.fsm.schema",
+    "CircuitConfig": "little_loops.fsm.schema",
+    "CommandEntry": "little_loops.fsm.schema",
+    "CostCeilingConfig": "little_loops.fsm.schema",
+    "EvaluateConfig": "little_loops.fsm.schema",
+    "FSMLoop": "little_loops.fsm.schema",
+    "LearningConfig": "little_loops.fsm.schema",
+    "LLMConfig": "little_loops.fsm.schema",
+    "ParameterSpec": "little_loops.fsm.schema",
+    "PromptSizeGuardConfig": "little_loops.fsm.schema",
+    "RepeatedFailureConfig": "little_loops.fsm.schema",
+    "RouteConfig": "little_loops.fsm.schema",
+    "StateConfig": "little_loops.fsm.schema",
+    "TargetFileSpec": "little_loops.fsm.schema",
+    "TargetStateSpec": "little_loops.fsm.schema",
+    "ThrottleConfig": "little_loops.fsm.schema",
+    "ERROR_SIGNAL": "little_loops.fsm.signal_detector",
+    "HANDOFF_SIGNAL": "little_loops.fsm.signal_detector",
+    "STOP_SIGNAL": "little_loops.fsm.signal_detector",
+    "DetectedSignal": "little_loops.fsm.signal_detector",
+    "SignalDetector": "little_loops.fsm.signal_detector",
+    "SignalPattern": "little_loops.fsm.signal_detector",
+    "Stall": "little_loops.fsm.stall_detector",
+    "StallDetector": "little_loops.fsm.stall_detector",
+    "Evaluator": "little_loops.fsm.types",
+    "ValidationError": "little_loops.fsm.validation",
+    "is_runnable_loop": "little_loops.fsm.validation",
+    "load_and_validate": "little_loops.fsm.validation",
+    "validate_fsm": "little_loops.fsm.validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load_export(__name__, _EXPORTS, name)
+
+
+def __dir__() -> list[str]:
+    return export_dir(__name__, _EXPORTS)
+
 
 __all__ = [
     "ABResults",
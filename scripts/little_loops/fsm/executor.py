@@ -43,7 +43,8 @@ from little_loops.fsm.host_guard import (
     HOST_PRESSURE_RELIEVED_EVENT,
     HOST_SUBPROC_RSS_EVENT,
     HostGuard,
-    RssSampler,
+    ProcessTreeSampler,
+    ProcessTreeUsage,
 )
 from little_loops.fsm.interpolation import (
     InterpolationContext,
@@ -382,13 +383,13 @@ class FSMExecutor:
         self._edge_revisit_counts: dict[str, int] = {}
 
         # Adaptive host memory-pressure guard (ENH-2452) + cumulative subprocess
-        # RSS budget (ENH-2453). Built from fsm.host_guard; None when disabled.
+        # RSS/CPU/I-O budgets (ENH-2453). Built from fsm.host_guard; None when disabled.
         self._host_guard: HostGuard | None = None
         if fsm.host_guard.enabled:
             self._host_guard = HostGuard(fsm.host_guard)
-            # Turn on per-subprocess RSS sampling only when the budget is active
-            # so the common case pays no sampling overhead.
-            if fsm.host_guard.max_cumulative_subproc_mb > 0 and isinstance(
+            # Turn on process-tree sampling only when a budget or account_actions
+            # is active so the common case pays no sampling overhead.
+            if self._host_guard.accounting_enabled and isinstance(
                 self.action_runner, DefaultActionRunner
             ):
                 self.action_runner.sample_rss = True
@@ -730,11 +731,23 @@ class FSMExecutor:
                     self._pending_host_budget_exceeded = False
                     assert self._host_guard is not None  # flag only set when guard exists
                     _hg_cfg = self._host_guard.config
+                    _exceeded = self._host_guard.exceeded_budgets()
                     _budget_payload: dict[str, Any] = {
                         "state": self.current_state,
                         "cumulative_mb": round(self._host_guard.cumulative_subproc_mb, 1),
                         "budget_mb": _hg_cfg.max_cumulative_subproc_mb,
+                        "exceeded": _exceeded,
                     }
+                    if _hg_cfg.max_cumulative_cpu_seconds > 0:
+                        _budget_payload["cumulative_cpu_seconds"] = round(
+                            self._host_guard.cumulative_cpu_seconds, 2
+                        )
+                        _budget_payload["budget_cpu_seconds"] = _hg_cfg.max_cumulative_cpu_seconds
+                    if _hg_cfg.max_cumulative_io_mb > 0:
+                        _budget_payload["cumulative_io_mb"] = round(
+                            self._host_guard.cumulative_io_mb, 1
+                        )
+                        _budget_payload["budget_io_mb"] = _hg_cfg.max_cumulative_io_mb
                     if _hg_cfg.on_budget_exceeded == "route" and _hg_cfg.budget_state:
                         self._emit(
                             HOST_BUDGET_EXCEEDED_EVENT,
@@ -746,13 +759,26 @@ class FSMExecutor:
                             HOST_BUDGET_EXCEEDED_EVENT,
                             {**_budget_payload, "action": "abort"},
                         )
-                        return self._finish(
-                            "host_budget_exceeded",
-                            error=(
+                        _reasons = {
+                            "rss": (
                                 f"Cumulative subprocess RSS "
                                 f"{self._host_guard.cumulative_subproc_mb:.0f} MB exceeded "
                                 f"budget of {_hg_cfg.max_cumulative_subproc_mb} MB"
                             ),
+                            "cpu": (
+                                f"Cumulative subprocess CPU "
+                                f"{self._host_guard.cumulative_cpu_seconds:.1f} s exceeded "
+                                f"budget of {_hg_cfg.max_cumulative_cpu_seconds:g} s"
+                            ),
+                            "io": (
+                                f"Cumulative subprocess I/O "
+                                f"{self._host_guard.cumulative_io_mb:.0f} MB exceeded "
+                                f"budget of {_hg_cfg.max_cumulative_io_mb} MB"
+                            ),
+                        }
+                        return self._finish(
+                            "host_budget_exceeded",
+                            error="; ".join(_reasons[name] for name in _exceeded),
                         )
 
                 # Handle maintain mode
@@ -2330,26 +2356,35 @@ class FSMExecutor:
         # ENH-2724: collect for the live usage_events write at _finish().
         for usage in result.usage_events:
             self._usage_events_collected.append((self.current_state, usage))
+        # Process-tree figures from the runner's sampler; absent when unsampled.
+        tree_usage = ProcessTreeUsage(
+            peak_rss_mb=result.peak_rss_mb,
+            cpu_seconds=result.cpu_seconds,
+            read_bytes=result.read_bytes,
+            write_bytes=result.write_bytes,
+        )
+        payload.update(tree_usage.to_payload())
         self._emit("action_complete", payload)
 
-        # ENH-2453: cumulative subprocess RSS budget accounting. Modeled on the
-        # action_complete token accounting shape; one host_subproc_rss event per
-        # sampled subprocess.
+        # ENH-2453: cumulative subprocess RSS/CPU/I-O budget accounting. Modeled
+        # on the action_complete token accounting shape; one host_subproc_rss
+        # event per subprocess with a sampled RSS.
         if (
             self._host_guard is not None
             and self._host_guard.budget_enabled
-            and result.peak_rss_mb is not None
+            and tree_usage != ProcessTreeUsage()
         ):
-            crossed = self._host_guard.record_subproc_rss(self.current_state, result.peak_rss_mb)
-            self._emit(
-                HOST_SUBPROC_RSS_EVENT,
-                {
-                    "state": self.current_state,
-                    "peak_rss_mb": round(result.peak_rss_mb, 1),
-                    "cumulative_mb": round(self._host_guard.cumulative_subproc_mb, 1),
-                    "budget_mb": self._host_guard.config.max_cumulative_subproc_mb,
-                },
-            )
+            crossed = self._host_guard.record_action_usage(self.current_state, tree_usage)
+            if result.peak_rss_mb is not None:
+                self._emit(
+                    HOST_SUBPROC_RSS_EVENT,
+                    {
+                        "state": self.current_state,
+                        "peak_rss_mb": round(result.peak_rss_mb, 1),
+                        "cumulative_mb": round(self._host_guard.cumulative_subproc_mb, 1),
+                        "budget_mb": self._host_guard.config.max_cumulative_subproc_mb,
+                    },
+                )
             if crossed:
                 self._pending_host_budget_exceeded = True
 
@@ -2474,10 +2509,10 @@ class FSMExecutor:
         deadline = time.time() + timeout if timeout else None
         last_output_at = time.time()
 
-        # ENH-2453: sample the subprocess's RSS while it runs (budget-gated).
-        sampler: RssSampler | None = None
-        if self._host_guard is not None and self._host_guard.budget_enabled:
-            sampler = RssSampler(process.pid)
+        # ENH-2453: sample the subprocess tree while it runs (budget-gated).
+        sampler: ProcessTreeSampler | None = None
+        if self._host_guard is not None and self._host_guard.accounting_enabled:
+            sampler = ProcessTreeSampler(process.pid)
             sampler.start()
 
         output_chunks: list[str] = []
@@ -2526,7 +2561,7 @@ class FSMExecutor:
             sel.close()
             self._current_process = None
 
-        peak_rss_mb = sampler.stop() if sampler is not None else None
+        tree_usage = sampler.stop() if sampler is not None else ProcessTreeUsage()
 
         if timed_out or idled_out:
             _kill_process_group(process)
@@ -2542,7 +2577,10 @@ class FSMExecutor:
                 exit_code=124,
                 duration_ms=_now_ms() - start,
                 timeout_kind="idle" if idled_out else "wall",
-                peak_rss_mb=peak_rss_mb,
+                peak_rss_mb=tree_usage.peak_rss_mb,
+                cpu_seconds=tree_usage.cpu_seconds,
+                read_bytes=tree_usage.read_bytes,
+                write_bytes=tree_usage.write_bytes,
             )
 
         process.wait(timeout=5)
@@ -2551,7 +2589,10 @@ class FSMExecutor:
             stderr="".join(stderr_chunks),
             exit_code=process.returncode,
             duration_ms=_now_ms() - start,
-            peak_rss_mb=peak_rss_mb,
+            peak_rss_mb=tree_usage.peak_rss_mb,
+            cpu_seconds=tree_usage.cpu_seconds,
+            read_bytes=tree_usage.read_bytes,
+            write_bytes=tree_usage.write_bytes,
         )
 
     def _evaluate(
@@ -35,6 +35,7 @@ from typing import Any
 
 import yaml
 
+from little_loops.fsm.loop_cache import cached, path_exists, read_loop_file
 from little_loops.fsm.loop_paths import resolve_loop_path
 
 _BUILTIN_LOOPS_DIR = Path(__file__).parent.parent / "loops"
@@ -94,17 +95,16 @@ def resolve_fragments(raw_loop_dict: dict[str, Any], loop_dir: Path) -> dict[str
     imported_fragments: dict[str, dict[str, Any]] = {}
     for import_path in raw_loop_dict.get("import", []):
         lib_path = loop_dir / import_path
-        if not lib_path.exists():
+        if not path_exists(lib_path):
             builtin_path = _BUILTIN_LOOPS_DIR / import_path
-            if builtin_path.exists():
+            if path_exists(builtin_path):
                 lib_path = builtin_path
             else:
                 raise FileNotFoundError(
                     f"Fragment library not found: {import_path} "
                     f"(checked '{loop_dir / import_path}' and '{builtin_path}')"
                 )
-        with open(lib_path) as f:
-            lib_data = yaml.safe_load(f)
+        lib_data = yaml.safe_load(read_loop_file(lib_path))
         if isinstance(lib_data, dict):
             for name, frag in lib_data.get("fragments", {}).items():
                 imported_fragments[name] = frag
@@ -204,8 +204,7 @@ def resolve_inheritance(
         raise ValueError(f"Circular `from:` chain: {chain}")
 
     parent_path = resolve_loop_path(parent_name, loop_dir)
-    with open(parent_path) as f:
-        parent_data = yaml.safe_load(f)
+    parent_data = yaml.safe_load(read_loop_file(parent_path))
 
     if not isinstance(parent_data, dict):
         raise ValueError(
@@ -220,6 +219,39 @@ def resolve_inheritance(
     return merged
 
 
+def _read_loop_spec(path: Path) -> tuple[Any, dict[str, Any] | None]:
+    data = yaml.safe_load(read_loop_file(path))
+    if not isinstance(data, dict):
+        return data, None
+    try:
+        return data, resolve_inheritance(data, path.parent)
+    except Exception:
+        return data, None
+
+
+def load_loop_spec(path: Path) -> tuple[Any, dict[str, Any] | None]:
+    """Load a loop YAML file and resolve its ``from:`` chain, with caching.
+
+    The cheap metadata path used by ``ll-loop list`` (:func:`is_runnable_loop`
+    and the description/category lookup), served from the compiled-loop cache
+    (:mod:`little_loops.fsm.loop_cache`) while the file and its parents are
+    unchanged.
+
+    Args:
+        path: Loop YAML file.
+
+    Returns:
+        ``(raw, resolved)``: the raw YAML document, and the inheritance-resolved
+        mapping (``raw`` itself when there is no ``from:`` key). ``resolved`` is
+        None when the document is not a mapping or inheritance fails.
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    return cached("spec", path, lambda: _read_loop_spec(path))
+
+
 def resolve_flow(raw_loop_dict: dict[str, Any]) -> dict[str, Any]:
     """Expand ``flow:`` linear shorthand into a verbose ``states:`` map.
 
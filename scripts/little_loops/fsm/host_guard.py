@@ -11,7 +11,10 @@ Two tiers of host-pressure defense for long-running loops:
 2. **Cumulative subprocess RSS budget** (ENH-2453): peak RSS of each spawned
    subprocess is sampled while it runs and accumulated across the run. When
    the sum exceeds ``max_cumulative_subproc_mb`` the runner routes to
-   ``budget_state`` or aborts, per ``on_budget_exceeded``.
+   ``budget_state`` or aborts, per ``on_budget_exceeded``. The same ladder
+   enforces ``max_cumulative_cpu_seconds`` and ``max_cumulative_io_mb``;
+   figures cover the action's whole process tree (shell children, the tools
+   ``claude -p`` spawns), not just the direct child.
 
 The guard is a *routing* signal, not a containment mechanism — macOS has no
 cgroup/RLIMIT_RSS enforcement, so the loop reacts to measured pressure rather
@@ -20,6 +23,7 @@ than being hard-capped.
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import sys
@@ -65,9 +69,15 @@ class HostGuardConfig:
             ``on_pressure="abort"`` fires.
         max_cumulative_subproc_mb: Cap on summed peak subprocess RSS across the
             run (ENH-2453). 0 = disabled (default).
+        max_cumulative_cpu_seconds: Cap on summed action process-tree CPU
+            time (user + system seconds) across the run. 0 = disabled.
+        max_cumulative_io_mb: Cap on summed action process-tree storage I/O
+            (read + write MB) across the run. 0 = disabled.
+        account_actions: Sample every action's process tree and add its
+            figures to ``action_complete`` even when no budget is set.
         on_budget_exceeded: ``"route"`` (go to ``budget_state``) or ``"abort"``.
         budget_state: Recovery state name; required when
-            ``on_budget_exceeded="route"`` and the budget is enabled.
+            ``on_budget_exceeded="route"`` and a budget is enabled.
     """
 
     enabled: bool = True
@@ -78,6 +88,9 @@ class HostGuardConfig:
     pressure_state: str | None = None
     on_abort_route: str | None = None
     max_cumulative_subproc_mb: int = 0
+    max_cumulative_cpu_seconds: float = 0.0
+    max_cumulative_io_mb: int = 0
+    account_actions: bool = False
     on_budget_exceeded: str = "route"
     budget_state: str | None = None
 
@@ -100,6 +113,12 @@ class HostGuardConfig:
             result["on_abort_route"] = self.on_abort_route
         if self.max_cumulative_subproc_mb != 0:
             result["max_cumulative_subproc_mb"] = self.max_cumulative_subproc_mb
+        if self.max_cumulative_cpu_seconds != 0.0:
+            result["max_cumulative_cpu_seconds"] = self.max_cumulative_cpu_seconds
+        if self.max_cumulative_io_mb != 0:
+            result["max_cumulative_io_mb"] = self.max_cumulative_io_mb
+        if self.account_actions:
+            result["account_actions"] = self.account_actions
         if self.on_budget_exceeded != "route":
             result["on_budget_exceeded"] = self.on_budget_exceeded
         if self.budget_state is not None:
@@ -118,6 +137,9 @@ class HostGuardConfig:
             pressure_state=data.get("pressure_state"),
             on_abort_route=data.get("on_abort_route"),
             max_cumulative_subproc_mb=data.get("max_cumulative_subproc_mb", 0),
+            max_cumulative_cpu_seconds=float(data.get("max_cumulative_cpu_seconds", 0.0)),
+            max_cumulative_io_mb=data.get("max_cumulative_io_mb", 0),
+            account_actions=data.get("account_actions", False),
             on_budget_exceeded=data.get("on_budget_exceeded", "route"),
             budget_state=data.get("budget_state"),
         )
@@ -296,6 +318,319 @@ class RssSampler:
             self._record_sample()
 
 
+# ---------------------------------------------------------------------------
+# Process-tree accounting
+# ---------------------------------------------------------------------------
+
+# Clock ticks per second for the utime/stime fields of /proc/<pid>/stat.
+try:
+    _CLK_TCK: int = os.sysconf("SC_CLK_TCK")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - non-POSIX
+    _CLK_TCK = 100
+
+
+@dataclass
+class ProcessTreeUsage:
+    """Resource figures for one action's process tree.
+
+    Each field is None when it could not be measured on this platform.
+
+    Attributes:
+        peak_rss_mb: Peak resident memory of the tree in MB — the root's peak
+            plus the current RSS of every live descendant, maxed over samples.
+        cpu_seconds: User + system CPU time of the tree, including descendants
+            that have already exited and been reaped inside the tree.
+        read_bytes: Bytes the tree caused to be fetched from storage.
+        write_bytes: Bytes the tree caused to be sent to storage.
+    """
+
+    peak_rss_mb: float | None = None
+    cpu_seconds: float | None = None
+    read_bytes: int | None = None
+    write_bytes: int | None = None
+
+    @property
+    def io_mb(self) -> float:
+        """Read + write bytes in MB (unmeasured counters count as 0)."""
+        return ((self.read_bytes or 0) + (self.write_bytes or 0)) / (1024.0 * 1024.0)
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return the measured figures as ``action_complete`` event fields."""
+        payload: dict[str, Any] = {}
+        if self.peak_rss_mb is not None:
+            payload["peak_rss_mb"] = round(self.peak_rss_mb, 1)
+        if self.cpu_seconds is not None:
+            payload["cpu_seconds"] = round(self.cpu_seconds, 2)
+        if self.read_bytes is not None:
+            payload["read_bytes"] = self.read_bytes
+        if self.write_bytes is not None:
+            payload["write_bytes"] = self.write_bytes
+        return payload
+
+
+def _read_proc_fields(path: Path) -> dict[str, str]:
+    """Parse a ``key: value`` /proc file, or return {} when it is unreadable."""
+    try:
+        text = path.read_text()
+    except OSError:
+        return {}
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        fields[key] = value.strip()
+    return fields
+
+
+def _kb_field(fields: dict[str, str], key: str) -> int | None:
+    parts = fields.get(key, "").split()
+    return int(parts[0]) if parts and parts[0].isdigit() else None
+
+
+def _proc_children(pid: int, proc_root: Path) -> list[int] | None:
+    """Direct children of ``pid`` from ``task/*/children``; None if unsupported."""
+    try:
+        tasks = list((proc_root / str(pid) / "task").iterdir())
+    except OSError:
+        return []  # exited since it was listed
+    children: list[int] = []
+    for task in tasks:
+        try:
+            text = (task / "children").read_text()
+        except FileNotFoundError:
+            # Kernel built without CONFIG_PROC_CHILDREN.
+            return None
+        except OSError:
+            continue
+        children.extend(int(tok) for tok in text.split())
+    return children
+
+
+def _proc_parent_map(proc_root: Path) -> dict[int, list[int]]:
+    """Map ppid -> child pids by scanning every ``/proc/<pid>/stat``."""
+    parents: dict[int, list[int]] = {}
+    try:
+        entries = list(proc_root.iterdir())
+    except OSError:
+        return parents
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # comm (field 2) may contain spaces and parens; ppid follows the last ")".
+        fields = stat[stat.rfind(")") + 2 :].split()
+        if len(fields) > 1 and fields[1].isdigit():
+            parents.setdefault(int(fields[1]), []).append(int(entry.name))
+    return parents
+
+
+def list_descendants(pid: int, proc_root: Path = Path("/proc")) -> list[int]:
+    """Return every live descendant of ``pid`` (children, grandchildren, ...).
+
+    Reads ``/proc/<pid>/task/<tid>/children`` when the kernel provides it and
+    otherwise builds a parent map from ``/proc/*/stat``. Returns [] when
+    ``/proc`` is unavailable.
+    """
+    parents: dict[int, list[int]] | None = None
+    found: list[int] = []
+    seen = {pid}
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        children = _proc_children(current, proc_root) if parents is None else None
+        if children is None:
+            if parents is None:
+                parents = _proc_parent_map(proc_root)
+            children = parents.get(current, [])
+        for child in children:
+            if child not in seen:
+                seen.add(child)
+                found.append(child)
+                stack.append(child)
+    return found
+
+
+def _proc_cpu_seconds(pid: int, proc_root: Path) -> float | None:
+    """utime + stime + cutime + cstime of ``pid`` in seconds."""
+    try:
+        stat = (proc_root / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # Fields after comm start at field 3 (state); utime..cstime are 14..17.
+    fields = stat[stat.rfind(")") + 2 :].split()
+    try:
+        ticks = sum(int(fields[i]) for i in range(11, 15))
+    except (IndexError, ValueError):
+        return None
+    return ticks / _CLK_TCK
+
+
+def _sample_proc_tree(pid: int, proc_root: Path) -> ProcessTreeUsage | None:
+    root_status = _read_proc_fields(proc_root / str(pid) / "status")
+    if not root_status:
+        return None
+    pids = [pid, *list_descendants(pid, proc_root)]
+    rss_kb: int | None = None
+    cpu: float | None = None
+    read_bytes: int | None = None
+    write_bytes: int | None = None
+    for member in pids:
+        if member == pid:
+            # Like sample_rss_mb: the root's own high-water mark when known.
+            kb = _kb_field(root_status, "VmHWM") or _kb_field(root_status, "VmRSS")
+        else:
+            kb = _kb_field(_read_proc_fields(proc_root / str(member) / "status"), "VmRSS")
+        if kb is not None:
+            rss_kb = (rss_kb or 0) + kb
+        seconds = _proc_cpu_seconds(member, proc_root)
+        if seconds is not None:
+            cpu = (cpu or 0.0) + seconds
+        io = _read_proc_fields(proc_root / str(member) / "io")
+        if io.get("read_bytes", "").isdigit():
+            read_bytes = (read_bytes or 0) + int(io["read_bytes"])
+        if io.get("write_bytes", "").isdigit():
+            write_bytes = (write_bytes or 0) + int(io["write_bytes"])
+    return ProcessTreeUsage(
+        peak_rss_mb=rss_kb / 1024.0 if rss_kb is not None else None,
+        cpu_seconds=cpu,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+    )
+
+
+def _sample_ps_tree(pid: int) -> ProcessTreeUsage | None:
+    """RSS of ``pid`` and its descendants via ``ps`` (macOS; no CPU/I-O)."""
+    try:
+        proc = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid=,rss="],
+            capture_output=True,
+            text=True,
+            timeout=_PROBE_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    rss: dict[int, int] = {}
+    parents: dict[int, list[int]] = {}
+    for line in proc.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and all(part.isdigit() for part in parts):
+            child, parent, kb = (int(part) for part in parts)
+            rss[child] = kb
+            parents.setdefault(parent, []).append(child)
+    if pid not in rss:
+        return None
+    total_kb = 0
+    stack = [pid]
+    seen = {pid}
+    while stack:
+        current = stack.pop()
+        total_kb += rss.get(current, 0)
+        for child in parents.get(current, []):
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return ProcessTreeUsage(peak_rss_mb=total_kb / 1024.0)
+
+
+def sample_process_tree(pid: int, proc_root: Path = Path("/proc")) -> ProcessTreeUsage | None:
+    """Sample the resources used by ``pid`` and all its live descendants.
+
+    Linux: walks the tree through ``/proc`` and sums ``VmRSS`` (``VmHWM`` for
+    the root), ``utime + stime + cutime + cstime`` from ``stat`` and
+    ``read_bytes`` / ``write_bytes`` from ``io`` (unreadable ``io`` files
+    leave the I/O figures None). Because the kernel folds a reaped child's
+    CPU time and I/O into its parent, work done by short-lived descendants
+    is still counted. Other platforms: tree RSS from ``ps``. Returns None
+    when the root process cannot be read.
+    """
+    if (proc_root / str(pid)).exists():
+        return _sample_proc_tree(pid, proc_root)
+    if proc_root.exists():
+        # /proc is present but the process is gone (already reaped).
+        return None
+    return _sample_ps_tree(pid)
+
+
+def _max_optional(a: Any, b: Any) -> Any:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+
+class ProcessTreeSampler:
+    """Background thread sampling an action's whole process tree.
+
+    The process-tree counterpart of :class:`RssSampler`: samples every
+    ``interval`` seconds via ``sample_fn`` (default
+    :func:`sample_process_tree`) and keeps the maximum of each figure. CPU
+    time and I/O only grow while the tree runs, so their maximum is the
+    final total; RSS is a true peak. :meth:`stop` returns the accumulated
+    :class:`ProcessTreeUsage` (all fields None when no sample succeeded).
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        interval: float = 1.0,
+        sample_fn: Callable[[int], ProcessTreeUsage | None] = sample_process_tree,
+    ) -> None:
+        """Initialize the sampler for ``pid`` without starting the thread."""
+        self.pid = pid
+        self.interval = interval
+        self.sample_fn = sample_fn
+        self.usage = ProcessTreeUsage()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def peak_mb(self) -> float | None:
+        """Peak tree RSS in MB so far (None when no sample succeeded)."""
+        return self.usage.peak_rss_mb
+
+    def start(self) -> None:
+        """Take an immediate first sample and begin periodic sampling."""
+        self._record_sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> ProcessTreeUsage:
+        """Stop sampling, take a final sample, and return the accumulated usage.
+
+        Call it before reaping the root process: its ``stat``/``io`` then
+        still include every descendant it reaped.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+        self._record_sample()
+        return self.usage
+
+    def _record_sample(self) -> None:
+        sample = self.sample_fn(self.pid)
+        if sample is None:
+            return
+        with self._lock:
+            current = self.usage
+            self.usage = ProcessTreeUsage(
+                peak_rss_mb=_max_optional(current.peak_rss_mb, sample.peak_rss_mb),
+                cpu_seconds=_max_optional(current.cpu_seconds, sample.cpu_seconds),
+                read_bytes=_max_optional(current.read_bytes, sample.read_bytes),
+                write_bytes=_max_optional(current.write_bytes, sample.write_bytes),
+            )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._record_sample()
+
+
 # ---------------------------------------------------------------------------
 # Guard runtime
 # ---------------------------------------------------------------------------
@@ -326,8 +661,8 @@ class HostGuard:
     """Runtime companion to :class:`HostGuardConfig`.
 
     Holds the per-run pressure latch (for ``host_pressure_relieved``) and the
-    cumulative subprocess RSS accumulator (ENH-2453). The executor owns event
-    emission and sleeping; this class only decides.
+    cumulative subprocess RSS, CPU and I/O accumulators (ENH-2453). The
+    executor owns event emission and sleeping; this class only decides.
     """
 
     def __init__(
@@ -346,6 +681,8 @@ class HostGuard:
         self._pressure_active = False
         self.cumulative_subproc_mb: float = 0.0
         self.subproc_samples: list[tuple[str, float]] = []
+        self.cumulative_cpu_seconds: float = 0.0
+        self.cumulative_io_mb: float = 0.0
         self._budget_fired = False
 
     def pre_state(self) -> GuardDecision:
@@ -391,8 +728,29 @@ class HostGuard:
 
     @property
     def budget_enabled(self) -> bool:
-        """True when the cumulative subprocess RSS budget is active."""
-        return self.config.max_cumulative_subproc_mb > 0
+        """True when any cumulative subprocess budget (RSS, CPU, I/O) is active."""
+        return (
+            self.config.max_cumulative_subproc_mb > 0
+            or self.config.max_cumulative_cpu_seconds > 0
+            or self.config.max_cumulative_io_mb > 0
+        )
+
+    @property
+    def accounting_enabled(self) -> bool:
+        """True when action process trees should be sampled at all."""
+        return self.budget_enabled or self.config.account_actions
+
+    def exceeded_budgets(self) -> list[str]:
+        """Names of the enabled budgets the run totals are currently over."""
+        cfg = self.config
+        exceeded: list[str] = []
+        if 0 < cfg.max_cumulative_subproc_mb < self.cumulative_subproc_mb:
+            exceeded.append("rss")
+        if 0 < cfg.max_cumulative_cpu_seconds < self.cumulative_cpu_seconds:
+            exceeded.append("cpu")
+        if 0 < cfg.max_cumulative_io_mb < self.cumulative_io_mb:
+            exceeded.append("io")
+        return exceeded
 
     def record_subproc_rss(self, label: str, peak_rss_mb: float) -> bool:
         """Accumulate one subprocess's peak RSS into the run total.
@@ -407,14 +765,32 @@ class HostGuard:
         """
         self.cumulative_subproc_mb += peak_rss_mb
         self.subproc_samples.append((label, peak_rss_mb))
-        if (
-            self.budget_enabled
-            and not self._budget_fired
-            and self.cumulative_subproc_mb > self.config.max_cumulative_subproc_mb
-        ):
-            self._budget_fired = True
-            return True
-        return False
+        return self._check_budgets()
+
+    def record_action_usage(self, label: str, usage: ProcessTreeUsage) -> bool:
+        """Accumulate one action's process-tree usage into the run totals.
+
+        Args:
+            label: Identifier for the sample (state name).
+            usage: The action's sampled figures; None fields add nothing.
+
+        Returns:
+            True exactly once — when the first enabled budget (RSS, CPU or
+            I/O) is crossed.
+        """
+        if usage.peak_rss_mb is not None:
+            self.cumulative_subproc_mb += usage.peak_rss_mb
+            self.subproc_samples.append((label, usage.peak_rss_mb))
+        if usage.cpu_seconds is not None:
+            self.cumulative_cpu_seconds += usage.cpu_seconds
+        self.cumulative_io_mb += usage.io_mb
+        return self._check_budgets()
+
+    def _check_budgets(self) -> bool:
+        if self._budget_fired or not self.exceeded_budgets():
+            return False
+        self._budget_fired = True
+        return True
 
 
 __all__ = [
@@ -427,9 +803,13 @@ __all__ = [
     "GuardDecision",
     "HostGuard",
     "HostGuardConfig",
+    "ProcessTreeSampler",
+    "ProcessTreeUsage",
     "RssSampler",
+    "list_descendants",
     "parse_meminfo",
     "parse_vm_stat",
     "read_memory_pressure",
+    "sample_process_tree",
     "sample_rss_mb",
 ]
@@ -0,0 +1,272 @@
+"""Content-addressed cache for compiled loop definitions.
+
+Loading a loop is dominated by work that only depends on file contents: YAML
+parsing, ``from:`` inheritance, ``flow:`` shorthand and fragment expansion,
+``FSMLoop.from_dict``, and the full ``validate_fsm`` rule suite. This module
+memoizes those results in-process and under the per-user cache directory
+(``$XDG_CACHE_HOME/little-loops/loops/compiled/``, default ``~/.cache``) so
+repeated loads (``ll-loop list``/``show``/``run`` and sub-loop entry) skip it.
+
+Every file the loader touches is recorded while a result is computed:
+
+- files that are read (the loop itself, ``from:`` parents, ``import:``
+  fragment libraries, child loops validated for ``with:`` bindings) are
+  recorded by content digest;
+- path probes made while resolving loop names and imports are recorded as
+  present/absent, so creating a file that would shadow a previous resolution
+  invalidates the entry.
+
+An entry is addressed by the digest of the root loop file (plus the cache
+kind, its absolute path, the working directory, caller-supplied key material,
+and a fingerprint of every file in the ``little_loops.fsm`` package, including
+non-Python inputs such as ``fsm-loop-schema.json``). A hit is only served
+after every recorded dependency still matches, so edits to any parent,
+fragment, or child loop are picked up on the next load.
+
+Entries are pickles, so they are never read from a project-controlled
+location: the disk layer lives in a directory created ``0700`` for the
+current user and is skipped when that directory is owned by someone else. It
+is only used when ``.loops/`` already exists in the working directory. Set
+``LL_LOOP_CACHE=0`` to bypass both layers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOOPS_DIR = Path(".loops")
+"""Project loop directory; the disk layer is only used when it exists in the cwd."""
+
+_COMPILED_SUBDIR = "compiled"
+_FORMAT_VERSION = 1
+_MEMORY_MAX = 512
+
+# Dependency markers: a content digest (str), or one of these for path probes.
+_ABSENT: None = None
+_PRESENT = ""
+
+_Deps = dict[str, str | None]
+
+_recorder: ContextVar[_Deps | None] = ContextVar("loop_cache_recorder", default=None)
+_memory: dict[str, tuple[_Deps, bytes]] = {}
+_memory_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    """Return False when ``LL_LOOP_CACHE`` is set to ``0``/``false``/``off``."""
+    return os.environ.get("LL_LOOP_CACHE", "").strip().lower() not in ("0", "false", "off")
+
+
+def clear_memory_cache() -> None:
+    """Drop the in-process layer (the on-disk layer is left untouched)."""
+    with _memory_lock:
+        _memory.clear()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _record(path: Path, marker: str | None) -> None:
+    deps = _recorder.get()
+    if deps is None:
+        return
+    key = os.path.abspath(path)
+    # A content digest is the strongest claim; never downgrade it to a probe.
+    if marker is _ABSENT:
+        deps.setdefault(key, _ABSENT)
+    elif marker == _PRESENT:
+        if not deps.get(key):
+            deps[key] = _PRESENT
+    else:
+        deps[key] = marker
+
+
+def read_loop_file(path: Path) -> bytes:
+    """Read a loop/fragment YAML file, recording its content as a dependency."""
+    data = path.read_bytes()
+    _record(path, _digest(data))
+    return data
+
+
+def path_exists(path: Path) -> bool:
+    """``path.exists()`` that records the probe as a dependency."""
+    exists = path.exists()
+    _record(path, _PRESENT if exists else _ABSENT)
+    return exists
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Fingerprint of the loader/validator sources so code changes miss the cache."""
+    from little_loops import __version__
+
+    fsm_dir = Path(__file__).parent
+    parts = [__version__, f"{sys.version_info[0]}.{sys.version_info[1]}"]
+    # Every packaged file, not just *.py: fsm-loop-schema.json feeds validation too.
+    for source in sorted(fsm_dir.rglob("*")):
+        if "__pycache__" in source.parts:
+            continue
+        try:
+            st = source.stat()
+        except OSError:
+            continue
+        if not source.is_file():
+            continue
+        parts.append(f"{source.relative_to(fsm_dir)}:{st.st_mtime_ns}:{st.st_size}")
+    return _digest("\n".join(parts).encode())
+
+
+def _deps_valid(deps: _Deps) -> bool:
+    for name, expected in deps.items():
+        path = Path(name)
+        if expected is _ABSENT:
+            if path.exists():
+                return False
+        elif expected == _PRESENT:
+            if not path.exists():
+                return False
+        else:
+            try:
+                if _digest(path.read_bytes()) != expected:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+def _replay(deps: _Deps) -> None:
+    """Merge a finished (or cached) computation's dependencies into the caller's."""
+    for name, marker in deps.items():
+        _record(Path(name), marker)
+
+
+def cache_root() -> Path:
+    """Return the per-user cache root (``$XDG_CACHE_HOME/little-loops/loops``)."""
+    xdg = os.environ.get("XDG_CACHE_HOME", "")
+    # The XDG spec says relative values are invalid and must be ignored.
+    base = Path(xdg) if os.path.isabs(xdg) else Path.home() / ".cache"
+    return base / "little-loops" / "loops"
+
+
+def _disk_dir() -> Path | None:
+    if not LOOPS_DIR.is_dir():
+        return None
+    directory = cache_root() / _COMPILED_SUBDIR
+    if hasattr(os, "getuid"):
+        try:
+            owner = directory.stat().st_uid
+        except OSError:
+            return directory  # created (0700) on first write
+        if owner != os.getuid():
+            logger.debug("Ignoring loop cache %s owned by uid %d", directory, owner)
+            return None
+    return directory
+
+
+def _read_entry(entry_path: Path) -> tuple[_Deps, bytes] | None:
+    try:
+        with open(entry_path, "rb") as f:
+            version, deps, payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # corrupt/truncated/incompatible entry — treat as a miss
+        logger.debug("Ignoring unreadable loop cache entry %s: %s", entry_path, exc)
+        return None
+    if version != _FORMAT_VERSION:
+        return None
+    return deps, payload
+
+
+def _write_entry(directory: Path, stem: str, name: str, deps: _Deps, payload: bytes) -> None:
+    try:
+        if not directory.is_dir():
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Drop superseded entries for the same loop before publishing the new one.
+        for stale in directory.glob(f"{stem}-*.pickle"):
+            if stale.name != name:
+                stale.unlink(missing_ok=True)
+        tmp = directory / f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((_FORMAT_VERSION, deps, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, directory / name)
+    except OSError as exc:
+        logger.debug("Could not write loop cache entry %s: %s", name, exc)
+
+
+def cached(kind: str, path: Path, compute: Callable[[], T], *, extra: Any = None) -> T:
+    """Return ``compute()`` for ``path``, served from the cache when still valid.
+
+    Args:
+        kind: Namespace for the cached value (one per kind of computation).
+        path: Root loop file the computation is derived from.
+        compute: Zero-argument callable producing the value. Must read files
+            through :func:`read_loop_file`/:func:`path_exists` (directly or via
+            the fragment/inheritance resolvers) so its dependencies are recorded.
+            Its result must be picklable; exceptions propagate and are not cached.
+        extra: Additional key material that affects the result (e.g. a config value).
+
+    Returns:
+        The computed or cached value. Cache hits return a fresh copy, so callers
+        may mutate the result.
+    """
+    if not cache_enabled():
+        return compute()
+    try:
+        root = path.read_bytes()
+    except OSError:
+        return compute()
+
+    stem = _digest(repr((kind, os.path.abspath(path), os.getcwd(), repr(extra))).encode())[:16]
+    name = f"{stem}-{_digest(f'{_code_fingerprint()}:{_digest(root)}'.encode())[:16]}.pickle"
+
+    with _memory_lock:
+        entry = _memory.get(name)
+    directory = _disk_dir()
+    if entry is None and directory is not None:
+        entry = _read_entry(directory / name)
+    if entry is not None and _deps_valid(entry[0]):
+        try:
+            value: T = pickle.loads(entry[1])
+        except Exception as exc:
+            logger.debug("Ignoring unloadable loop cache payload for %s: %s", path, exc)
+        else:
+            with _memory_lock:
+                _memory[name] = entry
+            _replay(entry[0])
+            return value
+
+    token = _recorder.set({})
+    try:
+        value = compute()
+    finally:
+        deps = _recorder.get() or {}
+        _recorder.reset(token)
+        _replay(deps)
+
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exc:
+        logger.debug("Loop cache value for %s is not picklable: %s", path, exc)
+        return value
+    with _memory_lock:
+        if len(_memory) >= _MEMORY_MAX:
+            _memory.pop(next(iter(_memory)))
+        _memory[name] = (deps, payload)
+    if directory is not None:
+        _write_entry(directory, stem, name, deps, payload)
+    return value
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from little_loops.fsm.loop_cache import path_exists
+
 
 def get_builtin_loops_dir() -> Path:
     """Get the path to built-in loops bundled with the plugin."""
@@ -17,24 +19,29 @@ def get_builtin_loops_dir() -> Path:
 
 
 def resolve_loop_path(name_or_path: str, loops_dir: Path) -> Path:
-    """Resolve loop name to file path."""
+    """Resolve loop name to file path.
+
+    Every candidate probe is recorded with the compiled-loop cache (see
+    :mod:`little_loops.fsm.loop_cache`), so a file that later shadows the
+    resolved one invalidates cached results that depended on the lookup.
+    """
     path = Path(name_or_path)
-    if path.exists():
+    if path_exists(path):
         return path
 
     # Try <loops_dir>/<name>.fsm.yaml first (compiled FSM)
     fsm_path = loops_dir / f"{name_or_path}.fsm.yaml"
-    if fsm_path.exists():
+    if path_exists(fsm_path):
         return fsm_path
 
     # Fall back to <loops_dir>/<name>.yaml
     loops_path = loops_dir / f"{name_or_path}.yaml"
-    if loops_path.exists():
+    if path_exists(loops_path):
         return loops_path
 
     # Fall back to built-in loops from plugin directory
     builtin_path = get_builtin_loops_dir() / f"{name_or_path}.yaml"
-    if builtin_path.exists():
+    if path_exists(builtin_path):
         return builtin_path
 
     raise FileNotFoundError(f"Loop not found: {name_or_path}")
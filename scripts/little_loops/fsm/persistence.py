@@ -11,12 +11,23 @@ File structure:
     ├── fix-types.yaml          # Loop definition
     ├── .running/               # Runtime state (auto-managed)
     │   ├── fix-types-20260503T122306.state.json
+    │   ├── fix-types-20260503T122306.state.journal  # journal mode only
     │   └── fix-types-20260503T122306.events.jsonl
     └── .history/               # Archived run logs (auto-populated)
         └── 2024-01-15T103000-fix-types/
             ├── state.json
             ├── events.jsonl
             └── summary.json    # present when loop wrote one to run_dir
+
+State is saved on every transition. In the default ``snapshot`` mode each save
+rewrites ``state.json`` in full, so a run with a growing ``messages`` log
+writes O(N²) bytes over N transitions. ``journal`` mode instead appends the
+delta since the previous save to ``<instance>.state.journal`` and folds the
+journal into a fresh ``state.json`` every ``journal_fold_every`` saves (and on
+any non-running status). Each journal-mode snapshot carries a generation
+stamp and each journal record the generation it extends, so readers replay
+only the records written on top of the snapshot they loaded; archived
+``state.json`` files are always fully folded.
 """
 
 from __future__ import annotations
@@ -26,23 +37,40 @@ import logging
 import os
 import re
 import shutil
+import struct
 import subprocess
 import tempfile
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from little_loops.events import EventBus
+from little_loops.file_utils import BufferedJsonlWriter
 from little_loops.fsm.concurrency import _process_alive
 from little_loops.fsm.executor import EventCallback, ExecutionResult, FSMExecutor
 from little_loops.fsm.schema import FSMLoop
 from little_loops.fsm.validation import _is_meta_loop
+from little_loops.transport import TRANSITION_EVENT_TYPES
+
+if TYPE_CHECKING:
+    from little_loops.config.features import JsonlEventsConfig
 
 RUNNING_DIR = ".running"
 HISTORY_DIR = ".history"
 
+# Journal-mode saves between full ``state.json`` rewrites (loops.journal_fold_every).
+DEFAULT_JOURNAL_FOLD_EVERY = 200
+
+# Journal records are a 4-byte big-endian length followed by that many bytes of
+# compact JSON, so a record torn by a crash mid-append is detected and dropped.
+_JOURNAL_LENGTH = struct.Struct(">I")
+# LoopState.to_dict() keys journaled as deltas rather than replaced wholesale.
+_JOURNAL_DELTA_KEYS = frozenset({"messages", "context"})
+# state.json key holding the snapshot generation that journal records must match.
+_JOURNAL_GENERATION_KEY = "journal_generation"
+
 RESUMABLE_STATUSES: frozenset[str] = frozenset(
     {"running", "awaiting_continuation", "interrupted", "user_stopped"}
 )
@@ -209,6 +237,123 @@ def _append_jsonl(path: Path, entry: dict[str, Any]) -> None:
         os.fsync(f.fileno())
 
 
+def _journal_path(state_file: Path) -> Path:
+    """``<stem>.state.json`` → ``<stem>.state.journal``."""
+    return state_file.with_name(state_file.name.removesuffix(".json") + ".journal")
+
+
+def _read_journal(journal_file: Path) -> list[dict[str, Any]]:
+    """Return the complete records of *journal_file*, stopping at a torn or corrupt tail."""
+    try:
+        raw = journal_file.read_bytes()
+    except FileNotFoundError:
+        return []
+    records: list[dict[str, Any]] = []
+    pos = 0
+    while pos + _JOURNAL_LENGTH.size <= len(raw):
+        (length,) = _JOURNAL_LENGTH.unpack_from(raw, pos)
+        start = pos + _JOURNAL_LENGTH.size
+        if start + length > len(raw):
+            break
+        try:
+            records.append(json.loads(raw[start : start + length]))
+        except ValueError:
+            break
+        pos = start + length
+    return records
+
+
+def _apply_journal_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply one journal delta to a ``LoopState.to_dict()`` mapping in place.
+
+    Records are only valid on top of the snapshot generation they were
+    written against; :func:`_load_state_data` filters the rest out.
+    """
+    data.update(record.get("set", {}))
+    for key in record.get("unset", []):
+        data.pop(key, None)
+    if "messages" in record:
+        data["messages"] = data.get("messages", [])[: record["messages_at"]] + record["messages"]
+    if "context_set" in record or "context_unset" in record:
+        context = data.setdefault("context", {})
+        context.update(record.get("context_set", {}))
+        for key in record.get("context_unset", []):
+            context.pop(key, None)
+
+
+def _load_state_data(state_file: Path) -> dict[str, Any]:
+    """Read ``state.json`` and replay its journal, if any.
+
+    Raises exactly what reading the snapshot alone raises (``OSError``,
+    ``json.JSONDecodeError``), so existing callers keep their error handling.
+    """
+    data: dict[str, Any] = json.loads(state_file.read_text())
+    generation = data.pop(_JOURNAL_GENERATION_KEY, None)
+    for record in _read_journal(_journal_path(state_file)):
+        # A journal left behind by a crash between a snapshot's os.replace and
+        # the journal unlink belongs to the previous generation: skip it.
+        if record.get("gen") == generation:
+            _apply_journal_record(data, record)
+    return data
+
+
+@dataclass
+class _JournalBase:
+    """What the last save put on disk, in a form cheap to diff against.
+
+    Top-level fields and context values are kept as their JSON text (so a
+    later in-place mutation of ``captured`` still shows up as a change); the
+    append-only ``messages`` list is kept as a shallow copy and diffed by prefix.
+    """
+
+    fields: dict[str, str]
+    messages: list[str]
+    context: dict[str, str]
+
+    @classmethod
+    def of(cls, data: dict[str, Any]) -> _JournalBase:
+        return cls(
+            fields={
+                key: json.dumps(value, sort_keys=True)
+                for key, value in data.items()
+                if key not in _JOURNAL_DELTA_KEYS
+            },
+            messages=list(data.get("messages", [])),
+            context={
+                key: json.dumps(value, sort_keys=True)
+                for key, value in data.get("context", {}).items()
+            },
+        )
+
+    def delta(self, new: _JournalBase, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the journal record that turns this base into *new* (*data*'s values)."""
+        record: dict[str, Any] = {}
+        changed = {
+            key: data[key] for key, text in new.fields.items() if self.fields.get(key) != text
+        }
+        if changed:
+            record["set"] = changed
+        unset = [key for key in self.fields if key not in new.fields]
+        if unset:
+            record["unset"] = unset
+        if new.messages != self.messages:
+            kept = len(self.messages)
+            if new.messages[:kept] != self.messages:
+                kept = 0
+            record["messages_at"] = kept
+            record["messages"] = new.messages[kept:]
+        context = data.get("context", {})
+        context_set = {
+            key: context[key] for key, text in new.context.items() if self.context.get(key) != text
+        }
+        if context_set:
+            record["context_set"] = context_set
+        context_unset = [key for key in self.context if key not in new.context]
+        if context_unset:
+            record["context_unset"] = context_unset
+        return record
+
+
 def _read_pid_file(pid_file: Path) -> int | None:
     """Read and validate a PID file, returning the PID or None."""
     if not pid_file.exists():
@@ -435,10 +580,27 @@ class StatePersistence:
     - Events file: JSONL file with execution events (append-only)
 
     Files are stored in .loops/.running/<instance_id>.*
+
+    Events go through one long-lived, fsyncing
+    :class:`~little_loops.file_utils.BufferedJsonlWriter`. Transition events
+    (:data:`~little_loops.transport.TRANSITION_EVENT_TYPES`) are always durable
+    before :meth:`append_event` returns (BUG-2501); *jsonl_config* chooses when
+    the rows between them are written. Without one every row is durable on
+    return, as before buffering.
+
+    With ``state_persistence="journal"``, :meth:`save_state` appends deltas to
+    ``<instance>.state.journal`` between full snapshots (see the module
+    docstring). Reading always replays the journal, whatever the mode.
     """
 
     def __init__(
-        self, loop_name: str, loops_dir: Path | None = None, instance_id: str | None = None
+        self,
+        loop_name: str,
+        loops_dir: Path | None = None,
+        instance_id: str | None = None,
+        jsonl_config: JsonlEventsConfig | None = None,
+        state_persistence: str = "snapshot",
+        journal_fold_every: int = DEFAULT_JOURNAL_FOLD_EVERY,
     ) -> None:
         """Initialize persistence for a loop.
 
@@ -446,6 +608,11 @@ class StatePersistence:
             loop_name: Name of the loop
             loops_dir: Base directory for loops (default: .loops)
             instance_id: Optional unique instance identifier; falls back to loop_name when None
+            jsonl_config: Optional events-log durability policy (``events.jsonl``);
+                defaults to ``every_event``
+            state_persistence: ``"snapshot"`` (rewrite ``state.json`` on every save)
+                or ``"journal"`` (append deltas, fold periodically)
+            journal_fold_every: Journal-mode saves between full snapshots
         """
         self.loop_name = loop_name
         self.loops_dir = loops_dir or Path(".loops")
@@ -454,6 +621,21 @@ class StatePersistence:
         self.state_file = self.running_dir / f"{stem}.state.json"
         self.events_file = self.running_dir / f"{stem}.events.jsonl"
         self.meta_eval_file = self.running_dir / f"{stem}.meta-eval.jsonl"
+        self.journal_file = _journal_path(self.state_file)
+        self._journal_mode = state_persistence == "journal"
+        self._journal_fold_every = journal_fold_every
+        self._journal_base: _JournalBase | None = None
+        self._journal_records = 0
+        self._snapshot_id: tuple[int, int] | None = None
+        self._generation: int | None = None
+        self._events_writer = BufferedJsonlWriter(
+            self.events_file,
+            policy=jsonl_config.durability if jsonl_config else "every_event",
+            every_n=jsonl_config.every_n if jsonl_config else 100,
+            interval_ms=jsonl_config.interval_ms if jsonl_config else 250,
+            fsync=True,
+            durable_events=TRANSITION_EVENT_TYPES,
+        )
 
     def initialize(self) -> None:
         """Create running directory if needed."""
@@ -466,21 +648,79 @@ class StatePersistence:
         file first, then renames it over the target to avoid leaving a corrupt
         or empty state file if the process is killed mid-write.
 
+        In journal mode a ``running`` state is appended as a delta instead,
+        unless the fold interval is reached or another process has replaced
+        ``state.json`` since this instance last wrote it.
+
         Args:
             state: LoopState to save
         """
         state.updated_at = _iso_now()
         # include_context=True: this is the on-disk persistence path, which must
         # carry fsm.context so resume can restore ${context.*} keys (BUG-2485).
-        data = json.dumps(state.to_dict(include_context=True), indent=2)
+        data = state.to_dict(include_context=True)
+        if not self._journal_mode or state.status != "running":
+            self._write_snapshot(data)
+            return
+        base = _JournalBase.of(data)
+        if (
+            self._journal_base is not None
+            and self._journal_records < self._journal_fold_every
+            and self._snapshot_id == self._stat_snapshot()
+        ):
+            self._append_journal(self._journal_base.delta(base, data))
+            self._journal_records += 1
+        else:
+            self._write_snapshot(data)
+        self._journal_base = base
+
+    def _stat_snapshot(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+
+    def _write_snapshot(self, data: dict[str, Any]) -> None:
+        """Atomically replace ``state.json`` with *data* and drop the journal it supersedes.
+
+        In journal mode the snapshot is stamped with a fresh generation that
+        the following journal records carry.
+        """
+        if self._journal_mode:
+            self._generation = time.time_ns()
+            data = {**data, _JOURNAL_GENERATION_KEY: self._generation}
+        payload = json.dumps(data, indent=2)
         tmp_fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix=".tmp")
         try:
             with os.fdopen(tmp_fd, "w") as f:
-                f.write(data)
+                f.write(payload)
             os.replace(tmp_path, self.state_file)
         except Exception:
             os.unlink(tmp_path)
             raise
+        # A crash before this unlink leaves records of the previous generation,
+        # which readers no longer apply to the snapshot just written.
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_base = None
+        self._journal_records = 0
+        self._snapshot_id = self._stat_snapshot()
+
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        record["gen"] = self._generation
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        with open(self.journal_file, "ab") as f:
+            f.write(_JOURNAL_LENGTH.pack(len(payload)) + payload)
+
+    def fold_journal(self) -> None:
+        """Fold a pending journal into ``state.json`` (no-op when there is none)."""
+        if not self.journal_file.exists():
+            return
+        try:
+            data = _load_state_data(self.state_file)
+        except (OSError, json.JSONDecodeError):
+            return
+        self._write_snapshot(data)
 
     def load_state(self) -> LoopState | None:
         """Load state from file, or None if not exists.
@@ -491,7 +731,7 @@ class StatePersistence:
         if not self.state_file.exists():
             return None
         try:
-            data = json.loads(self.state_file.read_text())
+            data = _load_state_data(self.state_file)
         except json.JSONDecodeError:
             return None
         try:
@@ -501,9 +741,12 @@ class StatePersistence:
             return None
 
     def clear_state(self) -> None:
-        """Remove state file."""
+        """Remove state file (and its journal)."""
         if self.state_file.exists():
             self.state_file.unlink()
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_base = None
+        self._journal_records = 0
 
     def append_event(self, event: dict[str, Any]) -> None:
         """Append event to JSONL file.
@@ -511,7 +754,15 @@ class StatePersistence:
         Args:
             event: Event dictionary to append
         """
-        _append_jsonl(self.events_file, event)
+        self._events_writer.write(event)
+
+    def flush_events(self) -> None:
+        """Write out (and fsync) any events still buffered by the durability policy."""
+        self._events_writer.sync()
+
+    def close(self) -> None:
+        """Flush buffered events and close the events file handle."""
+        self._events_writer.close()
 
     def read_events(self) -> list[dict[str, Any]]:
         """Read all events from file.
@@ -519,6 +770,7 @@ class StatePersistence:
         Returns:
             List of event dictionaries, empty if file doesn't exist
         """
+        self._events_writer.sync()
         if not self.events_file.exists():
             return []
         events: list[dict[str, Any]] = []
@@ -534,6 +786,7 @@ class StatePersistence:
 
     def clear_events(self) -> None:
         """Remove events file."""
+        self._events_writer.release()
         if self.events_file.exists():
             self.events_file.unlink()
 
@@ -563,6 +816,8 @@ class StatePersistence:
             Path to the archive directory if files were archived, None if
             there were no files to archive (fresh run).
         """
+        self._events_writer.sync()
+        self.fold_journal()
         has_state = self.state_file.exists()
         has_events = self.events_file.exists()
         if not has_state and not has_events:
@@ -624,7 +879,7 @@ def _reconcile_stale_runs(loops_dir: Path) -> int:
 
     for state_file in running_dir.glob("*.state.json"):
         try:
-            data = json.loads(state_file.read_text())
+            data = _load_state_data(state_file)
             state = LoopState.from_dict(data)
         except (json.JSONDecodeError, KeyError, OSError):
             continue
@@ -682,6 +937,9 @@ class PersistentExecutor:
         loops_dir: Path | None = None,
         instance_id: str | None = None,
         pid: int | None = None,
+        jsonl_config: JsonlEventsConfig | None = None,
+        state_persistence: str = "snapshot",
+        journal_fold_every: int = DEFAULT_JOURNAL_FOLD_EVERY,
         **executor_kwargs: Any,
     ) -> None:
         """Initialize persistent executor.
@@ -692,6 +950,9 @@ class PersistentExecutor:
             loops_dir: Base directory for loops (default: .loops)
             instance_id: Optional unique instance identifier for file path scoping
             pid: OS PID of the running process; stored in saved state for reconciliation
+            jsonl_config: Events-log durability policy for the default persistence
+            state_persistence: ``"snapshot"`` or ``"journal"`` for the default persistence
+            journal_fold_every: Journal-mode saves between full snapshots
             **executor_kwargs: Additional kwargs for FSMExecutor
         """
         from little_loops.fsm.handoff_handler import HandoffBehavior, HandoffHandler
@@ -701,7 +962,12 @@ class PersistentExecutor:
         self.loops_dir = loops_dir
         self._run_pid = pid
         self.persistence = persistence or StatePersistence(
-            fsm.name, loops_dir or Path(".loops"), instance_id=instance_id
+            fsm.name,
+            loops_dir or Path(".loops"),
+            instance_id=instance_id,
+            jsonl_config=jsonl_config,
+            state_persistence=state_persistence,
+            journal_fold_every=journal_fold_every,
         )
         self.persistence.initialize()
 
@@ -736,8 +1002,13 @@ class PersistentExecutor:
             self.event_bus.register(callback)
 
     def close_transports(self) -> None:
-        """Close all transports registered on the underlying EventBus."""
+        """Close all transports registered on the underlying EventBus.
+
+        Also closes the events log, writing out any rows its durability policy
+        was still buffering.
+        """
         self.event_bus.close_transports()
+        self.persistence.close()
 
     def request_shutdown(self, marker_path: Path | None = None) -> None:
         """Request graceful shutdown of the executor.
@@ -1089,7 +1360,7 @@ def _find_instances(loop_name: str, running_dir: Path) -> list[tuple[str | None,
         if not _INSTANCE_SUFFIX.search(base_stem):
             continue  # skip files like "loop-name-extra" that don't match timestamp pattern
         try:
-            data = json.loads(state_file.read_text())
+            data = _load_state_data(state_file)
             instances.append((base_stem, LoopState.from_dict(data)))
         except (json.JSONDecodeError, KeyError):
             continue
@@ -1098,7 +1369,7 @@ def _find_instances(loop_name: str, running_dir: Path) -> list[tuple[str | None,
     legacy_file = running_dir / f"{loop_name}.state.json"
     if legacy_file.exists():
         try:
-            data = json.loads(legacy_file.read_text())
+            data = _load_state_data(legacy_file)
             instances.append((None, LoopState.from_dict(data)))
         except (json.JSONDecodeError, KeyError):
             pass
@@ -1124,7 +1395,7 @@ def list_running_loops(loops_dir: Path | None = None) -> list[LoopState]:
     states: list[LoopState] = []
     for state_file in running_dir.glob("*.state.json"):
         try:
-            data = json.loads(state_file.read_text())
+            data = _load_state_data(state_file)
             state = LoopState.from_dict(data)
         except (json.JSONDecodeError, KeyError):
             continue  # Skip malformed files
@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
 
-from little_loops.fsm.host_guard import RssSampler
+from little_loops.fsm.host_guard import ProcessTreeSampler, ProcessTreeUsage
 from little_loops.fsm.types import ActionResult
 from little_loops.host_runner import project_child_env
 from little_loops.subprocess_utils import (
@@ -91,17 +91,19 @@ class DefaultActionRunner:
     """Execute actions via subprocess or Claude CLI.
 
     Attributes:
-        sample_rss: When True (set by the executor when the host-guard
-            cumulative RSS budget is active, ENH-2453), each spawned
-            subprocess's RSS is sampled while it runs and the peak is
-            reported via ``ActionResult.peak_rss_mb``.
+        sample_rss: When True (set by the executor when a host-guard
+            cumulative budget or ``account_actions`` is active, ENH-2453),
+            each spawned subprocess's process tree is sampled while it runs
+            and its peak RSS, CPU time and I/O are reported via
+            ``ActionResult.peak_rss_mb`` / ``cpu_seconds`` / ``read_bytes`` /
+            ``write_bytes``.
     """
 
     def __init__(self, sample_rss: bool = False) -> None:
         """Initialize the runner.
 
         Args:
-            sample_rss: Enable per-subprocess peak-RSS sampling (ENH-2453).
+            sample_rss: Enable per-subprocess process-tree sampling (ENH-2453).
         """
         self._current_process: subprocess.Popen[str] | None = None
         self.sample_rss = sample_rss
@@ -165,21 +167,26 @@ class DefaultActionRunner:
                 if not is_stderr and on_output_line:
                     on_output_line(line)
 
-            samplers: list[RssSampler] = []
-            peak_rss: list[float | None] = [None]
+            samplers: list[ProcessTreeSampler] = []
+            tree_usage: list[ProcessTreeUsage] = [ProcessTreeUsage()]
             result_seen: list[bool] = [False]
 
             def _on_proc_start(p: subprocess.Popen[str]) -> None:
                 self._current_process = p
                 if self.sample_rss:
-                    sampler = RssSampler(p.pid)
+                    sampler = ProcessTreeSampler(p.pid)
                     sampler.start()
                     samplers.append(sampler)
 
+            def _stop_sampler(p: subprocess.Popen[str]) -> None:
+                # Runs before run_claude_command reaps the root, so the final
+                # sample still includes the descendants it reaped.
+                if samplers:
+                    tree_usage[0] = samplers.pop().stop()
+
             def _on_proc_end(p: subprocess.Popen[str]) -> None:
                 self._current_process = None
-                if samplers:
-                    peak_rss[0] = samplers.pop().stop()
+                _stop_sampler(p)
 
             def _on_result_seen(seen: bool) -> None:
                 result_seen[0] = seen
@@ -203,6 +210,7 @@ class DefaultActionRunner:
                     stream_callback=_stream_cb,
                     on_process_start=_on_proc_start,
                     on_process_end=_on_proc_end,
+                    on_before_wait=_stop_sampler,
                     agent=agent,
                     tools=tools,
                     on_usage=on_usage,
@@ -245,7 +253,10 @@ class DefaultActionRunner:
                 exit_code=completed.returncode,
                 duration_ms=_now_ms() - start,
                 usage_events=collected_usage,
-                peak_rss_mb=peak_rss[0],
+                peak_rss_mb=tree_usage[0].peak_rss_mb,
+                cpu_seconds=tree_usage[0].cpu_seconds,
+                read_bytes=tree_usage[0].read_bytes,
+                write_bytes=tree_usage[0].write_bytes,
                 result_seen=result_seen[0],
                 session_id=detected_session_id[0],
             )
@@ -280,10 +291,10 @@ class DefaultActionRunner:
         deadline = time.time() + timeout if timeout else None
         last_output_at = time.time()
 
-        # ENH-2453: sample the subprocess's RSS while it runs (budget-gated).
-        shell_sampler: RssSampler | None = None
+        # ENH-2453: sample the subprocess tree while it runs (budget-gated).
+        shell_sampler: ProcessTreeSampler | None = None
         if self.sample_rss:
-            shell_sampler = RssSampler(process.pid)
+            shell_sampler = ProcessTreeSampler(process.pid)
             shell_sampler.start()
 
         output_chunks: list[str] = []
@@ -341,7 +352,9 @@ class DefaultActionRunner:
             sel.close()
             self._current_process = None
 
-        shell_peak_rss = shell_sampler.stop() if shell_sampler is not None else None
+        # Stopped before the wait below so the final sample still sees the
+        # unreaped root, whose counters include its reaped descendants.
+        shell_usage = shell_sampler.stop() if shell_sampler is not None else ProcessTreeUsage()
 
         if timed_out or idled_out:
             _kill_process_group(process)
@@ -358,7 +371,10 @@ class DefaultActionRunner:
                 exit_code=124,
                 duration_ms=_now_ms() - start,
                 timeout_kind="idle" if idled_out else "wall",
-                peak_rss_mb=shell_peak_rss,
+                peak_rss_mb=shell_usage.peak_rss_mb,
+                cpu_seconds=shell_usage.cpu_seconds,
+                read_bytes=shell_usage.read_bytes,
+                write_bytes=shell_usage.write_bytes,
                 result_seen=False,
             )
 
@@ -368,7 +384,10 @@ class DefaultActionRunner:
             stderr="".join(stderr_chunks),
             exit_code=process.returncode,
             duration_ms=_now_ms() - start,
-            peak_rss_mb=shell_peak_rss,
+            peak_rss_mb=shell_usage.peak_rss_mb,
+            cpu_seconds=shell_usage.cpu_seconds,
+            read_bytes=shell_usage.read_bytes,
+            write_bytes=shell_usage.write_bytes,
             result_seen=False,
         )
 
@@ -95,8 +95,15 @@ class ActionResult:
         exit_code: Exit code from the action
         duration_ms: Execution time in milliseconds
         usage_events: Token usage events from host-CLI invocations (empty for shell actions)
-        peak_rss_mb: Peak resident memory of the spawned subprocess in MB
-            (ENH-2453); None when RSS sampling was disabled or unavailable
+        peak_rss_mb: Peak resident memory of the spawned subprocess and its
+            descendants in MB (ENH-2453); None when sampling was disabled or
+            unavailable
+        cpu_seconds: User + system CPU seconds used by the subprocess tree;
+            None when sampling was disabled or unavailable
+        read_bytes: Storage bytes read by the subprocess tree; None when
+            sampling was disabled or ``/proc/<pid>/io`` is unreadable
+        write_bytes: Storage bytes written by the subprocess tree; None as
+            for ``read_bytes``
         result_seen: Whether a stream-json "result" event was observed before
             the subprocess exited (BUG-2731); False for non-host-CLI actions
             (shell, simulation) where no stream-json protocol applies
@@ -115,6 +122,9 @@ class ActionResult:
     duration_ms: int
     usage_events: list[TokenUsage] = field(default_factory=list)
     peak_rss_mb: float | None = None
+    cpu_seconds: float | None = None
+    read_bytes: int | None = None
+    write_bytes: int | None = None
     result_seen: bool = False
     session_id: str | None = None
     timeout_kind: str | None = None
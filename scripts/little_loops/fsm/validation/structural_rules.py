@@ -17,7 +17,13 @@ from typing import Any
 import yaml
 
 from little_loops.fsm.evaluators import _NUMERIC_OPERATORS
-from little_loops.fsm.fragments import resolve_flow, resolve_fragments, resolve_inheritance
+from little_loops.fsm.fragments import (
+    load_loop_spec,
+    resolve_flow,
+    resolve_fragments,
+    resolve_inheritance,
+)
+from little_loops.fsm.loop_cache import cached, read_loop_file
 from little_loops.fsm.loop_paths import resolve_loop_path
 from little_loops.fsm.schema import (
     EvaluateConfig,
@@ -1379,6 +1385,25 @@ def _validate_host_guard(fsm: FSMLoop, defined_states: set[str]) -> list[Validat
                 path="host_guard.max_cumulative_subproc_mb",
             )
         )
+    if hg.max_cumulative_cpu_seconds < 0:
+        errors.append(
+            ValidationError(
+                message=(
+                    f"host_guard.max_cumulative_cpu_seconds must be >= 0, "
+                    f"got {hg.max_cumulative_cpu_seconds}"
+                ),
+                path="host_guard.max_cumulative_cpu_seconds",
+            )
+        )
+    if hg.max_cumulative_io_mb < 0:
+        errors.append(
+            ValidationError(
+                message=(
+                    f"host_guard.max_cumulative_io_mb must be >= 0, got {hg.max_cumulative_io_mb}"
+                ),
+                path="host_guard.max_cumulative_io_mb",
+            )
+        )
     if hg.on_budget_exceeded not in ON_BUDGET_VALUES:
         errors.append(
             ValidationError(
@@ -1389,13 +1414,18 @@ def _validate_host_guard(fsm: FSMLoop, defined_states: set[str]) -> list[Validat
                 path="host_guard.on_budget_exceeded",
             )
         )
-    if hg.max_cumulative_subproc_mb > 0 and hg.on_budget_exceeded == "route":
+    budget_enabled = (
+        hg.max_cumulative_subproc_mb > 0
+        or hg.max_cumulative_cpu_seconds > 0
+        or hg.max_cumulative_io_mb > 0
+    )
+    if budget_enabled and hg.on_budget_exceeded == "route":
         if hg.budget_state is None:
             errors.append(
                 ValidationError(
                     message=(
                         "host_guard.budget_state is required when "
-                        "on_budget_exceeded='route' and the budget is enabled"
+                        "on_budget_exceeded='route' and a budget is enabled"
                     ),
                     path="host_guard.budget_state",
                 )
@@ -1495,18 +1525,20 @@ def is_runnable_loop(path: Path) -> bool:
     (mirroring :func:`load_and_validate`) so pure context-override stubs whose
     parent provides ``initial``/``states`` return True. Library fragments under
     ``loops/lib/`` still return False — their parent chain also lacks ``initial``.
+
+    The parsed document comes from :func:`load_loop_spec`, so repeated checks
+    over an unchanged loops directory are served from the compiled-loop cache.
     """
     try:
-        data = yaml.safe_load(path.read_text())
+        data, resolved = load_loop_spec(path)
     except (OSError, yaml.YAMLError):
         return False
     if not isinstance(data, dict):
         return False
     if "from" in data:
-        try:
-            data = resolve_inheritance(data, path.parent)
-        except Exception:
+        if resolved is None:
             return False
+        data = resolved
     has_flow = "states" in data or "flow" in data
     return "name" in data and "initial" in data and has_flow
 
@@ -1567,35 +1599,11 @@ def _validate_evaluate_unknown_keys(
     return errors
 
 
-def load_and_validate(
-    path: Path,
-    raise_on_error: bool = True,
-    orchestration_request_path: str | None = None,
-) -> tuple[FSMLoop, list[ValidationError]]:
-    """Load YAML file and validate FSM structure.
-
-    Args:
-        path: Path to the YAML file to load
-        raise_on_error: When True (default), raise ValueError on ERROR violations.
-            When False, return all violations (errors + warnings) without raising.
-        orchestration_request_path: Optional project-level ``orchestration.request_path``
-            config default (ENH-2810), threaded into ``validate_fsm`` for MR-12 Check 3's
-            config-level exemption.
-
-    Returns:
-        When raise_on_error=True: (FSMLoop, list of WARNING-severity ValidationErrors)
-        When raise_on_error=False: (FSMLoop, list of all ValidationErrors sorted errors-first)
-
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-        yaml.YAMLError: If the file is not valid YAML
-        ValueError: If raise_on_error=True and validation fails (contains error details)
-    """
-    if not path.exists():
-        raise FileNotFoundError(f"FSM file not found: {path}")
-
-    with open(path) as f:
-        data: dict[str, Any] = yaml.safe_load(f)
+def _compile_loop(
+    path: Path, orchestration_request_path: str | None
+) -> tuple[FSMLoop, list[ValidationError], list[ValidationError]]:
+    """Parse, resolve, and validate a loop file: ``(fsm, errors, warnings)``."""
+    data: dict[str, Any] = yaml.safe_load(read_loop_file(path))
 
     if not isinstance(data, dict):
         raise ValueError(f"FSM file must contain a YAML mapping, got {type(data)}")
@@ -1669,6 +1677,47 @@ def load_and_validate(
     error_list = [e for e in errors if e.severity == ValidationSeverity.ERROR]
     struct_warnings = [e for e in errors if e.severity == ValidationSeverity.WARNING]
     all_warnings = unknown_key_warnings + struct_warnings
+    return fsm, error_list, all_warnings
+
+
+def load_and_validate(
+    path: Path,
+    raise_on_error: bool = True,
+    orchestration_request_path: str | None = None,
+) -> tuple[FSMLoop, list[ValidationError]]:
+    """Load YAML file and validate FSM structure.
+
+    The compiled result (parsed ``FSMLoop`` plus all violations) is cached by
+    :mod:`little_loops.fsm.loop_cache`, keyed by the content of this file and
+    every parent, fragment library, and child loop the load pulled in; a cache
+    hit only re-runs the raise-or-log step.
+
+    Args:
+        path: Path to the YAML file to load
+        raise_on_error: When True (default), raise ValueError on ERROR violations.
+            When False, return all violations (errors + warnings) without raising.
+        orchestration_request_path: Optional project-level ``orchestration.request_path``
+            config default (ENH-2810), threaded into ``validate_fsm`` for MR-12 Check 3's
+            config-level exemption.
+
+    Returns:
+        When raise_on_error=True: (FSMLoop, list of WARNING-severity ValidationErrors)
+        When raise_on_error=False: (FSMLoop, list of all ValidationErrors sorted errors-first)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file is not valid YAML
+        ValueError: If raise_on_error=True and validation fails (contains error details)
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"FSM file not found: {path}")
+
+    fsm, error_list, all_warnings = cached(
+        "validated",
+        path,
+        lambda: _compile_loop(path, orchestration_request_path),
+        extra=orchestration_request_path,
+    )
 
     if not raise_on_error:
         return fsm, error_list + all_warnings
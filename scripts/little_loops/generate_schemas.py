@@ -152,6 +152,18 @@ SCHEMA_DEFINITIONS: dict[str, dict[str, Any]] = {
                 "Cache creation tokens written (prompt/slash_command only)"
             ),
             "model": _str("Model ID reported by the host CLI (prompt/slash_command only)"),
+            "peak_rss_mb": _number(
+                "Peak RSS of the action's process tree in MB (only when sampled by host_guard)"
+            ),
+            "cpu_seconds": _number(
+                "User + system CPU seconds of the action's process tree (only when sampled)"
+            ),
+            "read_bytes": _int(
+                "Storage bytes read by the action's process tree (only when sampled)"
+            ),
+            "write_bytes": _int(
+                "Storage bytes written by the action's process tree (only when sampled)"
+            ),
         },
         ["exit_code", "duration_ms", "is_prompt"],
     ),
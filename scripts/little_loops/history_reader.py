@@ -54,6 +54,7 @@ Public API:
     recent_issue_velocity(limit, ...) -> list[dict]
     lookup_session_metadata(session_id, ...) -> dict
     conversation_turns(db_path, ...) -> list[list[tuple[str, str]]]
+    read_connection(db) -> context manager sharing one cached connection/snapshot
     ll_grep(pattern, ...) -> list[GrepResult]
     ll_expand(summary_id, ...) -> list[dict]
     ll_describe(node_id, ...) -> SummaryNode | None
@@ -80,13 +81,17 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import sqlite3
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, cast
 
 from little_loops.fsm.verdicts import CANNOT_JUDGE
 from little_loops.session_store import (
@@ -419,23 +424,157 @@ def _stale_cutoff(days: int) -> str:
     return (datetime.now(UTC) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+# ---------------------------------------------------------------------------
+# Read connection cache
+# ---------------------------------------------------------------------------
+#
+# Every query function used to pay for ``ensure_db()`` (a separate write
+# connection, WAL pragmas and a ``meta.schema_version`` read) plus a fresh
+# read-only connection, per call. ``project_digest``, ``ll-ctx-stats`` and the
+# MCP ``history_search`` tool issue these back to back, so the setup dominated
+# the actual queries. Handles are now cached per thread (sqlite3 connections
+# are bound to their creating thread) and keyed by resolved DB path; the schema
+# is ensured once per file identity ``(st_dev, st_ino)``, so a database that is
+# deleted or replaced underneath a live handle is re-opened and re-checked. A
+# reused handle also keeps sqlite3's per-connection prepared-statement cache.
+
+# Distinct databases kept open per thread; the least recently used is closed.
+_READ_POOL_SIZE = 8
+
+# sqlite3's per-connection prepared-statement LRU (stdlib default: 128).
+_STATEMENT_CACHE_SIZE = 256
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Read-only connection whose ``close()`` leaves it open in the cache.
+
+    Query functions keep their ``finally: conn.close()`` shape; the cache owns
+    the handle's real lifetime and closes it via :meth:`_discard`.
+    """
+
+    def close(self) -> None:
+        return None
+
+    def _discard(self) -> None:
+        super().close()
+
+
+@dataclass
+class _ReadHandle:
+    conn: _PooledConnection
+    identity: tuple[int, int] | None
+    pinned: int = 0
+
+
+_read_pool = threading.local()
+
+
+def _read_handles() -> OrderedDict[str, _ReadHandle]:
+    handles: OrderedDict[str, _ReadHandle] | None = getattr(_read_pool, "handles", None)
+    if handles is None:
+        handles = _read_pool.handles = OrderedDict()
+    return handles
+
+
+def _file_identity(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _close_read_connections() -> None:
+    """Close every cached read handle owned by the calling thread."""
+    handles = _read_handles()
+    while handles:
+        _, handle = handles.popitem()
+        handle.conn._discard()
+
+
 def _connect_readonly(db_path: Path) -> sqlite3.Connection | None:
-    """Open a read-only connection, or return None on failure."""
+    """Return a cached read-only connection to *db_path*, or None on failure.
+
+    The first call for a database file runs ``ensure_db`` and opens the
+    handle; later calls only ``stat`` the file to confirm it is still the
+    same one. Callers still ``close()`` the result — that is a no-op on a
+    cached handle.
+    """
+    key = str(Path(db_path).resolve())
+    handles = _read_handles()
+    identity = _file_identity(key)
+    handle = handles.get(key)
+    if handle is not None:
+        if handle.pinned or (identity is not None and handle.identity == identity):
+            handles.move_to_end(key)
+            return handle.conn
+        del handles[key]
+        handle.conn._discard()
+
     try:
         ensure_db(db_path)
     except sqlite3.Error:
         logger.warning("history_reader: could not ensure schema for %s", db_path, exc_info=True)
         return None
     try:
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn = cast(
+            _PooledConnection,
+            sqlite3.connect(
+                f"file:{db_path}?mode=ro",
+                uri=True,
+                factory=_PooledConnection,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            ),
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA query_only = ON")
     except sqlite3.Error:
         logger.warning("history_reader: could not open %s read-only", db_path, exc_info=True)
         return None
+    handles[key] = _ReadHandle(conn=conn, identity=_file_identity(key))
+    unpinned = [k for k, h in handles.items() if not h.pinned]
+    for stale_key in unpinned[: max(0, len(unpinned) - _READ_POOL_SIZE)]:
+        handles.pop(stale_key).conn._discard()
     return conn
 
 
+@contextmanager
+def read_connection(db: Path | str = DEFAULT_DB_PATH) -> Iterator[sqlite3.Connection | None]:
+    """Run several history queries against *db* on one connection and snapshot.
+
+    Yields the cached read-only connection (``None`` when the database cannot
+    be opened, matching the query functions' degrade-to-empty contract) and
+    holds a single read transaction for the duration of the block, so every
+    ``history_reader`` query for the same database made inside it — in this
+    thread — reuses that connection and sees one consistent snapshot::
+
+        with read_connection(db):
+            usage = mcp_server_usage(db=db)
+            waste = waste_attribution(db=db)
+
+    Nested blocks for the same database share the outer transaction.
+    """
+    db_path = Path(db)
+    conn = _connect_readonly(db_path)
+    if conn is None:
+        yield None
+        return
+    handle = _read_handles()[str(db_path.resolve())]
+    outermost = handle.pinned == 0
+    handle.pinned += 1
+    try:
+        if outermost:
+            conn.execute("BEGIN")
+        yield conn
+    finally:
+        handle.pinned -= 1
+        if outermost and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                logger.debug("history_reader: could not end read snapshot", exc_info=True)
+
+
 def _row_to_dataclass(row: sqlite3.Row, dc: type[Any]) -> Any:
     """Map a sqlite3.Row to a dataclass instance, catching extra/unknown keys."""
     field_names = {f.name for f in dc.__dataclass_fields__.values()}
@@ -2372,6 +2511,66 @@ def conversation_turns(
 # Summary DAG retrieval (FEAT-1712)
 # ---------------------------------------------------------------------------
 
+# Characters a literal run may contain for the trigram prefilter: printable
+# ASCII, whose case folding under ``re.IGNORECASE`` matches the trigram
+# tokenizer's — except ``i``/``I``, which Python also matches against the
+# Turkish dotted/dotless ``İ``/``ı`` that SQLite does not fold.
+_TRIGRAM_SAFE = frozenset(chr(c) for c in range(0x20, 0x7F)) - {"i", "I"}
+
+
+def _trigram_clauses(items: Any) -> list[str]:
+    """Return FTS5 clauses, all of which a match of parsed regex *items* satisfies.
+
+    Walks the ``re._parser`` tree: consecutive safe literals form a run, and
+    every run of three or more characters becomes a quoted phrase. Anything
+    the walk does not understand just ends the current run, so the result is
+    always implied by the regex (possibly empty), never stricter than it.
+    """
+    from re import _constants as c  # type: ignore[attr-defined]
+
+    clauses: list[str] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if len(run) >= 3:
+            clauses.append(fts_phrase("".join(run)))
+        run.clear()
+
+    for op, av in items:
+        if op is c.LITERAL and chr(av) in _TRIGRAM_SAFE:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is c.SUBPATTERN:
+            clauses.extend(_trigram_clauses(av[-1]))
+        elif op is c.ATOMIC_GROUP:
+            clauses.extend(_trigram_clauses(av))
+        elif op in (c.MAX_REPEAT, c.MIN_REPEAT, c.POSSESSIVE_REPEAT) and av[0] >= 1:
+            clauses.extend(_trigram_clauses(av[2]))
+        elif op is c.BRANCH:
+            branches = [_trigram_clauses(branch) for branch in av[1]]
+            if all(branches):
+                clauses.append("(" + " OR ".join(" AND ".join(b) for b in branches) + ")")
+    flush()
+    return clauses
+
+
+def _trigram_query(pattern: str) -> str | None:
+    """Plan an FTS5 ``message_trigrams`` query that every ``ll_grep`` hit matches.
+
+    Returns ``None`` when no required literal of three or more characters can
+    be extracted (``\\d+``, ``a|.*``, ``ab``) or the pattern does not parse;
+    the caller then scans every row.
+    """
+    from re import _parser  # type: ignore[attr-defined]
+
+    try:
+        parsed = _parser.parse(pattern, re.IGNORECASE)
+    except (re.error, RecursionError):
+        return None
+    clauses = _trigram_clauses(parsed)
+    return " AND ".join(clauses) if clauses else None
+
 
 def ll_grep(
     pattern: str,
@@ -2390,6 +2589,13 @@ def ll_grep(
     walk the N-level DAG (condensed → … → leaves via parent_id → message_events via
     summary_spans) so that messages under all descendant leaves are searched regardless
     of condensation depth.
+
+    The regex is still evaluated in Python, but only against candidate rows:
+    the required literals of *pattern* (see :func:`_trigram_query`) are
+    looked up in the ``message_trigrams`` FTS5 index first. Patterns with no
+    extractable literal, databases migrated on an SQLite without the trigram
+    tokenizer (``meta.message_trigrams = 'unavailable'``), and databases whose
+    index cannot be queried fall back to testing every row.
     """
     db_path = Path(db)
     conn = _connect_readonly(db_path)
@@ -2402,42 +2608,17 @@ def ll_grep(
         except re.error:
             return False
 
+    trigram_query = _trigram_query(pattern)
     try:
         conn.create_function("regexp_match", 2, _regexp)
-        if summary_id is not None:
-            # Recursive CTE walks the full N-level DAG from the starting node
-            # through all descendants, terminating at leaf nodes that have
-            # summary_spans entries.  Works uniformly for both kind='leaf'
-            # (CTE = 1 row) and kind='condensed' at any depth.
-            rows = conn.execute(
-                "WITH RECURSIVE descendants AS ("
-                "  SELECT id, kind FROM summary_nodes WHERE id = ?1"
-                "  UNION ALL"
-                "  SELECT sn.id, sn.kind"
-                "  FROM summary_nodes sn"
-                "  JOIN descendants d ON sn.parent_id = d.id"
-                ")"
-                "SELECT me.id, me.session_id, me.ts, me.content,"
-                " sn.id AS summary_id, sn.kind AS summary_kind"
-                " FROM message_events me"
-                " JOIN summary_spans ss ON ss.message_event_id = me.id"
-                " JOIN descendants leaf ON leaf.id = ss.summary_id"
-                " JOIN summary_nodes sn ON sn.id = leaf.id"
-                " WHERE regexp_match(?2, me.content)"
-                " ORDER BY me.ts, me.id LIMIT ?3",
-                (summary_id, pattern, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT me.id, me.session_id, me.ts, me.content,"
-                " sn.id AS summary_id, sn.kind AS summary_kind"
-                " FROM message_events me"
-                " LEFT JOIN summary_spans ss ON ss.message_event_id = me.id"
-                " LEFT JOIN summary_nodes sn ON sn.id = ss.summary_id"
-                " WHERE regexp_match(?, me.content)"
-                " ORDER BY me.ts, me.id LIMIT ?",
-                (pattern, limit),
-            ).fetchall()
+        rows = None
+        if trigram_query is not None and _message_trigrams_available(conn):
+            try:
+                rows = _ll_grep_rows(conn, pattern, summary_id, limit, trigram_query)
+            except sqlite3.OperationalError:
+                logger.debug("history_reader: ll_grep prefilter unavailable", exc_info=True)
+        if rows is None:
+            rows = _ll_grep_rows(conn, pattern, summary_id, limit, None)
     except sqlite3.Error:
         logger.warning("history_reader: ll_grep query failed", exc_info=True)
         return []
@@ -2457,6 +2638,70 @@ def ll_grep(
     ]
 
 
+def _message_trigrams_available(conn: sqlite3.Connection) -> bool:
+    """False when the schema migration recorded ``message_trigrams`` as unavailable."""
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'message_trigrams'").fetchone()
+    except sqlite3.Error:
+        return False
+    return not (row and row[0] == "unavailable")
+
+
+def _ll_grep_rows(
+    conn: sqlite3.Connection,
+    pattern: str,
+    summary_id: int | None,
+    limit: int,
+    trigram_query: str | None,
+) -> list[sqlite3.Row]:
+    """Run the ``ll_grep`` SELECT, prefiltered by *trigram_query* when given."""
+    where = "regexp_match(:pattern, me.content)"
+    if trigram_query is not None:
+        where = (
+            "me.id IN (SELECT rowid FROM message_trigrams WHERE message_trigrams MATCH :trigrams)"
+            f" AND {where}"
+        )
+    params = {
+        "summary_id": summary_id,
+        "pattern": pattern,
+        "limit": limit,
+        "trigrams": trigram_query,
+    }
+    if summary_id is not None:
+        # Recursive CTE walks the full N-level DAG from the starting node
+        # through all descendants, terminating at leaf nodes that have
+        # summary_spans entries.  Works uniformly for both kind='leaf'
+        # (CTE = 1 row) and kind='condensed' at any depth.
+        return conn.execute(
+            "WITH RECURSIVE descendants AS ("
+            "  SELECT id, kind FROM summary_nodes WHERE id = :summary_id"
+            "  UNION ALL"
+            "  SELECT sn.id, sn.kind"
+            "  FROM summary_nodes sn"
+            "  JOIN descendants d ON sn.parent_id = d.id"
+            ")"
+            "SELECT me.id, me.session_id, me.ts, me.content,"
+            " sn.id AS summary_id, sn.kind AS summary_kind"
+            " FROM message_events me"
+            " JOIN summary_spans ss ON ss.message_event_id = me.id"
+            " JOIN descendants leaf ON leaf.id = ss.summary_id"
+            " JOIN summary_nodes sn ON sn.id = leaf.id"
+            f" WHERE {where}"
+            " ORDER BY me.ts, me.id LIMIT :limit",
+            params,
+        ).fetchall()
+    return conn.execute(
+        "SELECT me.id, me.session_id, me.ts, me.content,"
+        " sn.id AS summary_id, sn.kind AS summary_kind"
+        " FROM message_events me"
+        " LEFT JOIN summary_spans ss ON ss.message_event_id = me.id"
+        " LEFT JOIN summary_nodes sn ON sn.id = ss.summary_id"
+        f" WHERE {where}"
+        " ORDER BY me.ts, me.id LIMIT :limit",
+        params,
+    ).fetchall()
+
+
 def ll_expand(
     summary_id: int,
     *,
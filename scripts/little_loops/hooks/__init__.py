@@ -165,34 +165,30 @@ def _dispatch_table() -> dict[str, Callable[[LLHookEvent], LLHookResult]]:
     return {**_HOOK_INTENT_REGISTRY, **built_ins}
 
 
-def main_hooks() -> int:
-    """CLI entry-point for ``python -m little_loops.hooks <intent>``.
-
-    Reads JSON from stdin, constructs an :class:`LLHookEvent` for the named
-    intent, invokes the handler, and translates the :class:`LLHookResult`
-    into the Claude Code shell-hook contract (exit code + stderr feedback).
+def run_intent(intent: str, raw_stdin: str) -> LLHookResult:
+    """Dispatch one hook fire: parse ``raw_stdin``, run the intent handler.
+
+    Shared by :func:`main_hooks` (one interpreter per fire) and the resident
+    hook daemon (:mod:`little_loops.hooks.daemon`), so both paths build the
+    same :class:`LLHookEvent` from the process cwd and environment and apply
+    the same ``hook_events`` telemetry wrap. An unknown intent returns exit
+    code 1 with the available intents as feedback; empty or non-JSON stdin is
+    a no-op (exit 0).
     """
-    if len(sys.argv) < 2:
-        print(_USAGE, file=sys.stderr)
-        return 0
-
-    intent = sys.argv[1]
     handlers = _dispatch_table()
     handler = handlers.get(intent)
     if handler is None:
-        print(
-            f"Unknown intent: {intent!r}. Available: {', '.join(sorted(handlers))}",
-            file=sys.stderr,
+        return LLHookResult(
+            exit_code=1,
+            feedback=f"Unknown intent: {intent!r}. Available: {', '.join(sorted(handlers))}",
         )
-        return 1
 
-    raw_stdin = sys.stdin.read() if not sys.stdin.isatty() else ""
     if not raw_stdin.strip():
-        return 0
+        return LLHookResult(exit_code=0)
     try:
         parsed = json.loads(raw_stdin)
     except json.JSONDecodeError:
-        return 0
+        return LLHookResult(exit_code=0)
     payload: dict[str, Any] = parsed if isinstance(parsed, dict) else {}
 
     event = LLHookEvent(
@@ -219,6 +215,22 @@ def main_hooks() -> int:
                 completion.stderr_preview = result.feedback
     else:
         result = handler(event)
+    return result
+
+
+def main_hooks() -> int:
+    """CLI entry-point for ``python -m little_loops.hooks <intent>``.
+
+    Reads JSON from stdin, constructs an :class:`LLHookEvent` for the named
+    intent, invokes the handler, and translates the :class:`LLHookResult`
+    into the Claude Code shell-hook contract (exit code + stderr feedback).
+    """
+    if len(sys.argv) < 2:
+        print(_USAGE, file=sys.stderr)
+        return 0
+
+    raw_stdin = sys.stdin.read() if not sys.stdin.isatty() else ""
+    result = run_intent(sys.argv[1], raw_stdin)
     if result.stdout is not None:
         sys.stdout.write(result.stdout)
     if result.feedback:
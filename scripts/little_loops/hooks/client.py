@@ -0,0 +1,219 @@
+"""Hook client shim: forward a hook fire to the resident daemon, else run in-process.
+
+The Claude Code adapter scripts invoke ``python -m little_loops.hooks.client
+<intent>`` in place of ``python -m little_loops.hooks <intent>``. When a hook
+daemon (:mod:`little_loops.hooks.daemon`) is serving the current directory,
+the shim sends it the stdin payload and environment over a Unix socket and
+replays its exit code, stdout and stderr — the intent handler and its imports
+never load in the short-lived hook process. When no daemon is listening (the
+default: the daemon is opt-in via ``hooks.daemon.enabled``), it falls back to
+:func:`little_loops.hooks.main_hooks` in the same process, so the observable
+behavior is identical either way.
+
+The socket lives in a per-user ``0700`` directory (:func:`runtime_dir`), and
+the shim only forwards when SessionStart has marked the project enabled and
+the process listening on the socket runs as the same user — the request
+carries the caller's whole environment.
+
+This module must stay stdlib-only: its import cost is paid on every hook fire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+
+PROTOCOL_VERSION = 1
+
+# AF_UNIX paths are limited to ~104-108 bytes depending on the platform.
+_MAX_SOCKET_PATH = 100
+_CONNECT_TIMEOUT = 0.5
+# Stay under the hook's timeout in hooks/hooks.json (5s; 15s for session_end)
+# so a wedged daemon still yields the non-blocking error reply below instead
+# of the host killing the hook.
+_RESPONSE_TIMEOUT = 4.5
+_RESPONSE_TIMEOUTS = {"session_end": 14.5}
+
+
+def runtime_dir(*, create: bool = False) -> str | None:
+    """Per-user directory for daemon sockets, locks and enable markers.
+
+    ``$XDG_RUNTIME_DIR/little-loops`` when that variable is an absolute path,
+    else ``little-loops-<uid>`` under the temp directory; created ``0700``
+    when ``create`` is set. Returns ``None`` (no daemon) when the path is
+    missing or is not a directory owned by this user with no group or other
+    permissions, so a directory planted in a shared ``/tmp`` is never used.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    base = os.environ.get("XDG_RUNTIME_DIR", "")
+    if os.path.isabs(base):
+        path = os.path.join(base, "little-loops")
+    else:
+        path = os.path.join(tempfile.gettempdir(), f"little-loops-{os.getuid()}")
+    if create:
+        try:
+            os.mkdir(path, 0o700)
+        except FileExistsError:
+            pass
+        except OSError:
+            return None
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def _runtime_stem(cwd: str, *, create: bool = False) -> str | None:
+    """``<runtime_dir>/hookd-<digest>``: the per-project prefix of the daemon's files."""
+    directory = runtime_dir(create=create)
+    if directory is None:
+        return None
+    digest = hashlib.sha1(os.path.realpath(cwd).encode()).hexdigest()[:16]
+    return os.path.join(directory, f"hookd-{digest}")
+
+
+def socket_path(cwd: str) -> str | None:
+    """Daemon socket for the project at ``cwd``, or ``None`` when unavailable.
+
+    ``None`` when :func:`runtime_dir` is unusable or the path would exceed the
+    ``AF_UNIX`` length limit.
+    """
+    stem = _runtime_stem(cwd)
+    if stem is None or len(stem.encode()) + len(".sock") > _MAX_SOCKET_PATH:
+        return None
+    return stem + ".sock"
+
+
+def enabled_marker(cwd: str, *, create: bool = False) -> str | None:
+    """File SessionStart creates while ``hooks.daemon.enabled`` is set for ``cwd``.
+
+    ``create`` creates the runtime directory if needed (the marker itself is
+    left to the caller).
+    """
+    stem = _runtime_stem(cwd, create=create)
+    return None if stem is None else stem + ".enabled"
+
+
+def peer_uid(sock: socket.socket) -> int | None:
+    """uid of the process at the other end of a connected ``AF_UNIX`` socket.
+
+    ``SO_PEERCRED`` on Linux, ``LOCAL_PEERCRED`` on macOS; ``None`` when the
+    platform offers neither or the lookup fails.
+    """
+    try:
+        if hasattr(socket, "SO_PEERCRED"):
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            return int(struct.unpack("3i", creds)[1])  # struct ucred: pid, uid, gid
+        if sys.platform == "darwin":
+            # SOL_LOCAL (0) / LOCAL_PEERCRED (1) fill a struct xucred:
+            # cr_version, cr_uid, cr_ngroups, cr_groups[16].
+            creds = sock.getsockopt(
+                0, getattr(socket, "LOCAL_PEERCRED", 1), struct.calcsize("2Ih16I")
+            )
+            return int(struct.unpack_from("2I", creds)[1])
+    except OSError:
+        return None
+    return None
+
+
+def package_version() -> str:
+    """Installed little-loops version; the daemon refuses requests from another one."""
+    from little_loops import __version__
+
+    return __version__
+
+
+def recv_all(sock: socket.socket) -> bytes:
+    """Read from ``sock`` until the peer shuts down its write side."""
+    chunks: list[bytes] = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def forward(intent: str, raw_stdin: str, cwd: str | None = None) -> dict | None:
+    """Send one hook fire to the daemon serving ``cwd``.
+
+    Returns the daemon's reply (``exit_code``/``stdout``/``stderr``), or
+    ``None`` when no daemon accepted the request — the daemon is not enabled
+    for ``cwd``, nothing listens, or the listener is another user's — so the
+    caller may safely run the intent itself. Once the request is delivered a failure
+    is *not* retried in-process (the handler may already have had side
+    effects); it is reported as a non-blocking exit 0 instead.
+    """
+    cwd = cwd or os.getcwd()
+    path = socket_path(cwd)
+    marker = enabled_marker(cwd)
+    if path is None or marker is None or not (os.path.exists(marker) and os.path.exists(path)):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+        if peer_uid(sock) != os.getuid():
+            return None  # not our daemon: send it nothing
+        request = {
+            "protocol": PROTOCOL_VERSION,
+            "version": package_version(),
+            "intent": intent,
+            "stdin": raw_stdin,
+            "cwd": cwd,
+            "env": dict(os.environ),
+        }
+        try:
+            sock.sendall(json.dumps(request).encode())
+            sock.shutdown(socket.SHUT_WR)
+            sock.settimeout(_RESPONSE_TIMEOUTS.get(intent, _RESPONSE_TIMEOUT))
+            reply = json.loads(recv_all(sock))
+            if not isinstance(reply, dict):
+                raise ValueError(f"unexpected reply {reply!r}")
+        except (OSError, ValueError) as exc:
+            return {"exit_code": 0, "stdout": "", "stderr": f"[ll] hook daemon error: {exc}\n"}
+    finally:
+        sock.close()
+    if reply.get("rejected"):
+        # Stale daemon (other version/protocol), another project, or busy
+        # with another fire: it did not run the handler, so the caller falls
+        # back.
+        return None
+    return reply
+
+
+def main_client() -> int:
+    """CLI entry-point for ``python -m little_loops.hooks.client <intent>``."""
+    if len(sys.argv) < 2:
+        from little_loops.hooks import main_hooks
+
+        return main_hooks()
+
+    raw_stdin = sys.stdin.read() if not sys.stdin.isatty() else ""
+    reply = forward(sys.argv[1], raw_stdin)
+    if reply is None:
+        import io
+
+        from little_loops.hooks import main_hooks
+
+        sys.stdin = io.StringIO(raw_stdin)
+        return main_hooks()
+    sys.stdout.write(reply.get("stdout") or "")
+    sys.stderr.write(reply.get("stderr") or "")
+    return int(reply.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_client())
@@ -0,0 +1,400 @@
+"""Resident hook daemon: serve hook intents over a Unix socket.
+
+Every hook fire otherwise starts a fresh interpreter and re-imports the intent
+handler, the config layer and the session store. PreToolUse/PostToolUse fire
+on every tool call, so that fixed cost lands on every agent step. With
+``hooks.daemon.enabled`` set, the SessionStart hook starts one daemon per
+project (``python -m little_loops.hooks.daemon``). It listens on a socket in
+the per-user ``0700`` runtime directory (see
+:func:`little_loops.hooks.client.socket_path`), only serves connections from
+its own uid, keeps
+the handlers, compiled regexes and config modules imported, skips repeated
+``history.db`` schema checks, and runs each request through the same
+:func:`little_loops.hooks.run_intent` path as the in-process dispatcher.
+
+One request runs at a time, with the client's environment and captured
+stdout/stderr, so handlers that read ``LL_*`` variables see the caller's
+values. Module-level caches that the one-shot path only keeps for a single
+fire (``_PER_FIRE_CACHES``) are emptied before each request. A request that arrives while another is running is answered
+``{"rejected": "busy"}`` before any handler runs, so that client runs the
+intent in-process instead of queueing behind it until the host's hook timeout
+kills it. The daemon exits after ``hooks.daemon.idle_timeout_seconds``
+without a request, when its socket is removed, or when a client of another
+little-loops version connects or a hook, config or session-store source file
+changes (that client falls back to the in-process path and the next
+SessionStart starts a fresh daemon). SessionStart with the daemon disabled
+removes the project's enable marker — so clients stop forwarding — and stops
+any daemon still running.
+
+Config (``.ll/ll-config.json``)::
+
+    "hooks": {"daemon": {"enabled": true, "idle_timeout_seconds": 900}}
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fcntl
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any
+
+from little_loops.hooks.client import (
+    PROTOCOL_VERSION,
+    enabled_marker,
+    package_version,
+    peer_uid,
+    recv_all,
+    socket_path,
+)
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+# How often the accept loop wakes to check the idle deadline and socket file.
+_POLL_INTERVAL = 5.0
+_REQUEST_TIMEOUT = 30.0
+
+# Module-level caches that the one-shot path drops with its interpreter after
+# every fire. A resident daemon clears them before each request, so e.g. a
+# package proven between two PreToolUse fires is not still blocked from the
+# first fire's lookup.
+_PER_FIRE_CACHES = (
+    ("little_loops.hooks.learning_tests_gate", "_SESSION_CACHE"),
+    ("little_loops.hooks.install_learning_gate", "_SESSION_CACHE"),
+)
+
+
+def _inode(path: str) -> int | None:
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return None
+
+
+# Packages whose code a resident daemon keeps imported across requests.
+_STAMPED_PACKAGES = ("hooks", "config", "session_store")
+
+
+def _source_stamp() -> float:
+    """Newest mtime of the hook, config and session-store sources; an edit retires the daemon."""
+    root = Path(__file__).parent.parent
+    return max(
+        (p.stat().st_mtime for pkg in _STAMPED_PACKAGES for p in (root / pkg).glob("*.py")),
+        default=0.0,
+    )
+
+
+def _clear_per_fire_caches() -> None:
+    """Empty every ``_PER_FIRE_CACHES`` entry whose module is already imported."""
+    for module_name, attr in _PER_FIRE_CACHES:
+        cache = getattr(sys.modules.get(module_name), attr, None)
+        if cache is not None:
+            cache.clear()
+
+
+def daemon_settings(config: dict[str, Any]) -> tuple[bool, float]:
+    """``(enabled, idle_timeout_seconds)`` from a raw ll-config dict.
+
+    Reads ``hooks.daemon`` the same raw way as the other ``hooks.*`` keys
+    (the section has no BRConfig dataclass). Malformed values disable the
+    daemon rather than raising — SessionStart must never fail over it.
+    """
+    hooks = config.get("hooks", {})
+    section = hooks.get("daemon", {}) if isinstance(hooks, dict) else {}
+    if not isinstance(section, dict):
+        return False, DEFAULT_IDLE_TIMEOUT
+    try:
+        idle = float(section.get("idle_timeout_seconds", DEFAULT_IDLE_TIMEOUT))
+    except (TypeError, ValueError):
+        return False, DEFAULT_IDLE_TIMEOUT
+    return section.get("enabled", False) is True and idle > 0, idle
+
+
+def is_running(cwd: Path) -> bool:
+    """True when a daemon accepts connections on ``cwd``'s socket."""
+    path = socket_path(str(cwd))
+    if path is None or not os.path.exists(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def start_daemon(
+    cwd: Path, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT, wait: float = 0.0
+) -> bool:
+    """Spawn a detached daemon for ``cwd`` unless one is already serving it.
+
+    Creates ``cwd``'s enable marker first, so clients forward to the daemon.
+    Does not wait by default: hook fires that arrive before the daemon is
+    listening simply take the in-process path. Returns True when a daemon is
+    serving ``cwd`` within ``wait`` seconds; False at once when the per-user
+    runtime directory is unusable.
+    """
+    marker = enabled_marker(str(cwd), create=True)
+    if marker is None or socket_path(str(cwd)) is None:
+        return False
+    Path(marker).touch()
+    if is_running(cwd):
+        return True
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "little_loops.hooks.daemon",
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        cwd=str(cwd),
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + wait
+    while True:
+        if is_running(cwd):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def stop_daemon(cwd: Path) -> bool:
+    """Ask the daemon serving ``cwd`` to exit. Returns False when none was running."""
+    path = socket_path(str(cwd))
+    if path is None:
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_REQUEST_TIMEOUT)
+        try:
+            sock.connect(path)
+            sock.sendall(json.dumps({"protocol": PROTOCOL_VERSION, "shutdown": True}).encode())
+            sock.shutdown(socket.SHUT_WR)
+            recv_all(sock)
+        except OSError:
+            return False
+    return True
+
+
+def disable_daemon(cwd: Path) -> None:
+    """Remove ``cwd``'s enable marker and stop any daemon still serving it."""
+    marker = enabled_marker(str(cwd))
+    if marker is None:
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(marker)
+    if is_running(cwd):
+        stop_daemon(cwd)
+
+
+class HookDaemon:
+    """Serve hook intents for one project directory until idle.
+
+    Args:
+        cwd: Project directory; the daemon only serves clients whose cwd is
+            this directory, so handlers that use ``Path.cwd()`` behave as in
+            the in-process path.
+        idle_timeout: Seconds without a request before the daemon exits.
+    """
+
+    def __init__(self, cwd: Path, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        self.cwd = cwd
+        self.idle_timeout = idle_timeout
+        self.socket_path = socket_path(str(cwd))
+        self.version = package_version()
+        self._source_stamp = _source_stamp()
+        self._stopping = False
+        # Held while a handler runs: handle_request swaps os.environ, so only
+        # one may run at a time.
+        self._busy = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one request and return the reply sent back to the client."""
+        if request.get("protocol") != PROTOCOL_VERSION:
+            self._stopping = True
+            return {"rejected": "protocol"}
+        if request.get("shutdown"):
+            self._stopping = True
+            return {"stopped": True}
+        if request.get("version") != self.version:
+            # The installed package changed under us; let the next
+            # SessionStart start a daemon running the new code.
+            self._stopping = True
+            return {"rejected": "version"}
+        if _source_stamp() != self._source_stamp:
+            self._stopping = True
+            return {"rejected": "stale"}
+        if os.path.realpath(str(request.get("cwd", ""))) != os.path.realpath(self.cwd):
+            return {"rejected": "cwd"}
+
+        from little_loops.hooks import run_intent
+
+        _clear_per_fire_caches()
+        out, err = io.StringIO(), io.StringIO()
+        saved_env = dict(os.environ)
+        exit_code = 0
+        try:
+            os.environ.clear()
+            os.environ.update({str(k): str(v) for k, v in request.get("env", {}).items()})
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                result = run_intent(str(request.get("intent", "")), str(request.get("stdin", "")))
+            exit_code = result.exit_code
+            if result.stdout is not None:
+                out.write(result.stdout)
+            if result.feedback:
+                err.write(result.feedback + "\n")
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        except Exception:
+            # Same outcome as an uncaught handler exception in the one-shot
+            # interpreter: traceback on stderr, exit code 1.
+            err.write(traceback.format_exc())
+            exit_code = 1
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+        return {"exit_code": exit_code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    def _serve_connection(self, conn: socket.socket) -> bool:
+        """Serve one connection; False for liveness probes and malformed requests.
+
+        Closes ``conn`` itself, except when the request is handed to a worker
+        thread, which closes it after replying.
+        """
+        if peer_uid(conn) != os.getuid():
+            conn.close()  # another user's process: never run its request
+            return False
+        conn.settimeout(_REQUEST_TIMEOUT)
+        try:
+            request = json.loads(recv_all(conn))
+            if not isinstance(request, dict):
+                raise ValueError("request is not an object")
+        except (OSError, ValueError):
+            conn.close()
+            return False
+        if request.get("shutdown"):
+            _send_reply(conn, self.handle_request(request))
+        elif not self._busy.acquire(blocking=False):
+            _send_reply(conn, {"rejected": "busy"})
+        else:
+            self._worker = threading.Thread(
+                target=self._run_request, args=(conn, request), daemon=True
+            )
+            self._worker.start()
+        return True
+
+    def _run_request(self, conn: socket.socket, request: dict[str, Any]) -> None:
+        """Worker thread body: run one request while holding ``_busy``."""
+        try:
+            reply = self.handle_request(request)
+        finally:
+            # Release before replying so the client's next fire is not busy.
+            self._busy.release()
+        _send_reply(conn, reply)
+
+    def serve_forever(self) -> int:
+        """Bind the socket and serve until idle, stopped, or the socket is removed.
+
+        Returns 0 on a normal exit, including when another daemon already
+        holds the project's lock; 1 when the per-user runtime directory is
+        unusable.
+        """
+        path = self.socket_path
+        if path is None:
+            return 1
+        from little_loops.hooks import _dispatch_table
+        from little_loops.session_store import schema
+
+        lock_path = os.path.splitext(path)[0] + ".lock"
+        with open(lock_path, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return 0  # another daemon serves this project
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)  # stale socket from a killed daemon
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            bound: int | None = None
+            try:
+                server.bind(path)
+                server.listen(16)
+                server.settimeout(min(_POLL_INTERVAL, self.idle_timeout))
+                bound = _inode(path)
+                schema.remember_ensured_schemas(True)
+                _dispatch_table()  # import every handler up front
+                last_request = time.monotonic()
+                while not self._stopping:
+                    try:
+                        conn, _ = server.accept()
+                    except TimeoutError:
+                        pass
+                    else:
+                        if self._serve_connection(conn):
+                            last_request = time.monotonic()
+                    idle = time.monotonic() - last_request >= self.idle_timeout
+                    if idle and not self._busy.locked():
+                        break
+                    if _inode(path) != bound:
+                        break  # socket removed or taken over
+            finally:
+                server.close()
+                if self._worker is not None:
+                    self._worker.join()  # let an in-flight request finish and reply
+                if bound is not None and _inode(path) == bound:
+                    with contextlib.suppress(OSError):
+                        os.unlink(path)
+        return 0
+
+
+def _send_reply(conn: socket.socket, reply: dict[str, Any]) -> None:
+    with conn, contextlib.suppress(OSError):
+        conn.sendall(json.dumps(reply).encode())
+
+
+def _terminate(signum: int, frame: object) -> None:
+    raise SystemExit(0)
+
+
+def main_daemon(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m little_loops.hooks.daemon`` (serves the cwd)."""
+    parser = argparse.ArgumentParser(
+        prog="python -m little_loops.hooks.daemon",
+        description="Serve little-loops hook intents for the current project over a Unix socket",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Exit after this long without a request (default: {DEFAULT_IDLE_TIMEOUT:.0f})",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the daemon serving the current directory and exit",
+    )
+    args = parser.parse_args(argv)
+    cwd = Path.cwd()
+    if args.stop:
+        return 0 if stop_daemon(cwd) else 1
+    signal.signal(signal.SIGTERM, _terminate)
+    return HookDaemon(cwd, idle_timeout=args.idle_timeout).serve_forever()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_daemon())
@@ -163,9 +163,11 @@ def handle(event: LLHookEvent) -> LLHookResult:
                 _backfill_path = str(_pf) if _pf is not None else None
 
             if _backfill_path is not None and not _os.environ.get("LL_NON_INTERACTIVE"):
-                # ENH-2581: pass --rebuild only when SCHEMA_VERSION has advanced past
-                # the last rebuild() run, so the (expensive) cache-table rebuild is
-                # opt-in-on-migration rather than run on every session start.
+                # ENH-2581: --rebuild is always passed — the worker's rebuild is
+                # incremental (watermarked on raw_events.id), so in steady state
+                # it only derives the rows this backfill just ingested, and it
+                # falls back to a full wipe-and-replay itself when
+                # SCHEMA_VERSION has advanced past the last rebuild.
                 _worker_argv = [
                     sys.executable,
                     "-m",
@@ -177,19 +179,7 @@ def handle(event: LLHookEvent) -> LLHookResult:
                 # adapter envelope, not the worker's ambient host.
                 _backfill_host = event.host or _os.environ.get("LL_HOOK_HOST", "claude-code")
                 _worker_argv.extend(["--host", _backfill_host])
-                with contextlib.suppress(Exception):
-                    from little_loops.session_store import SCHEMA_VERSION, connect
-
-                    _rebuild_conn = connect(_db_path)
-                    try:
-                        _row = _rebuild_conn.execute(
-                            "SELECT value FROM meta WHERE key = 'last_rebuild_version'"
-                        ).fetchone()
-                    finally:
-                        _rebuild_conn.close()
-                    _last_rebuild_version = int(_row[0]) if (_row and _row[0]) else 0
-                    if _last_rebuild_version < SCHEMA_VERSION:
-                        _worker_argv.append("--rebuild")
+                _worker_argv.append("--rebuild")
 
                 subprocess.Popen(
                     _worker_argv,
@@ -200,6 +190,21 @@ def handle(event: LLHookEvent) -> LLHookResult:
                     cwd=str(cwd),
                 )
 
+        # Resident hook daemon (opt-in, hooks.daemon.enabled): later hook fires
+        # in this project are served over a per-user Unix socket instead of
+        # each starting a fresh interpreter. Not awaited — fires that arrive
+        # before it listens take the in-process path. When disabled, clear the
+        # enable marker and stop a daemon left from an earlier session so no
+        # fire is forwarded to it.
+        with contextlib.suppress(Exception):
+            from little_loops.hooks.daemon import daemon_settings, disable_daemon, start_daemon
+
+            _daemon_enabled, _daemon_idle = daemon_settings(merged_config)
+            if _daemon_enabled:
+                start_daemon(cwd, idle_timeout=_daemon_idle)
+            else:
+                disable_daemon(cwd)
+
         # ENH-1907: Inject project-context digest (best-effort, opt-in).
         # Runs after the backfill thread launches so the digest reflects only
         # already-persisted rows from prior sessions, not this session's backfill.
@@ -64,6 +64,7 @@ _GITIGNORE_ENTRIES: tuple[str, ...] = (
     ".ll/ll-session-events.jsonl",
     ".ll/history.db*",
     ".ll/queue.db*",
+    ".ll/issue_index.db*",
     ".ll/*.lock",
     ".ll/ll-continue-prompt.md",
     ".ll/private-refs.local.txt",
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -16,13 +15,13 @@ from little_loops.issue_discovery.matching import (
     FindingMatch,
     MatchClassification,
     RegressionEvidence,
-    _calculate_word_overlap,
     _extract_words,
     _matches_issue_type,
 )
 
 if TYPE_CHECKING:
     from little_loops.config import BRConfig
+    from little_loops.issue_index import IssueIndex
     from little_loops.logger import Logger
 
 
@@ -51,17 +50,27 @@ def _get_all_issue_files(
     Returns:
         List of ``(path, is_completed)`` tuples.
     """
-    from little_loops.frontmatter import parse_frontmatter
+    from little_loops.issue_index import IssueIndex
+
+    with IssueIndex.for_project(config.project_root) as index:
+        return _list_issue_files(index, config, include_completed, include_deferred)
 
-    files: list[tuple[Path, bool]] = []
 
+def _list_issue_files(
+    index: IssueIndex,
+    config: BRConfig,
+    include_completed: bool = True,
+    include_deferred: bool = False,
+) -> list[tuple[Path, bool]]:
+    """:func:`_get_all_issue_files` against an already-open *index*."""
+    files: list[tuple[Path, bool]] = []
     for category in config.issue_categories:
         issue_dir = config.get_issue_dir(category)
         if not issue_dir.exists():
             continue
         for f in issue_dir.glob("*.md"):
             try:
-                fm = parse_frontmatter(f.read_text(encoding="utf-8"))
+                fm = index.frontmatter(f)
             except Exception:
                 files.append((f, False))
                 continue
@@ -82,17 +91,26 @@ def search_issues_by_content(
     config: BRConfig,
     search_terms: list[str],
     include_completed: bool = True,
+    limit: int | None = None,
 ) -> list[tuple[Path, float, bool]]:
     """Search issues by content with relevance scoring.
 
+    Candidates are ranked by BM25 over the inverted index in
+    ``.ll/issue_index.db`` (see :meth:`IssueIndex.search`), so only issues
+    edited since the last search are re-read. The returned score is the
+    Jaccard word overlap the duplicate thresholds are calibrated against.
+
     Args:
         config: Project configuration
         search_terms: Terms to search for
         include_completed: Whether to include completed issues
+        limit: Keep only this many of the best BM25 matches (default: all)
 
     Returns:
         List of (path, score, is_completed) sorted by score descending
     """
+    from little_loops.issue_index import IssueIndex
+
     results: list[tuple[Path, float, bool]] = []
     search_words = set()
     for term in search_terms:
@@ -101,15 +119,15 @@ def search_issues_by_content(
     if not search_words:
         return results
 
-    for issue_path, is_completed in _get_all_issue_files(config, include_completed):
-        try:
-            content = issue_path.read_text(encoding="utf-8")
-            content_words = _extract_words(content)
-            score = _calculate_word_overlap(search_words, content_words)
-            if score > 0.1:  # Minimum threshold
-                results.append((issue_path, score, is_completed))
-        except Exception:
-            continue
+    with IssueIndex.for_project(config.project_root) as index:
+        files = dict(_list_issue_files(index, config, include_completed))
+        hits = index.search(list(files), search_words)
+
+    for hit in hits:
+        if hit.overlap > 0.1:  # Minimum threshold
+            results.append((hit.path, hit.overlap, files[hit.path]))
+            if limit is not None and len(results) >= limit:
+                break
 
     results.sort(key=lambda x: x[1], reverse=True)
     return results
@@ -166,7 +184,7 @@ def find_existing_issue(
     Uses a multi-pass approach:
     1. Exact file path match in Location sections
     2. Title word overlap (> dup_overlap_threshold (default 0.7) = likely duplicate)
-    3. Content overlap analysis
+    3. Content overlap among the top 5 BM25 matches
 
     For matches to completed issues, performs regression analysis to determine
     if the match is a regression (fix broke) or invalid fix (never worked).
@@ -230,30 +248,21 @@ def find_existing_issue(
     # Pass 2: Title similarity
     title_words = _extract_words(finding_title)
     if title_words:
+        from little_loops.issue_index import IssueIndex
+
+        with IssueIndex.for_project(config.project_root) as index:
+            files = dict(_list_issue_files(index, config))
+            title_hits = index.search(list(files), title_words, title=True)
+
         best_pass2: tuple[Path, bool, float, list[str]] | None = None
         best_pass2_score = best_match.match_score
-        for issue_path, is_completed in _get_all_issue_files(config):
-            try:
-                # Extract title from issue file
-                content = issue_path.read_text(encoding="utf-8")
-                title_match = re.search(r"^#\s+[\w-]+:\s*(.+)$", content, re.MULTILINE)
-                if title_match:
-                    issue_title = title_match.group(1)
-                    issue_words = _extract_words(issue_title)
-                    overlap = _calculate_word_overlap(title_words, issue_words)
-                    if (
-                        overlap > config.history.capture_issue.dup_overlap_threshold
-                        and overlap > best_pass2_score
-                    ):
-                        best_pass2_score = overlap
-                        best_pass2 = (
-                            issue_path,
-                            is_completed,
-                            overlap,
-                            list(title_words & issue_words),
-                        )
-            except Exception:
-                continue
+        for hit in title_hits:
+            if (
+                hit.overlap > config.history.capture_issue.dup_overlap_threshold
+                and hit.overlap > best_pass2_score
+            ):
+                best_pass2_score = hit.overlap
+                best_pass2 = (hit.path, files[hit.path], hit.overlap, list(hit.matched))
 
         # Determine classification once for the single best Pass 2 match
         if best_pass2 is not None:
@@ -280,10 +289,11 @@ def find_existing_issue(
         content_matches = search_issues_by_content(
             config,
             [finding_title, finding_content],
+            limit=5,
         )
         best_pass3: tuple[Path, bool, float] | None = None
         best_pass3_score = best_match.match_score
-        for issue_path, score, is_completed in content_matches[:5]:  # Top 5
+        for issue_path, score, is_completed in content_matches:
             adjusted_score = score * 0.8  # Content matches are less precise
             if adjusted_score > best_pass3_score:
                 best_pass3_score = adjusted_score
@@ -10,26 +10,29 @@ from __future__ import annotations
 import logging
 import re
 import subprocess
+from collections.abc import Iterator, Mapping
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 from little_loops.frontmatter import parse_frontmatter
 from little_loops.issue_history.models import CompletedIssue
+from little_loops.issue_index import IssueIndex
 from little_loops.text_utils import extract_file_paths
 
 logger = logging.getLogger(__name__)
 
 
 def parse_completed_issue(
-    file_path: Path, *, batch_dates: dict[str, date] | None = None
+    file_path: Path, *, batch_dates: Mapping[str, date] | None = None
 ) -> CompletedIssue:
     """Parse a completed issue file.
 
     Args:
         file_path: Path to the issue markdown file
-        batch_dates: Optional pre-fetched mapping of filename → add-date from a batch
-            git log call; when provided, skips the per-file subprocess call.
+        batch_dates: Optional mapping of filename → last-commit date from a batch
+            git log call (see ``_batch_completion_dates``); when provided, skips
+            the per-file subprocess call.
 
     Returns:
         CompletedIssue with parsed metadata
@@ -113,32 +116,122 @@ def _parse_discovered_by(fm: dict[str, Any]) -> str | None:
     return value if isinstance(value, str) else None
 
 
-def _batch_completion_dates(_issues_dir: Path) -> dict[str, date]:
-    """No-op stub kept for legacy callers.
+def _git_stdout(cwd: Path, *args: str) -> str | None:
+    """Run ``git *args`` in *cwd*; return stdout, or None on any failure."""
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, text=True, cwd=cwd)
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _parse_name_log(output: str) -> dict[str, str]:
+    """Map filename → newest date from ``git log --format=%x00%as --name-only``."""
+    dates: dict[str, str] = {}
+    current = ""
+    for line in output.splitlines():
+        if line.startswith("\0"):
+            current = line[1:]
+        elif line and current:
+            dates.setdefault(line.rsplit("/", 1)[-1], current)
+    return dates
+
 
-    The previous implementation used ``git log --diff-filter=A`` against
-    ``completed/`` to detect when issue files were *moved* into completion.
-    With status decoupled from directory location (ENH-1418), files no
-    longer move on completion; ``completed_at:`` frontmatter is the primary
-    source of truth, with a per-file ``git log -1`` fallback in
-    ``_parse_completion_date``. ENH-1420 will backfill ``completed_at`` for
-    pre-decoupling issues, after which the per-file fallback can also be
-    removed.
+def _batch_completion_dates(
+    issues_dir: Path, *, index: IssueIndex | None = None
+) -> dict[str, date]:
+    """Map every filename ever committed under *issues_dir* to its last commit date.
+
+    One ``git log --name-only`` over the directory replaces the per-file
+    ``git log -1`` fallback in ``_parse_completion_date`` (newest commit wins,
+    matching that call). When *index* is given the map is stored in it keyed
+    by ``HEAD``: an unchanged ``HEAD`` costs one ``rev-parse``, and a ``HEAD``
+    that has moved forward only logs the new commits.
 
     Args:
-        _issues_dir: Unused (kept for signature stability).
+        issues_dir: Directory whose history to read (usually ``.issues/``).
+        index: Optional open ``IssueIndex`` used as the persistent cache.
 
     Returns:
-        An empty mapping.
+        Filename → date mapping; empty when *issues_dir* is not in a git repo.
     """
-    return {}
+    head = _git_stdout(issues_dir, "rev-parse", "HEAD")
+    if head is None:
+        return {}
+    head = head.strip()
+    scope = str(issues_dir.resolve())
+    cached = index.git_dates(scope) if index is not None else None
+
+    if cached is not None and cached[0] == head:
+        names = cached[1]
+    else:
+        names = {}
+        revisions = "HEAD"
+        if (
+            cached is not None
+            and _git_stdout(issues_dir, "merge-base", "--is-ancestor", cached[0], "HEAD")
+            is not None
+        ):
+            names = cached[1]
+            revisions = f"{cached[0]}..HEAD"
+        output = _git_stdout(
+            issues_dir,
+            "-c",
+            "core.quotePath=false",
+            "log",
+            "--format=%x00%as",
+            "--name-only",
+            revisions,
+            "--",
+            ".",
+        )
+        if output is None:
+            return {}
+        names.update(_parse_name_log(output))
+        if index is not None:
+            index.store_git_dates(scope, head, names)
+
+    dates: dict[str, date] = {}
+    for name, value in names.items():
+        try:
+            dates[name] = date.fromisoformat(value)
+        except ValueError:
+            continue
+    return dates
+
+
+class _LazyCompletionDates(Mapping[str, date]):
+    """``_batch_completion_dates`` deferred until the first lookup.
+
+    Most completed issues carry ``completed_at`` or a Resolution date, so a
+    scan often never needs git at all.
+    """
+
+    def __init__(self, issues_dir: Path, index: IssueIndex | None = None) -> None:
+        self._issues_dir = issues_dir
+        self._index = index
+        self._dates: dict[str, date] | None = None
+
+    def _load(self) -> dict[str, date]:
+        if self._dates is None:
+            self._dates = _batch_completion_dates(self._issues_dir, index=self._index)
+        return self._dates
+
+    def __getitem__(self, name: str) -> date:
+        return self._load()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
 
 
 def _parse_completion_date(
     content: str,
     file_path: Path,
     *,
-    batch_dates: dict[str, date] | None = None,
+    batch_dates: Mapping[str, date] | None = None,
     fm: dict[str, Any] | None = None,
 ) -> date | None:
     """Extract completion date from frontmatter, Resolution section, or git log.
@@ -150,9 +243,9 @@ def _parse_completion_date(
     Args:
         content: File content
         file_path: Path for git log fallback
-        batch_dates: Optional pre-fetched mapping of filename → add-date from a batch
-            git log call; when provided, skips the per-file subprocess call if the
-            file is found in the mapping.
+        batch_dates: Optional mapping of filename → last-commit date from a batch
+            git log call; when provided it replaces the per-file subprocess call
+            (a missing filename yields None).
         fm: Optional pre-parsed frontmatter dict. When absent, frontmatter is
             parsed from ``content`` so external callers with no ``fm`` benefit
             from the ``completed_at`` check transparently.
@@ -289,6 +382,8 @@ def _detect_processing_agent(content: str, discovered_source: str | None = None)
 def scan_completed_issues(
     issues_dir: Path,
     category_dirs: list[str] | None = None,
+    *,
+    batch_dates: Mapping[str, date] | None = None,
 ) -> list[CompletedIssue]:
     """Scan type directories for issues with ``status: done`` frontmatter.
 
@@ -305,6 +400,10 @@ def scan_completed_issues(
         issues_dir: Path to ``.issues/`` (the parent of category dirs).
         category_dirs: Optional override of category subdirectories to scan.
             Defaults to ``["bugs", "features", "enhancements", "epics"]``.
+        batch_dates: Optional filename → date mapping for issues with no
+            ``completed_at`` or Resolution date. Defaults to one lazily-run
+            ``git log`` over ``issues_dir`` (cached in the issue index by
+            ``HEAD``); pass ``{}`` to skip git entirely.
 
     Returns:
         List of parsed ``CompletedIssue`` objects, sorted by file path.
@@ -316,34 +415,36 @@ def scan_completed_issues(
 
     scan_dirs = category_dirs or ["bugs", "features", "enhancements", "epics"]
     paths_to_scan: list[Path] = []
-    for category_dir in scan_dirs:
-        category_path = issues_dir / category_dir
-        if not category_path.exists():
-            continue
-        for file_path in category_path.glob("*.md"):
+    with IssueIndex.for_project(issues_dir) as index:
+        for category_dir in scan_dirs:
+            category_path = issues_dir / category_dir
+            if not category_path.exists():
+                continue
+            for file_path in category_path.glob("*.md"):
+                try:
+                    fm = index.frontmatter(file_path)
+                except Exception as e:
+                    logger.warning("Failed to read %s: %s", file_path, e)
+                    continue
+                if fm.get("status") != "done":
+                    continue
+                paths_to_scan.append(file_path)
+
+        # Legacy completed/ directory (pre-ENH-1418); scan unconditionally
+        # so older repos keep working until ENH-1420 backfills.
+        legacy_completed = issues_dir / "completed"
+        if legacy_completed.exists():
+            paths_to_scan.extend(legacy_completed.glob("*.md"))
+
+        if batch_dates is None:
+            batch_dates = _LazyCompletionDates(issues_dir, index)
+        for file_path in sorted(paths_to_scan):
             try:
-                content = file_path.read_text(encoding="utf-8")
-                fm = parse_frontmatter(content)
+                issue = parse_completed_issue(file_path, batch_dates=batch_dates)
+                issues.append(issue)
             except Exception as e:
-                logger.warning("Failed to read %s: %s", file_path, e)
-                continue
-            if fm.get("status") != "done":
+                logger.warning("Failed to parse %s: %s", file_path, e)
                 continue
-            paths_to_scan.append(file_path)
-
-    # Legacy completed/ directory (pre-ENH-1418); scan unconditionally
-    # so older repos keep working until ENH-1420 backfills.
-    legacy_completed = issues_dir / "completed"
-    if legacy_completed.exists():
-        paths_to_scan.extend(legacy_completed.glob("*.md"))
-
-    for file_path in sorted(paths_to_scan):
-        try:
-            issue = parse_completed_issue(file_path)
-            issues.append(issue)
-        except Exception as e:
-            logger.warning("Failed to parse %s: %s", file_path, e)
-            continue
 
     return issues
 
@@ -0,0 +1,635 @@
+"""Persistent, stat-keyed index of parsed issue files.
+
+Every issue listing — ``find_issues``, ``find_issues_for_graph``, the
+duplicate-search walk in :mod:`little_loops.issue_discovery` and
+``issue_history.scan_completed_issues`` — used to read and re-parse every
+``*.md`` under ``.issues/`` on every call. On a backlog of a few thousand
+issues that is seconds of pure parsing for ``ll-issues``, ``ll-sprint``,
+``ll-parallel`` and the MCP issue tools before any real work starts.
+
+:class:`IssueIndex` memoizes two things per file in ``.ll/issue_index.db``:
+
+- the raw frontmatter mapping (config-independent; enough for status checks),
+- the serialized :class:`~little_loops.issue_parser.IssueInfo` (keyed
+  additionally on a fingerprint of the parser-relevant config, since category
+  prefixes and priorities change how a filename is read).
+
+Both are invalidated together whenever the file's ``(st_mtime_ns, st_size)``
+changes. Like git's index, a file modified within :data:`_RACY_WINDOW_NS` of
+the lookup is never stored: coarse filesystem timestamps could otherwise let a
+same-size rewrite (``status: open`` → ``status: done``) inside one clock tick
+reuse the stale entry. Such files are simply re-parsed until they age out.
+
+The same database also holds, per issues directory, the filename → last-commit
+date map that ``issue_history`` falls back to for completion dates. That entry
+is keyed on the ``HEAD`` it was computed at rather than on file stats.
+
+Finally it holds an inverted index of issue text for the duplicate searches in
+:mod:`little_loops.issue_discovery`: term → postings with term frequencies
+(plus whether the term is in the ``# ID: title`` line), and per file its
+token count, distinct-term counts and stats. :meth:`IssueIndex.search` brings
+the postings up to date for just the files whose stats changed, then scores
+the query by BM25 from the postings of its terms alone, so a duplicate check
+no longer reads and re-tokenizes the whole backlog.
+
+The index is a best-effort cache, never a source of truth: it is only used when
+a project ``.ll/`` directory already resolves (it never creates one), every
+sqlite failure degrades to plain parsing, and deleting the file is always safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from little_loops.frontmatter import parse_frontmatter
+from little_loops.text_utils import _COMMON_WORDS, extract_words
+
+if TYPE_CHECKING:
+    from little_loops.issue_parser import IssueInfo, IssueParser
+
+__all__ = ["INDEX_DB_NAME", "IssueIndex", "SearchHit"]
+
+logger = logging.getLogger(__name__)
+
+INDEX_DB_NAME = "issue_index.db"
+
+# Bump whenever IssueParser.parse_file's output for an unchanged file changes
+# (new IssueInfo field, different normalization) so stale rows are re-parsed.
+_INDEX_FORMAT = 1
+
+# Files whose mtime is this close to "now" are parsed but never stored.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issue_index (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    frontmatter TEXT,
+    info_key TEXT,
+    info TEXT
+)
+"""
+
+# Filename -> last-commit date maps for ``issue_history``'s completion-date
+# fallback, one row per issues directory, valid for exactly one HEAD.
+_GIT_DATES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS git_dates (
+    scope TEXT PRIMARY KEY,
+    head TEXT NOT NULL,
+    dates TEXT NOT NULL
+)
+"""
+
+
+# Inverted index for duplicate search. ``length`` is the token count (BM25's
+# document length); ``terms``/``title_terms`` are distinct-word counts, enough
+# to recover the Jaccard overlap ``issue_discovery`` thresholds are tuned for.
+_SEARCH_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS search_docs (
+    doc_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    terms INTEGER NOT NULL,
+    title_terms INTEGER NOT NULL
+)
+""",
+    """
+CREATE TABLE IF NOT EXISTS search_postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    in_title INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID
+""",
+    "CREATE INDEX IF NOT EXISTS search_postings_doc ON search_postings(doc_id)",
+)
+
+# Standard BM25 parameters.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# Same tokenization as text_utils.extract_words, but keeping repeats.
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+_TITLE_RE = re.compile(r"^#\s+[\w-]+:\s*(.+)$", re.MULTILINE)
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER on old sqlite builds.
+_TERMS_PER_QUERY = 500
+
+
+@dataclass
+class _Entry:
+    """One cached row; JSON payloads are decoded lazily on first hit."""
+
+    mtime_ns: int
+    size: int
+    frontmatter: str | None = None
+    info_key: str | None = None
+    info: str | None = None
+
+
+@dataclass
+class _SearchDoc:
+    """One searchable file.
+
+    ``doc_id`` is set once the file's postings are in ``search_postings``;
+    files that are not stored (racy, pass-through index, failed write) keep
+    their ``counts``/``title`` in memory and are scored from those instead.
+    """
+
+    mtime_ns: int
+    size: int
+    length: int
+    terms: int
+    title_terms: int
+    doc_id: int | None = None
+    counts: Counter[str] | None = None
+    title: frozenset[str] | None = None
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One result of :meth:`IssueIndex.search`.
+
+    Attributes:
+        path: The matching file, as passed in ``paths``
+        score: BM25 relevance of the file to the query words
+        overlap: Jaccard overlap of the query words with the file's words
+            (title words when searching titles), from 0.0 to 1.0
+        matched: Query words the file contains, sorted
+    """
+
+    path: Path
+    score: float
+    overlap: float
+    matched: tuple[str, ...]
+
+
+class _WarningCounter(logging.Filter):
+    """Count WARNING-or-worse records passing through a logger; drops nothing."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            self.count += 1
+        return True
+
+
+def _tokenize(content: str) -> tuple[Counter[str], frozenset[str]]:
+    """Return ``(word counts, title words)`` for one issue file.
+
+    The keys of the counts are exactly ``extract_words(content)`` and the title
+    words are ``extract_words`` of the ``# ID: title`` heading, as the
+    uncached duplicate search computed them.
+    """
+    counts = Counter(w for w in _WORD_RE.findall(content.lower()) if w not in _COMMON_WORDS)
+    match = _TITLE_RE.search(content)
+    title = frozenset(extract_words(match.group(1))) if match else frozenset()
+    return counts, title
+
+
+def _parser_key(parser: IssueParser) -> str:
+    """Fingerprint the config inputs that change ``parse_file`` output."""
+    config = parser.config
+    payload = json.dumps(
+        [
+            _INDEX_FORMAT,
+            sorted(
+                (name, category.prefix, category.dir)
+                for name, category in config.issues.categories.items()
+            ),
+            list(config.issue_priorities),
+        ]
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class IssueIndex:
+    """Stat-keyed cache of parsed issue files backed by ``.ll/issue_index.db``.
+
+    Use as a context manager so new entries are flushed in one transaction::
+
+        with IssueIndex.for_project(config.project_root) as index:
+            infos = [index.parse(parser, path) for path in paths]
+
+    A ``db_path`` of ``None`` yields a pass-through index that parses every
+    file directly — callers never need a separate uncached code path.
+    """
+
+    def __init__(self, db_path: Path | None) -> None:
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._entries: dict[str, _Entry] = {}
+        self._dirty: dict[str, _Entry] = {}
+        self._seen: set[str] = set()
+        self._parser_keys: dict[int, str] = {}
+        self._dirty_git_dates: dict[str, tuple[str, str]] = {}
+        self._search_docs: dict[str, _SearchDoc] | None = None
+        self._search_in_memory = False
+        self.hits = 0
+        self.misses = 0
+        if db_path is not None:
+            self._open(db_path)
+
+    @classmethod
+    def for_project(cls, start: Path) -> IssueIndex:
+        """Return the index for the project containing *start*.
+
+        Resolves via :func:`~little_loops.paths.resolve_ll_dir` without
+        creating anything; when no ``.ll/`` resolves the index is pass-through.
+        """
+        from little_loops.paths import resolve_ll_dir
+
+        ll_dir = resolve_ll_dir(start)
+        return cls(ll_dir / INDEX_DB_NAME if ll_dir is not None else None)
+
+    def _open(self, db_path: Path) -> None:
+        try:
+            conn = sqlite3.connect(str(db_path), timeout=_BUSY_TIMEOUT_MS / 1000)
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_GIT_DATES_SCHEMA)
+            for statement in _SEARCH_SCHEMA:
+                conn.execute(statement)
+            rows = conn.execute(
+                "SELECT path, mtime_ns, size, frontmatter, info_key, info FROM issue_index"
+            ).fetchall()
+        except sqlite3.Error:
+            logger.debug("issue_index: could not open %s", db_path, exc_info=True)
+            return
+        self._conn = conn
+        self._entries = {row[0]: _Entry(*row[1:]) for row in rows}
+
+    def __enter__(self) -> IssueIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _lookup(self, path: Path) -> tuple[str, _Entry | None, bool]:
+        """Return ``(key, fresh entry or None, storable)`` for *path*."""
+        key = str(path)
+        self._seen.add(key)
+        if self._conn is None:
+            return key, None, False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return key, None, False
+        storable = time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS
+        entry = self._entries.get(key)
+        if entry is None or entry.mtime_ns != st.st_mtime_ns or entry.size != st.st_size:
+            entry = self._entries[key] = _Entry(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        return key, entry, storable
+
+    def frontmatter(self, path: Path) -> dict[str, Any]:
+        """Return ``parse_frontmatter(path.read_text())``, cached by stat.
+
+        Read errors propagate exactly as an uncached ``read_text`` would.
+        """
+        key, entry, storable = self._lookup(path)
+        if entry is not None and entry.frontmatter is not None:
+            self.hits += 1
+            cached: dict[str, Any] = json.loads(entry.frontmatter)
+            return cached
+        self.misses += 1
+        data = parse_frontmatter(path.read_text(encoding="utf-8"))
+        if entry is not None and storable:
+            try:
+                entry.frontmatter = json.dumps(data)
+            except (TypeError, ValueError):
+                return data
+            self._dirty[key] = entry
+        return data
+
+    def parse(self, parser: IssueParser, path: Path) -> IssueInfo:
+        """Return ``parser.parse_file(path)``, cached by stat and config."""
+        from little_loops.issue_parser import _WARNED_DEPRECATED_KEYS, IssueInfo
+        from little_loops.issue_parser import logger as parser_logger
+
+        parser_key = self._parser_keys.get(id(parser))
+        if parser_key is None:
+            parser_key = self._parser_keys[id(parser)] = _parser_key(parser)
+
+        key, entry, storable = self._lookup(path)
+        if entry is not None and entry.info is not None and entry.info_key == parser_key:
+            self.hits += 1
+            info = IssueInfo.from_dict(json.loads(entry.info))
+            info.path = path
+            return info
+
+        self.misses += 1
+        warnings = _WarningCounter()
+        parser_logger.addFilter(warnings)
+        try:
+            info = parser.parse_file(path)
+        finally:
+            parser_logger.removeFilter(warnings)
+        if entry is None or not storable or not self._is_storable(info, path):
+            return info
+        # A file whose parse logged a warning (a frontmatter/body relationship
+        # conflict, a deprecated key) is never stored, so the warning keeps
+        # firing on every fresh process instead of going silent once the index
+        # is warm. Deprecated-key warnings fire once per process, hence the
+        # second check for files parsed again after the first warning.
+        if warnings.count:
+            return info
+        resolved = str(path.resolve())
+        if any(warned_path == resolved for warned_path, _ in _WARNED_DEPRECATED_KEYS):
+            return info
+        entry.info_key = parser_key
+        entry.info = json.dumps(info.to_dict())
+        self._dirty[key] = entry
+        return info
+
+    def git_dates(self, scope: str) -> tuple[str, dict[str, str]] | None:
+        """Return the stored ``(head, {filename: "YYYY-MM-DD"})`` for *scope*, if any."""
+        pending = self._dirty_git_dates.get(scope)
+        if pending is not None:
+            return pending[0], json.loads(pending[1])
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT head, dates FROM git_dates WHERE scope = ?", (scope,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def store_git_dates(self, scope: str, head: str, dates: dict[str, str]) -> None:
+        """Record the date map for *scope* at *head*; written on :meth:`close`."""
+        if self._conn is not None:
+            self._dirty_git_dates[scope] = (head, json.dumps(dates))
+
+    def search(
+        self,
+        paths: Sequence[Path],
+        words: Iterable[str],
+        *,
+        title: bool = False,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        """Rank *paths* against *words* by BM25.
+
+        Postings are first brought up to date for the files in *paths* whose
+        stats changed since they were indexed; unchanged files are never read.
+        Collection statistics (document count, average length, document
+        frequencies) are taken over *paths* only, so the ranking does not
+        depend on what else happens to be indexed.
+
+        Args:
+            paths: Files to search; unreadable ones are skipped
+            words: Query words, as produced by ``extract_words``
+            title: Match against the ``# ID: title`` words instead of the body
+            limit: Return at most this many hits
+
+        Returns:
+            Hits for files containing at least one query word, best first.
+        """
+        query = set(words)
+        docs = self._sync_search(paths)
+        if not query or not docs:
+            return []
+
+        postings: dict[str, list[tuple[str, int]]] = defaultdict(list)
+        keys_by_id = {doc.doc_id: key for key, doc in docs.items() if doc.doc_id is not None}
+        if keys_by_id and self._conn is not None and not self._search_in_memory:
+            terms = sorted(query)
+            sql = "SELECT term, doc_id, tf FROM search_postings WHERE term IN ({})" + (
+                " AND in_title = 1" if title else ""
+            )
+            try:
+                for i in range(0, len(terms), _TERMS_PER_QUERY):
+                    chunk = terms[i : i + _TERMS_PER_QUERY]
+                    cursor = self._conn.execute(sql.format(",".join("?" * len(chunk))), chunk)
+                    for term, doc_id, tf in cursor:
+                        key = keys_by_id.get(doc_id)
+                        if key is not None:
+                            postings[term].append((key, 1 if title else tf))
+            except sqlite3.Error:
+                # Score everything from memory for the rest of this index's life.
+                logger.debug("issue_index: search query failed", exc_info=True)
+                self._search_in_memory = True
+                self._search_docs = None
+                return self.search(paths, query, title=title, limit=limit)
+        for key, doc in docs.items():
+            if doc.counts is None or doc.title is None:
+                continue
+            for term in query:
+                if title:
+                    if term in doc.title:
+                        postings[term].append((key, 1))
+                elif term in doc.counts:
+                    postings[term].append((key, doc.counts[term]))
+
+        lengths = {key: doc.title_terms if title else doc.length for key, doc in docs.items()}
+        avg_length = sum(lengths.values()) / len(lengths) or 1.0
+        scores: dict[str, float] = defaultdict(float)
+        matched: dict[str, list[str]] = defaultdict(list)
+        for term, plist in postings.items():
+            df = len(plist)
+            idf = math.log(1.0 + (len(docs) - df + 0.5) / (df + 0.5))
+            for key, tf in plist:
+                norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * lengths[key] / avg_length)
+                scores[key] += idf * tf * (_BM25_K1 + 1.0) / (tf + norm)
+                matched[key].append(term)
+
+        path_of = {str(path): path for path in paths}
+        order = {key: i for i, key in enumerate(path_of)}
+        ranked = sorted(scores, key=lambda key: (-scores[key], order[key]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        hits = []
+        for key in ranked:
+            doc = docs[key]
+            common = len(matched[key])
+            union = len(query) + (doc.title_terms if title else doc.terms) - common
+            hits.append(
+                SearchHit(
+                    path=path_of[key],
+                    score=scores[key],
+                    overlap=common / union,
+                    matched=tuple(sorted(matched[key])),
+                )
+            )
+        return hits
+
+    def _load_search_docs(self) -> dict[str, _SearchDoc]:
+        if self._search_docs is not None:
+            return self._search_docs
+        self._search_docs = {}
+        if self._conn is not None and not self._search_in_memory:
+            try:
+                rows = self._conn.execute(
+                    "SELECT path, mtime_ns, size, length, terms, title_terms, doc_id "
+                    "FROM search_docs"
+                ).fetchall()
+            except sqlite3.Error:
+                logger.debug("issue_index: could not read search_docs", exc_info=True)
+                rows = []
+            self._search_docs = {row[0]: _SearchDoc(*row[1:]) for row in rows}
+        return self._search_docs
+
+    def _sync_search(self, paths: Sequence[Path]) -> dict[str, _SearchDoc]:
+        """Return the searchable doc for every readable file in *paths*.
+
+        Files whose stats match their ``search_docs`` row are served as-is;
+        the rest are re-tokenized and, outside the racy window, their postings
+        replaced in one transaction. Rows for deleted files are dropped.
+        """
+        stored = self._load_search_docs()
+        docs: dict[str, _SearchDoc] = {}
+        fresh: list[tuple[str, _SearchDoc]] = []
+        now = time.time_ns()
+        for path in paths:
+            key = str(path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            doc = stored.get(key)
+            if doc is not None and doc.mtime_ns == st.st_mtime_ns and doc.size == st.st_size:
+                docs[key] = doc
+                continue
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            counts, title_words = _tokenize(content)
+            doc = _SearchDoc(
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
+                length=sum(counts.values()),
+                terms=len(counts),
+                title_terms=len(title_words),
+                counts=counts,
+                title=title_words,
+            )
+            docs[key] = stored[key] = doc
+            fresh.append((key, doc))
+        gone = [key for key in stored if key not in docs and not os.path.exists(key)]
+        for key in gone:
+            del stored[key]
+        if self._conn is not None and not self._search_in_memory and (fresh or gone):
+            self._write_search_docs(fresh, gone, now)
+        return docs
+
+    def _write_search_docs(
+        self, fresh: list[tuple[str, _SearchDoc]], gone: list[str], now: int
+    ) -> None:
+        assert self._conn is not None
+        conn = self._conn
+        assigned: list[tuple[_SearchDoc, int]] = []
+        try:
+            with conn:
+                for key in [key for key, _ in fresh] + gone:
+                    conn.execute(
+                        "DELETE FROM search_postings WHERE doc_id IN "
+                        "(SELECT doc_id FROM search_docs WHERE path = ?)",
+                        (key,),
+                    )
+                    conn.execute("DELETE FROM search_docs WHERE path = ?", (key,))
+                for key, doc in fresh:
+                    # Racy files only lose their outdated row; see _RACY_WINDOW_NS.
+                    if now - doc.mtime_ns <= _RACY_WINDOW_NS or doc.counts is None:
+                        continue
+                    cursor = conn.execute(
+                        "INSERT INTO search_docs"
+                        "(path, mtime_ns, size, length, terms, title_terms)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, doc.mtime_ns, doc.size, doc.length, doc.terms, doc.title_terms),
+                    )
+                    doc_id = cursor.lastrowid
+                    assert doc_id is not None
+                    title_words = doc.title or frozenset()
+                    conn.executemany(
+                        "INSERT INTO search_postings(term, doc_id, tf, in_title)"
+                        " VALUES (?, ?, ?, ?)",
+                        [
+                            (term, doc_id, tf, term in title_words)
+                            for term, tf in doc.counts.items()
+                        ],
+                    )
+                    assigned.append((doc, doc_id))
+        except sqlite3.Error:
+            logger.debug("issue_index: could not update search postings", exc_info=True)
+            return
+        for doc, doc_id in assigned:
+            doc.doc_id = doc_id
+            doc.counts = doc.title = None
+
+    @staticmethod
+    def _is_storable(info: IssueInfo, path: Path) -> bool:
+        """False when the ID was not read from the filename itself.
+
+        ``IssueParser._generate_id_from_filename`` falls back to the *next free*
+        issue number, which depends on sibling files rather than this file's
+        own content, so such results must not outlive the call.
+        """
+        number = info.issue_id.rsplit("-", 1)[-1]
+        return number in path.name
+
+    def close(self) -> None:
+        """Flush new entries, prune rows for deleted files, and close."""
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        stale = [key for key in self._entries if key not in self._seen and not os.path.exists(key)]
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO issue_index"
+                    "(path, mtime_ns, size, frontmatter, info_key, info) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, e.mtime_ns, e.size, e.frontmatter, e.info_key, e.info)
+                        for key, e in self._dirty.items()
+                    ],
+                )
+                conn.executemany(
+                    "DELETE FROM issue_index WHERE path = ?", [(key,) for key in stale]
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO git_dates(scope, head, dates) VALUES (?, ?, ?)",
+                    [
+                        (scope, head, dates)
+                        for scope, (head, dates) in self._dirty_git_dates.items()
+                    ],
+                )
+        except sqlite3.Error:
+            logger.debug("issue_index: could not flush %s", self.db_path, exc_info=True)
+        finally:
+            conn.close()
+        self._dirty.clear()
+        self._dirty_git_dates.clear()
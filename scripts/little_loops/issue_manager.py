@@ -26,7 +26,7 @@ if TYPE_CHECKING:
 from little_loops.cli_args import _id_matches
 from little_loops.config import BRConfig
 from little_loops.context_window import context_window_for
-from little_loops.dependency_graph import DependencyGraph
+from little_loops.dependency_graph import DependencyGraph, ReadySet
 from little_loops.events import EventBus
 from little_loops.git_operations import (
     check_git_status,
@@ -1684,6 +1684,9 @@ class AutoManager:
         # state.attempted_issues (persisted, may carry earlier-run IDs under
         # --resume). Used by _unreachable_reason() to word outcomes correctly.
         self._run_attempted: set[str] = set()
+        # Incremental ready set over self.dep_graph, advanced as issues
+        # complete; built lazily by _ready_issues().
+        self._ready_set: ReadySet | None = None
 
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -1710,7 +1713,7 @@ class AutoManager:
         skip_ids = self.state_manager.state.attempted_issues | self.skip_ids
 
         # Get issues that are ready (blockers satisfied)
-        ready_issues = self.dep_graph.get_ready_issues(completed)
+        ready_issues = self._ready_issues(completed)
 
         # Filter by skip_ids, only_ids, type_prefixes, priority_filter, label_filter
         candidates = [
@@ -1760,6 +1763,32 @@ class AutoManager:
 
         return None
 
+    def _ready_issues(self, completed: set[str]) -> list[IssueInfo]:
+        """Return ready issues for ``completed`` via the incremental ready set.
+
+        Only IDs completed since the previous call are applied, so each
+        completion costs O(out-degree) rather than a rescan of the whole graph.
+        The ready set is rebuilt when ``dep_graph`` is replaced or the completed
+        set shrinks (e.g. state was reset).
+
+        Args:
+            completed: Set of completed issue IDs
+
+        Returns:
+            Ready issues sorted by priority then issue_id
+        """
+        ready_set = self._ready_set
+        if (
+            ready_set is None
+            or ready_set.graph is not self.dep_graph
+            or not ready_set.completed <= completed
+        ):
+            ready_set = self._ready_set = self.dep_graph.ready_set(completed)
+        else:
+            for issue_id in completed - ready_set.completed:
+                ready_set.mark_completed(issue_id)
+        return ready_set.ready()
+
     def _log_blocked_issues(self, remaining: set[str], completed: set[str]) -> None:
         """Log information about blocked issues when processing stalls.
 
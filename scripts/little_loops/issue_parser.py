@@ -18,6 +18,7 @@ from little_loops.frontmatter import (
     DEPRECATED_STATUS_VALUES,
     parse_frontmatter,
 )
+from little_loops.issue_index import IssueIndex
 from little_loops.text_utils import fence_spans, in_fence
 
 if TYPE_CHECKING:
@@ -1849,6 +1850,7 @@ class IssueInfo:
             "blocked_by": self.blocked_by,
             "blocks": self.blocks,
             "parent": self.parent,
+            "base_branch": self.base_branch,
             "depends_on": self.depends_on,
             "relates_to": self.relates_to,
             "duplicate_of": self.duplicate_of,
@@ -1889,6 +1891,7 @@ class IssueInfo:
             blocked_by=data.get("blocked_by", []),
             blocks=data.get("blocks", []),
             parent=data.get("parent"),
+            base_branch=data.get("base_branch"),
             depends_on=data.get("depends_on", []),
             relates_to=data.get("relates_to", []),
             duplicate_of=data.get("duplicate_of"),
@@ -2531,46 +2534,45 @@ def find_issues(
         non_terminal = _ALL_STATUSES - _TERMINAL_STATUSES
         requested_categories = set(categories)
         all_active: list[IssueInfo] = []
-        for cat in config.issue_categories:
-            issue_dir = config.get_issue_dir(cat)
-            if not issue_dir.exists():
-                continue
-            for issue_file in issue_dir.glob("*.md"):
-                info = parser.parse_file(issue_file)
-                if info.status in non_terminal:
-                    all_active.append(info)
-                    if cat in requested_categories:
-                        if not _matches_status(info, status_filter):
-                            continue
-                        if not _matches_filters(info):
-                            continue
-                        issues.append(info)
-
-        all_known_ids: set[str] | None = None
-        try:
-            from little_loops.dependency_mapper import gather_all_issue_ids
+        # The same walk also yields every known ID (the filename-only scan
+        # ``dependency_mapper.gather_all_issue_ids`` performs), so blockers
+        # that are done/cancelled still resolve without a second directory walk.
+        all_known_ids: set[str] = set()
+        with IssueIndex.for_project(config.project_root) as index:
+            for cat in config.issue_categories:
+                issue_dir = config.get_issue_dir(cat)
+                if not issue_dir.exists():
+                    continue
+                for issue_file in issue_dir.glob("*.md"):
+                    if match := _FILENAME_ID_RE.search(issue_file.name):
+                        all_known_ids.add(f"{match.group(1)}-{match.group(2)}")
+                    info = index.parse(parser, issue_file)
+                    if info.status in non_terminal:
+                        all_active.append(info)
+                        if cat in requested_categories:
+                            if not _matches_status(info, status_filter):
+                                continue
+                            if not _matches_filters(info):
+                                continue
+                            issues.append(info)
 
-            issues_dir = config.project_root / config.issues.base_dir
-            all_known_ids = gather_all_issue_ids(issues_dir, config=config)
-        except Exception:  # pragma: no cover - defensive, mirrors sprint.py
-            logger.debug("Dependency mapping unavailable — falling back to active ID set")
-            all_known_ids = {info.issue_id for info in all_active}
         graph = DependencyGraph.from_issues(all_active, all_known_ids=all_known_ids)
         ready_ids = {info.issue_id for info in graph.get_ready_issues()}
         issues = [info for info in issues if info.issue_id in ready_ids]
     else:
-        for cat in categories:
-            issue_dir = config.get_issue_dir(cat)
-            if not issue_dir.exists():
-                continue
-
-            for issue_file in issue_dir.glob("*.md"):
-                info = parser.parse_file(issue_file)
-                if not _matches_status(info, status_filter):
-                    continue
-                if not _matches_filters(info):
+        with IssueIndex.for_project(config.project_root) as index:
+            for cat in categories:
+                issue_dir = config.get_issue_dir(cat)
+                if not issue_dir.exists():
                     continue
-                issues.append(info)
+
+                for issue_file in issue_dir.glob("*.md"):
+                    info = index.parse(parser, issue_file)
+                    if not _matches_status(info, status_filter):
+                        continue
+                    if not _matches_filters(info):
+                        continue
+                    issues.append(info)
 
     # When only_ids is a list, preserve input order; otherwise sort by priority
     if isinstance(only_ids, list):
@@ -13,24 +13,60 @@ Components:
     OverlapDetector: Detects overlapping file modifications between issues
 """
 
-from little_loops.parallel.file_hints import FileHints, extract_file_hints
-from little_loops.parallel.git_lock import GitLock
-from little_loops.parallel.merge_coordinator import MergeCoordinator
-from little_loops.parallel.orchestrator import ParallelOrchestrator
-from little_loops.parallel.overlap_detector import OverlapDetector, OverlapResult
-from little_loops.parallel.priority_queue import IssuePriorityQueue
-from little_loops.parallel.types import (
-    EpicBranchesConfig,
-    MergeRequest,
-    MergeStatus,
-    OrchestratorState,
-    ParallelConfig,
-    QueuedIssue,
-    SprintWorkerContext,
-    WorkerResult,
-    WorkerStage,
-)
-from little_loops.parallel.worker_pool import WorkerPool
+from typing import TYPE_CHECKING, Any
+
+from little_loops._lazy import export_dir, load_export
+
+if TYPE_CHECKING:
+    from little_loops.parallel.file_hints import FileHints, extract_file_hints
+    from little_loops.parallel.git_lock import GitLock
+    from little_loops.parallel.merge_coordinator import MergeCoordinator
+    from little_loops.parallel.orchestrator import ParallelOrchestrator
+    from little_loops.parallel.overlap_detector import OverlapDetector, OverlapResult
+    from little_loops.parallel.priority_queue import IssuePriorityQueue
+    from little_loops.parallel.types import (
+        EpicBranchesConfig,
+        MergeRequest,
+        MergeStatus,
+        OrchestratorState,
+        ParallelConfig,
+        QueuedIssue,
+        SprintWorkerContext,
+        WorkerResult,
+        WorkerStage,
+    )
+    from little_loops.parallel.worker_pool import WorkerPool
+
+# Resolved on first attribute access (see little_loops._lazy).
+_EXPORTS: dict[str, str] = {
+    "FileHints": "little_loops.parallel.file_hints",
+    "extract_file_hints": "little_loops.parallel.file_hints",
+    "GitLock": "little_loops.parallel.git_lock",
+    "MergeCoordinator": "little_loops.parallel.merge_coordinator",
+    "ParallelOrchestrator": "little_loops.parallel.orchestrator",
+    "OverlapDetector": "little_loops.parallel.overlap_detector",
+    "OverlapResult": "little_loops.parallel.overlap_detector",
+    "IssuePriorityQueue": "little_loops.parallel.priority_queue",
+    "EpicBranchesConfig": "little_loops.parallel.types",
+    "MergeRequest": "little_loops.parallel.types",
+    "MergeStatus": "little_loops.parallel.types",
+    "OrchestratorState": "little_loops.parallel.types",
+    "ParallelConfig": "little_loops.parallel.types",
+    "QueuedIssue": "little_loops.parallel.types",
+    "SprintWorkerContext": "little_loops.parallel.types",
+    "WorkerResult": "little_loops.parallel.types",
+    "WorkerStage": "little_loops.parallel.types",
+    "WorkerPool": "little_loops.parallel.worker_pool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return load_export(__name__, _EXPORTS, name)
+
+
+def __dir__() -> list[str]:
+    return export_dir(__name__, _EXPORTS)
+
 
 __all__ = [
     "EpicBranchesConfig",
@@ -6,7 +6,9 @@ potential file modifications before dispatch.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -40,6 +42,13 @@ MIN_OVERLAP_FILES = 2  # Minimum overlapping files to trigger overlap
 OVERLAP_RATIO_THRESHOLD = 0.25  # Minimum ratio of overlapping files to smaller set
 MIN_DIRECTORY_DEPTH = 2  # Minimum path segments for directory overlap (e.g., src/components/ = 2)
 
+# Extracted hint sets keyed by a digest of the issue content. Schedulers re-check
+# the same issue files many times per run (every dispatch and every deferred
+# re-check), and the write-target regexes dominate that cost.
+_HINT_CACHE_MAX = 4096
+_hint_cache: dict[bytes, tuple[frozenset[str], frozenset[str], frozenset[str]]] = {}
+_hint_cache_lock = threading.Lock()
+
 # Common infrastructure files excluded from overlap detection.
 # These appear incidentally in many issues but are rarely the actual conflict.
 COMMON_FILES_EXCLUDE = frozenset(
@@ -339,6 +348,9 @@ def _extract_write_target_directories(content: str) -> set[str]:
 def extract_file_hints(content: str, issue_id: str = "") -> FileHints:
     """Extract file hints from issue content.
 
+    Results are cached by a digest of *content*, so re-extracting an unchanged
+    issue costs one hash; each call still returns a fresh ``FileHints``.
+
     Args:
         content: Issue markdown content
         issue_id: Optional issue ID for tracking
@@ -346,23 +358,38 @@ def extract_file_hints(content: str, issue_id: str = "") -> FileHints:
     Returns:
         FileHints with extracted paths and scopes
     """
-    hints = FileHints(issue_id=issue_id)
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    cached = _hint_cache.get(key)
+    if cached is None:
+        cached = _extract_hint_sets(content)
+        with _hint_cache_lock:
+            if len(_hint_cache) >= _HINT_CACHE_MAX:
+                del _hint_cache[next(iter(_hint_cache))]
+            _hint_cache[key] = cached
+    files, directories, scopes = cached
+    return FileHints(
+        files=set(files), directories=set(directories), scopes=set(scopes), issue_id=issue_id
+    )
+
 
+def _extract_hint_sets(
+    content: str,
+) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """Run the extraction regexes behind :func:`extract_file_hints`."""
     # Extract file paths from write-target sections only.
     # Broad extraction across the full content would include reference docs
     # (e.g., "Related Key Documentation") causing false sprint serialization.
-    hints.files = _extract_write_target_files(content)
+    files = _extract_write_target_files(content)
 
     # Extract directory paths from write-target sections only.
     # Full-body extraction causes false conflicts when prose mentions a directory
     # (e.g., "this feature lives in src/viewer/") that is not an actual write target.
-    hints.directories = _extract_write_target_directories(content)
+    directories = _extract_write_target_directories(content)
 
     # Extract scopes
-    for match in SCOPE_PATTERN.findall(content):
-        hints.scopes.add(match.lower())
+    scopes = {match.lower() for match in SCOPE_PATTERN.findall(content)}
 
-    return hints
+    return frozenset(files), frozenset(directories), frozenset(scopes)
 
 
 def _is_valid_path(path: str) -> bool:
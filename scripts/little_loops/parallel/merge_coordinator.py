@@ -27,6 +27,7 @@ from little_loops.session_store import record_session_lifecycle_event, resolve_h
 
 if TYPE_CHECKING:
     from little_loops.logger import Logger
+    from little_loops.parallel.worktree_pool import WorktreePool
 
 
 class MergeCoordinator:
@@ -50,6 +51,7 @@ class MergeCoordinator:
         logger: Logger,
         repo_path: Path | None = None,
         git_lock: GitLock | None = None,
+        worktree_pool: WorktreePool | None = None,
     ) -> None:
         """Initialize the merge coordinator.
 
@@ -58,11 +60,14 @@ class MergeCoordinator:
             logger: Logger for merge output
             repo_path: Path to the git repository (default: current directory)
             git_lock: Shared lock for git operations (created if not provided)
+            worktree_pool: Pool that merged worktrees are recycled into
+                instead of being removed (None removes them, as before)
         """
         self.config = config
         self.logger = logger
         self.repo_path = repo_path or Path.cwd()
         self._git_lock = git_lock or GitLock(logger)
+        self._worktree_pool = worktree_pool
         self._queue: Queue[MergeRequest] = Queue()
         self._thread: threading.Thread | None = None
         self._shutdown_event = threading.Event()
@@ -1089,25 +1094,29 @@ class MergeCoordinator:
         if not worktree_path.exists():
             return
 
-        # BUG-2963 #8: preserve any uncommitted non-noise work to a durable ref
-        # before `--force` discards it.
-        preserve_before_teardown(worktree_path, self.logger)
+        # A recycled worktree is parked idle on a detached HEAD, so the branch
+        # below is free to delete either way.
+        recycled = self._worktree_pool is not None and self._worktree_pool.release(worktree_path)
+        if not recycled:
+            # BUG-2963 #8: preserve any uncommitted non-noise work to a durable ref
+            # before `--force` discards it.
+            preserve_before_teardown(worktree_path, self.logger)
 
-        # Remove worktree
-        self._git_lock.run(
-            ["worktree", "unlock", str(worktree_path)],
-            cwd=self.repo_path,
-            timeout=10,
-        )
-        self._git_lock.run(
-            ["worktree", "remove", "--force", str(worktree_path)],
-            cwd=self.repo_path,
-            timeout=30,
-        )
+            # Remove worktree
+            self._git_lock.run(
+                ["worktree", "unlock", str(worktree_path)],
+                cwd=self.repo_path,
+                timeout=10,
+            )
+            self._git_lock.run(
+                ["worktree", "remove", "--force", str(worktree_path)],
+                cwd=self.repo_path,
+                timeout=30,
+            )
 
-        # Force delete directory if still exists
-        if worktree_path.exists():
-            shutil.rmtree(worktree_path, ignore_errors=True)
+            # Force delete directory if still exists
+            if worktree_path.exists():
+                shutil.rmtree(worktree_path, ignore_errors=True)
 
         # Delete the branch
         if branch_name.startswith("parallel/"):
@@ -142,7 +142,11 @@ class ParallelOrchestrator:
             driver=self.driver,
         )
         self.merge_coordinator = MergeCoordinator(
-            parallel_config, self.logger, self.repo_path, self._git_lock
+            parallel_config,
+            self.logger,
+            self.repo_path,
+            self._git_lock,
+            worktree_pool=self.worker_pool.worktree_pool,
         )
 
         # State management
@@ -1243,6 +1247,7 @@ class ParallelOrchestrator:
         with self._state_lock:
             self.state.timing[result.issue_id] = {
                 "total": result.duration,
+                "setup": result.setup_duration,
             }
 
         # Record the authoritative result after merge/PR and timing state are final.
@@ -1615,6 +1620,8 @@ class ParallelOrchestrator:
                 speedup = total_issue_time / total_time
                 self.logger.info(f"Estimated speedup: {speedup:.2f}x")
 
+        self._report_worktree_setup()
+
         if self.queue.failed_ids:
             self.logger.info("")
             self.logger.warning("Failed issues:")
@@ -1859,6 +1866,27 @@ Title: {info.title}
             self.logger.error(f"Failed to complete lifecycle for {issue_id}: {e}")
             return False
 
+    def _report_worktree_setup(self) -> None:
+        """Log per-issue worktree setup time and the worktree pool hit rate."""
+        pool = self.worker_pool.worktree_pool
+        setup_seconds = dict(pool.stats.setup_seconds)
+        if not setup_seconds:
+            return
+        total_setup = sum(setup_seconds.values())
+        self.logger.info("")
+        self.logger.info(
+            f"Worktree setup: {format_duration(total_setup)} total, "
+            f"{total_setup / len(setup_seconds):.1f}s avg"
+        )
+        for issue_id, seconds in sorted(setup_seconds.items(), key=lambda x: -x[1]):
+            self.logger.info(f"  - {issue_id}: {seconds:.1f}s")
+        if pool.enabled:
+            stats = pool.stats
+            self.logger.info(
+                f"Worktree pool: {stats.hits}/{stats.hits + stats.misses} reused "
+                f"({stats.hit_rate * 100:.1f}%), {stats.recycled} recycled"
+            )
+
     def _cleanup(self) -> None:
         """Clean up resources."""
         self.logger.info("Cleaning up...")
@@ -2,14 +2,20 @@
 
 Tracks active issue scopes and detects potential file modification conflicts
 before dispatch to reduce merge conflicts.
+
+Active issues' files, directories and scopes are kept in an inverted index
+(:class:`_PathIndex`) so a candidate's possible conflicts are found by lookup
+rather than by comparing against every active issue; only those candidates are
+then confirmed with :meth:`FileHints.contends_with`.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from threading import RLock
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from little_loops.parallel.file_hints import FileHints, extract_file_hints
 
@@ -19,6 +25,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_K = TypeVar("_K", bound=Hashable)
+
 
 @dataclass
 class OverlapResult:
@@ -39,6 +47,89 @@ class OverlapResult:
         return self.has_overlap
 
 
+def _segments(path: str) -> tuple[str, ...]:
+    """Split *path* into segments, ignoring a trailing ``/``.
+
+    ``FileHints`` directory checks are string-prefix tests on paths normalized
+    to end in ``/``, which is exactly a segment-prefix test on these tuples.
+    """
+    return tuple(path.rstrip("/").split("/"))
+
+
+class _PathIndex:
+    """Inverted index over the hints of active issues.
+
+    ``candidates()`` returns a superset of the active issues whose hints could
+    contend with a new hint set: those sharing a file or scope, those with a
+    directory that is an ancestor of one of the new paths, and those with any
+    path below one of the new directories. Every lookup is by key, so the cost
+    depends on the size of the new hint set, not on the number of active issues.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[str, set[str]] = {}
+        self._scopes: dict[str, set[str]] = {}
+        self._dirs: dict[tuple[str, ...], set[str]] = {}
+        # Every prefix of every active path -> issues with a path under it.
+        self._under: dict[tuple[str, ...], set[str]] = {}
+
+    @staticmethod
+    def _prefixes(hints: FileHints) -> set[tuple[str, ...]]:
+        prefixes: set[tuple[str, ...]] = set()
+        for path in hints.all_paths:
+            parts = _segments(path)
+            prefixes.update(parts[:i] for i in range(1, len(parts) + 1))
+        return prefixes
+
+    def add(self, issue_id: str, hints: FileHints) -> None:
+        for f in hints.files:
+            self._files.setdefault(f, set()).add(issue_id)
+        for scope in hints.scopes:
+            self._scopes.setdefault(scope, set()).add(issue_id)
+        for d in hints.directories:
+            self._dirs.setdefault(_segments(d), set()).add(issue_id)
+        for prefix in self._prefixes(hints):
+            self._under.setdefault(prefix, set()).add(issue_id)
+
+    def remove(self, issue_id: str, hints: FileHints) -> None:
+        _discard(self._files, hints.files, issue_id)
+        _discard(self._scopes, hints.scopes, issue_id)
+        _discard(self._dirs, {_segments(d) for d in hints.directories}, issue_id)
+        _discard(self._under, self._prefixes(hints), issue_id)
+
+    def clear(self) -> None:
+        self._files.clear()
+        self._scopes.clear()
+        self._dirs.clear()
+        self._under.clear()
+
+    def candidates(self, hints: FileHints) -> set[str]:
+        found: set[str] = set()
+        for f in hints.files:
+            found.update(self._files.get(f, ()))
+        for scope in hints.scopes:
+            found.update(self._scopes.get(scope, ()))
+        for path in hints.all_paths:
+            parts = _segments(path)
+            # Active directories containing (or equal to) this path.
+            for i in range(1, len(parts) + 1):
+                found.update(self._dirs.get(parts[:i], ()))
+        for d in hints.directories:
+            # Active files and directories inside this directory.
+            found.update(self._under.get(_segments(d), ()))
+        return found
+
+
+def _discard(table: dict[_K, set[str]], keys: Iterable[_K], issue_id: str) -> None:
+    """Remove *issue_id* from each of *keys* in *table*, dropping empty entries."""
+    for key in keys:
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(issue_id)
+            if not ids:
+                del table[key]
+
+
 class OverlapDetector:
     """Detects overlapping file modifications between parallel issues.
 
@@ -71,8 +162,17 @@ class OverlapDetector:
         """
         self._lock = RLock()
         self._active_hints: dict[str, FileHints] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._index = _PathIndex()
         self._config = config
 
+    @staticmethod
+    def _read_hints(issue: IssueInfo) -> FileHints:
+        """Extract hints for *issue* (file I/O happens outside the lock)."""
+        content = issue.path.read_text() if issue.path.exists() else ""
+        return extract_file_hints(content, issue.issue_id)
+
     def register_issue(self, issue: IssueInfo) -> FileHints:
         """Register an issue as actively being processed.
 
@@ -82,10 +182,16 @@ class OverlapDetector:
         Returns:
             FileHints extracted from the issue
         """
+        hints = self._read_hints(issue)
         with self._lock:
-            content = issue.path.read_text() if issue.path.exists() else ""
-            hints = extract_file_hints(content, issue.issue_id)
+            previous = self._active_hints.get(issue.issue_id)
+            if previous is not None:
+                self._index.remove(issue.issue_id, previous)
+            else:
+                self._order[issue.issue_id] = self._next_order
+                self._next_order += 1
             self._active_hints[issue.issue_id] = hints
+            self._index.add(issue.issue_id, hints)
             logger.debug(
                 f"Registered {issue.issue_id} with hints: "
                 f"files={hints.files}, dirs={hints.directories}, scopes={hints.scopes}"
@@ -99,8 +205,10 @@ class OverlapDetector:
             issue_id: ID of the completed issue
         """
         with self._lock:
-            if issue_id in self._active_hints:
-                del self._active_hints[issue_id]
+            hints = self._active_hints.pop(issue_id, None)
+            if hints is not None:
+                del self._order[issue_id]
+                self._index.remove(issue_id, hints)
                 logger.debug(f"Unregistered {issue_id}")
 
     def check_overlap(self, issue: IssueInfo) -> OverlapResult:
@@ -115,13 +223,14 @@ class OverlapDetector:
         Returns:
             OverlapResult with overlap details
         """
+        new_hints = self._read_hints(issue)
         with self._lock:
-            content = issue.path.read_text() if issue.path.exists() else ""
-            new_hints = extract_file_hints(content, issue.issue_id)
-
             result = OverlapResult()
 
-            for active_id, active_hints in self._active_hints.items():
+            candidates = self._index.candidates(new_hints)
+            # Report in registration order, as a full scan would.
+            for active_id in sorted(candidates, key=self._order.__getitem__):
+                active_hints = self._active_hints[active_id]
                 if new_hints.contends_with(active_hints, config=self._config):
                     result.has_overlap = True
                     result.overlapping_issues.append(active_id)
@@ -168,4 +277,6 @@ class OverlapDetector:
         """Clear all tracked issues."""
         with self._lock:
             self._active_hints.clear()
+            self._order.clear()
+            self._index.clear()
             logger.debug("Cleared all overlap tracking")
@@ -77,6 +77,8 @@ class WorkerResult:
             `git rev-parse`) or the result predates the capture point
         base_dirty: Whether the main repo had *tracked* modifications at stamp
             time (ENH-2866); None when unstamped
+        setup_duration: Seconds spent preparing the worktree (fresh or
+            recycled from the worktree pool); 0.0 if setup never finished
     """
 
     issue_id: str
@@ -99,6 +101,7 @@ class WorkerResult:
     epic_branch: str | None = None
     base_sha: str | None = None
     base_dirty: bool | None = None
+    setup_duration: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -123,6 +126,7 @@ class WorkerResult:
             "epic_branch": self.epic_branch,
             "base_sha": self.base_sha,
             "base_dirty": self.base_dirty,
+            "setup_duration": self.setup_duration,
         }
 
     @classmethod
@@ -149,6 +153,7 @@ class WorkerResult:
             epic_branch=data.get("epic_branch"),
             base_sha=data.get("base_sha"),
             base_dirty=data.get("base_dirty"),
+            setup_duration=data.get("setup_duration", 0.0),
         )
 
 
@@ -375,6 +380,7 @@ class ParallelConfig:
         manage_command: Template for manage-issue command
         only_ids: If provided, only process these issue IDs
         skip_ids: Issue IDs to skip (in addition to completed/failed)
+        worktree_pool_size: Idle worktrees to keep for recycling (default: 0 = off)
         merge_pending: Attempt to merge pending worktrees from previous runs
         clean_start: Remove all worktrees without checking for pending work
         ignore_pending: Report pending work but continue without merging
@@ -420,6 +426,8 @@ class ParallelConfig:
     worktree_copy_files: list[str] = field(
         default_factory=lambda: [".claude/settings.local.json", ".env", ".ll/ll.local.md"]
     )
+    # Idle worktrees kept for reuse across issues, waves and runs (0 disables)
+    worktree_pool_size: int = 0
     # Pending worktree handling flags
     merge_pending: bool = False  # Attempt to merge pending worktrees
     clean_start: bool = False  # Remove all worktrees without checking
@@ -519,6 +527,7 @@ class ParallelConfig:
             "use_feature_branches": self.use_feature_branches,
             "push_feature_branches": self.push_feature_branches,
             "open_pr_for_feature_branches": self.open_pr_for_feature_branches,
+            "worktree_pool_size": self.worktree_pool_size,
             "merge_pending": self.merge_pending,
             "clean_start": self.clean_start,
             "ignore_pending": self.ignore_pending,
@@ -573,6 +582,7 @@ class ParallelConfig:
             use_feature_branches=data.get("use_feature_branches", False),
             push_feature_branches=data.get("push_feature_branches", False),
             open_pr_for_feature_branches=data.get("open_pr_for_feature_branches", False),
+            worktree_pool_size=data.get("worktree_pool_size", 0),
             merge_pending=data.get("merge_pending", False),
             clean_start=data.get("clean_start", False),
             ignore_pending=data.get("ignore_pending", False),
@@ -23,6 +23,7 @@ from little_loops.context_window import context_window_for
 from little_loops.host_runner import project_child_env, resolve_host
 from little_loops.parallel.git_lock import GitLock
 from little_loops.parallel.types import ParallelConfig, WorkerResult, WorkerStage
+from little_loops.parallel.worktree_pool import WorktreePool
 from little_loops.ready_issue import run_ready_issue_with_retry
 from little_loops.session_store import (
     record_orchestration_run,
@@ -195,6 +196,16 @@ class WorkerPool:
         # (FEAT-2452); None when the issue is standalone or epic_branches is
         # disabled, in which case git mechanics fall back to base_branch.
         self._worker_epic_branches: dict[str, str | None] = {}
+        # Idle worktrees recycled across issues (parallel.worktree_pool_size);
+        # disabled at size 0, where every worker gets a fresh worktree.
+        self.worktree_pool = WorktreePool(
+            self.repo_path,
+            parallel_config.worktree_base,
+            parallel_config.worktree_pool_size,
+            parallel_config.worktree_copy_files,
+            logger,
+            self._git_lock,
+        )
 
     def start(self) -> None:
         """Start the worker pool."""
@@ -205,6 +216,12 @@ class WorkerPool:
         worktree_base = self.repo_path / self.parallel_config.worktree_base
         worktree_base.mkdir(parents=True, exist_ok=True)
 
+        # Warm in the background: workers that start first simply miss and
+        # fall back to a fresh worktree.
+        threading.Thread(
+            target=self.worktree_pool.warm, name="worktree-pool-warm", daemon=True
+        ).start()
+
         self._executor = ThreadPoolExecutor(
             max_workers=self.parallel_config.max_workers,
             thread_name_prefix="issue-worker",
@@ -387,18 +404,26 @@ class WorkerPool:
         # on the same (run_id, issue_id) row and COALESCEs the stamp through.
         self._record_dequeue_stamp(issue.issue_id, base_sha, base_dirty)
 
+        setup_duration = 0.0
+
         def _stamped_result(**kwargs: Any) -> WorkerResult:
             """Build a WorkerResult carrying this worker's base-state stamp.
 
             Every return path inside this method uses it — a failed worker's
             base state is as worth recording as a successful one.
             """
-            return WorkerResult(base_sha=base_sha, base_dirty=base_dirty, **kwargs)
+            return WorkerResult(
+                base_sha=base_sha,
+                base_dirty=base_dirty,
+                setup_duration=setup_duration,
+                **kwargs,
+            )
 
         try:
             # Step 1: Create worktree with new branch. Fork from the EPIC
             # integration branch when set (FEAT-2452); otherwise keep today's
             # base_branch / HEAD behavior.
+            setup_start = time.time()
             self._setup_worktree(
                 worktree_path,
                 branch_name,
@@ -409,6 +434,8 @@ class WorkerPool:
                     else None
                 ),
             )
+            setup_duration = time.time() - setup_start
+            self.worktree_pool.record_setup(issue.issue_id, setup_duration)
             with suppress(Exception):
                 record_session_lifecycle_event(
                     resolve_history_db(),
@@ -764,6 +791,9 @@ class WorkerPool:
     ) -> None:
         """Create a git worktree with a new branch.
 
+        Takes an idle worktree from the pool when one is available, else
+        creates a fresh one.
+
         Args:
             worktree_path: Path for the new worktree
             branch_name: Name of the new branch
@@ -771,15 +801,16 @@ class WorkerPool:
         """
         from little_loops.worktree_utils import setup_worktree
 
-        setup_worktree(
-            repo_path=self.repo_path,
-            worktree_path=worktree_path,
-            branch_name=branch_name,
-            copy_files=self.parallel_config.worktree_copy_files,
-            logger=self.logger,
-            git_lock=self._git_lock,
-            base_branch=base_branch,
-        )
+        if not self.worktree_pool.acquire(worktree_path, branch_name, base_branch):
+            setup_worktree(
+                repo_path=self.repo_path,
+                worktree_path=worktree_path,
+                branch_name=branch_name,
+                copy_files=self.parallel_config.worktree_copy_files,
+                logger=self.logger,
+                git_lock=self._git_lock,
+                base_branch=base_branch,
+            )
 
         # Verify model if --show-model flag is set (requires API call)
         if self.parallel_config.show_model:
@@ -863,13 +894,17 @@ class WorkerPool:
 
         from little_loops.worktree_utils import cleanup_worktree
 
-        cleanup_worktree(
-            worktree_path=worktree_path,
-            repo_path=self.repo_path,
-            logger=self.logger,
-            git_lock=self._git_lock,
-            delete_branch=delete_branch,
-        )
+        if self.worktree_pool.release(worktree_path):
+            if delete_branch and branch_name:
+                self._git_lock.run(["branch", "-D", branch_name], cwd=self.repo_path, timeout=10)
+        else:
+            cleanup_worktree(
+                worktree_path=worktree_path,
+                repo_path=self.repo_path,
+                logger=self.logger,
+                git_lock=self._git_lock,
+                delete_branch=delete_branch,
+            )
         with suppress(Exception):
             match = re.match(r"^worker-(.+)-\d{8}-\d{6}$", worktree_path.name)
             record_session_lifecycle_event(
@@ -0,0 +1,347 @@
+"""Pool of pre-warmed, recyclable git worktrees for ll-parallel and ll-sprint.
+
+``git worktree add`` plus the ``worktree_copy_files`` copy is paid once per
+issue by :func:`little_loops.worktree_utils.setup_worktree`; on a large repo
+that checkout dominates a short worker's wall time. The pool keeps up to
+``parallel.worktree_pool_size`` idle worktrees parked under the worktree base
+on a detached HEAD and hands them out instead:
+
+- **acquire** renames an idle worktree to the worker's path with
+  ``git worktree move``, points it at the fork point with
+  ``git checkout -f -B``, scrubs untracked files with ``git clean -ffdx``
+  (keeping the copied files) and re-syncs ``.claude/`` and
+  ``worktree_copy_files`` incrementally via ``sync_copy_files``.
+- **release** (after a merge, or at end-of-run cleanup) preserves any
+  uncommitted work, detaches HEAD and parks the worktree back in the pool
+  when there is room; otherwise the caller tears it down as before.
+
+Idle worktrees are plain directories named ``pool-<id>`` carrying a
+``.ll-pool-ready`` marker, so they survive across ``ll-sprint`` waves and
+successive runs. The ``git worktree move`` out of the pool is the claim: two
+processes racing for the same idle worktree cannot both succeed. Pool names
+deliberately do not match ``_is_ll_worktree``, so orphan cleanup and the
+pending-work scan leave them alone.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from little_loops.git_operations import preserve_before_teardown
+from little_loops.worktree_utils import cleanup_worktree, sync_copy_files
+
+if TYPE_CHECKING:
+    from little_loops.logger import Logger
+    from little_loops.parallel.git_lock import GitLock
+
+POOL_PREFIX = "pool-"
+READY_MARKER = ".ll-pool-ready"
+
+
+def is_pool_worktree(name: str) -> bool:
+    """Return True if a worktree directory name belongs to the worktree pool."""
+    return name.startswith(POOL_PREFIX)
+
+
+def _owner_alive(path: Path) -> bool:
+    """Return True if a ``.ll-session-<pid>`` marker in ``path`` names a live process."""
+    for marker in path.glob(".ll-session-*"):
+        try:
+            os.kill(int(marker.name.split("-")[-1]), 0)
+            return True
+        except (ProcessLookupError, ValueError):
+            continue
+        except PermissionError:
+            return True
+    return False
+
+
+@dataclass
+class PoolStats:
+    """Worktree setup accounting for the run summary.
+
+    Attributes:
+        hits: Worktrees served from the pool
+        misses: Worktrees created fresh because the pool was empty or a
+            recycle attempt failed
+        setup_seconds: Per-issue worktree setup wall time, hit or miss
+        recycled: Worktrees parked back in the pool on release
+    """
+
+    hits: int = 0
+    misses: int = 0
+    setup_seconds: dict[str, float] = field(default_factory=dict)
+    recycled: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served from the pool (0.0 when none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class WorktreePool:
+    """Keeps up to ``size`` idle worktrees ready for reuse.
+
+    A ``size`` of 0 disables pre-warming and recycling; :meth:`acquire`
+    and :meth:`release` then always return False, so the
+    caller's fresh ``setup_worktree`` / teardown path runs unchanged.
+
+    Example:
+        >>> pool = WorktreePool(repo, Path(".worktrees"), 2, copy_files, logger, git_lock)
+        >>> pool.warm()
+        >>> if not pool.acquire(path, "parallel/bug-1-...", None):
+        ...     setup_worktree(...)
+        >>> pool.release(path)
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        worktree_base: Path,
+        size: int,
+        copy_files: list[str],
+        logger: Logger,
+        git_lock: GitLock,
+    ) -> None:
+        """Initialize the pool. No git or filesystem work happens here.
+
+        Args:
+            repo_path: Path to the main repository
+            worktree_base: Worktree directory, relative to ``repo_path``
+            size: Maximum number of idle worktrees to keep
+            copy_files: ``worktree_copy_files`` entries to keep in sync
+            logger: Logger instance
+            git_lock: Shared lock serializing repo-level git operations
+        """
+        self.repo_path = repo_path
+        self.base_dir = repo_path / worktree_base
+        self.size = max(0, size)
+        self.copy_files = copy_files
+        self.logger = logger
+        self._git_lock = git_lock
+        self._lock = threading.Lock()
+        self.stats = PoolStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether pooling is configured on."""
+        return self.size > 0
+
+    def idle_worktrees(self) -> list[Path]:
+        """Return idle, ready-to-claim pool worktrees (oldest first).
+
+        Each ready marker is stat'ed once; a marker another worker's claim or
+        the warm thread removes mid-scan just drops that entry.
+        """
+        if not self.base_dir.is_dir():
+            return []
+        idle: list[tuple[float, Path]] = []
+        for item in self.base_dir.iterdir():
+            if not is_pool_worktree(item.name):
+                continue
+            try:
+                mtime = (item / READY_MARKER).stat().st_mtime
+            except OSError:
+                continue
+            idle.append((mtime, item))
+        return [item for _, item in sorted(idle)]
+
+    def warm(self) -> int:
+        """Top the pool up to ``size`` idle worktrees; returns how many were created.
+
+        Also removes pool directories abandoned mid-warm by a dead process and
+        trims idle worktrees beyond ``size`` (e.g. after the setting was
+        lowered), so a disabled pool leaves nothing behind.
+        """
+        if not self.base_dir.is_dir():
+            return 0
+        for item in self.base_dir.iterdir():
+            if (
+                is_pool_worktree(item.name)
+                and item.is_dir()
+                and not (item / READY_MARKER).exists()
+                and not _owner_alive(item)
+            ):
+                self._discard(item)
+        for surplus in self.idle_worktrees()[self.size :]:
+            self._discard(surplus)
+
+        created = 0
+        while self.enabled and len(self.idle_worktrees()) < self.size:
+            if not self._create_idle():
+                break
+            created += 1
+        if created:
+            self.logger.info(f"Worktree pool: warmed {created} idle worktree(s)")
+        return created
+
+    def acquire(self, worktree_path: Path, branch_name: str, base_branch: str | None) -> bool:
+        """Check out ``branch_name`` in a recycled worktree moved to ``worktree_path``.
+
+        Mirrors :func:`~little_loops.worktree_utils.setup_worktree`: the new
+        branch forks from ``base_branch`` when given, else from the main
+        repo's current HEAD, and the session marker is written. Returns False
+        when the pool is disabled, and False (counted as a miss) when no idle
+        worktree is available, the branch already exists, or any recycle step
+        fails — the caller then falls back to a fresh ``setup_worktree``.
+
+        Args:
+            worktree_path: Destination path the worker expects
+            branch_name: New branch to create in the worktree
+            base_branch: Commit-ish to fork from, or None for the main HEAD
+        """
+        if not self.enabled:
+            return False
+        try:
+            hit = self._acquire(worktree_path, branch_name, base_branch)
+        except Exception as e:
+            self.logger.debug(f"Worktree pool: acquire failed, falling back: {e}")
+            hit = False
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+        return hit
+
+    def record_setup(self, issue_id: str, seconds: float) -> None:
+        """Record the worktree setup wall time for ``issue_id``."""
+        with self._lock:
+            self.stats.setup_seconds[issue_id] = seconds
+
+    def release(self, worktree_path: Path) -> bool:
+        """Park ``worktree_path`` in the pool; False if the caller must tear it down.
+
+        Uncommitted work is snapshotted with ``preserve_before_teardown``
+        first, exactly as before a ``git worktree remove --force``. The
+        worktree ends up on a detached HEAD so its branch can be deleted.
+        """
+        if not self.enabled or not worktree_path.exists():
+            return False
+        with self._lock:
+            if len(self.idle_worktrees()) >= self.size:
+                return False
+            preserve_before_teardown(worktree_path, self.logger)
+            pool_path = self._new_pool_path()
+            detach = self._git_lock.run(
+                ["checkout", "-f", "--detach"], cwd=worktree_path, timeout=60
+            )
+            if detach.returncode != 0:
+                return False
+            self._git_lock.run(
+                ["worktree", "unlock", str(worktree_path)], cwd=self.repo_path, timeout=10
+            )
+            move = self._git_lock.run(
+                ["worktree", "move", str(worktree_path), str(pool_path)],
+                cwd=self.repo_path,
+                timeout=60,
+            )
+            if move.returncode != 0:
+                self.logger.debug(f"Worktree pool: move failed, not recycling: {move.stderr}")
+                return False
+            # Ready marker first: until the session marker goes, a concurrent
+            # warm() in another process must see this directory as owned.
+            (pool_path / READY_MARKER).write_text(str(os.getpid()))
+            for marker in pool_path.glob(".ll-session-*"):
+                marker.unlink(missing_ok=True)
+            self.stats.recycled += 1
+        self.logger.info(f"Worktree pool: recycled {worktree_path.name} as {pool_path.name}")
+        return True
+
+    def _acquire(self, worktree_path: Path, branch_name: str, base_branch: str | None) -> bool:
+        # Never reset a branch that already exists (e.g. a retained feature
+        # branch): setup_worktree's `worktree add -b` refuses it, so must we.
+        exists = self._git_lock.run(
+            ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch_name}"],
+            cwd=self.repo_path,
+            timeout=10,
+        )
+        if exists.returncode == 0:
+            return False
+
+        start_point = base_branch or "HEAD"
+        resolved = self._git_lock.run(
+            ["rev-parse", "--verify", f"{start_point}^{{commit}}"],
+            cwd=self.repo_path,
+            timeout=10,
+        )
+        if resolved.returncode != 0:
+            return False
+        start_sha = resolved.stdout.strip()
+
+        claimed = self._claim(worktree_path)
+        if claimed is None:
+            return False
+
+        from little_loops.session_store.db import resolve_history_db
+
+        os.environ.setdefault("LL_HISTORY_DB", str(resolve_history_db()))
+
+        checkout = self._git_lock.run(
+            ["checkout", "-f", "-B", branch_name, start_sha],
+            cwd=worktree_path,
+            timeout=120,
+        )
+        if checkout.returncode != 0:
+            self.logger.warning(f"Worktree pool: checkout failed, discarding: {checkout.stderr}")
+            self._discard(worktree_path)
+            return False
+
+        keep = [".claude", *(f for f in self.copy_files if not f.startswith(".claude/"))]
+        clean_args = ["clean", "-ffdx"]
+        for rel in keep:
+            if (self.repo_path / rel).is_file() or rel == ".claude":
+                clean_args += ["-e", f"/{rel}"]
+        self._git_lock.run(clean_args, cwd=worktree_path, timeout=120)
+
+        copied = sync_copy_files(self.repo_path, worktree_path, self.copy_files, self.logger)
+        (worktree_path / f".ll-session-{os.getpid()}").write_text(str(os.getpid()))
+        self.logger.info(
+            f"Reused pooled worktree at {worktree_path} on branch {branch_name} "
+            f"({copied} file(s) re-synced)"
+        )
+        return True
+
+    def _claim(self, worktree_path: Path) -> Path | None:
+        """Move the first claimable idle worktree to ``worktree_path``."""
+        for idle in self.idle_worktrees():
+            move = self._git_lock.run(
+                ["worktree", "move", str(idle), str(worktree_path)],
+                cwd=self.repo_path,
+                timeout=60,
+            )
+            if move.returncode == 0:
+                (worktree_path / READY_MARKER).unlink(missing_ok=True)
+                return worktree_path
+        return None
+
+    def _create_idle(self) -> bool:
+        """Add one detached worktree to the pool; False on failure."""
+        pool_path = self._new_pool_path()
+        result = self._git_lock.run(
+            ["worktree", "add", "--detach", str(pool_path), "HEAD"],
+            cwd=self.repo_path,
+            timeout=300,
+        )
+        if result.returncode != 0:
+            self.logger.warning(f"Worktree pool: failed to warm a worktree: {result.stderr}")
+            shutil.rmtree(pool_path, ignore_errors=True)
+            return False
+        (pool_path / f".ll-session-{os.getpid()}").write_text(str(os.getpid()))
+        sync_copy_files(self.repo_path, pool_path, self.copy_files, self.logger)
+        (pool_path / READY_MARKER).write_text(str(os.getpid()))
+        (pool_path / f".ll-session-{os.getpid()}").unlink(missing_ok=True)
+        return True
+
+    def _discard(self, path: Path) -> None:
+        cleanup_worktree(path, self.repo_path, self.logger, self._git_lock, delete_branch=False)
+
+    def _new_pool_path(self) -> Path:
+        return self.base_dir / f"{POOL_PREFIX}{uuid.uuid4().hex[:8]}"
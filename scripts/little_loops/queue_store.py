@@ -14,8 +14,9 @@ precedence, P0=0 .. P5=5; ties broken FIFO by ``enqueued_at``) via a plain
 ``ORDER BY priority ASC, enqueued_at ASC`` — the class itself isn't reusable
 here since it's typed concretely against ``IssueInfo``.
 
-This module owns persistence and CRUD only (add/list/get/remove). Dequeuing
-and executing entries is FEAT-2683's worker loop; the ``ll-loop queue``
+This module owns persistence, CRUD (add/list/get/remove) and the claim
+primitives (:func:`claim_entry` by id, :func:`claim_next` for the
+highest-precedence pending entry). Executing entries is FEAT-2683's worker loop; the ``ll-loop queue``
 PID-liveness marker mechanism is a distinct, non-overlapping surface for FSM
 lock contention, preserved unchanged as a compat shim by FEAT-2684 rather
 than migrated into this store.
@@ -49,6 +50,7 @@ __all__ = [
     "remove_entry",
     "update_entry_result",
     "claim_entry",
+    "claim_next",
     "reset_to_pending",
 ]
 
@@ -56,6 +58,10 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path(".ll/queue.db")
 
+# ``UPDATE ... RETURNING`` landed in SQLite 3.35; older libraries take the
+# SELECT-then-UPDATE path in :func:`claim_next`.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 def _is_default_shaped(path: Path | str) -> bool:
     """True when *path* names the default queue DB location (ENH-2927).
@@ -97,7 +103,7 @@ PRIORITY_TIERS: tuple[str, ...] = ("P0", "P1", "P2", "P3", "P4", "P5")
 
 _BUSY_TIMEOUT_MS = 5000
 
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 3
 
 _MIGRATIONS: list[str] = [
     """
@@ -123,6 +129,13 @@ _MIGRATIONS: list[str] = [
     ALTER TABLE queue_entries ADD COLUMN claimed_at TEXT;
     ALTER TABLE queue_entries ADD COLUMN owner_pid INTEGER;
     """,
+    # claim_next's "highest-precedence pending entry" lookup: an index seek on
+    # status = 'pending' already in (priority, enqueued_at) order, instead of
+    # scanning done/failed history rows that accumulate in the table.
+    """
+    CREATE INDEX IF NOT EXISTS idx_queue_entries_claim
+        ON queue_entries(status, priority, enqueued_at);
+    """,
 ]
 
 
@@ -332,13 +345,26 @@ def add_entry(
     )
 
 
-def list_entries(db_path: Path | str = DEFAULT_DB_PATH) -> list[QueueEntry]:
-    """Return all entries ordered by priority tier, then FIFO within tier."""
+def list_entries(
+    db_path: Path | str = DEFAULT_DB_PATH, *, status: str | None = None
+) -> list[QueueEntry]:
+    """Return entries ordered by priority tier, then FIFO within tier.
+
+    *status*, when given, restricts the result to entries in that state
+    (filtered in SQL, so finished history rows are never deserialized).
+    """
     conn = connect(db_path)
     try:
-        rows = conn.execute(
-            "SELECT * FROM queue_entries ORDER BY priority ASC, enqueued_at ASC"
-        ).fetchall()
+        if status is None:
+            rows = conn.execute(
+                "SELECT * FROM queue_entries ORDER BY priority ASC, enqueued_at ASC"
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM queue_entries WHERE status = ? "
+                "ORDER BY priority ASC, enqueued_at ASC",
+                (status,),
+            ).fetchall()
     finally:
         conn.close()
     return [QueueEntry._from_row(row) for row in rows]
@@ -469,3 +495,61 @@ def claim_entry(
         conn.isolation_level = prior_isolation
         conn.close()
     return cur.rowcount > 0
+
+
+def claim_next(
+    db_path: Path | str = DEFAULT_DB_PATH, *, owner_pid: int | None = None
+) -> QueueEntry | None:
+    """Atomically claim the highest-precedence ``pending`` entry and return it.
+
+    One ``UPDATE ... WHERE id = (SELECT ... LIMIT 1) RETURNING *`` statement
+    picks the first pending entry in ``priority``/``enqueued_at`` order (via
+    ``idx_queue_entries_claim``) and flips it to ``running``, so concurrent
+    drainers each get a distinct entry without a Python-side
+    list-then-:func:`claim_entry` retry loop. Runs under ``BEGIN IMMEDIATE``
+    like :func:`claim_entry`, so the write lock is held before the lookup
+    reads its snapshot. On SQLite older than 3.35 (no ``RETURNING``) the
+    same transaction selects the entry, updates it and re-reads the row; the
+    write lock already excludes other claimers, so the result is identical.
+
+    *owner_pid* is stamped as in :func:`claim_entry`. Returns None when no
+    entry is pending.
+    """
+    pid = owner_pid if owner_pid is not None else os.getpid()
+    claimed_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    conn = connect(db_path)
+    prior_isolation = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if _HAS_RETURNING:
+                row = conn.execute(
+                    "UPDATE queue_entries SET status = 'running', claimed_at = ?, owner_pid = ? "
+                    "WHERE id = (SELECT id FROM queue_entries WHERE status = 'pending' "
+                    "ORDER BY priority ASC, enqueued_at ASC LIMIT 1) "
+                    "RETURNING *",
+                    (claimed_at, pid),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT id FROM queue_entries WHERE status = 'pending' "
+                    "ORDER BY priority ASC, enqueued_at ASC LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE queue_entries SET status = 'running', claimed_at = ?, "
+                        "owner_pid = ? WHERE id = ? AND status = 'pending'",
+                        (claimed_at, pid, row["id"]),
+                    )
+                    row = conn.execute(
+                        "SELECT * FROM queue_entries WHERE id = ?", (row["id"],)
+                    ).fetchone()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.isolation_level = prior_isolation
+        conn.close()
+    return QueueEntry._from_row(row) if row else None
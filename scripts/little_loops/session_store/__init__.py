@@ -52,6 +52,7 @@ Public API:
     record_hook_event(db,...):   write one row to ``hook_events`` + search_index (ENH-2506)
     hook_event_context(db,...):  hook-fire analogue of skill_event_context (ENH-2506)
     record_harness_event(db,...): write one row to ``harness_events`` + search_index (ENH-2739)
+    record_harness_events(db,rows): batch of harness_events rows in one transaction
     record_prompt_opt_event(db,...): write one row to ``prompt_opt_events`` + search_index (ENH-2498)
     record_verdict_event(db,...): write one row to ``verdict_events`` + search_index (ENH-2504)
 """
@@ -139,6 +140,7 @@ from little_loops.session_store.writers import (
     record_context_pressure_event,
     record_correction,
     record_harness_event,
+    record_harness_events,
     record_hook_event,
     record_issue_event,
     record_issue_snapshot,
@@ -220,6 +222,7 @@ __all__ = [
     "hook_event_context",
     "HookEventCompletion",
     "record_harness_event",
+    "record_harness_events",
     "record_prompt_opt_event",
     "record_verdict_event",
     # Private functions re-exported for test access
@@ -18,35 +18,42 @@ function bodies, so neither module can import the other at module-load time.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import sqlite3
 import subprocess
 import threading
+import time
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import little_loops.session_store as _pkg
 from little_loops.host_runner import project_child_env, resolve_host
 from little_loops.session_store.db import DEFAULT_DB_PATH
 from little_loops.session_store.schema import SCHEMA_VERSION, _configure_connection
 from little_loops.session_store.writers import (
-    _backfill_assistant_messages,
+    HostLayout,
+    RecordSink,
+    _assistant_messages_sink,
     _backfill_commit_events,
     _backfill_issues_and_snapshots,
     _backfill_learning_test_events,
     _backfill_loops,
-    _backfill_messages,
-    _backfill_prompt_opt,
-    _backfill_skill_events,
     _backfill_snapshots,
     _backfill_subagent_runs,
-    _backfill_tool_events,
-    _backfill_usage_events,
-    _iter_events,
+    _decode_raw_event,
+    _drain,
+    _messages_sink,
     _now,
     _pack_payload,
+    _prompt_opt_sink,
+    _skill_events_sink,
+    _tool_events_sink,
+    _usage_events_sink,
     host_layout_for,
     mine_corrections_from_messages,
 )
@@ -517,6 +524,7 @@ def _compact_sessions(
     config: dict | None = None,
     max_sessions: int | None = None,
     db: Path | str = DEFAULT_DB_PATH,
+    session_ids: set[str] | None = None,
 ) -> int:
     """Compact all sessions in the sessions table; returns total new leaf nodes created.
 
@@ -534,6 +542,9 @@ def _compact_sessions(
             (useful for incremental first-time backfills on large databases).
         db: Path passed through to the soft-threshold background summarizer
             (FEAT-2598), which needs its own connection to the same database.
+        session_ids: When set, only these sessions are compacted — the
+            incremental :func:`rebuild` passes the sessions that gained
+            ``message_events`` rows since its last run.
     """
     from little_loops.config.features import CompactionConfig
 
@@ -543,6 +554,8 @@ def _compact_sessions(
         return 0
 
     rows = conn.execute("SELECT session_id FROM sessions ORDER BY started_at DESC").fetchall()
+    if session_ids is not None:
+        rows = [row for row in rows if row[0] in session_ids]
     if max_sessions is not None:
         rows = rows[:max_sessions]
     total = 0
@@ -705,6 +718,26 @@ def compact_session(
     return result
 
 
+def _sessions_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``sessions`` extractor: one row per source, from its first ``sessionId``."""
+    seen: set[str] = set()
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
+        if source_label in seen:
+            return 0
+        session_id = record.get("sessionId")
+        if not session_id:
+            return 0
+        seen.add(source_label)
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO sessions(session_id, jsonl_path) VALUES(?, ?)",
+            (str(session_id), source_label),
+        )
+        return cur.rowcount
+
+    return sink
+
+
 def _backfill_sessions(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
     """Seed ``sessions`` table by mapping each JSONL file to its session_id.
 
@@ -714,26 +747,9 @@ def _backfill_sessions(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cu
     files or a raw_events cursor — see :func:`_iter_events`. Unlike the legacy
     per-file loop this no longer short-circuits to the next physical file on
     the first hit (the cursor path has no file boundary), instead skipping
-    further parse attempts for a source once its session_id is known.
+    further rows for a source once its session_id is known.
     """
-    count = 0
-    seen: set[str] = set()
-    for line, source_label in _iter_events(source):
-        if source_label in seen:
-            continue
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        session_id = record.get("sessionId")
-        if session_id:
-            cur = conn.execute(
-                "INSERT OR IGNORE INTO sessions(session_id, jsonl_path) VALUES(?, ?)",
-                (str(session_id), source_label),
-            )
-            count += cur.rowcount
-            seen.add(source_label)
-    return count
+    return _drain(source, _sessions_sink(conn))
 
 
 def _mtime(path: Path) -> float:
@@ -744,6 +760,40 @@ def _mtime(path: Path) -> float:
         return 0.0
 
 
+def _line_hash(raw: bytes) -> str:
+    """Fingerprint one consumed JSONL line for cursor rewrite detection."""
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _resume_cursor(
+    conn: sqlite3.Connection, source_path: str, handle: BinaryIO, st: os.stat_result
+) -> tuple[int, int, int, str | None]:
+    """Return ``(offset, line_no, tail_offset, tail_hash)`` to resume *source_path* from.
+
+    A stored cursor is trusted only when the file is the same inode, has not
+    shrunk below the stored offset, and still carries the same bytes for the
+    last consumed line. Anything else — rotation, truncation, an in-place
+    rewrite — resets to the start of the file; the ``(source_path, line_no)``
+    dedup index keeps that full replay idempotent, exactly as before cursors.
+    """
+    start: tuple[int, int, int, str | None] = (0, 0, 0, None)
+    row = conn.execute(
+        "SELECT inode, offset, line_no, tail_offset, tail_hash FROM raw_event_cursors"
+        " WHERE source_path = ?",
+        (source_path,),
+    ).fetchone()
+    if row is None:
+        return start
+    inode, offset, line_no, tail_offset, tail_hash = row
+    if inode != st.st_ino or st.st_size < offset:
+        return start
+    if tail_hash is not None:
+        handle.seek(tail_offset)
+        if _line_hash(handle.read(offset - tail_offset)) != tail_hash:
+            return start
+    return offset, line_no, tail_offset, tail_hash
+
+
 def _backfill_raw_events(
     conn: sqlite3.Connection, jsonl_files: list[Path], *, host: str | None = None
 ) -> int:
@@ -756,6 +806,14 @@ def _backfill_raw_events(
     rows), so raw_events stores the source line verbatim rather than a
     cache-table kind (ENH-2581).
 
+    Each file resumes from its ``raw_event_cursors`` row (see
+    :func:`_resume_cursor`), so a transcript that grew by ten lines costs ten
+    parses and compressions rather than a replay of the whole file. The cursor
+    only advances past newline-terminated lines: an unterminated final line
+    (the host may still be mid-append) is ingested if it already parses but is
+    re-read next time, where the dedup index absorbs the repeat. The cursor is
+    written in the caller's transaction, so rows and cursor commit together.
+
     *host* overrides the ambient ``resolve_host().name`` for the
     ``raw_events.host`` column (ENH-3166) — ``ll-session backfill --host
     qwen`` must stamp qwen, not whatever CLI orchestrates the call. The
@@ -766,39 +824,67 @@ def _backfill_raw_events(
     layout = host_layout_for(effective_host)
     skip = layout.skip_at_ingest
     count = 0
+
+    def _ingest(raw: bytes, source_path: str, line_no: int) -> int:
+        try:
+            line = raw.decode("utf-8").strip()
+        except UnicodeDecodeError:
+            return 0
+        if not line:
+            return 0
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return 0
+        if skip is not None and skip(record):
+            return 0
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO raw_events"
+            "(ts, session_id, host, source_path, line_no, event_type, raw_line, parsed_json)"
+            " VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(record.get("timestamp") or ""),
+                record.get("sessionId"),
+                effective_host,
+                source_path,
+                line_no,
+                str(record.get("type") or "unknown"),
+                _pack_payload(line),
+                _pack_payload(json.dumps(record)),
+            ),
+        )
+        return cur.rowcount
+
     for jsonl_file in jsonl_files:
         try:
-            handle = jsonl_file.open(encoding="utf-8")
+            handle = jsonl_file.open("rb")
         except OSError:
             continue
         source_path = str(jsonl_file)
         with handle:
-            for line_no, line in enumerate(handle, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if skip is not None and skip(record):
-                    continue
-                cur = conn.execute(
-                    "INSERT OR IGNORE INTO raw_events"
-                    "(ts, session_id, host, source_path, line_no, event_type, raw_line, parsed_json)"
-                    " VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        str(record.get("timestamp") or ""),
-                        record.get("sessionId"),
-                        effective_host,
-                        source_path,
-                        line_no,
-                        str(record.get("type") or "unknown"),
-                        _pack_payload(line),
-                        _pack_payload(json.dumps(record)),
-                    ),
-                )
-                count += cur.rowcount
+            st = os.fstat(handle.fileno())
+            offset, line_no, tail_offset, tail_hash = _resume_cursor(conn, source_path, handle, st)
+            if offset == st.st_size:
+                continue
+            handle.seek(offset)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    count += _ingest(raw, source_path, line_no + 1)
+                    break
+                line_no += 1
+                tail_offset, tail_hash = offset, _line_hash(raw)
+                offset += len(raw)
+                count += _ingest(raw, source_path, line_no)
+        conn.execute(
+            "INSERT INTO raw_event_cursors"
+            "(source_path, inode, size, offset, line_no, tail_offset, tail_hash, updated_at)"
+            " VALUES(?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(source_path) DO UPDATE SET inode = excluded.inode,"
+            " size = excluded.size, offset = excluded.offset, line_no = excluded.line_no,"
+            " tail_offset = excluded.tail_offset, tail_hash = excluded.tail_hash,"
+            " updated_at = excluded.updated_at",
+            (source_path, st.st_ino, st.st_size, offset, line_no, tail_offset, tail_hash, _now()),
+        )
     return count
 
 
@@ -907,8 +993,8 @@ def recompress_raw_events(
 # would be unrecoverable data loss. hook_events and harness_events in
 # particular have no transcript-JSONL source at all (ENH-2506, ENH-2739).
 # prompt_opt_events does get JSONL-sourced enrichment (ENH-2498's
-# _backfill_prompt_opt), but as a non-destructive UPDATE-only pass called
-# separately below — it must NOT be added here or to _REBUILD_SEARCH_KINDS,
+# _prompt_opt_sink), but as a non-destructive UPDATE-only extractor registered
+# last in the replay — it must NOT be added here or to _REBUILD_SEARCH_KINDS,
 # since a wipe would destroy the live offer rows it enriches.
 _REBUILD_TABLES = (
     "tool_events",
@@ -924,21 +1010,124 @@ _REBUILD_TABLES = (
 
 _REBUILD_SEARCH_KINDS = ("tool", "message", "skill", "correction", "usage")
 
+# raw_events rows replayed per rebuild() transaction.
+_REBUILD_BATCH_ROWS = 5000
+
+
+def _upsert_meta(conn: sqlite3.Connection, items: Sequence[tuple[str, str | None]]) -> None:
+    """Set each ``(key, value)`` in *items* on the ``meta`` table."""
+    conn.executemany(
+        "INSERT INTO meta(key, value) VALUES(?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        items,
+    )
+
+
+def _meta_int(conn: sqlite3.Connection, key: str) -> int:
+    """Return the integer meta value for *key*, or 0 when unset/NULL/garbled."""
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    try:
+        return int(row[0]) if row and row[0] else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _replay_raw_events(
+    conn: sqlite3.Connection,
+    sinks: Sequence[tuple[str, RecordSink]],
+    *,
+    after_id: int = 0,
+    batch_size: int = _REBUILD_BATCH_ROWS,
+) -> tuple[dict[str, int], dict[str, float]]:
+    """Decode every ``raw_events`` row past *after_id* once and fan it out to *sinks*.
+
+    Pages through ``raw_events`` by primary key (``WHERE id > ? ... LIMIT``)
+    so neither a long-lived read cursor nor the whole table is held while the
+    sinks write, and commits after each page so the WAL stays bounded on
+    multi-million-row stores. Each row is unpacked, parsed and host-normalized
+    exactly once (:func:`_decode_raw_event`); the resulting record is handed to
+    every sink in registration order, which is how ordering constraints such
+    as sessions-first are expressed.
+
+    Each page's commit also advances the ``last_rebuilt_raw_event_id`` meta
+    watermark, so the rows a page derived and the watermark covering them land
+    atomically: an interrupted incremental rebuild resumes after the last
+    committed page and never re-derives (and duplicates) its rows.
+
+    Returns ``(counts, timings)``: rows written per sink name, and seconds
+    spent per sink plus ``"decode"`` for the shared unpack/parse step.
+    """
+    counts = {name: 0 for name, _ in sinks}
+    timings = {"decode": 0.0, **{name: 0.0 for name, _ in sinks}}
+    layouts: dict[str, HostLayout] = {}
+    clock = time.perf_counter
+    last_id = after_id
+    while True:
+        rows = conn.execute(
+            "SELECT id, raw_line, source_path, host FROM raw_events"
+            " WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+        for _row_id, raw_line, source_path, host in rows:
+            mark = clock()
+            record = _decode_raw_event(raw_line, host, layouts)
+            now = clock()
+            timings["decode"] += now - mark
+            if record is None:
+                continue
+            for name, sink in sinks:
+                mark = now
+                counts[name] += sink(record, source_path)
+                now = clock()
+                timings[name] += now - mark
+        last_id = rows[-1][0]
+        _upsert_meta(conn, [("last_rebuilt_raw_event_id", str(last_id))])
+        conn.commit()
+    return counts, timings
+
 
 def rebuild(
     db: Path | str = DEFAULT_DB_PATH,
     *,
     config: dict | None = None,
     max_sessions: int | None = None,
+    incremental: bool = False,
 ) -> dict[str, int]:
-    """Wipe and re-derive the JSONL-sourced cache tables from ``raw_events``.
-
-    Wipes ``_REBUILD_TABLES`` plus the ``search_index`` rows for
-    ``_REBUILD_SEARCH_KINDS``, then re-derives them by replaying every
-    ``raw_events`` row through the same ``_backfill_*`` parsers the legacy
-    JSONL path uses (via :func:`_iter_events`). Idempotent — safe to call
-    repeatedly. Updates the ``last_rebuild_version`` meta key to
-    ``SCHEMA_VERSION`` on success.
+    """Re-derive the JSONL-sourced cache tables from ``raw_events``.
+
+    A full rebuild (the default) wipes ``_REBUILD_TABLES`` plus the
+    ``search_index`` rows for ``_REBUILD_SEARCH_KINDS``, then re-derives them
+    in a single pass over ``raw_events`` (:func:`_replay_raw_events`): each row
+    is decompressed and parsed once and fanned out to every per-table
+    extractor — sessions first (ENH-1710), then tools, messages, assistant
+    messages, skills, usage, and the non-destructive prompt-opt enrichment
+    last. Corrections mining and session compaction then run over the derived
+    tables. Idempotent — safe to call repeatedly.
+
+    With ``incremental=True`` nothing is wiped: only ``raw_events`` rows past
+    the ``last_rebuilt_raw_event_id`` watermark are replayed through the same
+    extractors (every one of them appends, ``INSERT OR IGNORE``s or guards its
+    UPDATE, so new rows compose with the existing tables), and corrections
+    mining and compaction only visit ``message_events`` rows past the
+    ``last_rebuilt_message_event_id`` watermark and the sessions they belong
+    to. It falls back to a full rebuild whenever ``last_rebuild_version`` is
+    not ``SCHEMA_VERSION`` (a migration may change what the extractors
+    derive) or the watermark is past the newest ``raw_events`` id (the table
+    was replaced underneath it). ``tool_events``, ``skill_events`` and
+    ``usage_events`` are also written live (hooks, loop runs); their
+    extractors adopt the matching live row instead of inserting a second one
+    (see the ``derived`` column, schema v44), so replaying a hooked session
+    does not double count it. In steady state the SessionStart worker's
+    rebuild therefore costs one watermark lookup plus the new rows.
+
+    Work is committed in ``_REBUILD_BATCH_ROWS``-row batches. A full rebuild
+    clears ``last_rebuild_version`` together with the wipe and only sets it
+    back to ``SCHEMA_VERSION`` once every stage has finished, so an
+    interrupted full rebuild leaves a version mismatch that forces the next
+    run to start over. Per-stage wall time (milliseconds) is logged and
+    stored as JSON under the ``last_rebuild_timings`` meta key.
 
     Issue/loop/commit/cli/file/test_run tables are outside ``raw_events``'s
     scope for this issue (ENH-2581) and are left untouched.
@@ -956,35 +1145,85 @@ def rebuild(
         "prompt_opt_events": 0,
     }
     try:
-        for table in _REBUILD_TABLES:
-            conn.execute(f"DELETE FROM {table}")
-        placeholders = ",".join(["?"] * len(_REBUILD_SEARCH_KINDS))
-        conn.execute(
-            f"DELETE FROM search_index WHERE kind IN ({placeholders})",
-            _REBUILD_SEARCH_KINDS,
+        after_id = _meta_int(conn, "last_rebuilt_raw_event_id")
+        message_floor = _meta_int(conn, "last_rebuilt_message_event_id")
+        newest_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM raw_events").fetchone()[0]
+        full = (
+            not incremental
+            or _meta_int(conn, "last_rebuild_version") != SCHEMA_VERSION
+            or after_id > newest_id
         )
+        if full:
+            after_id = message_floor = 0
+            for table in _REBUILD_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            placeholders = ",".join(["?"] * len(_REBUILD_SEARCH_KINDS))
+            conn.execute(
+                f"DELETE FROM search_index WHERE kind IN ({placeholders})",
+                _REBUILD_SEARCH_KINDS,
+            )
+            _upsert_meta(
+                conn,
+                [
+                    ("last_rebuild_version", None),
+                    ("last_rebuilt_raw_event_id", "0"),
+                    ("last_rebuilt_message_event_id", "0"),
+                ],
+            )
 
-        def _raw_events_cursor() -> sqlite3.Cursor:
-            return conn.execute("SELECT raw_line, source_path, host FROM raw_events ORDER BY id")
-
-        # sessions first: assistant_messages/backfill order elsewhere relies on
-        # the sessions table already being populated (ENH-1710).
-        counts["sessions"] = _backfill_sessions(conn, _raw_events_cursor())
-        counts["tools"] = _backfill_tool_events(conn, _raw_events_cursor())
-        counts["messages"] = _backfill_messages(conn, _raw_events_cursor())
-        counts["assistant_messages"] = _backfill_assistant_messages(conn, _raw_events_cursor())
-        counts["skill_events"] = _backfill_skill_events(conn, _raw_events_cursor())
-        counts["usage_events"] = _backfill_usage_events(conn, _raw_events_cursor())
-        counts["corrections"] = mine_corrections_from_messages(conn, config)
-        counts["summaries"] = _compact_sessions(conn, config, max_sessions=max_sessions, db=db)
-        # Non-destructive UPDATE-only enrichment — deliberately not part of
-        # the DELETE-then-replay loop above (see _REBUILD_TABLES comment).
-        counts["prompt_opt_events"] = _backfill_prompt_opt(conn, _raw_events_cursor())
+        sinks: list[tuple[str, RecordSink]] = [
+            ("sessions", _sessions_sink(conn)),
+            ("tools", _tool_events_sink(conn)),
+            ("messages", _messages_sink(conn)),
+            ("assistant_messages", _assistant_messages_sink(conn)),
+            ("skill_events", _skill_events_sink(conn)),
+            ("usage_events", _usage_events_sink(conn)),
+        ]
+        # Non-destructive UPDATE-only enrichment — its table is deliberately
+        # not wiped above (see _REBUILD_TABLES comment); None means no open offers.
+        prompt_opt = _prompt_opt_sink(conn)
+        if prompt_opt is not None:
+            sinks.append(("prompt_opt_events", prompt_opt))
+        replayed, timings = _replay_raw_events(conn, sinks, after_id=after_id)
+        counts.update(replayed)
+
+        started = time.perf_counter()
+        counts["corrections"] = mine_corrections_from_messages(conn, config, after_id=message_floor)
+        timings["corrections"] = time.perf_counter() - started
+        started = time.perf_counter()
+        touched: set[str] | None = None
+        if not full:
+            touched = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT session_id FROM message_events"
+                    " WHERE id > ? AND session_id IS NOT NULL",
+                    (message_floor,),
+                )
+            }
+        counts["summaries"] = (
+            _compact_sessions(conn, config, max_sessions=max_sessions, db=db, session_ids=touched)
+            if touched is None or touched
+            else 0
+        )
+        timings["summaries"] = time.perf_counter() - started
 
-        conn.execute(
-            "INSERT INTO meta(key, value) VALUES('last_rebuild_version', ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            (str(SCHEMA_VERSION),),
+        timings_ms = {stage: round(seconds * 1000, 1) for stage, seconds in timings.items()}
+        logger.info(
+            "%s rebuild timings (ms): %s",
+            "full" if full else "incremental",
+            ", ".join(f"{stage}={ms}" for stage, ms in timings_ms.items()),
+        )
+        newest_message = conn.execute("SELECT COALESCE(MAX(id), 0) FROM message_events").fetchone()[
+            0
+        ]
+        _upsert_meta(
+            conn,
+            [
+                ("last_rebuild_timings", json.dumps(timings_ms)),
+                ("last_rebuilt_message_event_id", str(newest_message)),
+                ("last_rebuild_version", str(SCHEMA_VERSION)),
+            ],
         )
         conn.commit()
     finally:
@@ -1117,8 +1356,10 @@ def backfill_incremental(
 
     Pass ``also_rebuild=True`` to materialize the JSONL-derived cache tables
     from ``raw_events`` afterward in the same call — used by the
-    ``SessionStart`` hook worker when ``SCHEMA_VERSION`` has changed (see
-    ``cli/backfill_worker.py --rebuild``).
+    ``SessionStart`` hook worker (see ``cli/backfill_worker.py --rebuild``).
+    The rebuild is incremental (``rebuild(incremental=True)``): only the rows
+    just ingested are derived, with a full rebuild only after a
+    ``SCHEMA_VERSION`` change.
 
     Issues and loop-state JSON are NOT backfilled here; this variant is
     JSONL-only and designed for low-latency background use in session hooks.
@@ -1145,7 +1386,7 @@ def backfill_incremental(
     raw_count = backfill_raw_events(db, jsonl_files=jsonl_files, since_ts=since_ts, host=host)
     counts: dict[str, int] = {"raw_events": raw_count}
     if also_rebuild:
-        counts.update(rebuild(db, config=config))
+        counts.update(rebuild(db, config=config, incremental=True))
     return counts
 
 
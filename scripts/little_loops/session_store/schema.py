@@ -12,13 +12,14 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Callable
 from pathlib import Path
 
 from little_loops.session_store.db import DEFAULT_DB_PATH, _resolve_db_path
 
 logger = logging.getLogger(__name__)
 
-SCHEMA_VERSION = 41
+SCHEMA_VERSION = 44
 
 VALID_KINDS: tuple[str, ...] = (
     "tool",
@@ -81,6 +82,8 @@ _KINDLESS_TABLES = frozenset(
         "summary_nodes",
         "summary_spans",
         "raw_events",
+        "raw_event_cursors",
+        "message_trigrams",
         "correction_retirements",
         # (ENH-2997) keyed by issue_id, not session_id — readers take the most
         # recent row for an issue, so there is no "recent by kind" concept to
@@ -995,9 +998,108 @@ _MIGRATIONS: list[str] = [
     CREATE INDEX IF NOT EXISTS idx_harness_semantic_verdict
         ON harness_events(semantic_verdict);
     """,
+    # v42: raw_event_cursors — per-transcript tail cursor for raw_events
+    # ingestion. backfill_incremental used to reopen every modified JSONL from
+    # line 1 and lean on idx_raw_events_dedup to discard the already-ingested
+    # prefix, paying json.loads + two zlib compressions per old line. A cursor
+    # records where the last ingest stopped: inode + byte offset of the first
+    # unconsumed line, the line_no that precedes it (so line numbering stays
+    # identical to a from-scratch replay), and the offset + hash of the last
+    # consumed line so an in-place rewrite that happens to grow the file is
+    # detected as a rotation rather than resumed mid-record. Any mismatch falls
+    # back to a full replay, which the dedup index keeps idempotent.
+    """
+    CREATE TABLE IF NOT EXISTS raw_event_cursors (
+        source_path TEXT PRIMARY KEY,
+        inode INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        offset INTEGER NOT NULL,
+        line_no INTEGER NOT NULL,
+        tail_offset INTEGER NOT NULL,
+        tail_hash TEXT,
+        updated_at TEXT NOT NULL
+    );
+    """,
+    # v43: message_trigrams — trigram-tokenised FTS5 shadow of
+    # message_events.content so history_reader.ll_grep can narrow a regex
+    # search to rows containing the pattern's required literals before
+    # running the Python regexp_match UDF, instead of calling it on every row.
+    # External-content (no second copy of the text); the triggers keep it in
+    # step with every insert/update/delete, including direct test inserts and
+    # rebuild()'s wipe, and the trailing 'rebuild' indexes existing rows once.
+    # Requires FTS5 and SQLite >= 3.34 for the trigram tokenizer; see
+    # _OPTIONAL_MIGRATIONS for what runs instead on older libraries.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS message_trigrams USING fts5(
+        content,
+        content='message_events',
+        content_rowid='id',
+        tokenize='trigram'
+    );
+    CREATE TRIGGER IF NOT EXISTS message_trigrams_ai AFTER INSERT ON message_events BEGIN
+        INSERT INTO message_trigrams(rowid, content) VALUES (new.id, new.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS message_trigrams_ad AFTER DELETE ON message_events BEGIN
+        INSERT INTO message_trigrams(message_trigrams, rowid, content)
+            VALUES ('delete', old.id, old.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS message_trigrams_au AFTER UPDATE OF content ON message_events
+    BEGIN
+        INSERT INTO message_trigrams(message_trigrams, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        INSERT INTO message_trigrams(rowid, content) VALUES (new.id, new.content);
+    END;
+    INSERT INTO message_trigrams(message_trigrams) VALUES ('rebuild');
+    """,
+    # v44: derived flag on the tables written both live (post_tool_use,
+    # user_prompt_submit, loop-run usage) and by rebuild()'s replay of
+    # raw_events. Live rows keep the default 0; replayed rows are stamped 1,
+    # and a replayed tool/skill event first adopts the matching live row
+    # (stamping it) instead of inserting a second copy, so an incremental
+    # rebuild does not count a hooked event twice. The partial indexes serve
+    # that adoption lookup.
+    """
+    ALTER TABLE tool_events ADD COLUMN derived INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE skill_events ADD COLUMN derived INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE usage_events ADD COLUMN derived INTEGER NOT NULL DEFAULT 0;
+    CREATE INDEX IF NOT EXISTS idx_tool_events_live
+        ON tool_events(session_id, tool_name, args_hash) WHERE derived = 0;
+    CREATE INDEX IF NOT EXISTS idx_skill_events_live
+        ON skill_events(session_id, skill_name) WHERE derived = 0;
+    """,
 ]
 
 
+def _trigram_fts5_available(conn: sqlite3.Connection) -> bool:
+    """True when this SQLite has FTS5 and its ``trigram`` tokenizer (3.34+)."""
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        return False
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE temp._ll_trigram_probe USING fts5(x, tokenize='trigram')"
+        )
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp._ll_trigram_probe")
+    return True
+
+
+# Migrations that depend on an optional SQLite feature, keyed by their index in
+# _MIGRATIONS: (probe, fallback SQL applied instead when the probe fails). The
+# schema version still advances, so a database migrated without the feature
+# records that in ``meta`` and readers take their non-indexed path.
+_OPTIONAL_MIGRATIONS: dict[int, tuple[Callable[[sqlite3.Connection], bool], str]] = {
+    # v43: without message_trigrams, ll_grep scans every message_events row.
+    42: (
+        _trigram_fts5_available,
+        """
+        INSERT INTO meta(key, value) VALUES('message_trigrams', 'unavailable')
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value;
+        """,
+    ),
+}
+
+
 def _configure_connection(conn: sqlite3.Connection) -> None:
     """Apply concurrency pragmas to a freshly opened connection.
 
@@ -1024,10 +1126,22 @@ def _split_sql_statements(script: str) -> list[str]:
     issues an implicit ``COMMIT`` that would release the write lock held across
     the migration sequence (see :func:`_apply_migrations`). The migration SQL in
     ``_MIGRATIONS`` is fully controlled and contains no semicolons inside string
-    literals or column definitions, so a plain ``;`` split is safe here; do not
-    repurpose this for arbitrary user SQL.
+    literals or column definitions; the only statements with inner ``;`` are
+    ``CREATE TRIGGER ... BEGIN ...; END``, so pieces are accumulated until
+    :func:`sqlite3.complete_statement` accepts them. Do not repurpose this for
+    arbitrary user SQL.
     """
-    return [stmt for raw in script.split(";") if (stmt := raw.strip())]
+    statements: list[str] = []
+    pending = ""
+    for raw in script.split(";"):
+        pending += raw + ";"
+        if sqlite3.complete_statement(pending):
+            if stmt := pending.strip().rstrip(";").strip():
+                statements.append(stmt)
+            pending = ""
+    if stmt := pending.strip().rstrip(";").strip():
+        statements.append(stmt)
+    return statements
 
 
 def _current_version(conn: sqlite3.Connection) -> int:
@@ -1056,7 +1170,9 @@ def _apply_migrations(conn: sqlite3.Connection) -> None:
     and apply nothing. The version is re-checked *inside* the lock to close the
     fresh-database race where two processes both read version 0 and both try to
     create the bootstrap tables. ``executescript`` is avoided because its implicit
-    leading ``COMMIT`` would drop the lock between migrations.
+    leading ``COMMIT`` would drop the lock between migrations. A migration in
+    ``_OPTIONAL_MIGRATIONS`` whose feature probe fails runs its fallback SQL
+    instead, so an older SQLite still reaches the current version.
 
     Fast path: when the schema is already current, return without taking the
     write lock at all — in WAL mode this read never blocks on a concurrent
@@ -1071,7 +1187,17 @@ def _apply_migrations(conn: sqlite3.Connection) -> None:
         try:
             version = _current_version(conn)
             for index in range(version, len(_MIGRATIONS)):
-                for statement in _split_sql_statements(_MIGRATIONS[index]):
+                script = _MIGRATIONS[index]
+                optional = _OPTIONAL_MIGRATIONS.get(index)
+                if optional is not None and not optional[0](conn):
+                    logger.info(
+                        "session_store: SQLite %s lacks a feature migration v%d needs; "
+                        "applying its fallback",
+                        sqlite3.sqlite_version,
+                        index + 1,
+                    )
+                    script = optional[1]
+                for statement in _split_sql_statements(script):
                     conn.execute(statement)
                 conn.execute(
                     "INSERT INTO meta(key, value) VALUES('schema_version', ?) "
@@ -1086,6 +1212,33 @@ def _apply_migrations(conn: sqlite3.Connection) -> None:
         conn.isolation_level = prior_isolation
 
 
+# Databases this process has already brought to the current schema, keyed by
+# path -> (st_dev, st_ino). ``None`` (the default) disables the memo: one-shot
+# ``ll-*`` processes check once per connect anyway, and tests recreate
+# databases in place. Long-lived processes (the hook daemon) opt in via
+# :func:`remember_ensured_schemas` so each hook fire skips the check.
+_ENSURED: dict[Path, tuple[int, int]] | None = None
+
+
+def remember_ensured_schemas(enabled: bool) -> None:
+    """Enable (or disable and clear) the per-process ``ensure_db`` memo.
+
+    While enabled, :func:`ensure_db` returns immediately for a database file
+    it has already migrated in this process. The memo is keyed on the file's
+    identity, so a deleted or replaced database is checked again.
+    """
+    global _ENSURED
+    _ENSURED = {} if enabled else None
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
 def ensure_db(path: Path | str = DEFAULT_DB_PATH) -> Path:
     """Create the database at *path* (if needed) and apply pending migrations.
 
@@ -1101,6 +1254,10 @@ def ensure_db(path: Path | str = DEFAULT_DB_PATH) -> Path:
     diagnostic context).
     """
     db_path = _resolve_db_path(path)
+    if _ENSURED is not None:
+        identity = _file_identity(db_path)
+        if identity is not None and _ENSURED.get(db_path) == identity:
+            return db_path
     legacy = db_path.parent / "session.db"
     if legacy.exists() and not db_path.exists():
         for suffix in ("", "-shm", "-wal"):
@@ -1124,6 +1281,10 @@ def ensure_db(path: Path | str = DEFAULT_DB_PATH) -> Path:
         _apply_migrations(conn)
     finally:
         conn.close()
+    if _ENSURED is not None:
+        identity = _file_identity(db_path)
+        if identity is not None:
+            _ENSURED[db_path] = identity
     return db_path
 
 
@@ -12,6 +12,7 @@ Depends on :mod:`little_loops.session_store.schema` (``connect``, ``ensure_db``,
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
@@ -20,12 +21,14 @@ import sqlite3
 import subprocess
 import threading
 import time
+import weakref
 import zlib
 from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from queue import Empty, Full, Queue
 from typing import Any
 
 import little_loops.session_store as _pkg
@@ -368,6 +371,39 @@ def record_issue_snapshot(
 
     Silently returns if *file_path* does not exist or cannot be read.
     """
+    snapshot = _load_issue_snapshot(issue_id, transition, file_path)
+    if snapshot is None:
+        return
+    conn = _pkg.connect(db_path)
+    try:
+        _write_issue_snapshot(conn, snapshot)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@dataclass
+class _IssueSnapshot:
+    """An issue file read into ``issue_snapshots`` column values, not yet written."""
+
+    ts: str
+    issue_id: str
+    issue_num: int | None
+    transition: str
+    file_path: str
+    title: str
+    priority: Any
+    issue_type: Any
+    body: str
+    frontmatter: str
+
+
+def _load_issue_snapshot(issue_id: str, transition: str, file_path: str) -> _IssueSnapshot | None:
+    """Read *file_path* into an :class:`_IssueSnapshot`; ``None`` if unreadable.
+
+    Split from the insert so :class:`SQLiteTransport` can read the file on the
+    emitting thread — before a later move/rename — and write it on its writer.
+    """
     from little_loops.frontmatter import parse_frontmatter, strip_frontmatter
 
     issue_id = canonicalize_issue_id(issue_id, file_path) or issue_id
@@ -375,41 +411,59 @@ def record_issue_snapshot(
     try:
         content = Path(file_path).read_text(encoding="utf-8")
     except OSError:
-        return
+        return None
 
     fm = parse_frontmatter(content)
-    body = strip_frontmatter(content)
     title = fm.get("title") or fm.get("id") or issue_id
-    priority = fm.get("priority")
-    issue_type = fm.get("type")
+    return _IssueSnapshot(
+        ts=_now(),
+        issue_id=issue_id,
+        issue_num=normalize_issue_id(issue_id),
+        transition=transition,
+        file_path=file_path,
+        title=str(title),
+        priority=fm.get("priority"),
+        issue_type=fm.get("type"),
+        body=strip_frontmatter(content),
+        # Serialise frontmatter as JSON for storage.
+        frontmatter=json.dumps({k: str(v) for k, v in fm.items() if v is not None}, sort_keys=True),
+    )
 
-    # Serialise frontmatter as JSON for storage.
-    fm_json = json.dumps({k: str(v) for k, v in fm.items() if v is not None}, sort_keys=True)
 
-    issue_num = normalize_issue_id(issue_id)
-    conn = _pkg.connect(db_path)
-    ts = _now()
-    try:
-        cursor = conn.execute(
-            "INSERT OR IGNORE INTO issue_snapshots"
-            "(ts, issue_id, issue_num, transition, title, priority, issue_type, body, frontmatter)"
-            " VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (ts, issue_id, issue_num, transition, str(title), priority, issue_type, body, fm_json),
-        )
-        _warn_on_dedup_collision(
-            conn, "issue_snapshots", issue_num, issue_id, transition, cursor.rowcount == 1
-        )
-        _index(
-            conn,
-            content=f"{issue_id} {title} {body or ''}".strip(),
-            kind="snapshot",
-            ref=issue_id,
-            anchor=file_path,
-            ts=ts,
-        )
-        conn.commit()
-    finally:
-        conn.close()
+def _write_issue_snapshot(conn: sqlite3.Connection, snapshot: _IssueSnapshot) -> None:
+    """Insert and index *snapshot* on *conn*; the caller owns the commit."""
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO issue_snapshots"
+        "(ts, issue_id, issue_num, transition, title, priority, issue_type, body, frontmatter)"
+        " VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            snapshot.ts,
+            snapshot.issue_id,
+            snapshot.issue_num,
+            snapshot.transition,
+            snapshot.title,
+            snapshot.priority,
+            snapshot.issue_type,
+            snapshot.body,
+            snapshot.frontmatter,
+        ),
+    )
+    _warn_on_dedup_collision(
+        conn,
+        "issue_snapshots",
+        snapshot.issue_num,
+        snapshot.issue_id,
+        snapshot.transition,
+        cursor.rowcount == 1,
+    )
+    _index(
+        conn,
+        content=f"{snapshot.issue_id} {snapshot.title} {snapshot.body or ''}".strip(),
+        kind="snapshot",
+        ref=snapshot.issue_id,
+        anchor=snapshot.file_path,
+        ts=snapshot.ts,
+    )
 
 
 def record_issue_event(
@@ -1021,6 +1075,71 @@ def record_test_run_event(
         conn.close()
 
 
+def _insert_harness_event(
+    conn: sqlite3.Connection,
+    *,
+    ts: str,
+    runner: str | None = None,
+    target: str | None = None,
+    exit_code: int | None = None,
+    semantic_verdict: str | None = None,
+    semantic_passed: bool | None = None,
+    timed_out: bool | None = None,
+    duration_ms: int | None = None,
+    head_sha: str | None = None,
+    branch: str | None = None,
+    parent_id: int | None = None,
+    semantic_prompt: str | None = None,
+    semantic_confidence: float | None = None,
+    semantic_reason: str | None = None,
+    semantic_evidence: str | None = None,
+    semantic_model: str | None = None,
+    target_content_hash: str | None = None,
+    target_path: str | None = None,
+    dirty: int | None = None,
+) -> None:
+    """Insert one ``harness_events`` row plus its search_index entry (no commit)."""
+    conn.execute(
+        "INSERT INTO harness_events("
+        "ts, runner, target, exit_code, semantic_verdict, semantic_passed, "
+        "timed_out, duration_ms, head_sha, branch, parent_id, "
+        "semantic_prompt, semantic_confidence, semantic_reason, "
+        "semantic_evidence, semantic_model, "
+        "target_content_hash, target_path, dirty"
+        ") VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            ts,
+            runner,
+            target,
+            exit_code,
+            semantic_verdict,
+            None if semantic_passed is None else int(semantic_passed),
+            None if timed_out is None else int(timed_out),
+            duration_ms,
+            head_sha,
+            branch,
+            parent_id,
+            semantic_prompt,
+            semantic_confidence,
+            semantic_reason,
+            semantic_evidence,
+            semantic_model,
+            target_content_hash,
+            target_path,
+            None if dirty is None else int(dirty),
+        ),
+    )
+    summary = f"{runner or 'harness'} {target or ''} exit={exit_code}".strip()
+    _index(
+        conn,
+        content=summary[:512],
+        kind="harness",
+        ref=head_sha or "",
+        anchor=branch or "",
+        ts=ts,
+    )
+
+
 def record_harness_event(
     db_path: Path | str,
     *,
@@ -1060,50 +1179,52 @@ def record_harness_event(
     """
     conn = _pkg.connect(db_path)
     try:
-        conn.execute(
-            "INSERT INTO harness_events("
-            "ts, runner, target, exit_code, semantic_verdict, semantic_passed, "
-            "timed_out, duration_ms, head_sha, branch, parent_id, "
-            "semantic_prompt, semantic_confidence, semantic_reason, "
-            "semantic_evidence, semantic_model, "
-            "target_content_hash, target_path, dirty"
-            ") VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                ts,
-                runner,
-                target,
-                exit_code,
-                semantic_verdict,
-                None if semantic_passed is None else int(semantic_passed),
-                None if timed_out is None else int(timed_out),
-                duration_ms,
-                head_sha,
-                branch,
-                parent_id,
-                semantic_prompt,
-                semantic_confidence,
-                semantic_reason,
-                semantic_evidence,
-                semantic_model,
-                target_content_hash,
-                target_path,
-                None if dirty is None else int(dirty),
-            ),
-        )
-        summary = f"{runner or 'harness'} {target or ''} exit={exit_code}".strip()
-        _index(
+        _insert_harness_event(
             conn,
-            content=summary[:512],
-            kind="harness",
-            ref=head_sha or "",
-            anchor=branch or "",
             ts=ts,
+            runner=runner,
+            target=target,
+            exit_code=exit_code,
+            semantic_verdict=semantic_verdict,
+            semantic_passed=semantic_passed,
+            timed_out=timed_out,
+            duration_ms=duration_ms,
+            head_sha=head_sha,
+            branch=branch,
+            parent_id=parent_id,
+            semantic_prompt=semantic_prompt,
+            semantic_confidence=semantic_confidence,
+            semantic_reason=semantic_reason,
+            semantic_evidence=semantic_evidence,
+            semantic_model=semantic_model,
+            target_content_hash=target_content_hash,
+            target_path=target_path,
+            dirty=dirty,
         )
         conn.commit()
     finally:
         conn.close()
 
 
+def record_harness_events(db_path: Path | str, rows: Sequence[dict[str, Any]]) -> None:
+    """Write several ``harness_events`` rows in a single transaction.
+
+    Each mapping in *rows* takes the keyword arguments of
+    :func:`record_harness_event`. ``ll-harness dsl`` buffers its per-task rows
+    and flushes them here once, instead of opening a connection and committing
+    per task. Raises on failure, like :func:`record_harness_event`.
+    """
+    if not rows:
+        return
+    conn = _pkg.connect(db_path)
+    try:
+        for row in rows:
+            _insert_harness_event(conn, **row)
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def record_prompt_opt_event(
     db_path: Path | str,
     *,
@@ -2258,20 +2379,88 @@ def _derive_transition(event_type: str) -> str:
     return _ISSUE_TRANSITION_MAP.get(event_type, event_type.split(".", 1)[1])
 
 
+_SQLITE_BATCH_SIZE_DEFAULT = 64
+_SQLITE_FLUSH_MS_DEFAULT = 100
+_SQLITE_QUEUE_MAXSIZE = 10_000
+_SQLITE_CLOSE_TIMEOUT = 10.0
+_SQLITE_DROP_LOG_INTERVAL_SEC = 5.0
+
+
+@dataclass
+class _PendingWrite:
+    """A recognised event captured on the emitting thread, awaiting the writer."""
+
+    event: dict[str, Any]
+    event_type: str
+    ts: str
+    issue_id: Any = None
+    snapshot: _IssueSnapshot | None = None
+
+
+class _Flush:
+    """Queue barrier: the writer commits everything ahead of it, then sets ``done``."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+# Transports whose writer may still hold queued events; drained at interpreter
+# exit so a caller that never reaches close_transports() loses nothing.
+_LIVE_TRANSPORTS: weakref.WeakSet[SQLiteTransport] = weakref.WeakSet()
+
+
+def _close_live_transports() -> None:
+    for transport in list(_LIVE_TRANSPORTS):
+        transport.close()
+
+
+atexit.register(_close_live_transports)
+
+
 class SQLiteTransport:
     """EventBus sink that records FSM loop events into the session database.
 
-    A single connection is opened at construction with ``check_same_thread``
-    disabled, since :meth:`send` may be called from the FSM thread while other
-    transports run their own threads; a lock serialises writes. Every
-    operation is best-effort — a database error is logged and swallowed so a
-    failing sink never aborts a loop run (the four ``wire_transports`` call
-    sites depend on this).
+    :meth:`send` never touches the database: it filters out unrecognised event
+    types, stamps the event, reads the issue file for snapshot-bearing
+    ``issue.*`` events (so a later move cannot lose it), and enqueues the
+    result on a bounded queue. A daemon writer thread owns the single
+    connection and groups queued events into one transaction per
+    *batch_size* events or *flush_ms* milliseconds, whichever comes first —
+    ``loop_events``/``issue_events`` rows, their FTS5 ``search_index`` rows and
+    ``issue_snapshots`` all share that commit. A full queue drops the newest
+    event with a rate-limited warning, like
+    :class:`~little_loops.transport.UnixSocketTransport`.
+
+    :meth:`flush` blocks until everything sent so far is committed;
+    :meth:`close` flushes, stops the writer and closes the connection.
+    Transports never closed are drained by an ``atexit`` hook. Every operation
+    is best-effort — a database error is logged and swallowed so a failing sink
+    never aborts a loop run (the four ``wire_transports`` call sites depend on
+    this); a failing batch is retried event-by-event so one bad row cannot
+    lose its neighbours.
     """
 
-    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH) -> None:
+    def __init__(
+        self,
+        db_path: Path | str = DEFAULT_DB_PATH,
+        *,
+        batch_size: int = _SQLITE_BATCH_SIZE_DEFAULT,
+        flush_ms: int = _SQLITE_FLUSH_MS_DEFAULT,
+        max_queue: int = _SQLITE_QUEUE_MAXSIZE,
+    ) -> None:
         self._path = resolve_history_db(db_path)
-        self._lock = threading.Lock()
+        self._batch_size = max(1, batch_size)
+        self._flush_s = max(0, flush_ms) / 1000.0
+        self._queue: Queue[_PendingWrite | _Flush | None] = Queue(maxsize=max(1, max_queue))
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._events_written = 0
+        self._events_dropped = 0
+        self._dropped_since_log = 0
+        self._last_drop_log_ts = 0.0
+        self._write_errors = 0
+        self._batches = 0
+        self._thread: threading.Thread | None = None
         self._conn: sqlite3.Connection | None = None
         try:
             _pkg.ensure_db(self._path)
@@ -2282,111 +2471,82 @@ class SQLiteTransport:
                 "SQLiteTransport: could not open %s; sink disabled", self._path, exc_info=True
             )
             self._conn = None
+            return
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="sqlite-transport-writer", daemon=True
+        )
+        self._thread.start()
+        _LIVE_TRANSPORTS.add(self)
 
     def send(self, event: dict[str, Any]) -> None:
-        """Record a recognised event as a ``loop_events`` or ``issue_events`` row (best-effort)."""
-        conn = self._conn
-        if conn is None:
+        """Queue a recognised event for the writer thread (non-blocking)."""
+        if self._conn is None or self._closed:
             return
         event_type = str(event.get("event", ""))
-        ts = str(event.get("ts") or _now())
+        if event_type not in _LOOP_EVENT_TYPES and not event_type.startswith("issue."):
+            return
+        pending = _PendingWrite(dict(event), event_type, str(event.get("ts") or _now()))
+        if event_type.startswith("issue."):
+            # Side-effect: snapshot the content when the event carries a file path.
+            file_path = event.get("file_path")
+            issue_id = canonicalize_issue_id(
+                event.get("issue_id"), file_path or event.get("issue_file")
+            ) or event.get("issue_id")
+            pending.issue_id = issue_id
+            transition = _derive_transition(event_type)
+            if file_path and issue_id and transition in ("done", "open", "cancelled"):
+                pending.snapshot = _load_issue_snapshot(str(issue_id), transition, str(file_path))
         try:
-            with self._lock:
-                if event_type in _LOOP_EVENT_TYPES:
-                    loop_name = str(event.get("loop_name", "")) or None
-                    state = event.get("state")
-                    if event_type == "loop_complete":
-                        from little_loops.fsm.persistence import map_final_status
-
-                        state = map_final_status(
-                            str(event.get("terminated_by", "")),
-                            failure_terminal=bool(event.get("failure_terminal", False)),
-                        )
-                    retries = event.get("retries")
-                    conn.execute(
-                        "INSERT INTO loop_events(ts, loop_name, state, transition, retries) "
-                        "VALUES(?, ?, ?, ?, ?)",
-                        (
-                            ts,
-                            loop_name,
-                            str(state) if state is not None else None,
-                            event_type,
-                            int(retries) if isinstance(retries, int) else None,
-                        ),
-                    )
-                    _index(
-                        conn,
-                        content=" ".join(
-                            str(p) for p in (loop_name, state, event_type) if p is not None
-                        ),
-                        kind="loop",
-                        ref=loop_name or "",
-                        anchor=f".loops/{loop_name}.yaml" if loop_name else "",
-                        ts=ts,
-                    )
-                elif event_type.startswith("issue."):
-                    _id_source_path = event.get("file_path") or event.get("issue_file")
-                    issue_id = canonicalize_issue_id(
-                        event.get("issue_id"), _id_source_path
-                    ) or event.get("issue_id")
-                    transition = _derive_transition(event_type)
-                    # Authoritative session linkage (ENH-2462): producers put the
-                    # emitting session's ID in the payload; both snake_case and
-                    # the host JSONL camelCase spelling are accepted.
-                    session_id = event.get("session_id") or event.get("sessionId")
-                    issue_num = normalize_issue_id(issue_id) if issue_id else None
-                    _cursor = conn.execute(
-                        "INSERT OR IGNORE INTO issue_events("
-                        "ts, issue_id, issue_num, transition, discovered_by, "
-                        "issue_type, priority, captured_at, completed_at, session_id"
-                        ") VALUES(?,?,?,?,?,?,?,?,?,?)",
-                        (
-                            ts,
-                            issue_id,
-                            issue_num,
-                            transition,
-                            event.get("discovered_by"),
-                            event.get("issue_type"),
-                            event.get("priority"),
-                            event.get("captured_at"),
-                            event.get("completed_at"),
-                            str(session_id) if session_id else None,
-                        ),
-                    )
-                    if issue_id:
-                        _warn_on_dedup_collision(
-                            conn,
-                            "issue_events",
-                            issue_num,
-                            str(issue_id),
-                            transition,
-                            _cursor.rowcount == 1,
-                        )
-                    _index(
-                        conn,
-                        content=f"{issue_id or ''} {event.get('issue_type', '')}".strip(),
-                        kind="issue",
-                        ref=str(issue_id or ""),
-                        anchor=event.get("issue_file", ""),
-                        ts=ts,
-                    )
-                    # Side-effect: write content snapshot when the event carries a file path.
-                    file_path = event.get("file_path")
-                    if file_path and issue_id and transition in ("done", "open", "cancelled"):
-                        try:
-                            conn.commit()  # flush issue_events before spawning new conn
-                        except sqlite3.Error:
-                            pass
-                        record_issue_snapshot(self._path, str(issue_id), transition, str(file_path))
-                        return  # skip second commit below; record_issue_snapshot committed
-                else:
-                    return
-                conn.commit()
-        except sqlite3.Error:
-            logger.warning("SQLiteTransport: write failed for event %r", event_type, exc_info=True)
+            self._queue.put_nowait(pending)
+        except Full:
+            self._record_drop()
+
+    def flush(self, timeout: float = _SQLITE_CLOSE_TIMEOUT) -> bool:
+        """Block until every event sent before this call is committed.
+
+        Returns ``False`` if the writer did not catch up within *timeout*
+        seconds (or the transport is disabled or closed).
+        """
+        if self._thread is None or self._closed:
+            return False
+        barrier = _Flush()
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except Full:
+            return False
+        return barrier.done.wait(timeout)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return writer statistics (counts since construction, plus queue depth)."""
+        return {
+            "events_written": self._events_written,
+            "events_dropped": self._events_dropped,
+            "write_errors": self._write_errors,
+            "batches": self._batches,
+            "backlog": self._queue.qsize(),
+        }
 
     def close(self) -> None:
-        """Close the underlying connection (best-effort)."""
+        """Commit queued events, stop the writer and close the connection (best-effort)."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        _LIVE_TRANSPORTS.discard(self)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(None, timeout=_SQLITE_CLOSE_TIMEOUT)
+            except Full:
+                pass
+            thread.join(timeout=_SQLITE_CLOSE_TIMEOUT)
+            if thread.is_alive():
+                logger.warning(
+                    "SQLiteTransport: writer did not exit within %.1fs; %d events unwritten",
+                    _SQLITE_CLOSE_TIMEOUT,
+                    self._queue.qsize(),
+                )
+                return
         if self._conn is not None:
             try:
                 self._conn.close()
@@ -2394,6 +2554,163 @@ class SQLiteTransport:
                 pass
             self._conn = None
 
+    def _record_drop(self) -> None:
+        self._events_dropped += 1
+        self._dropped_since_log += 1
+        now = time.monotonic()
+        if self._events_dropped == 1:
+            logger.warning(
+                "SQLiteTransport: dropping events; writer backlog full at %d",
+                self._queue.maxsize,
+            )
+        elif now - self._last_drop_log_ts >= _SQLITE_DROP_LOG_INTERVAL_SEC:
+            logger.warning("SQLiteTransport: dropped %d events", self._dropped_since_log)
+        else:
+            return
+        self._last_drop_log_ts = now
+        self._dropped_since_log = 0
+
+    def _writer_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch: list[_PendingWrite] = []
+            barriers: list[_Flush] = []
+            deadline = time.monotonic() + self._flush_s
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                if isinstance(item, _Flush):
+                    barriers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            for barrier in barriers:
+                barrier.done.set()
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            with conn:
+                for pending in batch:
+                    self._write_event(conn, pending)
+        except Exception:
+            # Isolate the failure: one transaction per event so a single bad
+            # row cannot take the rest of the batch down with it.
+            for pending in batch:
+                try:
+                    with conn:
+                        self._write_event(conn, pending)
+                except Exception:
+                    self._write_errors += 1
+                    logger.warning(
+                        "SQLiteTransport: write failed for event %r",
+                        pending.event_type,
+                        exc_info=True,
+                    )
+                else:
+                    self._events_written += 1
+        else:
+            self._events_written += len(batch)
+        self._batches += 1
+
+    @staticmethod
+    def _write_event(conn: sqlite3.Connection, pending: _PendingWrite) -> None:
+        """Insert one queued event's rows on *conn*; the caller owns the commit."""
+        event, event_type, ts = pending.event, pending.event_type, pending.ts
+        if event_type in _LOOP_EVENT_TYPES:
+            loop_name = str(event.get("loop_name", "")) or None
+            state = event.get("state")
+            if event_type == "loop_complete":
+                from little_loops.fsm.persistence import map_final_status
+
+                state = map_final_status(
+                    str(event.get("terminated_by", "")),
+                    failure_terminal=bool(event.get("failure_terminal", False)),
+                )
+            retries = event.get("retries")
+            conn.execute(
+                "INSERT INTO loop_events(ts, loop_name, state, transition, retries) "
+                "VALUES(?, ?, ?, ?, ?)",
+                (
+                    ts,
+                    loop_name,
+                    str(state) if state is not None else None,
+                    event_type,
+                    int(retries) if isinstance(retries, int) else None,
+                ),
+            )
+            _index(
+                conn,
+                content=" ".join(str(p) for p in (loop_name, state, event_type) if p is not None),
+                kind="loop",
+                ref=loop_name or "",
+                anchor=f".loops/{loop_name}.yaml" if loop_name else "",
+                ts=ts,
+            )
+            return
+
+        # issue_id was canonicalized on the emitting thread by send().
+        issue_id = pending.issue_id
+        transition = _derive_transition(event_type)
+        # Authoritative session linkage (ENH-2462): producers put the
+        # emitting session's ID in the payload; both snake_case and
+        # the host JSONL camelCase spelling are accepted.
+        session_id = event.get("session_id") or event.get("sessionId")
+        issue_num = normalize_issue_id(issue_id) if issue_id else None
+        _cursor = conn.execute(
+            "INSERT OR IGNORE INTO issue_events("
+            "ts, issue_id, issue_num, transition, discovered_by, "
+            "issue_type, priority, captured_at, completed_at, session_id"
+            ") VALUES(?,?,?,?,?,?,?,?,?,?)",
+            (
+                ts,
+                issue_id,
+                issue_num,
+                transition,
+                event.get("discovered_by"),
+                event.get("issue_type"),
+                event.get("priority"),
+                event.get("captured_at"),
+                event.get("completed_at"),
+                str(session_id) if session_id else None,
+            ),
+        )
+        if issue_id:
+            _warn_on_dedup_collision(
+                conn,
+                "issue_events",
+                issue_num,
+                str(issue_id),
+                transition,
+                _cursor.rowcount == 1,
+            )
+        _index(
+            conn,
+            content=f"{issue_id or ''} {event.get('issue_type', '')}".strip(),
+            kind="issue",
+            ref=str(issue_id or ""),
+            anchor=event.get("issue_file", ""),
+            ts=ts,
+        )
+        if pending.snapshot is not None:
+            _write_issue_snapshot(conn, pending.snapshot)
+
 
 def _hash_args(value: Any) -> str:
     """Return a short stable hash of a tool-call argument structure."""
@@ -2791,25 +3108,90 @@ def _iter_events(source: list[Path] | sqlite3.Cursor) -> Generator[tuple[str, st
                     yield line, str(jsonl_file)
 
 
-def _backfill_tool_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
-    """Seed ``tool_events`` from assistant tool-use blocks in session JSONL files.
+# A per-table extractor: consumes one parsed transcript record plus its source
+# label and returns the number of cache rows it wrote. Built by the
+# ``_*_sink(conn)`` factories below so :func:`rebuild` can decode each
+# raw_events row once and fan the record out to every extractor.
+RecordSink = Callable[[dict[str, Any], str], int]
 
-    *source* is either a list of on-disk JSONL files (legacy) or a
-    ``raw_events`` cursor (the :func:`rebuild` path) — see :func:`_iter_events`.
+
+def _decode_raw_event(
+    raw_line: str | bytes, host: str | None, layouts: dict[str, HostLayout]
+) -> dict[str, Any] | None:
+    """Decode one ``raw_events`` row into the Claude-shaped record extractors consume.
+
+    Unpacks the payload, parses it once, and applies the host layout's
+    ``normalize`` callable when it has one (ENH-3166) — the same transform
+    :func:`_iter_events` performs, minus its re-serialization. Returns ``None``
+    for unparseable lines, non-object JSON, and records the normalizer drops.
+    *layouts* memoizes :func:`host_layout_for` across calls.
     """
-    count = 0
+    try:
+        record = json.loads(_unpack_payload(raw_line))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    if host:
+        layout = layouts.get(host)
+        if layout is None:
+            layout = layouts[host] = host_layout_for(str(host))
+        if layout.normalize is not None:
+            return layout.normalize(record)
+    return record
+
+
+def _iter_records(
+    source: list[Path] | sqlite3.Cursor,
+) -> Generator[tuple[dict[str, Any], str], None, None]:
+    """Yield ``(record, source_label)`` pairs — :func:`_iter_events`, parsed.
+
+    Drives the per-table ``_backfill_*`` wrappers over a single source. Cursor
+    rows go through :func:`_decode_raw_event`; JSONL lines are parsed as-is.
+    Lines that do not decode to a JSON object are skipped.
+    """
+    if isinstance(source, sqlite3.Cursor):
+        layouts: dict[str, HostLayout] = {}
+        for row in source:
+            host = row[2] if len(row) > 2 else None
+            decoded = _decode_raw_event(row[0], host, layouts)
+            if decoded is not None:
+                yield decoded, row[1]
+        return
     for line, source_label in _iter_events(source):
         try:
             record = json.loads(line)
         except json.JSONDecodeError:
             continue
+        if isinstance(record, dict):
+            yield record, source_label
+
+
+def _drain(source: list[Path] | sqlite3.Cursor, sink: RecordSink | None) -> int:
+    """Run every record in *source* through *sink*; return the rows it wrote."""
+    if sink is None:
+        return 0
+    return sum(sink(record, source_label) for record, source_label in _iter_records(source))
+
+
+def _tool_events_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``tool_events`` extractor: one row per assistant ``tool_use`` block.
+
+    A block that ``post_tool_use`` already recorded live (same session, tool
+    and args hash, not yet adopted) is not inserted again: the oldest such
+    live row is stamped ``derived = 1`` instead, so replaying a hooked
+    session yields one row per call whether or not the hook fired (schema v44).
+    """
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
         if record.get("type") != "assistant":
-            continue
+            return 0
         session_id = record.get("sessionId")
         ts = str(record.get("timestamp") or "")
         content = record.get("message", {}).get("content", [])
         if not isinstance(content, list):
-            continue
+            return 0
+        count = 0
         for block in content:
             if not isinstance(block, dict) or block.get("type") != "tool_use":
                 continue
@@ -2821,16 +3203,25 @@ def _backfill_tool_events(conn: sqlite3.Connection, source: list[Path] | sqlite3
                 else None
             )
             mcp_server, mcp_tool = _parse_mcp_tool_name(tool_name)
+            args_hash = _hash_args(args)
+            adopted = conn.execute(
+                "UPDATE tool_events SET derived = 1 WHERE id = ("
+                "SELECT id FROM tool_events WHERE derived = 0 AND session_id = ? "
+                "AND tool_name = ? AND args_hash = ? ORDER BY id LIMIT 1)",
+                (session_id, tool_name, args_hash),
+            ).rowcount
+            if adopted:
+                continue
             conn.execute(
                 "INSERT INTO tool_events(ts, session_id, tool_name, args_hash, "
                 "result_size, bytes_in, bytes_out, cache_hit, agent_type, "
-                "mcp_server, mcp_tool) "
-                "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                "mcp_server, mcp_tool, derived) "
+                "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
                 (
                     ts,
                     session_id,
                     tool_name,
-                    _hash_args(args),
+                    args_hash,
                     None,
                     None,
                     None,
@@ -2849,7 +3240,18 @@ def _backfill_tool_events(conn: sqlite3.Connection, source: list[Path] | sqlite3
                 ts=ts,
             )
             count += 1
-    return count
+        return count
+
+    return sink
+
+
+def _backfill_tool_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
+    """Seed ``tool_events`` from assistant tool-use blocks in session JSONL files.
+
+    *source* is either a list of on-disk JSONL files (legacy) or a
+    ``raw_events`` cursor (the :func:`rebuild` path) — see :func:`_iter_events`.
+    """
+    return _drain(source, _tool_events_sink(conn))
 
 
 def _load_loop_run_windows(conn: sqlite3.Connection) -> list[tuple[str, str, str]]:
@@ -2880,43 +3282,33 @@ def _derive_run_id_for_ts(ts: str, windows: list[tuple[str, str, str]]) -> str |
     return matches[0] if len(matches) == 1 else None
 
 
-def _backfill_usage_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
-    """Seed ``usage_events`` from assistant ``message.usage`` blocks (ENH-2461).
-
-    Persists the real LLM token counts the API returned (``input_tokens``,
-    ``output_tokens``, ``cache_read_input_tokens``,
-    ``cache_creation_input_tokens``) plus a derived ``cost_usd``, one row per
-    assistant turn. The on-disk transcript carries the usage block on
-    ``type == "assistant"`` records at ``message.usage`` — verified against live
-    session files. (The ``type == "result"`` shape referenced in earlier issue
-    research only exists in the *live* subprocess stdout stream, which
-    ``raw_events`` never ingests.) The ``state`` column is always ``NULL`` here:
-    the transcript stream carries no FSM-state boundary, so per-state grain is
-    not derivable from this source (ENH-2461 Addendum 2). *source* accepts either
-    JSONL files or a ``raw_events`` cursor — see :func:`_iter_events`.
+def _usage_events_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``usage_events`` extractor: one row per assistant turn carrying a usage block.
 
-    ``run_id`` is backfilled via a timestamp-window join against ``loop_runs``
-    (ENH-2725) — see :func:`_derive_run_id_for_ts`. Rows with no derivable
-    ``run_id`` stay ``NULL``, matching the live-writer path's behavior for
-    non-loop sessions.
+    Turns attributed to a loop run whose usage :func:`record_usage_event`
+    already wrote live (``derived = 0`` rows with that ``run_id``) are
+    skipped: the live rows are per-invocation totals, so adding the per-turn
+    rows on top would count that run's tokens twice (schema v44).
     """
     from little_loops.pricing import estimate_cost_usd
 
-    count = 0
     windows = _load_loop_run_windows(conn)
-    for line, source_label in _iter_events(source):
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    live_runs = {
+        row[0]
+        for row in conn.execute(
+            "SELECT DISTINCT run_id FROM usage_events WHERE derived = 0 AND run_id IS NOT NULL"
+        )
+    }
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
         if record.get("type") != "assistant":
-            continue
+            return 0
         message = record.get("message")
         if not isinstance(message, dict):
-            continue
+            return 0
         usage = message.get("usage")
         if not isinstance(usage, dict):
-            continue
+            return 0
         input_tokens = usage.get("input_tokens")
         output_tokens = usage.get("output_tokens")
         cache_read = usage.get("cache_read_input_tokens")
@@ -2924,7 +3316,7 @@ def _backfill_usage_events(conn: sqlite3.Connection, source: list[Path] | sqlite
         # Every real usage block carries at least input/output; skip rows with
         # no token signal at all (defensive against malformed/partial records).
         if input_tokens is None and output_tokens is None:
-            continue
+            return 0
         session_id = record.get("sessionId")
         ts = str(record.get("timestamp") or "")
         model = message.get("model")
@@ -2936,11 +3328,13 @@ def _backfill_usage_events(conn: sqlite3.Connection, source: list[Path] | sqlite
             int(cache_creation or 0),
         )
         run_id = _derive_run_id_for_ts(ts, windows)
+        if run_id is not None and run_id in live_runs:
+            return 0
         conn.execute(
             "INSERT INTO usage_events(ts, session_id, model, state, input_tokens, "
             "output_tokens, cache_read_input_tokens, cache_creation_input_tokens, cost_usd, "
-            "run_id) "
-            "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "run_id, derived) "
+            "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
             (
                 ts,
                 session_id,
@@ -2962,27 +3356,40 @@ def _backfill_usage_events(conn: sqlite3.Connection, source: list[Path] | sqlite
             anchor=source_label,
             ts=ts,
         )
-        count += 1
-    return count
+        return 1
 
+    return sink
 
-def _backfill_messages(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
-    """Seed ``message_events`` from user blocks in session JSONL files.
 
-    Mirrors :func:`_backfill_tool_events` but selects ``type == "user"`` records
-    and inserts the user's textual content. Used by analyze_workflows() so
-    workflow analysis can read message bodies from the DB instead of a JSONL
-    file (ENH-1621). *source* accepts either JSONL files or a raw_events
-    cursor — see :func:`_iter_events`.
+def _backfill_usage_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
+    """Seed ``usage_events`` from assistant ``message.usage`` blocks (ENH-2461).
+
+    Persists the real LLM token counts the API returned (``input_tokens``,
+    ``output_tokens``, ``cache_read_input_tokens``,
+    ``cache_creation_input_tokens``) plus a derived ``cost_usd``, one row per
+    assistant turn. The on-disk transcript carries the usage block on
+    ``type == "assistant"`` records at ``message.usage`` — verified against live
+    session files. (The ``type == "result"`` shape referenced in earlier issue
+    research only exists in the *live* subprocess stdout stream, which
+    ``raw_events`` never ingests.) The ``state`` column is always ``NULL`` here:
+    the transcript stream carries no FSM-state boundary, so per-state grain is
+    not derivable from this source (ENH-2461 Addendum 2). *source* accepts either
+    JSONL files or a ``raw_events`` cursor — see :func:`_iter_events`.
+
+    ``run_id`` is backfilled via a timestamp-window join against ``loop_runs``
+    (ENH-2725) — see :func:`_derive_run_id_for_ts`. Rows with no derivable
+    ``run_id`` stay ``NULL``, matching the live-writer path's behavior for
+    non-loop sessions.
     """
-    count = 0
-    for line, source_label in _iter_events(source):
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    return _drain(source, _usage_events_sink(conn))
+
+
+def _messages_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``message_events`` extractor: one row per non-empty user turn."""
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
         if record.get("type") != "user":
-            continue
+            return 0
         session_id = record.get("sessionId")
         ts = str(record.get("timestamp") or "")
         # The user message body lives at message.content; it may be a
@@ -3001,7 +3408,7 @@ def _backfill_messages(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cu
         else:
             text = ""
         if not text.strip():
-            continue
+            return 0
         conn.execute(
             "INSERT INTO message_events(ts, session_id, content) VALUES(?, ?, ?)",
             (ts, str(session_id) if session_id else None, text),
@@ -3014,39 +3421,34 @@ def _backfill_messages(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cu
             anchor=source_label,
             ts=ts,
         )
-        count += 1
-    return count
+        return 1
 
+    return sink
 
-def _backfill_assistant_messages(
-    conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor
-) -> int:
-    """Seed ``assistant_messages`` from assistant blocks in session JSONL files.
 
-    Mirrors :func:`_backfill_messages` but selects ``type == "assistant"`` records
-    and concatenates text blocks with ``"\\n\\n"`` — matching the output shape of
-    ``_extract_turn_pairs()`` in ``user_messages.py``. Also counts ``tool_use``
-    blocks and stores the count in ``tool_use_count`` so filter predicates like
-    ``min_tool_invocations`` (ENH-1941) can operate without a JOIN.
+def _backfill_messages(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
+    """Seed ``message_events`` from user blocks in session JSONL files.
 
-    Idempotent: INSERT OR IGNORE prevents duplicate rows on repeated backfill.
-    Depends on the ``sessions`` table (v4 / ENH-1710) for the session_id→JSONL
-    mapping used by ``conversation_turns()`` to JOIN on session_id. *source*
-    accepts either JSONL files or a raw_events cursor — see :func:`_iter_events`.
+    Mirrors :func:`_backfill_tool_events` but selects ``type == "user"`` records
+    and inserts the user's textual content. Used by analyze_workflows() so
+    workflow analysis can read message bodies from the DB instead of a JSONL
+    file (ENH-1621). *source* accepts either JSONL files or a raw_events
+    cursor — see :func:`_iter_events`.
     """
-    count = 0
-    for line, source_label in _iter_events(source):
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    return _drain(source, _messages_sink(conn))
+
+
+def _assistant_messages_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``assistant_messages`` extractor: one row per assistant turn with text."""
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
         if record.get("type") != "assistant":
-            continue
+            return 0
         session_id = record.get("sessionId")
         ts = str(record.get("timestamp") or "")
         content = record.get("message", {}).get("content", [])
         if not isinstance(content, list):
-            continue
+            return 0
         # Collect text blocks and count tool_use blocks
         text_blocks: list[str] = []
         tool_use_count = 0
@@ -3059,7 +3461,7 @@ def _backfill_assistant_messages(
                 elif block.get("type") == "tool_use":
                     tool_use_count += 1
         if not text_blocks:
-            continue
+            return 0
         concatenated = "\n\n".join(text_blocks)
         conn.execute(
             "INSERT OR IGNORE INTO assistant_messages(ts, session_id, content, tool_use_count)"
@@ -3074,8 +3476,28 @@ def _backfill_assistant_messages(
             anchor=source_label,
             ts=ts,
         )
-        count += 1
-    return count
+        return 1
+
+    return sink
+
+
+def _backfill_assistant_messages(
+    conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor
+) -> int:
+    """Seed ``assistant_messages`` from assistant blocks in session JSONL files.
+
+    Mirrors :func:`_backfill_messages` but selects ``type == "assistant"`` records
+    and concatenates text blocks with ``"\\n\\n"`` — matching the output shape of
+    ``_extract_turn_pairs()`` in ``user_messages.py``. Also counts ``tool_use``
+    blocks and stores the count in ``tool_use_count`` so filter predicates like
+    ``min_tool_invocations`` (ENH-1941) can operate without a JOIN.
+
+    Idempotent: INSERT OR IGNORE prevents duplicate rows on repeated backfill.
+    Depends on the ``sessions`` table (v4 / ENH-1710) for the session_id→JSONL
+    mapping used by ``conversation_turns()`` to JOIN on session_id. *source*
+    accepts either JSONL files or a raw_events cursor — see :func:`_iter_events`.
+    """
+    return _drain(source, _assistant_messages_sink(conn))
 
 
 _BACKFILL_SKILL_RE = re.compile(r"<command-name>/ll:(\S+)")
@@ -3085,48 +3507,29 @@ _BACKFILL_ARGS_RE = re.compile(r"<command-args>(.*?)</command-args>", re.DOTALL)
 _BACKFILL_ENHANCED_RE = re.compile(r"^ENHANCED:\s*(.+)", re.MULTILINE | re.DOTALL)
 
 
-def _backfill_prompt_opt(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
-    """Best-effort enrich ``prompt_opt_events`` offer rows with the optimized text.
-
-    Matches each still-unenriched ``offered=1`` row (written live by
-    ``user_prompt_submit.py::handle()``) to the nearest-following assistant
-    turn in the same session whose text contains an ``ENHANCED:`` block —
-    the ``confirm=true`` path in ``optimize-prompt-hook.md`` (ENH-2498).
-    ``confirm=false`` sessions emit only a short summary with no recoverable
-    replacement prompt, so those offer rows are left unenriched
-    (``optimized_text``/``accepted`` stay NULL) — a documented evidence
-    limitation, not a bug. Only rows with ``optimized_text IS NULL`` are
-    candidates and the UPDATE is guarded the same way, so repeated calls
-    (e.g. from :func:`rebuild`) are idempotent and never re-index duplicate
-    FTS rows. *source* accepts either JSONL files or a ``raw_events``
-    cursor — see :func:`_iter_events`.
-    """
+def _prompt_opt_sink(conn: sqlite3.Connection) -> RecordSink | None:
+    """Build the ``prompt_opt_events`` enrichment extractor, or ``None`` with no open offers."""
     offers = conn.execute(
         "SELECT id, ts, session_id FROM prompt_opt_events "
         "WHERE offered = 1 AND optimized_text IS NULL AND session_id IS NOT NULL"
     ).fetchall()
     if not offers:
-        return 0
+        return None
     by_session: dict[str, list[tuple[int, str]]] = {}
     for row_id, ts, session_id in offers:
         by_session.setdefault(session_id, []).append((row_id, ts))
 
-    count = 0
-    for line, _source_label in _iter_events(source):
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    def sink(record: dict[str, Any], _source_label: str) -> int:
         if record.get("type") != "assistant":
-            continue
+            return 0
         session_id = record.get("sessionId")
-        candidates = by_session.get(session_id)
+        candidates = by_session.get(session_id) if isinstance(session_id, str) else None
         if not candidates:
-            continue
+            return 0
         ts = str(record.get("timestamp") or "")
         content = record.get("message", {}).get("content", [])
         if not isinstance(content, list):
-            continue
+            return 0
         text = "\n".join(
             block.get("text", "")
             for block in content
@@ -3134,10 +3537,10 @@ def _backfill_prompt_opt(conn: sqlite3.Connection, source: list[Path] | sqlite3.
         )
         m = _BACKFILL_ENHANCED_RE.search(text)
         if not m:
-            continue
+            return 0
         eligible = [(row_id, o_ts) for row_id, o_ts in candidates if o_ts <= ts]
         if not eligible:
-            continue
+            return 0
         row_id, _ = max(eligible, key=lambda c: c[1])
         enhanced = m.group(1).strip()
         cursor = conn.execute(
@@ -3154,28 +3557,42 @@ def _backfill_prompt_opt(conn: sqlite3.Connection, source: list[Path] | sqlite3.
                 anchor="",
                 ts=ts,
             )
-            count += 1
-    return count
+            return 1
+        return 0
 
+    return sink
 
-def _backfill_skill_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
-    """Seed ``skill_events`` from /ll: invocations in user blocks of session JSONL files.
 
-    Mirrors :func:`_backfill_messages` but selects ``type == "user"`` records and
-    matches the ``<command-name>/ll:<name></command-name>`` signal. Populates the
-    ``skill_events`` table that was added in schema v7 (ENH-1833) but never extended
-    to include a backfill path (BUG-2283). Used by ``ll-logs stats`` so pre-init
-    invocations are reflected in skill invocation counts. *source* accepts either
-    JSONL files or a raw_events cursor — see :func:`_iter_events`.
+def _backfill_prompt_opt(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
+    """Best-effort enrich ``prompt_opt_events`` offer rows with the optimized text.
+
+    Matches each still-unenriched ``offered=1`` row (written live by
+    ``user_prompt_submit.py::handle()``) to the nearest-following assistant
+    turn in the same session whose text contains an ``ENHANCED:`` block —
+    the ``confirm=true`` path in ``optimize-prompt-hook.md`` (ENH-2498).
+    ``confirm=false`` sessions emit only a short summary with no recoverable
+    replacement prompt, so those offer rows are left unenriched
+    (``optimized_text``/``accepted`` stay NULL) — a documented evidence
+    limitation, not a bug. Only rows with ``optimized_text IS NULL`` are
+    candidates and the UPDATE is guarded the same way, so repeated calls
+    (e.g. from :func:`rebuild`) are idempotent and never re-index duplicate
+    FTS rows. *source* accepts either JSONL files or a ``raw_events``
+    cursor — see :func:`_iter_events`.
     """
-    count = 0
-    for line, source_label in _iter_events(source):
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    return _drain(source, _prompt_opt_sink(conn))
+
+
+def _skill_events_sink(conn: sqlite3.Connection) -> RecordSink:
+    """Build the ``skill_events`` extractor: one row per ``/ll:`` invocation.
+
+    As in :func:`_tool_events_sink`, an invocation ``user_prompt_submit``
+    already recorded live (same session and skill, not yet adopted) stamps
+    that row ``derived = 1`` rather than inserting a duplicate (schema v44).
+    """
+
+    def sink(record: dict[str, Any], source_label: str) -> int:
         if record.get("type") != "user":
-            continue
+            return 0
         session_id = record.get("sessionId")
         ts = str(record.get("timestamp") or "")
         content = record.get("message", {}).get("content", "")
@@ -3191,18 +3608,28 @@ def _backfill_skill_events(conn: sqlite3.Connection, source: list[Path] | sqlite
         else:
             text = ""
         if not text:
-            continue
+            return 0
         m = _BACKFILL_SKILL_RE.search(text)
         if not m:
-            continue
+            return 0
         skill_name = m.group(1)
         if skill_name.endswith("</command-name>"):
             skill_name = skill_name[: -len("</command-name>")]
         args_m = _BACKFILL_ARGS_RE.search(text)
         args = args_m.group(1).strip()[:200] if args_m else ""
+        session = str(session_id) if session_id else None
+        adopted = conn.execute(
+            "UPDATE skill_events SET derived = 1 WHERE id = ("
+            "SELECT id FROM skill_events WHERE derived = 0 AND session_id = ? "
+            "AND skill_name = ? ORDER BY id LIMIT 1)",
+            (session, skill_name),
+        ).rowcount
+        if adopted:
+            return 0
         conn.execute(
-            "INSERT INTO skill_events(ts, session_id, skill_name, args) VALUES(?, ?, ?, ?)",
-            (ts, str(session_id) if session_id else None, skill_name, args),
+            "INSERT INTO skill_events(ts, session_id, skill_name, args, derived) "
+            "VALUES(?, ?, ?, ?, 1)",
+            (ts, session, skill_name, args),
         )
         _index(
             conn,
@@ -3212,18 +3639,36 @@ def _backfill_skill_events(conn: sqlite3.Connection, source: list[Path] | sqlite
             anchor=source_label,
             ts=ts,
         )
-        count += 1
-    return count
+        return 1
 
+    return sink
 
-def mine_corrections_from_messages(conn: sqlite3.Connection, config: dict | None = None) -> int:
+
+def _backfill_skill_events(conn: sqlite3.Connection, source: list[Path] | sqlite3.Cursor) -> int:
+    """Seed ``skill_events`` from /ll: invocations in user blocks of session JSONL files.
+
+    Mirrors :func:`_backfill_messages` but selects ``type == "user"`` records and
+    matches the ``<command-name>/ll:<name></command-name>`` signal. Populates the
+    ``skill_events`` table that was added in schema v7 (ENH-1833) but never extended
+    to include a backfill path (BUG-2283). Used by ``ll-logs stats`` so pre-init
+    invocations are reflected in skill invocation counts. *source* accepts either
+    JSONL files or a raw_events cursor — see :func:`_iter_events`.
+    """
+    return _drain(source, _skill_events_sink(conn))
+
+
+def mine_corrections_from_messages(
+    conn: sqlite3.Connection, config: dict | None = None, *, after_id: int = 0
+) -> int:
     """Scan ``message_events`` and insert matching rows into ``user_corrections``.
 
     Designed for both the one-time retroactive pass over existing rows and
     repeated calls during backfill; idempotent via ``INSERT OR IGNORE`` +
     ``idx_corrections_dedup``. Only writes a ``search_index`` entry when the
     row is actually inserted (rowcount == 1) to avoid duplicate FTS rows.
-    Gated by ``analytics.capture.corrections`` (ENH-1841).
+    Gated by ``analytics.capture.corrections`` (ENH-1841). *after_id* limits
+    the scan to ``message_events`` rows with a higher id — the incremental
+    :func:`rebuild` path only mines rows it has not mined before.
 
     Returns the count of newly inserted correction rows.
     """
@@ -3237,7 +3682,9 @@ def mine_corrections_from_messages(conn: sqlite3.Connection, config: dict | None
         extra_patterns = capture.correction_patterns
 
     count = 0
-    rows = conn.execute("SELECT ts, session_id, content FROM message_events").fetchall()
+    rows = conn.execute(
+        "SELECT ts, session_id, content FROM message_events WHERE id > ?", (after_id,)
+    ).fetchall()
     for ts, session_id, content in rows:
         if not content or not is_correction(content, extra_patterns=extra_patterns):
             continue
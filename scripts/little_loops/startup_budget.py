@@ -0,0 +1,181 @@
+"""Console-script startup budget (``python -X importtime`` per ``ll-*`` command).
+
+Every ``ll-*`` console script and hook pays its module-import cost on each
+invocation. This module measures that cost the same way for every entry point
+— a fresh interpreter running ``python -X importtime -c "from <module> import
+<func>"`` — and compares it to a per-command budget, so ``ll-doctor --startup``
+can report regressions and CI can fail on them.
+
+Only imports triggered by the entry point itself are counted: interpreter
+startup (``site``, ``.pth`` hooks) is excluded by a marker written to stderr
+just before the import. A second, timing-independent check flags any entry
+point that imports one of :data:`DEFERRED_MODULES` at startup — heavy
+third-party packages that must only be imported on the code paths that use
+them.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata as importlib_metadata
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+DEFAULT_BUDGET_MS = 400
+"""Import budget for any command without an entry in :data:`BUDGETS_MS`."""
+
+BUDGETS_MS: dict[str, int] = {
+    # Orchestrators that legitimately need the issue manager / worker pool
+    # surface at startup.
+    "ll-auto": 600,
+    "ll-parallel": 600,
+    "ll-sprint": 800,
+    "ll-sync": 600,
+    "ll-migrate": 600,
+    # Log/analytics readers that load the session-store writers and history reader.
+    "ll-logs": 600,
+    "ll-ctx-stats": 600,
+}
+
+DEFERRED_MODULES: frozenset[str] = frozenset(
+    {"anthropic", "questionary", "rich", "textual", "prompt_toolkit"}
+)
+"""Top-level packages no entry point may import at startup."""
+
+_SCALE_ENV = "LL_STARTUP_BUDGET_SCALE"
+_MARKER = "@@ll-startup-budget@@"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Import cost of one console-script entry point.
+
+    Attributes:
+        command: Console-script name (``ll-loop``).
+        target: Entry-point target (``little_loops.cli:main_loop``).
+        total_ms: Cumulative import time of the entry point (best of the runs).
+        budget_ms: Budget after ``LL_STARTUP_BUDGET_SCALE`` is applied.
+        deferred_leaks: :data:`DEFERRED_MODULES` members imported at startup.
+        slowest: Top-level imports by cumulative time, slowest first.
+        error: Non-empty when the entry point failed to import.
+    """
+
+    command: str
+    target: str
+    total_ms: float
+    budget_ms: float
+    deferred_leaks: tuple[str, ...] = ()
+    slowest: tuple[tuple[str, float], ...] = ()
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True when the import succeeded, fits the budget, and leaks nothing."""
+        return not self.error and not self.deferred_leaks and self.total_ms <= self.budget_ms
+
+
+def budget_scale() -> float:
+    """Multiplier from ``LL_STARTUP_BUDGET_SCALE`` (default 1.0) for slower machines."""
+    raw = os.environ.get(_SCALE_ENV, "").strip()
+    if not raw:
+        return 1.0
+    try:
+        scale = float(raw)
+    except ValueError:
+        return 1.0
+    return scale if scale > 0 else 1.0
+
+
+def budget_for(command: str) -> float:
+    """Scaled import budget (ms) for ``command``."""
+    return BUDGETS_MS.get(command, DEFAULT_BUDGET_MS) * budget_scale()
+
+
+def console_scripts() -> dict[str, str]:
+    """``{name: "module:func"}`` for the installed distribution's console scripts.
+
+    Read from distribution metadata (like ``ll-doctor``'s Entry Points section)
+    so it works for wheel installs; empty when little-loops is not installed.
+    """
+    try:
+        dist = importlib_metadata.distribution("little-loops")
+    except importlib_metadata.PackageNotFoundError:
+        return {}
+    return {ep.name: ep.value for ep in dist.entry_points if ep.group == "console_scripts"}
+
+
+def parse_importtime(stderr: str) -> tuple[float, dict[str, float], set[str]]:
+    """Parse ``-X importtime`` output written after the start marker.
+
+    Returns:
+        ``(total_ms, top_level, packages)``: summed cumulative time of the
+        top-level imports, each top-level module's cumulative ms, and the set
+        of top-level package names imported at any depth.
+    """
+    _, found, tail = stderr.partition(_MARKER)
+    if not found:
+        tail = stderr
+    top_level: dict[str, float] = {}
+    packages: set[str] = set()
+    for line in tail.splitlines():
+        match = _IMPORTTIME_RE.match(line.strip("\n"))
+        if match is None:
+            continue
+        name = match.group(4)
+        packages.add(name.split(".", 1)[0])
+        if len(match.group(3)) == 1:
+            top_level[name] = top_level.get(name, 0.0) + int(match.group(2)) / 1000
+    return sum(top_level.values()), top_level, packages
+
+
+def measure(
+    command: str,
+    target: str,
+    *,
+    runs: int = 3,
+    python: str = sys.executable,
+    timeout: float = 60.0,
+) -> ImportProfile:
+    """Import ``target`` in fresh interpreters and return the best-of-``runs`` profile."""
+    module, _, func = target.partition(":")
+    statement = f"from {module} import {func}" if func else f"import {module}"
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); {statement}"
+    best: tuple[float, dict[str, float], set[str]] | None = None
+    for _ in range(max(1, runs)):
+        try:
+            result = subprocess.run(
+                [python, "-X", "importtime", "-c", code],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            return ImportProfile(command, target, 0.0, budget_for(command), error=str(exc))
+        if result.returncode != 0:
+            last = (result.stderr.strip().splitlines() or ["import failed"])[-1]
+            return ImportProfile(command, target, 0.0, budget_for(command), error=last)
+        parsed = parse_importtime(result.stderr)
+        if best is None or parsed[0] < best[0]:
+            best = parsed
+    assert best is not None
+    total_ms, top_level, packages = best
+    slowest = tuple(sorted(top_level.items(), key=lambda kv: kv[1], reverse=True)[:5])
+    return ImportProfile(
+        command=command,
+        target=target,
+        total_ms=total_ms,
+        budget_ms=budget_for(command),
+        deferred_leaks=tuple(sorted(packages & DEFERRED_MODULES)),
+        slowest=slowest,
+    )
+
+
+def check_startup_budgets(
+    scripts: dict[str, str] | None = None, *, runs: int = 3
+) -> list[ImportProfile]:
+    """Measure every console script (or ``scripts``), sorted by command name."""
+    targets = console_scripts() if scripts is None else scripts
+    return [measure(name, target, runs=runs) for name, target in sorted(targets.items())]
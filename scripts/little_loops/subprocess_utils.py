@@ -363,6 +363,7 @@ def run_claude_command(
     on_session_id_detected: SessionIdCallback | None = None,
     on_tool_call: ToolCallCallback | None = None,
     workspace_root: Path | None = None,
+    on_before_wait: ProcessCallback | None = None,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke Claude CLI command with real-time output streaming.
 
@@ -425,6 +426,11 @@ def run_claude_command(
             (FEAT-2878). Only honored by hosts advertising
             ``HostCapabilities.workspace_sandboxed`` — see that flag's
             docstring for the current support matrix.
+        on_before_wait: Optional callback invoked with the Popen object once
+            reading stops (streams closed, result seen, or a timeout fired) and
+            before the process is first waited on, i.e. while it is still
+            unreaped. Lets a caller take a final reading of ``/proc/<pid>``
+            counters that reaping would discard.
 
     Returns:
         CompletedProcess with stdout/stderr captured
@@ -500,6 +506,8 @@ def run_claude_command(
             while sel.get_map():
                 now = time.time()
                 if timeout and (now - start_time) > timeout:
+                    if on_before_wait:
+                        on_before_wait(process)
                     _kill_process_group(process, grace_seconds=timeout_kill_grace_seconds)
                     try:
                         process.wait(timeout=10)
@@ -511,6 +519,8 @@ def run_claude_command(
                     raise subprocess.TimeoutExpired(cmd_args, timeout)
 
                 if idle_timeout and (now - last_output_time) > idle_timeout:
+                    if on_before_wait:
+                        on_before_wait(process)
                     _kill_process_group(process, grace_seconds=timeout_kill_grace_seconds)
                     try:
                         process.wait(timeout=10)
@@ -628,6 +638,8 @@ def run_claude_command(
                 "result event" if result_seen else "natural EOF, no result event",
                 post_stream_close_grace_seconds,
             )
+            if on_before_wait:
+                on_before_wait(process)
             try:
                 process.wait(timeout=post_stream_close_grace_seconds)
             except subprocess.TimeoutExpired:
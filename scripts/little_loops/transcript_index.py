@@ -0,0 +1,508 @@
+"""Persistent, incremental index of host session transcripts for ``ll-logs``.
+
+Every ``ll-logs`` subcommand used to start from scratch: project discovery
+opened every JSONL under the host's projects root to find a ``cwd`` and an
+ll-activity hit, and ``sequences``, ``scan-failures`` and ``loop-fleet`` then
+re-streamed every transcript (or every archived ``events.jsonl``) from byte
+zero. With a few months of history that is gigabytes read per invocation.
+
+:class:`TranscriptIndex` keeps, in ``~/.ll/transcript_index.db``:
+
+- per transcript: path, size, mtime, the byte offset read so far, the first
+  ``cwd``, the ll-activity flag, the ll invocations found (tool, timestamp,
+  session) and the raw failed ``ll-*`` Bash results (tool, timestamp,
+  session, error text), plus the ``tool_use`` ids still awaiting a result;
+- per archived loop run: its ``loop_complete`` event (or its absence).
+
+Host transcripts are append-only, so a changed file is read only from the
+stored offset onward. A file that shrank, or whose leading bytes changed, is
+treated as rewritten and re-read from the start. Only complete lines are
+consumed, so a line the host is still writing is picked up next time.
+
+The index is a cache, never a source of truth: deleting the file is always
+safe, and when it cannot be opened the index runs against an in-memory
+database, which degrades to today's full scan. ``LL_TRANSCRIPT_INDEX``
+overrides the location (``:memory:`` disables persistence).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from little_loops.session_store import HostLayout
+
+__all__ = [
+    "INDEX_DB_ENV",
+    "INDEX_DB_NAME",
+    "FailureRecord",
+    "TranscriptIndex",
+    "TranscriptSummary",
+]
+
+logger = logging.getLogger(__name__)
+
+INDEX_DB_NAME = "transcript_index.db"
+INDEX_DB_ENV = "LL_TRANSCRIPT_INDEX"
+
+# Bump whenever what is extracted per record changes, so stale rows are dropped.
+_INDEX_FORMAT = 1
+
+# Leading bytes fingerprinted to detect a transcript rewritten in place.
+_HEAD_BYTES = 256
+
+_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    path TEXT PRIMARY KEY,
+    layout TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    head TEXT NOT NULL,
+    cwd TEXT,
+    ll_activity INTEGER NOT NULL,
+    pending TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS invocations (
+    path TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    session_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS invocations_path ON invocations(path);
+CREATE TABLE IF NOT EXISTS failures (
+    path TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    error_text TEXT NOT NULL,
+    is_error INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS failures_path ON failures(path);
+CREATE TABLE IF NOT EXISTS loop_terminals (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    event TEXT
+);
+"""
+
+_TABLES = ("transcripts", "invocations", "failures", "loop_terminals")
+
+
+@dataclass(frozen=True)
+class TranscriptSummary:
+    """Per-transcript facts ``ll-logs`` discovery needs."""
+
+    path: Path
+    cwd: str | None
+    ll_activity: bool
+
+
+@dataclass(frozen=True)
+class FailureRecord:
+    """A failed ``ll-*`` Bash result: ``is_error`` set or a traceback in the output.
+
+    Recorded before any allowlist or ``classify_failure`` filtering, which
+    depend on the caller's project and are applied by ``ll-logs scan-failures``.
+    """
+
+    tool_name: str
+    ts: str
+    session_id: str
+    error_text: str
+    is_error: bool
+
+
+def _str_field(record: dict[str, Any], key: str) -> str:
+    value = record.get(key)
+    return value if isinstance(value, str) else ""
+
+
+def _layout_key(layout: HostLayout) -> str:
+    """Name what record normalization a transcript was indexed under.
+
+    Hosts without a normalizer all see raw records, so they share one key
+    and a file indexed for one is reused as-is for another.
+    """
+    return layout.name if layout.normalize is not None else ""
+
+
+def _head_hash(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _read_records(data: bytes) -> tuple[list[dict[str, Any]], int]:
+    """Decode the complete JSONL lines in *data*; returns ``(records, bytes consumed)``.
+
+    A trailing line without a newline is consumed only when it already parses
+    as JSON (a finished file without a final newline); otherwise it is left
+    for the next refresh.
+    """
+    end = data.rfind(b"\n") + 1
+    lines = data[:end].split(b"\n")
+    tail = data[end:]
+    consumed = end
+    if tail.strip():
+        try:
+            json.loads(tail)
+        except ValueError:
+            pass
+        else:
+            lines.append(tail)
+            consumed = len(data)
+    records: list[dict[str, Any]] = []
+    for raw in lines:
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records, consumed
+
+
+class TranscriptIndex:
+    """Offset-tracking cache of transcript scans backed by ``~/.ll/transcript_index.db``.
+
+    Use as a context manager so the connection is closed::
+
+        with TranscriptIndex.default() as index:
+            summaries = index.refresh(project_folder, layout)
+            events = index.invocations([s.path for s in summaries])
+
+    Every query first brings the rows for its files up to date, so callers
+    never need a separate uncached code path.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = str(db_path)
+        self._conn = self._open(self.db_path)
+
+    @classmethod
+    def default(cls) -> TranscriptIndex:
+        """Return the index at ``$LL_TRANSCRIPT_INDEX`` or ``~/.ll/transcript_index.db``."""
+        override = os.environ.get(INDEX_DB_ENV)
+        if override:
+            return cls(override)
+        path = Path.home() / ".ll" / INDEX_DB_NAME
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return cls(":memory:")
+        return cls(path)
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT_MS / 1000)
+            conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+            if db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode = WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _INDEX_FORMAT:
+                with conn:
+                    for table in _TABLES:
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute(f"PRAGMA user_version = {_INDEX_FORMAT}")
+            conn.executescript(_SCHEMA)
+            return conn
+        except sqlite3.Error:
+            logger.debug("transcript_index: could not open %s", db_path, exc_info=True)
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def __enter__(self) -> TranscriptIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._conn.close()
+
+    def refresh(self, folder: Path, layout: HostLayout) -> list[TranscriptSummary]:
+        """Bring every non-agent session file under *folder* up to date.
+
+        Returns one summary per file, in ``layout.session_glob`` order;
+        unreadable files are skipped. Rows for files that no longer exist are
+        pruned.
+        """
+        files = [f for f in folder.glob(layout.session_glob) if not f.name.startswith("agent-")]
+        summaries: list[TranscriptSummary] = []
+        try:
+            with self._conn:
+                for path in files:
+                    summary = self._refresh_file(path, layout)
+                    if summary is not None:
+                        summaries.append(summary)
+                self._prune(folder)
+        except sqlite3.Error:
+            logger.debug("transcript_index: refresh failed for %s", folder, exc_info=True)
+        return summaries
+
+    def invocations(self, paths: list[Path]) -> list[tuple[str, str, str]]:
+        """Return ``(tool_name, timestamp, session_id)`` per ll invocation, in file order."""
+        out: list[tuple[str, str, str]] = []
+        for path in paths:
+            out.extend(
+                self._conn.execute(
+                    "SELECT tool_name, ts, session_id FROM invocations WHERE path = ? "
+                    "ORDER BY rowid",
+                    (str(path),),
+                ).fetchall()
+            )
+        return out
+
+    def failures(self, paths: list[Path]) -> list[FailureRecord]:
+        """Return the failed ``ll-*`` Bash results recorded for *paths*, in file order."""
+        out: list[FailureRecord] = []
+        for path in paths:
+            for tool_name, ts, session_id, error_text, is_error in self._conn.execute(
+                "SELECT tool_name, ts, session_id, error_text, is_error FROM failures "
+                "WHERE path = ? ORDER BY rowid",
+                (str(path),),
+            ):
+                out.append(FailureRecord(tool_name, ts, session_id, error_text, bool(is_error)))
+        return out
+
+    def loop_terminal(self, events_file: Path) -> dict[str, Any] | None:
+        """Return the first ``loop_complete`` event in *events_file*, or None.
+
+        Archived runs are immutable once complete, so a run whose terminal
+        event is recorded is never re-read; an unfinished run is resumed from
+        the stored offset.
+        """
+        key = str(events_file)
+        try:
+            st = os.stat(events_file)
+        except OSError:
+            return None
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, offset, event FROM loop_terminals WHERE path = ?", (key,)
+        ).fetchone()
+        if row is not None and st.st_size >= row[2]:
+            size, mtime_ns, offset, event = row
+            if event is not None or (size, mtime_ns) == (st.st_size, st.st_mtime_ns):
+                return json.loads(event) if event is not None else None
+        else:
+            offset = 0
+
+        try:
+            with open(events_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return None
+        records, consumed = _read_records(data)
+        terminal = next((r for r in records if r.get("event") == "loop_complete"), None)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO loop_terminals(path, size, mtime_ns, offset, event) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        st.st_size,
+                        st.st_mtime_ns,
+                        offset + consumed,
+                        json.dumps(terminal) if terminal is not None else None,
+                    ),
+                )
+        except sqlite3.Error:
+            logger.debug("transcript_index: could not store %s", key, exc_info=True)
+        return terminal
+
+    def _refresh_file(self, path: Path, layout: HostLayout) -> TranscriptSummary | None:
+        key = str(path)
+        layout_key = _layout_key(layout)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        row = self._conn.execute(
+            "SELECT layout, size, mtime_ns, offset, head, cwd, ll_activity, pending "
+            "FROM transcripts WHERE path = ?",
+            (key,),
+        ).fetchone()
+        if (
+            row is not None
+            and row[0] == layout_key
+            and (row[1], row[2]) == (st.st_size, st.st_mtime_ns)
+        ):
+            return TranscriptSummary(path, row[5], bool(row[6]))
+
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_HEAD_BYTES)
+                resume = (
+                    row is not None
+                    and row[0] == layout_key
+                    and st.st_size >= row[3]
+                    and _head_hash(head[: min(row[3], _HEAD_BYTES)]) == row[4]
+                )
+                offset = row[3] if row is not None and resume else 0
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return None
+
+        if row is not None and resume:
+            cwd: str | None = row[5]
+            ll_activity = bool(row[6])
+            pending: dict[str, str] = json.loads(row[7])
+        else:
+            cwd, ll_activity, pending = None, False, {}
+            self._conn.execute("DELETE FROM invocations WHERE path = ?", (key,))
+            self._conn.execute("DELETE FROM failures WHERE path = ?", (key,))
+
+        records, consumed = _read_records(data)
+        invocations, failures, cwd, ll_activity = _scan_transcript(
+            records, layout, pending, cwd=cwd, ll_activity=ll_activity
+        )
+        self._conn.executemany(
+            "INSERT INTO invocations(path, tool_name, ts, session_id) VALUES (?, ?, ?, ?)",
+            [(key, *inv) for inv in invocations],
+        )
+        self._conn.executemany(
+            "INSERT INTO failures(path, tool_name, ts, session_id, error_text, is_error) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (key, f.tool_name, f.ts, f.session_id, f.error_text, int(f.is_error))
+                for f in failures
+            ],
+        )
+        new_offset = offset + consumed
+        self._conn.execute(
+            "INSERT OR REPLACE INTO transcripts"
+            "(path, layout, size, mtime_ns, offset, head, cwd, ll_activity, pending) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                layout_key,
+                st.st_size,
+                st.st_mtime_ns,
+                new_offset,
+                _head_hash(head[: min(new_offset, _HEAD_BYTES)]),
+                cwd,
+                int(ll_activity),
+                json.dumps(pending),
+            ),
+        )
+        return TranscriptSummary(path, cwd, ll_activity)
+
+    def _prune(self, folder: Path) -> None:
+        prefix = str(folder) + os.sep
+        stale = [
+            (path,)
+            for (path,) in self._conn.execute(
+                "SELECT path FROM transcripts WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            if not os.path.exists(path)
+        ]
+        for table in ("transcripts", "invocations", "failures"):
+            self._conn.executemany(f"DELETE FROM {table} WHERE path = ?", stale)
+
+
+def _scan_transcript(
+    records: list[dict[str, Any]],
+    layout: HostLayout,
+    pending: dict[str, str],
+    *,
+    cwd: str | None,
+    ll_activity: bool,
+) -> tuple[list[tuple[str, str, str]], list[FailureRecord], str | None, bool]:
+    """Extract everything the index stores from newly read *records*.
+
+    ``cwd`` and failures are read from the raw record (as discovery and
+    ``scan-failures`` always did); the ll-activity flag and invocations from
+    the layout-normalized one. *pending* maps ``ll-*`` Bash ``tool_use`` ids
+    to their tool name and is updated in place, so a result that lands in a
+    later refresh still pairs with its call.
+    """
+    from little_loops.cli.logs import (
+        _LL_BASH_RE,
+        _extract_error_text,
+        _extract_tool_name,
+        _is_ll_relevant,
+    )
+
+    invocations: list[tuple[str, str, str]] = []
+    failures: list[FailureRecord] = []
+    for record in records:
+        if cwd is None:
+            record_cwd = record.get("cwd")
+            if isinstance(record_cwd, str) and record_cwd:
+                cwd = record_cwd
+
+        record_type = record.get("type")
+        message = record.get("message", {})
+        content = message.get("content", []) if isinstance(message, dict) else []
+        if record_type == "assistant" and isinstance(content, list):
+            for block in content:
+                if (
+                    isinstance(block, dict)
+                    and block.get("type") == "tool_use"
+                    and block.get("name") == "Bash"
+                ):
+                    inp = block.get("input", {})
+                    cmd = inp.get("command", "") if isinstance(inp, dict) else ""
+                    m = _LL_BASH_RE.search(cmd) if isinstance(cmd, str) else None
+                    block_id = block.get("id", "")
+                    if m and block_id:
+                        pending[block_id] = m.group(1)
+        elif record_type == "user" and isinstance(content, list):
+            for block in content:
+                if not isinstance(block, dict) or block.get("type") != "tool_result":
+                    continue
+                tool_name = pending.pop(block.get("tool_use_id", ""), None)
+                if tool_name is None:
+                    continue
+                is_error = block.get("is_error") is True
+                error_text = _extract_error_text(block.get("content", ""))
+                if is_error or "Traceback (most recent call last)" in error_text:
+                    failures.append(
+                        FailureRecord(
+                            tool_name,
+                            _str_field(record, "timestamp"),
+                            _str_field(record, "sessionId"),
+                            error_text,
+                            is_error,
+                        )
+                    )
+
+        normalized = record
+        if layout.normalize is not None:
+            converted = layout.normalize(record)
+            if converted is None:
+                continue
+            normalized = converted
+        if not ll_activity and _is_ll_relevant(normalized):
+            ll_activity = True
+        tool = _extract_tool_name(normalized)
+        if tool is not None:
+            invocations.append(
+                (tool, _str_field(normalized, "timestamp"), _str_field(normalized, "sessionId"))
+            )
+    return invocations, failures, cwd, ll_activity
@@ -5,7 +5,11 @@ is intentionally minimal — `send(event)` for delivery and `close()` for cleanu
 so that new sinks can be added without modifying `EventBus` itself.
 
 Built-in implementations:
-    JsonlTransport: appends each event as a JSON line to a file.
+    JsonlTransport: appends each event as a JSON line to a file, buffered per a
+        configurable durability policy.
+    QueuedTransport: wraps any transport so ``send()`` only enqueues; a
+        dedicated thread delivers from a bounded queue (``EventBus`` async
+        dispatch).
     UnixSocketTransport: streams newline-delimited JSON to AF_UNIX socket clients
         for sub-second-latency local consumers (TUIs, log tailers, dashboards).
     OTelTransport: maps loop executions to OpenTelemetry traces/spans, exporting
@@ -15,11 +19,13 @@ Built-in implementations:
         dashboards, Slack bots, and CI systems. Requires the optional ``httpx``
         package (``pip install little-loops[webhooks]``).
     SQLiteTransport: records FSM loop events into the per-project session
-        database (``.ll/history.db``) for indexed cross-cutting queries.
+        database (``.ll/history.db``) for indexed cross-cutting queries, batching
+        writes on a background thread.
 
 Public exports:
     Transport: runtime-checkable Protocol that any sink must satisfy
     JsonlTransport: writes events to a JSONL file
+    QueuedTransport: delivers to a wrapped transport from its own bounded queue
     UnixSocketTransport: streams events over an AF_UNIX socket
     OTelTransport: exports loop traces via OTLP
     WebhookTransport: POSTs batched events to an HTTP endpoint
@@ -38,6 +44,8 @@ from pathlib import Path
 from queue import Empty, Full, Queue
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from little_loops.file_utils import BufferedJsonlWriter
+
 if TYPE_CHECKING:
     from little_loops.config.features import EventsConfig
     from little_loops.events import EventBus
@@ -53,6 +61,9 @@ _CLOSE_TOTAL_TIMEOUT = 10.0
 _ACCEPT_POLL_TIMEOUT = 1.0
 _CLIENT_QUEUE_POLL_TIMEOUT = 0.5
 
+_QUEUED_MAXSIZE_DEFAULT = 1024
+_QUEUED_CLOSE_TIMEOUT = 10.0
+
 _WEBHOOK_BATCH_MS_DEFAULT = 1000
 _WEBHOOK_CLOSE_TIMEOUT = 10.0
 _WEBHOOK_RETRY_BASE_S = 0.5
@@ -78,24 +89,186 @@ class Transport(Protocol):
         ...
 
 
+# FSM transition events: always a durability point for buffered JSONL writers,
+# whatever the policy, so a SIGKILLed loop's event log never ends short of the
+# transitions it actually made (BUG-2501). Everything else — chiefly per-line
+# ``action_output`` — may be batched.
+TRANSITION_EVENT_TYPES: frozenset[str] = frozenset(
+    {
+        "loop_start",
+        "loop_resume",
+        "state_enter",
+        "route",
+        "baseline_complete",
+        "loop_complete",
+    }
+)
+
+
 class JsonlTransport:
     """Append events to a JSONL file, one JSON object per line.
 
     The parent directory is created at construction time so per-event writes do
-    not have to check it. `close()` is a no-op since each `send()` opens and
-    closes the file (matching the existing JSONL write pattern in this codebase).
+    not have to check it. Events go through one long-lived
+    :class:`~little_loops.file_utils.BufferedJsonlWriter`; *durability* picks
+    when buffered rows reach the file (see ``events.jsonl.durability``).
+    Transition events are always written immediately. The default
+    ``every_event`` keeps every row visible to readers as soon as ``send()``
+    returns; ``close()`` writes out anything still buffered.
     """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        durability: str = "every_event",
+        every_n: int = 100,
+        interval_ms: int = 250,
+    ) -> None:
         self._path = path
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = BufferedJsonlWriter(
+            path,
+            policy=durability,
+            every_n=every_n,
+            interval_ms=interval_ms,
+            durable_events=TRANSITION_EVENT_TYPES,
+        )
+
+    def send(self, event: dict[str, Any]) -> None:
+        self._writer.write(event)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _QueueBarrier:
+    """Queue barrier: set once every event ahead of it has been delivered."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class QueuedTransport:
+    """Deliver events to *inner* from a dedicated thread and bounded queue.
+
+    ``send()`` only enqueues, so a slow sink (an OTel exporter under load, a
+    transport doing disk or network I/O inline) can never stall the emitting
+    FSM or orchestrator thread. Events reach *inner* in emission order. When
+    the queue is full the newest event is dropped and a rate-limited warning is
+    logged — the same slow-consumer policy as `UnixSocketTransport` clients.
+    ``close()`` delivers whatever is still queued, then closes *inner*.
+
+    Events are delivered by reference: emitters must not mutate an event dict
+    after ``EventBus.emit`` returns (none of the built-in emitters do).
+    """
+
+    def __init__(self, inner: Transport, *, max_queue: int = _QUEUED_MAXSIZE_DEFAULT) -> None:
+        self.inner = inner
+        self._queue: Queue[dict[str, Any] | _QueueBarrier | None] = Queue(maxsize=max(1, max_queue))
+        self._max_queue = max(1, max_queue)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._dropped_total = 0
+        self._dropped_since_log = 0
+        self._first_drop_logged = False
+        self._last_drop_log_ts = 0.0
+        self._thread = threading.Thread(
+            target=self._deliver_loop,
+            name=f"ll-queued-{type(inner).__name__}",
+            daemon=True,
+        )
+        self._thread.start()
 
     def send(self, event: dict[str, Any]) -> None:
-        with open(self._path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event) + "\n")
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except Full:
+            self._record_drop()
+
+    def flush(self, timeout: float = _QUEUED_CLOSE_TIMEOUT) -> bool:
+        """Block until every event sent before this call reached *inner*.
+
+        Returns ``False`` if delivery did not catch up within *timeout* seconds
+        (or the transport is already closed).
+        """
+        if self._closed:
+            return False
+        barrier = _QueueBarrier()
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except Full:
+            return False
+        return barrier.done.wait(timeout)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return the wrapped transport's stats plus queue drops and depth."""
+        stats: dict[str, int] = {}
+        inner_stats = getattr(self.inner, "get_stats", None)
+        if callable(inner_stats):
+            stats.update(inner_stats())
+        stats["queue_dropped"] = self._dropped_total
+        stats["queue_backlog"] = self._queue.qsize()
+        return stats
 
     def close(self) -> None:
-        return None
+        """Deliver queued events, stop the thread and close *inner* (best-effort)."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=_QUEUED_CLOSE_TIMEOUT)
+            except Full:
+                pass
+            self._thread.join(timeout=_QUEUED_CLOSE_TIMEOUT)
+            if self._thread.is_alive():
+                logger.warning(
+                    "QueuedTransport: %s did not drain within %.1fs; %d events undelivered",
+                    type(self.inner).__name__,
+                    _QUEUED_CLOSE_TIMEOUT,
+                    self._queue.qsize(),
+                )
+        self.inner.close()
+
+    def _deliver_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, _QueueBarrier):
+                item.done.set()
+                continue
+            try:
+                self.inner.send(item)
+            except Exception:
+                logger.warning("EventBus transport raised an exception", exc_info=True)
+
+    def _record_drop(self) -> None:
+        self._dropped_total += 1
+        self._dropped_since_log += 1
+        now = time.monotonic()
+        if not self._first_drop_logged:
+            logger.warning(
+                "QueuedTransport: dropping events for slow %s (queue full at %d)",
+                type(self.inner).__name__,
+                self._max_queue,
+            )
+            self._first_drop_logged = True
+            self._last_drop_log_ts = now
+            self._dropped_since_log = 0
+            return
+        if now - self._last_drop_log_ts >= _DROP_LOG_INTERVAL_SEC:
+            logger.warning(
+                "QueuedTransport: dropped %d events for slow %s",
+                self._dropped_since_log,
+                type(self.inner).__name__,
+            )
+            self._last_drop_log_ts = now
+            self._dropped_since_log = 0
 
 
 class _SocketClient:
@@ -624,7 +797,9 @@ def wire_transports(
 
     Args:
         bus: EventBus to register transports on
-        config: EventsConfig holding the list of transport names to wire up
+        config: EventsConfig holding the list of transport names to wire up.
+            Names also listed in ``config.async_transports`` are registered with
+            async dispatch (their own `QueuedTransport` queue and thread).
         log_dir: Directory under which built-in transports place their log files.
             Defaults to ``.ll`` under the current working directory.
     """
@@ -633,14 +808,18 @@ def wire_transports(
         if name not in _TRANSPORT_REGISTRY:
             logger.warning("Unknown transport %r; skipping", name)
             continue
+        transport: Transport
         if name == "jsonl":
-            bus.add_transport(JsonlTransport(base / "events.jsonl"))
+            transport = JsonlTransport(
+                base / "events.jsonl",
+                durability=config.jsonl.durability,
+                every_n=config.jsonl.every_n,
+                interval_ms=config.jsonl.interval_ms,
+            )
         elif name == "otel":
-            bus.add_transport(
-                OTelTransport(
-                    endpoint=config.otel.endpoint,
-                    service_name=config.otel.service_name,
-                )
+            transport = OTelTransport(
+                endpoint=config.otel.endpoint,
+                service_name=config.otel.service_name,
             )
         elif name == "socket":
             if not hasattr(socket, "AF_UNIX"):
@@ -650,29 +829,34 @@ def wire_transports(
                     'use a different transport such as "jsonl".'
                 )
             resolved = _resolve_socket_path(config.socket.path, base)
-            bus.add_transport(
-                UnixSocketTransport(
-                    resolved,
-                    config.socket.max_clients,
-                    on_connect=_make_seed_callback(),
-                )
+            transport = UnixSocketTransport(
+                resolved,
+                config.socket.max_clients,
+                on_connect=_make_seed_callback(),
             )
         elif name == "sqlite":
             from little_loops.session_store import SQLiteTransport
 
-            bus.add_transport(SQLiteTransport(base / "history.db"))
-        elif name == "webhook":
+            transport = SQLiteTransport(
+                base / "history.db",
+                batch_size=config.sqlite.batch_size,
+                flush_ms=config.sqlite.flush_ms,
+            )
+        else:  # webhook
             if config.webhook.url is None:
                 logger.warning("WebhookTransport: events.webhook.url is None; skipping")
                 continue
-            bus.add_transport(
-                WebhookTransport(
-                    url=config.webhook.url,
-                    batch_ms=config.webhook.batch_ms,
-                    headers=config.webhook.headers,
-                    max_retries=3,
-                )
+            transport = WebhookTransport(
+                url=config.webhook.url,
+                batch_ms=config.webhook.batch_ms,
+                headers=config.webhook.headers,
+                max_retries=3,
             )
+        bus.add_transport(
+            transport,
+            async_dispatch=name in config.async_transports,
+            max_queue=config.async_queue_size,
+        )
 
 
 def _resolve_socket_path(configured: str, base: Path) -> Path:
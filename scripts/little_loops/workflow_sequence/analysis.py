@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import re
 import sys
+from bisect import bisect_right
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -248,33 +250,64 @@ def _group_by_session(messages: list[dict[str, Any]]) -> dict[str, list[dict[str
 
 
 def _link_sessions(sessions: dict[str, list[dict[str, Any]]]) -> list[SessionLink]:
-    """Identify sessions that are part of the same workflow."""
+    """Identify sessions that are part of the same workflow.
+
+    A pair (a, b), with a before b in ``sessions`` order, scores 0.4 when a's
+    last branch equals b's first branch, 0.4 when a contains a handoff marker,
+    and up to 0.2 for entity overlap; it links above 0.3. Overlap alone never
+    reaches the threshold, so the only candidates are same-branch pairs
+    (looked up in a branch index) and pairs whose first session hands off.
+    Handoff flags are computed once per session; entity sets and timestamps
+    once per session that appears in a candidate pair.
+    """
     links: list[SessionLink] = []
-    session_ids = list(sessions.keys())
+    session_ids = [session_id for session_id, msgs in sessions.items() if msgs]
     link_counter = 0
 
+    handoffs = [
+        any(_detect_handoff(msg.get("content", "")) for msg in sessions[session_id])
+        for session_id in session_ids
+    ]
+    # Session positions keyed by the branch of their first message, ascending.
+    first_branch_index: dict[str, list[int]] = {}
+    for idx, session_id in enumerate(session_ids):
+        first_branch = sessions[session_id][0].get("git_branch")
+        if first_branch:
+            first_branch_index.setdefault(first_branch, []).append(idx)
+
+    entity_cache: dict[int, set[str]] = {}
+    timestamp_cache: dict[int, list[datetime]] = {}
+
+    def entities_of(idx: int) -> set[str]:
+        if idx not in entity_cache:
+            entities: set[str] = set()
+            for msg in sessions[session_ids[idx]]:
+                entities.update(extract_entities(msg.get("content", "")))
+            entity_cache[idx] = entities
+        return entity_cache[idx]
+
+    def timestamps_of(idx: int) -> list[datetime]:
+        if idx not in timestamp_cache:
+            timestamp_cache[idx] = _parse_timestamps(sessions[session_ids[idx]])
+        return timestamp_cache[idx]
+
     for i, session_a_id in enumerate(session_ids):
         session_a = sessions[session_a_id]
-        if not session_a:
+        branch_a = session_a[-1].get("git_branch")
+
+        candidates: Sequence[int]
+        if handoffs[i]:
+            candidates = range(i + 1, len(session_ids))
+        elif branch_a:
+            same_branch = first_branch_index.get(branch_a, [])
+            candidates = same_branch[bisect_right(same_branch, i) :]
+        else:
             continue
 
-        # Extract session metadata
-        last_msg_a = session_a[-1] if session_a else {}
-        entities_a: set[str] = set()
-        for msg in session_a:
-            entities_a.update(extract_entities(msg.get("content", "")))
-        branch_a = last_msg_a.get("git_branch")
-
-        for session_b_id in session_ids[i + 1 :]:
+        for j in candidates:
+            session_b_id = session_ids[j]
             session_b = sessions[session_b_id]
-            if not session_b:
-                continue
-
-            first_msg_b = session_b[0] if session_b else {}
-            entities_b: set[str] = set()
-            for msg in session_b:
-                entities_b.update(extract_entities(msg.get("content", "")))
-            branch_b = first_msg_b.get("git_branch")
+            branch_b = session_b[0].get("git_branch")
 
             # Calculate link score
             score = 0.0
@@ -286,12 +319,12 @@ def _link_sessions(sessions: dict[str, list[dict[str, Any]]]) -> list[SessionLin
                 evidence.append("shared_branch")
 
             # Explicit handoff marker (HIGH weight)
-            if any(_detect_handoff(msg.get("content", "")) for msg in session_a):
+            if handoffs[i]:
                 score += 0.4
                 evidence.append("handoff_detected")
 
             # Shared entities (MEDIUM weight)
-            overlap = entity_overlap(entities_a, entities_b)
+            overlap = entity_overlap(entities_of(i), entities_of(j))
             if overlap > 0.5:
                 score += 0.2
                 evidence.append("entity_overlap")
@@ -303,7 +336,7 @@ def _link_sessions(sessions: dict[str, list[dict[str, Any]]]) -> list[SessionLin
                 link_counter += 1
 
                 # Calculate span
-                timestamps = _parse_timestamps(session_a + session_b)
+                timestamps = timestamps_of(i) + timestamps_of(j)
 
                 span_hours = 0.0
                 if len(timestamps) >= 2:
@@ -280,6 +280,116 @@ def setup_worktree(
         marker_path.write_text(str(os.getpid()))
 
 
+# ioctl(2) request number for FICLONE (Linux btrfs/xfs/bcachefs reflink).
+_FICLONE = 0x40049409
+
+
+def clone_file(src: Path, dest: Path) -> None:
+    """Copy ``src`` to ``dest``, sharing extents with a reflink when possible.
+
+    On copy-on-write filesystems the ``FICLONE`` ioctl makes the copy O(1)
+    regardless of file size; everywhere else (or if the ioctl is refused) it
+    falls back to ``shutil.copy2``. Hardlinks are deliberately not used: a
+    worker editing a hardlinked ``.env`` in place would rewrite the main
+    checkout's copy. Metadata is copied either way so the mtime-based
+    freshness check in :func:`sync_copy_files` holds.
+    """
+    try:
+        import fcntl
+
+        with open(src, "rb") as src_f, open(dest, "wb") as dest_f:
+            fcntl.ioctl(dest_f.fileno(), _FICLONE, src_f.fileno())
+    except (ImportError, OSError):
+        shutil.copy2(src, dest)
+        return
+    shutil.copystat(src, dest)
+
+
+def _sync_file(src: Path, dest: Path) -> bool:
+    """Clone ``src`` over ``dest`` unless ``dest`` already matches; True if copied."""
+    src_stat = src.stat()
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if dest_stat.st_size == src_stat.st_size and dest_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.is_symlink():
+        dest.unlink()
+    elif dest.is_dir():
+        shutil.rmtree(dest)
+    clone_file(src, dest)
+    return True
+
+
+def _sync_tree(src: Path, dest: Path, *, mirror: bool) -> int:
+    """Sync directory ``src`` into ``dest`` file by file; returns files copied.
+
+    With ``mirror`` the destination ends up identical to ``src`` (entries
+    absent from ``src`` are removed) — the recycled-worktree equivalent of
+    ``setup_worktree``'s ``rmtree`` + ``copytree`` replace semantics.
+    Otherwise it merges, like ``copytree(dirs_exist_ok=True)``.
+    """
+    copied = 0
+    wanted: set[Path] = set()
+    for root, dirs, files in os.walk(src):
+        rel_root = Path(root).relative_to(src)
+        for name in dirs:
+            wanted.add(rel_root / name)
+        for name in files:
+            rel = rel_root / name
+            wanted.add(rel)
+            copied += _sync_file(src / rel, dest / rel)
+    if mirror and dest.is_dir():
+        for root, dirs, files in os.walk(dest, topdown=False):
+            rel_root = Path(root).relative_to(dest)
+            for name in files:
+                if rel_root / name not in wanted:
+                    (Path(root) / name).unlink()
+            for name in dirs:
+                if rel_root / name not in wanted:
+                    shutil.rmtree(Path(root) / name, ignore_errors=True)
+    return copied
+
+
+def sync_copy_files(
+    repo_path: Path,
+    worktree_path: Path,
+    copy_files: list[str],
+    logger: Logger,
+) -> int:
+    """Bring ``.claude/`` and ``copy_files`` up to date in an existing worktree.
+
+    The recycled-worktree counterpart of the copy step in
+    :func:`setup_worktree`, with the same contract (``.claude/`` replaced
+    wholesale, ``copy_files`` directories merged, missing entries skipped)
+    but incremental: files whose size and mtime already match the main repo
+    are left alone, and the rest go through :func:`clone_file`.
+
+    Returns:
+        Number of files actually copied.
+    """
+    copied = 0
+    claude_dir = repo_path / ".claude"
+    if claude_dir.is_dir():
+        copied += _sync_tree(claude_dir, worktree_path / ".claude", mirror=True)
+
+    for file_path in copy_files:
+        if file_path.startswith(".claude/"):
+            continue  # already covered by the .claude/ sync above
+        src = repo_path / file_path
+        if not src.exists():
+            logger.debug(f"Skipped {file_path} (not found in main repo)")
+            continue
+        if src.is_dir():
+            copied += _sync_tree(src, worktree_path / file_path, mirror=False)
+        else:
+            copied += _sync_file(src, worktree_path / file_path)
+    return copied
+
+
 def cleanup_worktree(
     worktree_path: Path,
     repo_path: Path,
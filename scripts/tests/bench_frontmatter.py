@@ -0,0 +1,105 @@
+"""Benchmark: ``frontmatter.parse_frontmatter`` throughput by YAML loading strategy.
+
+Parses every issue file under ``.issues/`` (or ``--issues-dir``) with
+``parse_frontmatter``, the call ``find_issues``, ``ll-issues list`` and the MCP
+issue tools make per file. Three variants of the per-block YAML load:
+
+  - ``pure``: the previous behavior — ``yaml.load(text, Loader=yaml.BaseLoader)``
+    (pure Python) for every block.
+  - ``libyaml``: ``yaml.CBaseLoader`` for every block (skipped when PyYAML was
+    built without libyaml).
+  - ``fast``: the current ``_load_mapping`` — the simple-subset scanner, then
+    libyaml, then the pure loader.
+
+Every variant must produce identical results for every file.
+
+Usage:
+    python scripts/tests/bench_frontmatter.py
+    python scripts/tests/bench_frontmatter.py --issues-dir path/to/.issues --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import yaml
+
+from little_loops import frontmatter
+from little_loops.frontmatter import _scan_simple_block, parse_frontmatter
+
+_DEFAULT_ISSUES_DIR = Path(__file__).resolve().parents[2] / ".issues"
+_DEFAULT_ITERATIONS = 3
+
+
+def _run(contents: list[str], iterations: int) -> tuple[float, list[dict[str, Any]]]:
+    samples = []
+    results: list[dict[str, Any]] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        results = [parse_frontmatter(content) for content in contents]
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues-dir", type=Path, default=_DEFAULT_ISSUES_DIR)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    contents = [p.read_text(encoding="utf-8") for p in sorted(args.issues_dir.rglob("*.md"))]
+    if not contents:
+        print(f"no issue files under {args.issues_dir}")
+        return 1
+
+    variants: list[tuple[str, Callable[[str], Any] | None]] = [
+        ("pure", lambda text: yaml.load(text, Loader=yaml.BaseLoader)),
+    ]
+    c_loader = getattr(yaml, "CBaseLoader", None)
+    if c_loader is not None:
+        variants.append(("libyaml", lambda text: yaml.load(text, Loader=c_loader)))
+    variants.append(("fast", None))
+
+    rows = []
+    reference: list[dict[str, Any]] | None = None
+    for name, loader in variants:
+        if loader is None:
+            elapsed, results = _run(contents, args.iterations)
+        else:
+            with patch.object(frontmatter, "_load_mapping", loader):
+                elapsed, results = _run(contents, args.iterations)
+        if reference is None:
+            reference = results
+        elif results != reference:
+            print(f"MISMATCH: {name} disagrees with pure on some files")
+            return 1
+        rows.append((name, elapsed))
+
+    simple = sum(
+        1
+        for content in contents
+        for block in frontmatter._iter_frontmatter_blocks(content)
+        if _scan_simple_block(content[block.body_span[0] : block.body_span[1]]) is not None
+    )
+    n = len(contents)
+    base = rows[0][1]
+    print(f"\n{n} files, {simple} blocks on the simple-subset fast path")
+    print(f"{'Variant':<10} {'total':>10} {'files/s':>10} {'us/file':>9} {'speedup':>8}")
+    print("-" * 52)
+    for name, elapsed in rows:
+        print(
+            f"  {name:<8} {elapsed * 1000:>8.1f}ms {n / elapsed:>10,.0f} "
+            f"{elapsed / n * 1e6:>9.1f} {base / elapsed:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
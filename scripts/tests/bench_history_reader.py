@@ -0,0 +1,113 @@
+"""Benchmark: per-query overhead of ``history_reader`` read connections.
+
+Builds a small migrated ``history.db`` (a few hundred rows across the tables
+the queries touch) so query execution is cheap and connection setup dominates,
+then times each query three ways:
+
+  - ``uncached``: every call pays ``ensure_db`` + a fresh read-only connection
+    (the cache is cleared before each call — the pre-cache behavior).
+  - ``cached``: calls reuse the thread's cached handle (stat check only).
+  - ``read_connection``: calls run inside one ``read_connection`` block
+    (pinned handle, one read snapshot).
+
+Usage:
+    python scripts/tests/bench_history_reader.py
+    python scripts/tests/bench_history_reader.py --calls 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from little_loops import history_reader
+from little_loops.history_reader import (
+    find_user_corrections,
+    mcp_server_usage,
+    read_connection,
+    recent_skill_events,
+    search,
+)
+from little_loops.session_store import connect, ensure_db
+
+_DEFAULT_CALLS = 200
+
+
+def _build_db(db: Path) -> None:
+    ensure_db(db)
+    conn = connect(db)
+    try:
+        for n in range(200):
+            ts = f"2026-05-{1 + n % 28:02d}T00:00:00Z"
+            conn.execute(
+                "INSERT INTO user_corrections(ts, session_id, content, source) VALUES(?,?,?,?)",
+                (ts, f"s{n % 7}", f"no, use the other helper {n}", "bench"),
+            )
+            conn.execute(
+                "INSERT INTO skill_events(ts, session_id, skill_name, args) VALUES(?,?,?,?)",
+                (ts, f"s{n % 7}", f"skill-{n % 5}", ""),
+            )
+            conn.execute(
+                "INSERT INTO search_index(content, kind, ref, anchor, ts) VALUES(?,?,?,?,?)",
+                (f"refactor parser module {n}", "message", f"s{n % 7}", "", ts),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _queries(db: Path) -> list[tuple[str, Callable[[], object]]]:
+    return [
+        ("find_user_corrections", lambda: find_user_corrections("helper", db=db)),
+        ("recent_skill_events", lambda: recent_skill_events("skill-1", db=db)),
+        ("search", lambda: search("parser", db=db)),
+        ("mcp_server_usage", lambda: mcp_server_usage(db=db)),
+    ]
+
+
+def _time_us(fn: Callable[[], object], calls: int, *, reset: bool) -> float:
+    samples = []
+    for _ in range(calls):
+        if reset:
+            history_reader._close_read_connections()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=_DEFAULT_CALLS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "history.db"
+        _build_db(db)
+        rows: list[tuple[str, float, float, float]] = []
+        for name, fn in _queries(db):
+            uncached = _time_us(fn, args.calls, reset=True)
+            history_reader._close_read_connections()
+            cached = _time_us(fn, args.calls, reset=False)
+            with read_connection(db):
+                pinned = _time_us(fn, args.calls, reset=False)
+            rows.append((name, uncached, cached, pinned))
+        history_reader._close_read_connections()
+
+    print(f"\n{'Query':<24} {'uncached':>10} {'cached':>10} {'read_conn':>10} {'speedup':>8}")
+    print("-" * 66)
+    for name, uncached, cached, pinned in rows:
+        print(
+            f"  {name:<22} {uncached:>8.0f}us {cached:>8.0f}us {pinned:>8.0f}us "
+            f"{uncached / cached:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Benchmark: per-fire latency of the PreToolUse/PostToolUse hooks, with and without the daemon.
+
+Replays what the Claude Code adapter scripts do on every tool call — pipe the
+hook payload into a fresh ``python -m ...`` process — in a scratch project with
+``analytics.enabled`` set (so ``post_tool_use`` writes ``tool_events`` and
+``file_events`` rows). Each intent is timed three ways:
+
+  - ``one-shot``: ``python -m little_loops.hooks <intent>`` (the pre-daemon
+    adapter command).
+  - ``fallback``: ``python -m little_loops.hooks.client <intent>`` with no
+    daemon running (the default, ``hooks.daemon.enabled`` unset).
+  - ``daemon``: the same client command, forwarded to a running
+    ``little_loops.hooks.daemon``.
+
+Usage:
+    python scripts/tests/bench_hook_daemon.py
+    python scripts/tests/bench_hook_daemon.py --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from little_loops.hooks import daemon
+
+_DEFAULT_ITERATIONS = 20
+
+_PAYLOADS = {
+    "pre_tool_use": {
+        "session_id": "bench",
+        "tool_name": "Edit",
+        "tool_input": {"file_path": "src/app.py", "old_string": "a", "new_string": "b"},
+    },
+    "post_tool_use": {
+        "session_id": "bench",
+        "tool_name": "Read",
+        "tool_input": {"file_path": "src/app.py"},
+        "tool_response": {"content": "x" * 2000},
+    },
+}
+
+
+def _fire(project: Path, module: str, intent: str) -> float:
+    stdin = json.dumps(_PAYLOADS[intent])
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", module, intent],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=str(project),
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def _measure(project: Path, module: str, intent: str, iterations: int) -> tuple[float, float]:
+    _fire(project, module, intent)  # warm the page cache / daemon
+    samples = sorted(_fire(project, module, intent) for _ in range(iterations))
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.median(samples), p95
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    rows: list[tuple[str, str, float, float]] = []
+    with tempfile.TemporaryDirectory(prefix="llhd") as tmp:
+        project = Path(tmp)
+        (project / ".ll").mkdir()
+        (project / ".ll" / "ll-config.json").write_text(
+            json.dumps({"analytics": {"enabled": True}}), encoding="utf-8"
+        )
+        for intent in _PAYLOADS:
+            rows.append(
+                (
+                    intent,
+                    "one-shot",
+                    *_measure(project, "little_loops.hooks", intent, args.iterations),
+                )
+            )
+            rows.append(
+                (
+                    intent,
+                    "fallback",
+                    *_measure(project, "little_loops.hooks.client", intent, args.iterations),
+                )
+            )
+        if not daemon.start_daemon(project, idle_timeout=120, wait=30):
+            print("hook daemon failed to start", file=sys.stderr)
+            return 1
+        try:
+            for intent in _PAYLOADS:
+                rows.append(
+                    (
+                        intent,
+                        "daemon",
+                        *_measure(project, "little_loops.hooks.client", intent, args.iterations),
+                    )
+                )
+        finally:
+            daemon.stop_daemon(project)
+
+    baseline = {intent: median for intent, mode, median, _ in rows if mode == "one-shot"}
+    print(f"\n{args.iterations} fires per row (wall clock incl. interpreter start)")
+    print(f"\n{'Intent':<16} {'mode':<10} {'median':>10} {'p95':>10} {'speedup':>8}")
+    print("-" * 58)
+    for intent, mode, median, p95 in rows:
+        print(
+            f"  {intent:<14} {mode:<10} {median:>8.1f}ms {p95:>8.1f}ms "
+            f"{baseline[intent] / median:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Benchmark: cold vs. warm ``find_issues`` listing through ``.ll/issue_index.db``.
+
+Generates a synthetic project with N issue files (default 5000) spread across
+the four default categories, backdates every file past the index's racy
+window, then times:
+
+  - ``no index``: listing with the index disabled (every file parsed).
+  - ``cold``: first listing with an empty index (parse + populate).
+  - ``warm``: repeated listings served from the index (stat + decode only).
+  - ``warm, 1% touched``: warm listing after rewriting 1% of the files.
+
+Usage:
+    python scripts/tests/bench_issue_index.py
+    python scripts/tests/bench_issue_index.py --issues 2000 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from little_loops.config import BRConfig
+from little_loops.issue_index import INDEX_DB_NAME, IssueIndex
+from little_loops.issue_parser import find_issues
+
+_DEFAULT_ISSUES = 5000
+_DEFAULT_ITERATIONS = 3
+_CATEGORIES = (("bugs", "BUG"), ("features", "FEAT"), ("enhancements", "ENH"), ("epics", "EPIC"))
+_STATUSES = ("open", "open", "open", "in_progress", "done", "deferred")
+
+_BODY = """---
+id: {issue_id}
+status: {status}
+priority: P{priority}
+labels:
+- synthetic
+- bench
+blocked_by: {blocked_by}
+---
+
+# {issue_id}: Synthetic issue {n}
+
+## Summary
+
+Synthetic benchmark issue {n}. Touches `scripts/little_loops/module_{mod}.py`.
+
+## Acceptance Criteria
+
+- [ ] Criterion one
+- [ ] Criterion two
+
+## Session Log
+- `/ll:refine-issue` - 2026-01-01T00:00:00 - `x.jsonl`
+"""
+
+
+def _build_project(root: Path, count: int) -> BRConfig:
+    (root / ".ll").mkdir()
+    (root / ".ll" / "ll-config.json").write_text(json.dumps({"project": {"name": "bench"}}))
+    stamp = time.time() - 3600
+    for n in range(1, count + 1):
+        category, prefix = _CATEGORIES[n % len(_CATEGORIES)]
+        issue_dir = root / ".issues" / category
+        issue_dir.mkdir(parents=True, exist_ok=True)
+        issue_id = f"{prefix}-{n}"
+        blocked_by = f"[{_CATEGORIES[(n - 1) % 4][1]}-{n - 1}]" if n % 7 == 0 else "[]"
+        path = issue_dir / f"P{n % 6}-{issue_id}-synthetic-issue-{n}.md"
+        path.write_text(
+            _BODY.format(
+                issue_id=issue_id,
+                status=_STATUSES[n % len(_STATUSES)],
+                priority=n % 6,
+                blocked_by=blocked_by,
+                n=n,
+                mod=n % 50,
+            )
+        )
+        os.utime(path, (stamp, stamp))
+    return BRConfig(root)
+
+
+def _time_listing(config: BRConfig) -> tuple[float, int]:
+    start = time.perf_counter()
+    issues = find_issues(config)
+    return (time.perf_counter() - start) * 1000, len(issues)
+
+
+def _touch_fraction(root: Path, fraction: float) -> None:
+    files = sorted((root / ".issues").rglob("*.md"))
+    step = max(1, int(1 / fraction))
+    stamp = time.time() - 60
+    for path in files[::step]:
+        path.write_text(path.read_text() + "\n")
+        os.utime(path, (stamp, stamp))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=_DEFAULT_ISSUES)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        print(f"Generating {args.issues} synthetic issues...")
+        config = _build_project(root, args.issues)
+        db = root / ".ll" / INDEX_DB_NAME
+
+        rows: list[tuple[str, float, int]] = []
+
+        with patch.object(IssueIndex, "for_project", classmethod(lambda cls, start: cls(None))):
+            samples = [_time_listing(config) for _ in range(args.iterations)]
+        rows.append(("no index", statistics.median(s[0] for s in samples), samples[0][1]))
+
+        cold_samples = []
+        for _ in range(args.iterations):
+            db.unlink(missing_ok=True)
+            cold_samples.append(_time_listing(config))
+        rows.append(("cold", statistics.median(s[0] for s in cold_samples), cold_samples[0][1]))
+
+        warm = [_time_listing(config) for _ in range(args.iterations)]
+        rows.append(("warm", statistics.median(s[0] for s in warm), warm[0][1]))
+
+        _touch_fraction(root, 0.01)
+        touched = _time_listing(config)
+        rows.append(("warm, 1% touched", touched[0], touched[1]))
+
+    print(f"\n{'Mode':<20} {'median':>10} {'listed':>8}")
+    print("-" * 40)
+    for mode, ms, listed in rows:
+        print(f"  {mode:<18} {ms:>8.1f}ms {listed:>8}")
+    baseline = rows[0][1]
+    print(f"\nwarm speedup vs. no index: {baseline / rows[2][1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
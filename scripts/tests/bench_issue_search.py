@@ -0,0 +1,157 @@
+"""Benchmark: duplicate-issue search by full scan vs. the BM25 index in ``.ll/issue_index.db``.
+
+Generates N synthetic issue files (default 20000) whose titles and bodies are
+drawn from a Zipf-distributed vocabulary, backdates them past the index's racy
+window, then times:
+
+  - ``scan``: the pre-index search — read every file, ``extract_words`` it and
+    compute the word overlap with the query (per query).
+  - ``cold build``: first ``IssueIndex.search`` against an empty index
+    (tokenize every file and write its postings).
+  - ``incremental``: a search after rewriting 1% of the files (only those are
+    re-read and re-indexed).
+  - ``query``: warm ``IssueIndex.search`` per query, body and title.
+
+The overlap the index reports must equal the scan's for every file.
+
+Usage:
+    python scripts/tests/bench_issue_search.py
+    python scripts/tests/bench_issue_search.py --issues 5000 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from little_loops.issue_index import INDEX_DB_NAME, IssueIndex
+from little_loops.text_utils import calculate_word_overlap, extract_words
+
+_DEFAULT_ISSUES = 20000
+_DEFAULT_ITERATIONS = 3
+_VOCABULARY = 5000
+_QUERIES = 10
+
+
+def _word(n: int) -> str:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    n += 26 * 26
+    while n:
+        n, r = divmod(n, 26)
+        out += letters[r]
+    return out
+
+
+def _generate(issues_dir: Path, count: int, rng: random.Random) -> list[Path]:
+    vocab = [_word(n) for n in range(_VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(_VOCABULARY)]
+    stamp = time.time() - 60
+    paths = []
+    for n in range(count):
+        title = " ".join(rng.choices(vocab, weights, k=rng.randint(3, 8)))
+        body = " ".join(rng.choices(vocab, weights, k=rng.randint(60, 240)))
+        path = issues_dir / f"P2-BUG-{n:05d}-synthetic.md"
+        path.write_text(
+            f"---\nstatus: open\n---\n\n# BUG-{n:05d}: {title}\n\n## Summary\n\n{body}\n"
+        )
+        os.utime(path, (stamp, stamp))
+        paths.append(path)
+    return paths
+
+
+def _scan(paths: list[Path], query: set[str]) -> dict[Path, float]:
+    overlaps = {}
+    for path in paths:
+        overlap = calculate_word_overlap(query, extract_words(path.read_text(encoding="utf-8")))
+        if overlap > 0:
+            overlaps[path] = overlap
+    return overlaps
+
+
+def _time_ms(fn: Callable[[], Any], iterations: int) -> tuple[float, Any]:
+    samples = []
+    result: Any = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=_DEFAULT_ISSUES)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory(prefix="ll-bench-search-") as tmp:
+        issues_dir = Path(tmp) / "bugs"
+        issues_dir.mkdir()
+        paths = _generate(issues_dir, args.issues, rng)
+        db = Path(tmp) / INDEX_DB_NAME
+        queries = [
+            extract_words(paths[rng.randrange(len(paths))].read_text().splitlines()[4])
+            | extract_words(" ".join(_word(rng.randrange(_VOCABULARY)) for _ in range(8)))
+            for _ in range(_QUERIES)
+        ]
+
+        def search(query: set[str], title: bool = False) -> list[Any]:
+            with IssueIndex(db) as index:
+                return index.search(paths, query, title=title)
+
+        start = time.perf_counter()
+        search(queries[0])
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        for path in rng.sample(paths, max(1, len(paths) // 100)):
+            path.write_text(path.read_text() + "\nRewritten with additional context.\n")
+            stamp = time.time() - 60
+            os.utime(path, (stamp, stamp))
+        start = time.perf_counter()
+        search(queries[0])
+        incremental_ms = (time.perf_counter() - start) * 1000
+
+        scan_ms, _ = _time_ms(lambda: _scan(paths, queries[0]), 1)
+        body_ms, title_ms = [], []
+        for query in queries:
+            ms, hits = _time_ms(lambda q=query: search(q), args.iterations)
+            body_ms.append(ms)
+            indexed = {h.path: h.overlap for h in hits}
+            expected = _scan(paths, query)
+            if indexed.keys() != expected.keys() or any(
+                abs(indexed[p] - expected[p]) > 1e-12 for p in expected
+            ):
+                print(f"MISMATCH for query {sorted(query)}")
+                return 1
+            ms, _ = _time_ms(lambda q=query: search(q, title=True), args.iterations)
+            title_ms.append(ms)
+
+        db_mb = db.stat().st_size / 1e6
+
+    query_ms = statistics.median(body_ms)
+    print(f"\n{args.issues:,} issues, {_QUERIES} queries, index {db_mb:.1f} MB")
+    print(f"{'Step':<24} {'time':>11} {'vs scan':>8}")
+    print("-" * 45)
+    for name, ms in (
+        ("scan (per query)", scan_ms),
+        ("cold build", cold_ms),
+        ("incremental (1%)", incremental_ms),
+        ("query, body (median)", query_ms),
+        ("query, title (median)", statistics.median(title_ms)),
+    ):
+        print(f"  {name:<22} {ms:>9.1f}ms {scan_ms / ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Benchmark: ``history_reader.ll_grep`` full scan vs. trigram prefilter.
+
+Builds a synthetic ``.ll/history.db`` with N user messages (default 1,000,000)
+drawn from a small development vocabulary, with a handful of rare needles
+planted, then runs a set of grep patterns two ways:
+
+  - ``scan``: the pre-index behavior — the ``regexp_match`` UDF runs on every
+    ``message_events`` row (``_trigram_query`` forced to ``None``).
+  - ``prefiltered``: the current ``ll_grep`` — required literals are looked up
+    in ``message_trigrams`` first and only candidate rows reach the UDF.
+
+Both variants must return the same rows for every pattern. The database is
+built once in a temp directory (the insert triggers populate the trigram index
+as rows are written; build time is reported separately).
+
+Usage:
+    python scripts/tests/bench_ll_grep_trigram.py
+    python scripts/tests/bench_ll_grep_trigram.py --messages 200000 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from little_loops import history_reader
+from little_loops.history_reader import _trigram_query, ll_grep
+from little_loops.session_store import connect
+
+_DEFAULT_MESSAGES = 1_000_000
+_DEFAULT_ITERATIONS = 3
+_EPOCH = datetime(2026, 1, 1)
+_WORDS = (
+    "update", "refactor", "the", "loop", "runner", "parser", "tests", "for", "and", "fix",
+    "config", "sprint", "worktree", "merge", "branch", "please", "check", "again", "hook",
+    "session", "history", "module", "error", "output", "state", "review", "docs", "now",
+)  # fmt: skip
+_NEEDLES = ("BUG-90210 regression in the journal fold", "deadlock under ll-parallel --workers 8")
+_PATTERNS = (
+    r"BUG-90210",
+    r"deadlock under ll-\w+",
+    r"(journal fold|worktree pool) regression",
+    r"refactor the parser",
+    r"\d{5}",
+)
+
+
+def _build(db: Path, count: int) -> float:
+    rng = random.Random(42)
+    start = time.perf_counter()
+    conn = connect(db)
+    try:
+        rows = []
+        for n in range(count):
+            words = rng.choices(_WORDS, k=rng.randint(6, 18))
+            if n % (count // 10 or 1) == 0:
+                words.append(_NEEDLES[(n // (count // 10 or 1)) % len(_NEEDLES)])
+            ts = (_EPOCH + timedelta(seconds=n)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            rows.append((ts, f"session-{n // 40}", " ".join(words)))
+        conn.executemany(
+            "INSERT INTO message_events(ts, session_id, content) VALUES(?, ?, ?)", rows
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return time.perf_counter() - start
+
+
+def _time_ms(fn: Callable[[], list[Any]], iterations: int) -> tuple[float, list[Any]]:
+    samples = []
+    result: list[Any] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=_DEFAULT_MESSAGES)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ll-bench-grep-") as tmp:
+        db = Path(tmp) / "history.db"
+        build_s = _build(db, args.messages)
+        print(f"built {args.messages:,} messages in {build_s:.1f}s")
+
+        def grep(pattern: str) -> list[int]:
+            return [r.message_event_id for r in ll_grep(pattern, limit=args.limit, db=db)]
+
+        print(f"\n{'Pattern':<42} {'hits':>5} {'scan':>11} {'prefiltered':>12} {'speedup':>8}")
+        print("-" * 82)
+        for pattern in _PATTERNS:
+            with patch.object(history_reader, "_trigram_query", return_value=None):
+                scan_ms, scanned = _time_ms(lambda p=pattern: grep(p), args.iterations)
+            pre_ms, prefiltered = _time_ms(lambda p=pattern: grep(p), args.iterations)
+            if scanned != prefiltered:
+                print(
+                    f"MISMATCH for {pattern!r}: scan {len(scanned)}, prefiltered {len(prefiltered)}"
+                )
+                return 1
+            label = pattern if _trigram_query(pattern) else f"{pattern} (no literal)"
+            print(
+                f"  {label:<40} {len(scanned):>5} {scan_ms:>9.1f}ms {pre_ms:>10.1f}ms "
+                f"{scan_ms / pre_ms:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
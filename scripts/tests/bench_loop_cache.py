@@ -0,0 +1,132 @@
+"""Benchmark: compiled-loop cache for loop listing and validation.
+
+Replays the two hot paths over every bundled loop YAML (about 100 files):
+
+  - ``list``: what ``ll-loop list`` does per file — ``is_runnable_loop`` plus
+    the description/category lookup (``_load_loop_meta``).
+  - ``validate``: ``load_and_validate`` on every runnable loop (``ll-loop
+    show``/``run``/``validate`` and sub-loop entry).
+
+Each is timed three ways:
+
+  - ``uncached``: ``LL_LOOP_CACHE=0`` (the pre-cache behavior).
+  - ``memory``: a second pass in the same process.
+  - ``disk``: in-process layer cleared, served from the per-user disk cache
+    (a fresh ``ll-loop`` invocation). ``XDG_CACHE_HOME`` points into a temp
+    directory, so the real ``~/.cache`` is left alone.
+
+Usage:
+    python scripts/tests/bench_loop_cache.py
+    python scripts/tests/bench_loop_cache.py --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from little_loops.cli.loop.info import _load_loop_meta
+from little_loops.fsm import loop_cache
+from little_loops.fsm.loop_paths import get_builtin_loops_dir
+from little_loops.fsm.validation import is_runnable_loop, load_and_validate
+
+_DEFAULT_ITERATIONS = 3
+
+
+def _list(files: list[Path]) -> int:
+    runnable = [p for p in files if is_runnable_loop(p)]
+    for path in runnable:
+        _load_loop_meta(path)
+    return len(runnable)
+
+
+def _validate(files: list[Path]) -> int:
+    loaded = 0
+    for path in files:
+        try:
+            load_and_validate(path, raise_on_error=False)
+        except Exception:
+            continue
+        loaded += 1
+    return loaded
+
+
+def _time_ms(fn: Callable[[], int], iterations: int, *, setup: Callable[[], None]) -> float:
+    samples = []
+    for _ in range(iterations):
+        setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _uncached() -> None:
+    os.environ["LL_LOOP_CACHE"] = "0"
+
+
+def _memory() -> None:
+    os.environ.pop("LL_LOOP_CACHE", None)
+
+
+def _disk() -> None:
+    os.environ.pop("LL_LOOP_CACHE", None)
+    loop_cache.clear_memory_cache()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    # Validation warnings are logged per load; they are not what is being measured.
+    logging.disable(logging.WARNING)
+    files = sorted(get_builtin_loops_dir().rglob("*.yaml"))
+    runnable = [p for p in files if is_runnable_loop(p)]
+
+    rows: list[tuple[str, float, float, float]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = str(Path(tmp) / "xdg-cache")
+        os.chdir(tmp)
+        try:
+            (Path(tmp) / ".loops").mkdir()
+            for name, fn in (
+                ("list", lambda: _list(files)),
+                ("validate", lambda: _validate(runnable)),
+            ):
+                uncached = _time_ms(fn, args.iterations, setup=_uncached)
+                _memory()
+                fn()  # populate both layers
+                memory = _time_ms(fn, args.iterations, setup=_memory)
+                disk = _time_ms(fn, args.iterations, setup=_disk)
+                rows.append((name, uncached, memory, disk))
+        finally:
+            os.chdir(cwd)
+            os.environ.pop("LL_LOOP_CACHE", None)
+            if xdg is None:
+                os.environ.pop("XDG_CACHE_HOME", None)
+            else:
+                os.environ["XDG_CACHE_HOME"] = xdg
+
+    print(f"\n{len(files)} loop files, {len(runnable)} runnable")
+    print(f"\n{'Path':<12} {'uncached':>10} {'memory':>10} {'disk':>10} {'speedup':>8}")
+    print("-" * 54)
+    for name, uncached, memory, disk in rows:
+        print(
+            f"  {name:<10} {uncached:>8.0f}ms {memory:>8.1f}ms {disk:>8.1f}ms "
+            f"{uncached / disk:>7.0f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Benchmark: ``OverlapDetector`` scheduling cost with a large queue.
+
+Generates N synthetic issue files (default 500), each naming a few write-target
+files and directories drawn from a shared module tree, then replays the worst
+case for ``ll-parallel`` dispatch: every issue is checked against all issues
+registered so far and then registered itself (``serialize_overlapping`` off),
+followed by one deferred re-check pass over the whole queue. Three variants:
+
+  - ``full scan``: the pre-index algorithm — re-read and re-extract the issue
+    on every check, then ``contends_with`` against every active issue.
+  - ``indexed, cold``: ``OverlapDetector`` with an empty hint cache.
+  - ``indexed, warm``: ``OverlapDetector`` with hints already cached.
+
+Usage:
+    python scripts/tests/bench_overlap_detector.py
+    python scripts/tests/bench_overlap_detector.py --issues 2000 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from little_loops.issue_parser import IssueInfo
+from little_loops.parallel import file_hints
+from little_loops.parallel.file_hints import FileHints, _extract_hint_sets
+from little_loops.parallel.overlap_detector import OverlapDetector
+
+_DEFAULT_ISSUES = 500
+_DEFAULT_ITERATIONS = 3
+_PACKAGES = ("cli", "fsm", "parallel", "session_store", "issues", "hooks", "config", "loops")
+
+
+def _make_issues(root: Path, count: int) -> list[IssueInfo]:
+    rng = random.Random(42)
+    issues = []
+    for n in range(count):
+        issue_id = f"ENH-{n:04d}"
+        lines = ["### Files to Modify"]
+        for _ in range(rng.randint(3, 6)):
+            pkg = rng.choice(_PACKAGES)
+            lines.append(f"- `scripts/little_loops/{pkg}/module_{rng.randint(0, 60)}.py`")
+        if rng.random() < 0.2:
+            pkg = rng.choice(_PACKAGES)
+            lines.append(f"- `scripts/little_loops/{pkg}/sub_{rng.randint(0, 40)}/`")
+        lines.append("")
+        lines.append(f"scope: area-{rng.randint(0, 150)}")
+        path = root / f"P3-{issue_id}-synthetic.md"
+        path.write_text(f"# {issue_id}: Synthetic\n\n" + "\n".join(lines) + "\n")
+        issues.append(
+            IssueInfo(
+                path=path,
+                issue_type="enhancements",
+                priority="P3",
+                issue_id=issue_id,
+                title=f"Synthetic {n}",
+            )
+        )
+    return issues
+
+
+def _full_scan(issues: list[IssueInfo]) -> int:
+    """The pre-index algorithm: re-extract per check, compare against everyone."""
+
+    def hints_for(issue: IssueInfo) -> FileHints:
+        files, dirs, scopes = _extract_hint_sets(issue.path.read_text())
+        return FileHints(set(files), set(dirs), set(scopes), issue.issue_id)
+
+    active: dict[str, FileHints] = {}
+    overlaps = 0
+    for issue in issues:
+        new = hints_for(issue)
+        overlaps += sum(1 for h in active.values() if new.contends_with(h))
+        active[issue.issue_id] = hints_for(issue)
+    for issue in issues:
+        new = hints_for(issue)
+        overlaps += sum(1 for h in active.values() if new.contends_with(h))
+    return overlaps
+
+
+def _indexed(issues: list[IssueInfo]) -> int:
+    detector = OverlapDetector()
+    overlaps = 0
+    for issue in issues:
+        overlaps += len(detector.check_overlap(issue).overlapping_issues)
+        detector.register_issue(issue)
+    for issue in issues:
+        overlaps += len(detector.check_overlap(issue).overlapping_issues)
+    return overlaps
+
+
+def _time_ms(fn: Callable[[], int], iterations: int, *, cold: bool) -> tuple[float, int]:
+    samples = []
+    result = 0
+    for _ in range(iterations):
+        if cold:
+            file_hints._hint_cache.clear()
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=_DEFAULT_ISSUES)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        issues = _make_issues(Path(tmp), args.issues)
+        scan_ms, scan_hits = _time_ms(lambda: _full_scan(issues), args.iterations, cold=True)
+        cold_ms, cold_hits = _time_ms(lambda: _indexed(issues), args.iterations, cold=True)
+        warm_ms, warm_hits = _time_ms(lambda: _indexed(issues), args.iterations, cold=False)
+
+    if not scan_hits == cold_hits == warm_hits:
+        print(f"MISMATCH: full scan {scan_hits}, cold {cold_hits}, warm {warm_hits}")
+        return 1
+
+    checks = args.issues * 2
+    print(f"\n{args.issues} issues, {checks} checks, {scan_hits} overlapping pairs reported")
+    print(f"\n{'Variant':<18} {'total':>10} {'per check':>11} {'speedup':>8}")
+    print("-" * 50)
+    for name, ms in (
+        ("full scan", scan_ms),
+        ("indexed, cold", cold_ms),
+        ("indexed, warm", warm_ms),
+    ):
+        print(f"  {name:<16} {ms:>8.1f}ms {ms * 1000 / checks:>9.0f}us {scan_ms / ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Benchmark: FSM-thread cost of ``SQLiteTransport.send()``.
+
+Emits a stream of ``state_enter`` events into a fresh ``history.db`` and
+reports the time spent inside ``send()`` (what the FSM thread pays) and the
+total time until ``close()`` has committed everything, for:
+
+  - ``per-event``: ``batch_size=1`` — one transaction (and fsync) per event,
+    the pre-batching behaviour, though now paid on the writer thread.
+  - ``batched``: the default ``batch_size``/``flush_ms``.
+
+Usage:
+    python scripts/tests/bench_sqlite_transport.py
+    python scripts/tests/bench_sqlite_transport.py --events 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from little_loops.session_store import SQLiteTransport
+
+_DEFAULT_EVENTS = 2000
+
+
+def _run(db: Path, events: int, **kwargs: int) -> tuple[float, float, dict[str, int]]:
+    transport = SQLiteTransport(db, **kwargs)
+    start = time.perf_counter()
+    for n in range(events):
+        transport.send({"event": "state_enter", "loop_name": "bench", "state": f"s{n % 7}"})
+    sent = time.perf_counter()
+    transport.flush()
+    stats = transport.get_stats()
+    transport.close()
+    done = time.perf_counter()
+    return sent - start, done - start, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=_DEFAULT_EVENTS)
+    args = parser.parse_args()
+
+    rows: list[tuple[str, float, float, dict[str, int]]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, kwargs in (("per-event", {"batch_size": 1}), ("batched", {})):
+            db = Path(tmp) / f"{label}.db"
+            send_s, total_s, stats = _run(db, args.events, **kwargs)
+            rows.append((label, send_s, total_s, stats))
+
+    print(f"\n{args.events} events")
+    print(f"{'Mode':<12} {'send() us/evt':>14} {'total ms':>10} {'batches':>8}")
+    print("-" * 48)
+    for label, send_s, total_s, stats in rows:
+        print(
+            f"  {label:<10} {send_s / args.events * 1e6:>14.1f} {total_s * 1000:>10.1f} "
+            f"{stats['batches']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Benchmark: ``StatePersistence.save_state`` in snapshot vs. journal mode.
+
+Drives a synthetic N-transition loop (default 5000) straight through
+``StatePersistence``, the way ``PersistentExecutor._save_state`` does on every
+``state_enter``: each transition bumps the iteration, flips the current state,
+rewrites one captured output and appends one line to the shared ``messages``
+log, so the full state grows linearly with the run. Two variants:
+
+  - ``snapshot``: the default — every save rewrites ``state.json`` in full
+    (O(N²) bytes over the run).
+  - ``journal``: ``state_persistence="journal"`` — per-transition deltas
+    appended to ``state.journal``, folded into ``state.json`` every
+    ``--fold-every`` saves.
+
+Both runs must load back to the same final state. Bytes written come from
+``/proc/self/io`` (``wchar``) where available, so neither mode is instrumented.
+
+Usage:
+    python scripts/tests/bench_state_journal.py
+    python scripts/tests/bench_state_journal.py --iterations 20000 --fold-every 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from little_loops.fsm.persistence import DEFAULT_JOURNAL_FOLD_EVERY, LoopState, StatePersistence
+
+_DEFAULT_ITERATIONS = 5000
+
+
+def _written_bytes() -> int | None:
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _run(loops_dir: Path, mode: str, iterations: int, fold_every: int) -> tuple[float, int | None]:
+    persistence = StatePersistence(
+        "bench", loops_dir, state_persistence=mode, journal_fold_every=fold_every
+    )
+    persistence.initialize()
+    state = LoopState(
+        loop_name="bench",
+        current_state="check",
+        iteration=0,
+        captured={},
+        prev_result=None,
+        last_result=None,
+        started_at="2026-01-01T00:00:00Z",
+        updated_at="",
+        status="running",
+        context={"input": "synthetic benchmark input", "run_dir": str(loops_dir / "run")},
+    )
+    before = _written_bytes()
+    start = time.perf_counter()
+    for n in range(1, iterations + 1):
+        state.iteration = n
+        state.current_state = "fix" if n % 2 else "check"
+        state.captured["result"] = {"output": f"{n} checks passed", "exit_code": 0}
+        state.prev_result = {"output": "ok", "exit_code": 0, "state": state.current_state}
+        state.messages.append(f"[iter {n}] {state.current_state}: processed batch {n} of work")
+        persistence.save_state(state)
+    elapsed = time.perf_counter() - start
+    after = _written_bytes()
+    return elapsed, (after - before) if before is not None and after is not None else None
+
+
+def _final(loops_dir: Path) -> dict[str, object]:
+    loaded = StatePersistence("bench", loops_dir).load_state()
+    assert loaded is not None
+    data = loaded.to_dict(include_context=True)
+    data.pop("updated_at")
+    data["context"] = {k: v for k, v in data["context"].items() if k != "run_dir"}
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    parser.add_argument("--fold-every", type=int, default=DEFAULT_JOURNAL_FOLD_EVERY)
+    args = parser.parse_args()
+
+    rows = []
+    finals = []
+    with tempfile.TemporaryDirectory(prefix="ll-bench-journal-") as tmp:
+        for mode in ("snapshot", "journal"):
+            loops_dir = Path(tmp) / mode
+            elapsed, written = _run(loops_dir, mode, args.iterations, args.fold_every)
+            rows.append((mode, elapsed, written))
+            finals.append(_final(loops_dir))
+
+    if finals[0] != finals[1]:
+        print("MISMATCH: snapshot and journal runs loaded back different final states")
+        return 1
+
+    n = args.iterations
+    base_s = rows[0][1]
+    print(
+        f"\n{'Mode':<12} {'transitions':>11} {'bytes written':>15} {'B/transition':>13} "
+        f"{'us/transition':>14} {'speedup':>8}"
+    )
+    print("-" * 78)
+    for mode, elapsed, written in rows:
+        total = f"{written:,}" if written is not None else "n/a"
+        per = f"{written / n:,.0f}" if written is not None else "n/a"
+        print(
+            f"  {mode:<10} {n:>11} {total:>15} {per:>13} {elapsed / n * 1e6:>14.1f} "
+            f"{base_s / elapsed:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
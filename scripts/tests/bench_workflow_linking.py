@@ -0,0 +1,169 @@
+"""Benchmark: ``workflow_sequence._link_sessions`` on a synthetic session corpus.
+
+Generates N synthetic sessions (default 5000) of a dozen or so messages each,
+spread over a pool of git branches, mentioning files and issue IDs from a
+shared tree, with a small fraction ending in a handoff marker. Two variants:
+
+  - ``pairwise``: the pre-index algorithm — every (a, b) pair, re-extracting
+    b's entities and re-scanning a for handoff markers inside the inner loop.
+    O(S² × M), so it only runs on the first ``--baseline`` sessions.
+  - ``indexed``: the current ``_link_sessions`` (branch index, per-session
+    handoff flags and entity sets).
+
+Both variants run on the baseline subset and must produce identical links;
+``indexed`` then runs on the full corpus.
+
+Usage:
+    python scripts/tests/bench_workflow_linking.py
+    python scripts/tests/bench_workflow_linking.py --sessions 20000 --baseline 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from little_loops.workflow_sequence.analysis import (
+    _detect_handoff,
+    _link_sessions,
+    _parse_timestamps,
+    entity_overlap,
+    extract_entities,
+)
+
+_DEFAULT_SESSIONS = 5000
+_DEFAULT_BASELINE = 400
+_DEFAULT_ITERATIONS = 3
+_PACKAGES = ("cli", "fsm", "parallel", "session_store", "issues", "hooks", "config", "loops")
+
+Sessions = dict[str, list[dict[str, Any]]]
+
+
+def _make_sessions(count: int) -> Sessions:
+    rng = random.Random(42)
+    branches = [f"feat/area-{n}" for n in range(max(1, count // 10))]
+    sessions: Sessions = {}
+    for n in range(count):
+        branch = rng.choice(branches) if rng.random() < 0.8 else None
+        day = 1 + n * 90 // count
+        messages = []
+        for m in range(rng.randint(8, 16)):
+            pkg = rng.choice(_PACKAGES)
+            content = (
+                f"Update scripts/little_loops/{pkg}/module_{rng.randint(0, 40)}.py "
+                f"for ENH-{rng.randint(0, 300)} and run /ll:check-code"
+            )
+            messages.append(
+                {
+                    "content": content,
+                    "uuid": f"msg-{n}-{m}",
+                    "git_branch": branch,
+                    "timestamp": f"2026-{1 + day // 31:02d}-{1 + day % 28:02d}T{m:02d}:00:00Z",
+                }
+            )
+        if rng.random() < 0.005:
+            messages[-1]["content"] += " — /ll:handoff continue in new session"
+        sessions[f"session-{n:05d}"] = messages
+    return sessions
+
+
+def _pairwise(sessions: Sessions) -> list[tuple[str, str, tuple[str, ...], float, float]]:
+    """The pre-index algorithm, returning comparable link tuples."""
+    links = []
+    session_ids = list(sessions.keys())
+    for i, session_a_id in enumerate(session_ids):
+        session_a = sessions[session_a_id]
+        if not session_a:
+            continue
+        entities_a: set[str] = set()
+        for msg in session_a:
+            entities_a.update(extract_entities(msg.get("content", "")))
+        branch_a = session_a[-1].get("git_branch")
+        for session_b_id in session_ids[i + 1 :]:
+            session_b = sessions[session_b_id]
+            if not session_b:
+                continue
+            entities_b: set[str] = set()
+            for msg in session_b:
+                entities_b.update(extract_entities(msg.get("content", "")))
+            branch_b = session_b[0].get("git_branch")
+            score = 0.0
+            evidence: list[str] = []
+            if branch_a and branch_a == branch_b:
+                score += 0.4
+                evidence.append("shared_branch")
+            if any(_detect_handoff(msg.get("content", "")) for msg in session_a):
+                score += 0.4
+                evidence.append("handoff_detected")
+            overlap = entity_overlap(entities_a, entities_b)
+            if overlap > 0.5:
+                score += 0.2
+                evidence.append("entity_overlap")
+            elif overlap > 0.3:
+                score += 0.1
+                evidence.append("partial_entity_overlap")
+            if score > 0.3:
+                timestamps = _parse_timestamps(session_a + session_b)
+                span = (max(timestamps) - min(timestamps)).total_seconds() / 3600
+                links.append((session_a_id, session_b_id, tuple(evidence), score, round(span, 1)))
+    return links
+
+
+def _indexed(sessions: Sessions) -> list[tuple[str, str, tuple[str, ...], float, float]]:
+    return [
+        (
+            link.sessions[0]["session_id"],
+            link.sessions[1]["session_id"],
+            tuple(link.unified_workflow["evidence"]),
+            link.confidence,
+            link.unified_workflow["span_hours"],
+        )
+        for link in _link_sessions(sessions)
+    ]
+
+
+def _time_ms(fn: Callable[[], list[Any]], iterations: int) -> tuple[float, list[Any]]:
+    samples = []
+    result: list[Any] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=_DEFAULT_SESSIONS)
+    parser.add_argument("--baseline", type=int, default=_DEFAULT_BASELINE)
+    parser.add_argument("--iterations", type=int, default=_DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    sessions = _make_sessions(args.sessions)
+    subset = dict(list(sessions.items())[: args.baseline])
+
+    pair_ms, pair_links = _time_ms(lambda: _pairwise(subset), 1)
+    sub_ms, sub_links = _time_ms(lambda: _indexed(subset), args.iterations)
+    if pair_links != sub_links:
+        print(f"MISMATCH: pairwise {len(pair_links)} links, indexed {len(sub_links)} links")
+        return 1
+    full_ms, full_links = _time_ms(lambda: _indexed(sessions), args.iterations)
+
+    print(f"\n{'Variant':<28} {'sessions':>9} {'links':>8} {'total':>11} {'speedup':>8}")
+    print("-" * 68)
+    print(f"  {'pairwise':<26} {len(subset):>9} {len(pair_links):>8} {pair_ms:>9.1f}ms {'':>8}")
+    print(
+        f"  {'indexed':<26} {len(subset):>9} {len(sub_links):>8} "
+        f"{sub_ms:>9.1f}ms {pair_ms / sub_ms:>7.1f}x"
+    )
+    print(f"  {'indexed':<26} {len(sessions):>9} {len(full_links):>8} {full_ms:>9.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -618,6 +618,9 @@ def _isolate_history_db(
 def _guard_real_history_db() -> Generator[None, None, None]:
     """Fail fast if any test opens the real .ll/history.db without isolation.
 
+    The repo's own ``.ll/issue_index.db`` is guarded the same way: tests that
+    list the real corpus must request ``passthrough_issue_index``.
+
     Intercepts the single choke point every DB open routes through —
     ``little_loops.session_store.sqlite3.connect`` (used by ``ensure_db``,
     ``connect``, ``SessionStore._connect``, and vacuum) — and raises if a test
@@ -634,6 +637,7 @@ def _guard_real_history_db() -> Generator[None, None, None]:
     from little_loops import session_store
 
     real_db = (Path(__file__).parent.parent.parent / ".ll" / "history.db").resolve()
+    real_index = real_db.with_name("issue_index.db")
     real_connect = sqlite3.connect
 
     def guarded_connect(database: Any, *args: Any, **kwargs: Any) -> sqlite3.Connection:
@@ -642,6 +646,10 @@ def _guard_real_history_db() -> Generator[None, None, None]:
         except TypeError:
             # Non-path targets (e.g. ":memory:") never alias the real DB.
             return real_connect(database, *args, **kwargs)
+        assert resolved != real_index, (
+            f"A test opened the repo's issue index: {resolved}. Tests that list the "
+            f"real corpus must request the passthrough_issue_index fixture."
+        )
         assert resolved != real_db, (
             f"A test opened the production database without isolation: {resolved}. "
             f"Route the open through LL_HISTORY_DB / resolve_history_db() so it "
@@ -657,6 +665,18 @@ def _guard_real_history_db() -> Generator[None, None, None]:
         mp.undo()
 
 
+@pytest.fixture
+def passthrough_issue_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """List issues without an index, for tests that walk this repo's own ``.issues/``.
+
+    ``IssueIndex.for_project`` would otherwise open (and create) the repo's
+    ``.ll/issue_index.db``; ``IssueIndex(None)`` parses every file directly.
+    """
+    from little_loops.issue_index import IssueIndex
+
+    monkeypatch.setattr(IssueIndex, "for_project", classmethod(lambda cls, start: cls(None)))
+
+
 # =============================================================================
 # Session-log directory isolation (BUG-2489)
 # =============================================================================
@@ -698,8 +718,34 @@ def _isolate_session_log_dir(
     (e.g. ``TestSessionLogHostAware`` and the ``test_ll_logs.py`` host-aware tests)
     run *after* this fixture and win — composition, not conflict. Only the
     (empty, read-only-by-convention) home directory itself is session-scoped.
+
+    The same convention keeps ``ll-logs``' transcript index out of that home:
+    ``LL_TRANSCRIPT_INDEX=:memory:`` gives every index a fresh, empty database,
+    so nothing is written under ``~/.ll/``. Index tests set their own path.
     """
     monkeypatch.setattr(Path, "home", lambda: _shared_fake_home)
+    monkeypatch.setenv("LL_TRANSCRIPT_INDEX", ":memory:")
+    yield
+
+
+@pytest.fixture(scope="session")
+def _shared_user_cache(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One ``$XDG_CACHE_HOME`` per (xdist worker) process."""
+    return tmp_path_factory.mktemp("xdg_cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_user_cache_dir(
+    _shared_user_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Keep the compiled-loop disk cache out of the real ``~/.cache/little-loops``.
+
+    Unlike the fake home above, this directory IS written to (any test that loads
+    a loop with ``.loops/`` in its cwd stores an entry). Sharing it is safe:
+    entries are keyed by the loop's absolute path and cwd, and every hit is
+    re-validated against its recorded dependencies.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(_shared_user_cache))
     yield
 
 
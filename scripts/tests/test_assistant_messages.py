@@ -85,7 +85,7 @@ class TestAssistantMessagesMigration:
             conn.close()
 
     def test_schema_version_is_12(self) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
 
     def test_upgrade_from_v10_preserves_data(self, tmp_path: Path) -> None:
         """Simulate v10 → v11 upgrade: existing tables survive the migration."""
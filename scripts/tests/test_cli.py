@@ -2443,12 +2443,15 @@ class TestMainSprintAdditionalCoverage:
     """Additional coverage tests for main_sprint entry point."""
 
     @pytest.fixture
-    def sprint_project(self) -> Generator[Path, None, None]:
+    def sprint_project(self, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
         """Create a temporary project with sprint config."""
         import json
 
         with tempfile.TemporaryDirectory() as tmpdir:
             project = Path(tmpdir)
+            # SprintManager's default sprints_dir is the cwd-relative ".sprints";
+            # patching Path.cwd alone leaves it pointing at the real cwd.
+            monkeypatch.chdir(project)
             ll_dir = project / ".ll"
             ll_dir.mkdir()
             config = {
@@ -2582,9 +2585,9 @@ class TestMainSprintAdditionalCoverage:
         data = _json.loads(capsys.readouterr().out)
         assert data == []
 
-    def test_delete_not_found_error(self) -> None:
+    def test_delete_not_found_error(self, sprint_project: Path) -> None:
         """ll-sprint delete returns error for non-existent sprint."""
-        with patch("pathlib.Path.cwd", return_value=Path.cwd()):
+        with patch("pathlib.Path.cwd", return_value=sprint_project):
             with patch.object(sys, "argv", ["ll-sprint", "delete", "nonexistent-sprint"]):
                 from little_loops.cli import main_sprint
 
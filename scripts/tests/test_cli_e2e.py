@@ -217,11 +217,15 @@ class TestSprintPlanningWorkflow(E2ETestFixture):
         # Verify sprint was created
         assert sprint_file.exists()
 
-    def test_sprint_configuration_validation(self, e2e_project_dir: Path) -> None:
+    def test_sprint_configuration_validation(
+        self, e2e_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Sprint configuration should be validated."""
         from little_loops.config import BRConfig
         from little_loops.sprint import SprintManager
 
+        # SprintManager creates the relative sprints_dir against the cwd
+        monkeypatch.chdir(e2e_project_dir)
         config = BRConfig(e2e_project_dir)
         manager = SprintManager(config=config)
 
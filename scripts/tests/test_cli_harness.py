@@ -1010,6 +1010,16 @@ class TestDslSubcommandParser:
         args = _parse_harness_args(["dsl", str(tmp_path), "--verbose"])
         assert args.verbose is True
 
+    def test_dsl_subparser_jobs_and_cache_defaults(self, tmp_path: Path) -> None:
+        args = _parse_harness_args(["dsl", str(tmp_path)])
+        assert args.jobs == 1
+        assert args.cache is False
+
+    def test_dsl_subparser_jobs_and_cache(self, tmp_path: Path) -> None:
+        args = _parse_harness_args(["dsl", str(tmp_path), "-j", "4", "--cache"])
+        assert args.jobs == 4
+        assert args.cache is True
+
 
 # ---------------------------------------------------------------------------
 # TestCmdDsl
@@ -1535,6 +1545,150 @@ class TestCmdDsl:
 # ---------------------------------------------------------------------------
 
 
+class PromptEchoRunner(FakeRunner):
+    """FakeRunner that passes the prompt through as the invocation's last arg."""
+
+    def build_blocking_json(self, **kwargs: object) -> HostInvocation:
+        return HostInvocation(binary="claude", args=[str(kwargs["prompt"])])
+
+
+class TestCmdDslJobsAndCache:
+    """`ll-harness dsl --jobs N` ordering and the `--cache` result cache."""
+
+    def _make_tasks(self, tmp_path: Path, count: int) -> list[Path]:
+        paths = []
+        for i in range(count):
+            p = tmp_path / f"task{i}.yaml"
+            p.write_text(
+                f"prompt: Task {i} of the set.\n"
+                "blanks:\n  - answer\n"
+                f"expected:\n  answer: a{i}\n"
+                "source_dsl: loop\n"
+                "task_type: fill-in-the-blank\n"
+            )
+            paths.append(p)
+        return paths
+
+    @staticmethod
+    def _answer(cmd: list[str], **_: object) -> subprocess.CompletedProcess:
+        """Answer `Task i` with `a{i}` — except task 1, which answers wrong.
+
+        Earlier tasks sleep longer so that, with several jobs, they finish last.
+        """
+        import re
+        import time
+
+        if cmd[0] != "claude":  # git probes for the history rows
+            return _make_completed(returncode=1)
+        index = int(re.search(r"Task (\d+)", cmd[-1]).group(1))  # type: ignore[union-attr]
+        time.sleep(0.02 * (4 - index))
+        answer = "wrong" if index == 1 else f"a{index}"
+        return _make_completed(returncode=0, stdout=json.dumps({"answer": answer}))
+
+    def test_jobs_keeps_task_order_and_totals(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        self._make_tasks(tmp_path, 4)
+
+        outputs = {}
+        for jobs in (1, 4):
+            args = _make_namespace(runner="dsl", path=str(tmp_path), jobs=jobs)
+            with (
+                patch("little_loops.runner_spec.resolve_host", return_value=PromptEchoRunner()),
+                patch("subprocess.run", side_effect=self._answer),
+            ):
+                assert cmd_dsl(args) == 1
+            outputs[jobs] = capsys.readouterr().out
+
+        assert outputs[1] == outputs[4]
+        assert "DSL pass-rate: 3/4" in outputs[4]
+        assert "task1.yaml (answer: expected 'a1' got 'wrong')" in outputs[4]
+        labels = [line for line in outputs[4].splitlines() if "Task " in line]
+        assert [label.split("Task ")[1][0] for label in labels] == ["0", "1", "2", "3"]
+
+    def test_jobs_below_one_exits_2(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        self._make_tasks(tmp_path, 1)
+        args = _make_namespace(runner="dsl", path=str(tmp_path), jobs=0)
+
+        with patch("subprocess.run") as mock_run:
+            assert cmd_dsl(args) == 2
+        mock_run.assert_not_called()
+        assert "--jobs" in capsys.readouterr().err
+
+    def test_jobs_writes_one_row_per_task(self, tmp_path: Path) -> None:
+        from little_loops.session_store import recent
+
+        self._make_tasks(tmp_path, 3)
+        args = _make_namespace(runner="dsl", path=str(tmp_path), jobs=3)
+        with (
+            patch("little_loops.runner_spec.resolve_host", return_value=PromptEchoRunner()),
+            patch("subprocess.run", side_effect=self._answer),
+        ):
+            cmd_dsl(args)
+
+        rows = recent(kind="harness", limit=20)
+        aggregate = next(r for r in rows if r["runner"] == "dsl")
+        task_rows = [r for r in rows if r["runner"] == "dsl-task"]
+        assert sorted(r["target"] for r in task_rows) == ["task0.yaml", "task1.yaml", "task2.yaml"]
+        assert {r["parent_id"] for r in task_rows} == {aggregate["id"]}
+
+    def test_cache_replays_unchanged_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        tasks = self._make_tasks(tasks_dir, 2)
+        monkeypatch.chdir(tmp_path)
+        args = _make_namespace(runner="dsl", path=str(tasks_dir), cache=True)
+
+        def run(mock_run: MagicMock) -> int:
+            with (
+                patch("little_loops.runner_spec.resolve_host", return_value=PromptEchoRunner()),
+                patch("subprocess.run", mock_run),
+            ):
+                return cmd_dsl(args)
+
+        first = MagicMock(side_effect=self._answer)
+        assert run(first) == 1
+        assert first.call_count >= 2
+        first_out = capsys.readouterr().out
+
+        second = MagicMock(side_effect=self._answer)
+        assert run(second) == 1
+        prompt_calls = [c for c in second.call_args_list if c.args[0][0] == "claude"]
+        assert prompt_calls == []
+        second_out = capsys.readouterr().out
+        assert "cached: 2 of 2 task(s)" in second_out
+        assert second_out.split("\nDSL pass-rate")[0] == first_out.split("\nDSL pass-rate")[0]
+
+        # Editing a task file invalidates only that task's entry.
+        tasks[0].write_text(tasks[0].read_text().replace("Task 0 of", "Task 0 from"))
+        third = MagicMock(side_effect=self._answer)
+        run(third)
+        prompt_calls = [c for c in third.call_args_list if c.args[0][0] == "claude"]
+        assert len(prompt_calls) == 1
+        assert "cached: 1 of 2 task(s)" in capsys.readouterr().out
+
+    def test_cache_skips_infra_errors(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from little_loops.cli.harness import DSL_CACHE_DIR
+
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        self._make_tasks(tasks_dir, 1)
+        monkeypatch.chdir(tmp_path)
+        args = _make_namespace(runner="dsl", path=str(tasks_dir), cache=True)
+
+        with (
+            patch("little_loops.runner_spec.resolve_host", return_value=PromptEchoRunner()),
+            patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=1)),
+        ):
+            assert cmd_dsl(args) == 2
+
+        assert not list((tmp_path / DSL_CACHE_DIR).glob("*.json"))
+
+
 class TestHarnessEventPersistence:
     """ENH-2740: ll-harness call sites write harness_events rows."""
 
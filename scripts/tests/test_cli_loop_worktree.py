@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from little_loops.config import JsonlEventsConfig
 from little_loops.parallel.git_lock import GitLock
 from little_loops.worktree_utils import cleanup_worktree, setup_worktree
 
@@ -842,7 +843,7 @@ class TestCmdRunWorktree:
             mock_cfg.return_value.commands.rate_limits.circuit_breaker_enabled = False
             mock_cfg.return_value.design_tokens.enabled = False
             mock_cfg.return_value.extensions = []
-            mock_cfg.return_value.events = MagicMock(transports=[])
+            mock_cfg.return_value.events = MagicMock(transports=[], jsonl=JsonlEventsConfig())
 
             result = cmd_run("test-loop", args, loops_dir, logger)
 
@@ -878,7 +879,7 @@ class TestCmdRunWorktree:
             mock_cfg.return_value.commands.rate_limits.circuit_breaker_enabled = False
             mock_cfg.return_value.design_tokens.enabled = False
             mock_cfg.return_value.extensions = []
-            mock_cfg.return_value.events = MagicMock(transports=[])
+            mock_cfg.return_value.events = MagicMock(transports=[], jsonl=JsonlEventsConfig())
 
             cmd_run("test-loop", args, loops_dir, logger)
 
@@ -1032,7 +1033,7 @@ def _mock_br_config(mock_cfg: MagicMock, tmp_path: Path) -> None:
     mock_cfg.return_value.commands.rate_limits.circuit_breaker_enabled = False
     mock_cfg.return_value.design_tokens.enabled = False
     mock_cfg.return_value.extensions = []
-    mock_cfg.return_value.events = MagicMock(transports=[])
+    mock_cfg.return_value.events = MagicMock(transports=[], jsonl=JsonlEventsConfig())
 
 
 class TestCmdRunWorktreeAbsoluteLoopsDir:
@@ -226,6 +226,56 @@ class TestCmdRunClaimContention:
         assert second_entry is not None and second_entry.status == "done"
 
 
+class TestCmdRunWorkers:
+    """`ll-queue run --workers N` runs up to N entries concurrently."""
+
+    def test_workers_run_entries_concurrently(self, capsys: pytest.CaptureFixture[str]) -> None:
+        for i in range(4):
+            _add(f"entry-{i}")
+        capsys.readouterr()
+
+        # Both workers must be inside run_action at once for the barrier to
+        # release; a serial drainer would time out here.
+        barrier = threading.Barrier(2, timeout=10)
+        dispatched: list[str] = []
+        lock = threading.Lock()
+
+        def fake_run_action(spec: object) -> RunnerResult:
+            barrier.wait()
+            with lock:
+                dispatched.append(spec.target)  # type: ignore[attr-defined]
+            return RunnerResult(stdout="ok", stderr="", exit_code=0)
+
+        with patch("little_loops.runner_spec.run_action", side_effect=fake_run_action):
+            with patch("sys.argv", ["ll-queue", "run", "--workers", "2", "--json"]):
+                result = main_queue()
+
+        assert result == 0
+        records = json.loads(capsys.readouterr().out)
+        assert sorted(dispatched) == [f"entry-{i}" for i in range(4)]
+        assert sorted(r["status"] for r in records) == ["done"] * 4
+        assert {e.status for e in list_entries()} == {"done"}
+
+    def test_stop_set_before_drain_claims_nothing(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from little_loops.cli.queue import _drain_once
+
+        _add("never-run")
+        stop = threading.Event()
+        stop.set()
+
+        assert _drain_once(stop, threading.Event(), workers=3) == []
+        assert [e.status for e in list_entries()] == ["pending"]
+
+    def test_invalid_worker_count_is_a_usage_error(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with patch("sys.argv", ["ll-queue", "run", "--workers", "0"]):
+            result = main_queue()
+
+        assert result == 2
+        assert "--workers" in capsys.readouterr().err
+
+
 class TestQueueRunExitCodeVerdict:
     """ENH-2814: `ll-queue run` marks a nonzero-exiting action "failed"."""
 
@@ -557,6 +607,21 @@ class TestKillCurrentLoopProc:
         finally:
             queue_mod._current_loop_proc = None
 
+    def test_signals_every_inflight_proc(self) -> None:
+        import little_loops.cli.queue as queue_mod
+
+        procs = [MagicMock(pid=pid) for pid in (101, 102)]
+        for proc in procs:
+            proc.poll.return_value = None
+        queue_mod._inflight_loop_procs.update(procs)
+        try:
+            with patch("little_loops.cli.queue.os.getpgid", side_effect=lambda pid: pid):
+                with patch("little_loops.cli.queue.os.killpg") as mock_killpg:
+                    assert queue_mod._kill_current_loop_proc() is True
+            assert sorted(c.args[0] for c in mock_killpg.call_args_list) == [101, 102]
+        finally:
+            queue_mod._inflight_loop_procs.clear()
+
     def test_swallows_permission_error_from_killpg(self) -> None:
         import little_loops.cli.queue as queue_mod
 
@@ -118,8 +118,9 @@ class TestMainSprintDispatch:
         assert result == 0
         mocks["_cmd_sprint_run"].assert_called_once()
 
-    def test_list_routes_to_handler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_routes_to_handler(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """main_sprint dispatches 'list' to _cmd_sprint_list (no project root needed)."""
+        monkeypatch.chdir(tmp_path)  # SprintManager() creates a cwd-relative .sprints/
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "list"]):
@@ -128,8 +129,11 @@ class TestMainSprintDispatch:
         assert result == 0
         mocks["_cmd_sprint_list"].assert_called_once()
 
-    def test_list_alias_l_routes_to_handler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_alias_l_routes_to_handler(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Alias 'l' dispatches to _cmd_sprint_list."""
+        monkeypatch.chdir(tmp_path)
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "l"]):
@@ -190,8 +194,11 @@ class TestMainSprintDispatch:
         assert result == 0
         mocks["_cmd_sprint_edit"].assert_called_once()
 
-    def test_delete_routes_to_handler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_delete_routes_to_handler(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """main_sprint dispatches 'delete' to _cmd_sprint_delete (no project root needed)."""
+        monkeypatch.chdir(tmp_path)
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "delete", "test-sprint"]):
@@ -200,8 +207,11 @@ class TestMainSprintDispatch:
         assert result == 0
         mocks["_cmd_sprint_delete"].assert_called_once()
 
-    def test_delete_alias_del_routes_to_handler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_delete_alias_del_routes_to_handler(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Alias 'del' dispatches to _cmd_sprint_delete."""
+        monkeypatch.chdir(tmp_path)
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "del", "test-sprint"]):
@@ -419,8 +429,11 @@ class TestMainSprintArgForwarding:
         call_args = mocks["_cmd_sprint_show"].call_args[0][0]
         assert call_args.json is True
 
-    def test_list_forwards_json_short_form(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_forwards_json_short_form(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """-j short form for list sets json=True."""
+        monkeypatch.chdir(tmp_path)
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "list", "-j"]):
@@ -563,9 +576,15 @@ class TestHandoffThresholdValidation:
 class TestMainSprintEdgeCases:
     """Edge case and error path tests for main_sprint()."""
 
-    def test_run_with_config_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_run_with_config_flag(
+        self,
+        tmp_path: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """--config flag sets project root for commands that need it."""
         project = _make_sprint_project(tmp_path)
+        monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(
@@ -578,8 +597,9 @@ class TestMainSprintEdgeCases:
         assert result == 0
         mocks["_cmd_sprint_run"].assert_called_once()
 
-    def test_list_with_verbose_flag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_with_verbose_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """list --verbose forwards verbose=True."""
+        monkeypatch.chdir(tmp_path)
         mocks = _mock_handlers(monkeypatch)
 
         with patch.object(sys, "argv", ["ll-sprint", "list", "--verbose"]):
@@ -42,6 +42,7 @@ from little_loops.config import (
     GoNoGoConfig,
     HistoryConfig,
     IssuesConfig,
+    JsonlEventsConfig,
     LearningTestsConfig,
     LoopsConfig,
     LoopsGlyphsConfig,
@@ -676,6 +677,20 @@ class TestLoopsConfig:
 
         assert config.loops_dir == ".loops"
         assert config.queue_wait_timeout_seconds == 86400
+        assert config.state_persistence == "snapshot"
+        assert config.journal_fold_every == 200
+
+    def test_state_persistence_journal(self) -> None:
+        """journal mode and its fold interval are read from config."""
+        config = LoopsConfig.from_dict({"state_persistence": "journal", "journal_fold_every": 50})
+
+        assert config.state_persistence == "journal"
+        assert config.journal_fold_every == 50
+
+    def test_invalid_state_persistence_raises(self) -> None:
+        """An unknown state_persistence mode is rejected."""
+        with pytest.raises(ValueError, match="loops.state_persistence"):
+            LoopsConfig.from_dict({"state_persistence": "wal"})
 
 
 class TestQueueConfig:
@@ -2320,6 +2335,33 @@ class TestEventsConfig:
         assert config.webhook.batch_ms == 500
         assert config.webhook.headers == {"Authorization": "Bearer tok"}
 
+    def test_from_dict_with_jsonl_overrides(self) -> None:
+        """events.jsonl sub-object overrides the durability defaults."""
+        config = EventsConfig.from_dict(
+            {"jsonl": {"durability": "every_n", "every_n": 10, "interval_ms": 50}}
+        )
+
+        assert config.jsonl.durability == "every_n"
+        assert config.jsonl.every_n == 10
+        assert config.jsonl.interval_ms == 50
+
+
+class TestJsonlEventsConfig:
+    """Tests for JsonlEventsConfig dataclass."""
+
+    def test_defaults(self) -> None:
+        """JsonlEventsConfig defaults match the documented values."""
+        config = JsonlEventsConfig.from_dict({})
+
+        assert config.durability == "every_event"
+        assert config.every_n == 100
+        assert config.interval_ms == 250
+
+    def test_invalid_durability_raises(self) -> None:
+        """An unknown durability policy is rejected at load time."""
+        with pytest.raises(ValueError, match="events.jsonl.durability"):
+            JsonlEventsConfig.from_dict({"durability": "sometimes"})
+
 
 class TestSocketEventsConfig:
     """Tests for SocketEventsConfig dataclass."""
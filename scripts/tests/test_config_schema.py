@@ -1316,6 +1316,7 @@ _DATACLASS_SECTION_MAP: dict[str, str | None] = {
     "CodeQueryCodegraphConfig": "code_query",
     "CodeQueryConfig": "code_query",
     "TamperGuardConfig": "tamper_guard",
+    "JsonlEventsConfig": "events",
     "SocketEventsConfig": "events",
     "OTelEventsConfig": "events",
     "OTelAttributesConfig": "observability",
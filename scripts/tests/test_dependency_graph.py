@@ -9,6 +9,7 @@ import pytest
 
 from little_loops.dependency_graph import (
     DependencyGraph,
+    ReadySet,
     WaveContentionNote,
     refine_waves_for_contention,
 )
@@ -858,6 +859,87 @@ class TestGetExecutionWaves:
         assert len(waves) == 1
         assert waves[0][0].issue_id == "FEAT-001"
 
+    def test_matches_rescan_waves_on_large_graph(self) -> None:
+        """One-pass Kahn levels equal the repeated get_ready_issues() rescan."""
+        issues = [
+            make_issue(
+                f"FEAT-{i:03d}",
+                priority=f"P{i % 4}",
+                blocked_by=[f"FEAT-{j:03d}" for j in (i - 3, i - 7) if j >= 0 and i % 3],
+                depends_on=[f"FEAT-{i - 5:03d}"] if i >= 5 and i % 4 == 0 else [],
+            )
+            for i in range(60)
+        ]
+        graph = DependencyGraph.from_issues(issues)
+
+        expected: list[list[str]] = []
+        processed: set[str] = set()
+        while wave := graph.get_ready_issues(completed=processed):
+            expected.append([i.issue_id for i in wave])
+            processed |= {i.issue_id for i in wave}
+
+        assert [[i.issue_id for i in w] for w in graph.get_execution_waves()] == expected
+
+
+class TestReadySet:
+    """Tests for the incremental ReadySet."""
+
+    def test_initial_ready_matches_get_ready_issues(self) -> None:
+        issue_a = make_issue("FEAT-001", priority="P2")
+        issue_b = make_issue("FEAT-002", priority="P0")
+        issue_c = make_issue("FEAT-003", blocked_by=["FEAT-001"])
+        graph = DependencyGraph.from_issues([issue_a, issue_b, issue_c])
+
+        ready = graph.ready_set()
+
+        assert isinstance(ready, ReadySet)
+        assert ready.ready() == graph.get_ready_issues()
+
+    def test_mark_completed_returns_newly_unblocked(self) -> None:
+        issue_a = make_issue("FEAT-001")
+        issue_b = make_issue("FEAT-002")
+        issue_c = make_issue("FEAT-003", blocked_by=["FEAT-001", "FEAT-002"])
+        issue_d = make_issue("FEAT-004", depends_on=["FEAT-001"])
+        graph = DependencyGraph.from_issues([issue_a, issue_b, issue_c, issue_d])
+        ready = graph.ready_set()
+
+        assert [i.issue_id for i in ready.mark_completed("FEAT-001")] == ["FEAT-004"]
+        assert [i.issue_id for i in ready.mark_completed("FEAT-002")] == ["FEAT-003"]
+        assert [i.issue_id for i in ready.ready()] == ["FEAT-003", "FEAT-004"]
+        assert ready.remaining() == {"FEAT-003", "FEAT-004"}
+
+    def test_mark_completed_is_idempotent_and_ignores_unknown(self) -> None:
+        issue_a = make_issue("FEAT-001")
+        issue_b = make_issue("FEAT-002", blocked_by=["FEAT-001"])
+        graph = DependencyGraph.from_issues([issue_a, issue_b])
+        ready = graph.ready_set()
+
+        assert ready.mark_completed("BUG-999") == []
+        assert len(ready.mark_completed("FEAT-001")) == 1
+        assert ready.mark_completed("FEAT-001") == []
+        assert [i.issue_id for i in ready.ready()] == ["FEAT-002"]
+
+    def test_seed_completed_set(self) -> None:
+        issue_a = make_issue("FEAT-001")
+        issue_b = make_issue("FEAT-002", blocked_by=["FEAT-001"])
+        graph = DependencyGraph.from_issues([issue_a, issue_b])
+
+        ready = graph.ready_set(completed={"FEAT-001"})
+
+        assert [i.issue_id for i in ready.ready()] == ["FEAT-002"]
+        assert ready.remaining() == {"FEAT-002"}
+
+    def test_cycle_members_never_ready(self) -> None:
+        issue_a = make_issue("FEAT-001", blocked_by=["FEAT-002"])
+        issue_b = make_issue("FEAT-002", blocked_by=["FEAT-001"])
+        issue_c = make_issue("FEAT-003")
+        graph = DependencyGraph.from_issues([issue_a, issue_b, issue_c])
+        ready = graph.ready_set()
+
+        assert ready.mark_completed("FEAT-003") == []
+        assert ready.ready() == []
+        assert ready.remaining() == {"FEAT-001", "FEAT-002"}
+
 
 def _make_issue_with_content(
     issue_id: str,
@@ -487,6 +487,43 @@ class TestFindFileOverlapsSemanticAnalysis:
         assert len(proposals) == 0
         assert len(parallel_safe) == 1
 
+    def _overlapping_backlog(self, count: int) -> tuple[list[IssueInfo], dict[str, str]]:
+        issues = [make_issue(f"ENH-{n:03d}", priority=f"P{n % 3 + 1}") for n in range(count)]
+        contents = {
+            issue.issue_id: (
+                f"{'Refactor' if n % 2 else 'Add button to'} ActivityCard in the "
+                f"{'header' if n % 3 else 'sidebar'} of `src/pkg{n % 4}/view.tsx` "
+                f"and `src/pkg{n % 4}/styles.tsx`"
+            )
+            for n, issue in enumerate(issues)
+        }
+        return issues, contents
+
+    def test_signals_extracted_once_per_issue(self) -> None:
+        """Each issue's conflict signals are extracted once, not once per pair."""
+        from little_loops.dependency_mapper import analysis
+
+        issues, contents = self._overlapping_backlog(12)
+        with patch.object(
+            analysis, "_conflict_signals", wraps=analysis._conflict_signals
+        ) as extract:
+            proposals, parallel_safe = find_file_overlaps(issues, contents)
+
+        # 4 groups of 3 issues sharing both files -> 12 pairs over 12 issues.
+        assert len(proposals) + len(parallel_safe) == 12
+        assert extract.call_count == 12
+
+    def test_process_pool_matches_in_process(self) -> None:
+        """max_workers > 1 yields exactly the in-process proposals and pairs."""
+        from little_loops.dependency_mapper import analysis
+
+        issues, contents = self._overlapping_backlog(16)
+        expected = find_file_overlaps(issues, contents)
+        with patch.object(analysis, "_POOL_MIN_ISSUES", 1):
+            pooled = find_file_overlaps(issues, contents, max_workers=2)
+
+        assert pooled == expected
+
 
 # =============================================================================
 # BUG-680: overlap guard and default score tests
@@ -319,3 +319,55 @@ class TestEventBusFilter:
         assert len(all_events) == 2
         assert len(fsm_events) == 1
         assert fsm_events[0]["event"] == "state_enter"
+
+    def test_register_after_emit_invalidates_dispatch_cache(self) -> None:
+        """An observer registered after an event type was cached still receives it."""
+        first: list[dict[str, Any]] = []
+        late: list[dict[str, Any]] = []
+        bus = EventBus()
+        bus.register(lambda e: first.append(e), filter="state_*")
+
+        bus.emit({"event": "state_enter", "ts": "now"})
+        bus.register(lambda e: late.append(e), filter=["loop_*", "state_enter"])
+        bus.emit({"event": "state_enter", "ts": "now"})
+
+        assert len(first) == 2
+        assert len(late) == 1
+
+    def test_unregister_after_emit_invalidates_dispatch_cache(self) -> None:
+        """An unregistered observer stops receiving already-cached event types."""
+        received: list[dict[str, Any]] = []
+
+        def callback(e: dict[str, Any]) -> None:
+            received.append(e)
+
+        bus = EventBus()
+        bus.register(callback, filter="issue.*")
+        bus.emit({"event": "issue.closed", "ts": "now"})
+        bus.unregister(callback)
+        bus.emit({"event": "issue.closed", "ts": "now"})
+
+        assert len(received) == 1
+
+    def test_filter_character_class_and_single_char(self) -> None:
+        """Compiled filters keep fnmatch semantics for ``?`` and ``[...]``."""
+        received: list[str] = []
+        bus = EventBus()
+        bus.register(lambda e: received.append(e["event"]), filter=["loop_?tart", "issue.[cd]*"])
+
+        for name in ("loop_start", "loop_restart", "issue.closed", "issue.deferred", "issue.open"):
+            bus.emit({"event": name, "ts": "now"})
+
+        assert received == ["loop_start", "issue.closed", "issue.deferred"]
+
+    def test_dispatch_cache_is_bounded(self) -> None:
+        """Unbounded event-type values do not grow the dispatch cache without limit."""
+        received: list[dict[str, Any]] = []
+        bus = EventBus()
+        bus.register(lambda e: received.append(e), filter="task.*")
+
+        for i in range(2000):
+            bus.emit({"event": f"task.{i}", "ts": "now"})
+
+        assert len(received) == 2000
+        assert len(bus._dispatch) <= 512
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from little_loops.events import EventBus, LLEvent
 from little_loops.extension import (
     ExtensionLoader,
@@ -89,8 +91,11 @@ class TestExtensionLoader:
         extensions = ExtensionLoader.from_config([])
         assert extensions == []
 
-    def test_from_config_loads_valid_path(self) -> None:
+    def test_from_config_loads_valid_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Loads extension from a valid dotted module path."""
+        monkeypatch.chdir(tmp_path)  # NoopLoggerExtension() creates a cwd-relative .ll/
         # Use the reference extension as the test target
         extensions = ExtensionLoader.from_config(["little_loops.extension:NoopLoggerExtension"])
         assert len(extensions) == 1
@@ -101,8 +106,9 @@ class TestExtensionLoader:
         extensions = ExtensionLoader.from_config(["nonexistent.module:FakeExtension"])
         assert extensions == []
 
-    def test_from_config_multiple(self) -> None:
+    def test_from_config_multiple(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Multiple valid paths load multiple extensions."""
+        monkeypatch.chdir(tmp_path)
         extensions = ExtensionLoader.from_config(
             [
                 "little_loops.extension:NoopLoggerExtension",
@@ -117,8 +123,11 @@ class TestExtensionLoader:
             extensions = ExtensionLoader.from_entry_points()
         assert extensions == []
 
-    def test_load_all_combines_sources(self) -> None:
+    def test_load_all_combines_sources(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """load_all combines config and entry point extensions."""
+        monkeypatch.chdir(tmp_path)
         with patch("little_loops.extension.entry_points", return_value=[]):
             extensions = ExtensionLoader.load_all(
                 config_paths=["little_loops.extension:NoopLoggerExtension"]
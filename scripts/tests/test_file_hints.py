@@ -148,6 +148,17 @@ vim scripts/little_loops/cli.py
         hints = extract_file_hints(content)
         assert "scripts/little_loops/cli.py" not in hints.files
 
+    def test_cached_extraction_returns_independent_sets(self) -> None:
+        """Repeat extraction of the same content is cached but never shares sets."""
+        content = "### Files to Modify\n- `src/pkg/cli.py`\nscope: cli\n"
+        first = extract_file_hints(content, "ENH-001")
+        first.files.add("mutated.py")
+        second = extract_file_hints(content, "ENH-002")
+
+        assert second.files == {"src/pkg/cli.py"}
+        assert second.scopes == {"cli"}
+        assert second.issue_id == "ENH-002"
+
 
 class TestExtractWriteTargetFiles:
     """Tests for _extract_write_target_files — section-scoped extraction."""
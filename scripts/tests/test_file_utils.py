@@ -1,4 +1,4 @@
-"""Tests for atomic_write_json and acquire_lock in little_loops.file_utils (FEAT-1454)."""
+"""Tests for little_loops.file_utils: atomic_write_json, acquire_lock (FEAT-1454), BufferedJsonlWriter."""
 
 from __future__ import annotations
 
@@ -14,7 +14,7 @@ from unittest.mock import patch
 
 import pytest
 
-from little_loops.file_utils import acquire_lock, atomic_write_json
+from little_loops.file_utils import BufferedJsonlWriter, acquire_lock, atomic_write_json
 
 
 class TestAtomicWriteJson:
@@ -242,3 +242,86 @@ class TestFlockSameProcessContention:
                 contender.close()
         finally:
             holder.close()
+
+
+def _rows(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return [json.loads(line)["event"] for line in path.read_text().splitlines() if line]
+
+
+class TestBufferedJsonlWriter:
+    """Durability policies decide when buffered rows reach the file."""
+
+    def test_every_event_writes_through(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        writer = BufferedJsonlWriter(path)
+        writer.write({"event": "a"})
+        assert _rows(path) == ["a"]
+        writer.close()
+
+    def test_every_n_batches_rows(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        writer = BufferedJsonlWriter(path, policy="every_n", every_n=3)
+        writer.write({"event": "a"})
+        writer.write({"event": "b"})
+        assert path.exists() and _rows(path) == []
+        writer.write({"event": "c"})
+        assert _rows(path) == ["a", "b", "c"]
+        writer.close()
+
+    def test_durable_event_syncs_under_every_policy(self, tmp_path: Path) -> None:
+        """A transition row forces everything buffered before it out (BUG-2501)."""
+        for policy in ("every_n", "interval_ms", "on_state_transition"):
+            path = tmp_path / f"{policy}.jsonl"
+            writer = BufferedJsonlWriter(
+                path, policy=policy, interval_ms=60_000, durable_events={"state_enter"}
+            )
+            writer.write({"event": "action_output"})
+            assert _rows(path) == []
+            writer.write({"event": "state_enter"})
+            assert _rows(path) == ["action_output", "state_enter"], policy
+            writer.close()
+
+    def test_interval_flushes_without_further_writes(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        writer = BufferedJsonlWriter(path, policy="interval_ms", interval_ms=20)
+        writer.write({"event": "a"})
+        deadline = time.monotonic() + 5
+        while _rows(path) != ["a"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _rows(path) == ["a"]
+        writer.close()
+
+    def test_close_writes_buffered_rows(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        writer = BufferedJsonlWriter(path, policy="on_state_transition")
+        writer.write({"event": "a"})
+        writer.close()
+        assert _rows(path) == ["a"]
+        writer.write({"event": "late"})  # written through after close
+        assert _rows(path) == ["a", "late"]
+
+    def test_fsync_only_at_sync_points(self, tmp_path: Path) -> None:
+        writer = BufferedJsonlWriter(
+            tmp_path / "events.jsonl", policy="every_n", every_n=10, fsync=True
+        )
+        with patch("little_loops.file_utils.os.fsync") as fsync:
+            for _ in range(25):
+                writer.write({"event": "action_output"})
+            assert fsync.call_count == 2
+            writer.close()
+            assert fsync.call_count == 3
+
+    def test_reopens_after_file_is_unlinked(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        writer = BufferedJsonlWriter(path)
+        writer.write({"event": "old"})
+        path.unlink()
+        writer.write({"event": "new"})
+        assert _rows(path) == ["new"]
+        writer.close()
+
+    def test_unknown_policy_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="durability policy"):
+            BufferedJsonlWriter(tmp_path / "x.jsonl", policy="sometimes")
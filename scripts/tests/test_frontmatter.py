@@ -317,6 +317,109 @@ class TestParseFrontmatterCorpus:
                 )
 
 
+def _pure_load(text: str) -> object:
+    """The reference result: pure-Python BaseLoader, or ``YAMLError`` if it raises."""
+    import yaml
+
+    try:
+        return yaml.load(text, Loader=yaml.BaseLoader)
+    except yaml.YAMLError:
+        return yaml.YAMLError
+
+
+def _fast_load(text: str) -> object:
+    import yaml
+
+    from little_loops.frontmatter import _load_mapping
+
+    try:
+        return _load_mapping(text)
+    except yaml.YAMLError:
+        return yaml.YAMLError
+
+
+def _repo_frontmatter_blocks() -> list[tuple[str, str]]:
+    """Every frontmatter block body under the repo's markdown trees."""
+    from pathlib import Path
+
+    from little_loops.frontmatter import _iter_frontmatter_blocks
+
+    root = Path(__file__).resolve().parents[2]
+    trees = [".issues", "skills", "agents", "commands", "docs", "scripts/tests/fixtures"]
+    corpus: list[tuple[str, str]] = []
+    for tree in trees:
+        for path in sorted((root / tree).rglob("*.md")):
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            for n, block in enumerate(_iter_frontmatter_blocks(content)):
+                start, end = block.body_span
+                corpus.append((f"{path.relative_to(root)}#{n}", content[start:end]))
+    return corpus
+
+
+class TestFastPathEquivalence:
+    """The simple-subset scanner and libyaml route must match BaseLoader exactly."""
+
+    SIMPLE = [
+        "id: BUG-1\nstatus: open\npriority: P2",
+        "title: Fix it\ndiscovered_date: 2026-01-02\ncount: 007",
+        "status: null\nowner: ~\nnotes:",
+        "blocked_by:\n- ENH-1\n- 'FEAT-2'\nnext: x",
+        'blocked_by:\n  - ENH-1\n  - "FEAT-2"\n\n  - BUG-3',
+        "blocked_by: []\nrelates_to: [ENH-1, FEAT-22]",
+        "title: a long wrapped\n  title that continues\n  over lines\nid: X-1",
+        "title: 'it''s quoted: with colon'\nurl: http://x.test/a#b",
+        "# leading comment\nkey: value  \ndup: one\ndup: two",
+        "title: Pi Adapter — Wire Tests\nc: C#",
+    ]
+    NOT_SIMPLE = [
+        "title: a # trailing comment",
+        'title: "Decisions Log \\u2014 Skill Bridges"',
+        "description: |\n  block scalar\n",
+        "description: >-\n  folded\n  scalar\n",
+        "title: 'wrapped single\n  quoted'",
+        "title: first\n\n  after a blank line",
+        "nested:\n  key: value",
+        "items:\n  - name: a\n    kind: b",
+        "anchor: &a x\nalias: *a",
+        "tagged: !custom value",
+        "key:\tvalue",
+        "bad: a: b",
+        "[a, b]",
+        "- orphan item",
+        "key: [a, [b]]",
+        "key: [a, 'b']",
+        "  indented: key",
+        "",
+    ]
+
+    @pytest.mark.parametrize("text", SIMPLE)
+    def test_simple_shapes_take_the_fast_path(self, text: str) -> None:
+        from little_loops.frontmatter import _scan_simple_block
+
+        fast = _scan_simple_block(text)
+        reference = _pure_load(text)
+        assert isinstance(reference, dict)
+        assert fast == reference
+        assert list(fast) == list(reference)
+
+    @pytest.mark.parametrize("text", NOT_SIMPLE)
+    def test_other_shapes_fall_through_unchanged(self, text: str) -> None:
+        from little_loops.frontmatter import _scan_simple_block
+
+        assert _scan_simple_block(text) is None
+        assert _fast_load(text) == _pure_load(text)
+
+    def test_every_repo_frontmatter_block_matches_base_loader(self) -> None:
+        corpus = _repo_frontmatter_blocks()
+        if not corpus:
+            pytest.skip("no frontmatter corpus present")
+        mismatches = [name for name, text in corpus if _fast_load(text) != _pure_load(text)]
+        assert not mismatches, mismatches[:10]
+
+
 class TestParseSkillFrontmatter:
     """Tests for parse_skill_frontmatter — the SKILL.md-specific helper."""
 
@@ -792,9 +792,11 @@ class TestEvaluateDispatcher:
         ],
     )
     def test_dispatch_nonzero_exit_does_not_affect_exit_code_aware_evaluators(
-        self, eval_type: str
+        self, eval_type: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """BUG-1815: exit-code-aware evaluators are exempt from the non-zero short-circuit."""
+        # diff_stall/action_stall keep their counters under ./.loops/tmp.
+        monkeypatch.chdir(tmp_path)
         config = EvaluateConfig(type=eval_type)  # type: ignore[arg-type]
         ctx = InterpolationContext()
         result = evaluate(config, output="", exit_code=1, context=ctx)
@@ -0,0 +1,330 @@
+"""Tests for little_loops.fsm.loop_cache (compiled-loop cache)."""
+
+from __future__ import annotations
+
+import os
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from little_loops.fsm import loop_cache
+from little_loops.fsm.fragments import load_loop_spec
+from little_loops.fsm.validation import is_runnable_loop, load_and_validate, structural_rules
+
+_LOOP = textwrap.dedent(
+    """\
+    name: cached-loop
+    initial: run
+    scope: ["."]
+    states:
+      run:
+        action: "echo hi"
+        action_type: shell
+        next: done
+      done:
+        terminal: true
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.delenv("LL_LOOP_CACHE", raising=False)
+    loop_cache.clear_memory_cache()
+    yield
+    loop_cache.clear_memory_cache()
+
+
+def _compiled_dir(tmp_path: Path) -> Path:
+    return tmp_path / "xdg-cache" / "little-loops" / "loops" / "compiled"
+
+
+@pytest.fixture
+def compile_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every uncached compile performed by load_and_validate."""
+    calls: list[Path] = []
+    real = structural_rules._compile_loop
+
+    def counting(path: Path, orchestration_request_path: str | None):  # type: ignore[no-untyped-def]
+        calls.append(path)
+        return real(path, orchestration_request_path)
+
+    monkeypatch.setattr(structural_rules, "_compile_loop", counting)
+    return calls
+
+
+class TestLoadAndValidateCache:
+    def test_repeated_load_is_served_from_cache(
+        self, tmp_path: Path, compile_calls: list[Path]
+    ) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        first, _ = load_and_validate(loop)
+        second, _ = load_and_validate(loop)
+
+        assert compile_calls == [loop]
+        assert second == first
+
+    def test_cache_hit_returns_independent_copy(self, tmp_path: Path) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        first, _ = load_and_validate(loop)
+        first.max_iterations = 999
+        second, _ = load_and_validate(loop)
+
+        assert second.max_iterations != 999
+
+    def test_editing_loop_file_invalidates(self, tmp_path: Path, compile_calls: list[Path]) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+        load_and_validate(loop)
+
+        loop.write_text(_LOOP.replace("echo hi", "echo bye"))
+        fsm, _ = load_and_validate(loop)
+
+        assert len(compile_calls) == 2
+        assert fsm.states["run"].action == "echo bye"
+
+    def test_editing_parent_invalidates(self, tmp_path: Path, compile_calls: list[Path]) -> None:
+        (tmp_path / "base.yaml").write_text(_LOOP)
+        child = tmp_path / "child.yaml"
+        child.write_text("from: base\nname: child\n")
+        load_and_validate(child)
+
+        (tmp_path / "base.yaml").write_text(_LOOP.replace("echo hi", "echo parent"))
+        fsm, _ = load_and_validate(child)
+
+        assert len(compile_calls) == 2
+        assert fsm.states["run"].action == "echo parent"
+
+    def test_shadowing_parent_invalidates(self, tmp_path: Path, compile_calls: list[Path]) -> None:
+        """A new file earlier in the resolution order changes the parent lookup."""
+        (tmp_path / "base.yaml").write_text(_LOOP)
+        child = tmp_path / "child.yaml"
+        child.write_text("from: base\nname: child\n")
+        load_and_validate(child)
+
+        (tmp_path / "base.fsm.yaml").write_text(_LOOP.replace("echo hi", "echo shadow"))
+        fsm, _ = load_and_validate(child)
+
+        assert len(compile_calls) == 2
+        assert fsm.states["run"].action == "echo shadow"
+
+    def test_editing_fragment_library_invalidates(
+        self, tmp_path: Path, compile_calls: list[Path]
+    ) -> None:
+        lib = tmp_path / "lib"
+        lib.mkdir()
+        (lib / "common.yaml").write_text(
+            "fragments:\n  say:\n    action_type: shell\n    action: echo one\n"
+        )
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(
+            _LOOP.replace("states:", "import:\n  - lib/common.yaml\nstates:").replace(
+                '    action: "echo hi"\n    action_type: shell\n', "    fragment: say\n"
+            )
+        )
+        assert load_and_validate(loop)[0].states["run"].action == "echo one"
+
+        (lib / "common.yaml").write_text(
+            "fragments:\n  say:\n    action_type: shell\n    action: echo two\n"
+        )
+
+        assert load_and_validate(loop)[0].states["run"].action == "echo two"
+        assert len(compile_calls) == 2
+
+    def test_creating_missing_loop_reference_invalidates(self, tmp_path: Path) -> None:
+        parent = tmp_path / "parent.yaml"
+        parent.write_text(
+            _LOOP.replace('    action: "echo hi"\n    action_type: shell\n', "    loop: kid\n")
+        )
+        _, violations = load_and_validate(parent, raise_on_error=False)
+        assert any("'kid' does not resolve" in str(v) for v in violations)
+
+        (tmp_path / "kid.yaml").write_text(_LOOP)
+        _, violations = load_and_validate(parent, raise_on_error=False)
+
+        assert not any("'kid' does not resolve" in str(v) for v in violations)
+
+    def test_orchestration_request_path_is_part_of_key(
+        self, tmp_path: Path, compile_calls: list[Path]
+    ) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        load_and_validate(loop)
+        load_and_validate(loop, orchestration_request_path="req.md")
+
+        assert len(compile_calls) == 2
+
+    def test_errors_still_raise_on_cache_hit(self, tmp_path: Path) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP.replace("next: done", "next: nowhere"))
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="nowhere"):
+                load_and_validate(loop)
+
+    def test_env_opt_out_bypasses_cache(
+        self, tmp_path: Path, compile_calls: list[Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("LL_LOOP_CACHE", "0")
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        load_and_validate(loop)
+        load_and_validate(loop)
+
+        assert len(compile_calls) == 2
+        assert not (tmp_path / ".loops" / ".cache").exists()
+
+    def test_cached_child_dependencies_propagate_to_parent(self, tmp_path: Path) -> None:
+        """A child loaded from cache still invalidates the parent when edited."""
+        kid = tmp_path / "kid.yaml"
+        kid.write_text(
+            _LOOP.replace("states:", "parameters:\n  target:\n    type: string\nstates:")
+        )
+        parent = tmp_path / "parent.yaml"
+        parent.write_text(
+            _LOOP.replace(
+                '    action: "echo hi"\n    action_type: shell\n',
+                "    loop: kid\n    with:\n      target: x\n",
+            )
+        )
+        load_and_validate(kid)  # child entry is cached before the parent's
+        _, violations = load_and_validate(parent, raise_on_error=False)
+        assert not any("with.target" in str(v) for v in violations)
+
+        kid.write_text(_LOOP.replace("states:", "parameters:\n  other:\n    type: string\nstates:"))
+        _, violations = load_and_validate(parent, raise_on_error=False)
+
+        assert any("'with.target' is not a declared parameter" in str(v) for v in violations)
+
+
+class TestDiskLayer:
+    def test_no_disk_cache_without_loops_dir(self, tmp_path: Path) -> None:
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        load_and_validate(loop)
+
+        assert not (tmp_path / ".loops").exists()
+
+    def test_disk_entry_survives_memory_clear(
+        self, tmp_path: Path, compile_calls: list[Path]
+    ) -> None:
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        load_and_validate(loop)
+        loop_cache.clear_memory_cache()
+        load_and_validate(loop)
+
+        assert len(compile_calls) == 1
+        assert len(list(_compiled_dir(tmp_path).glob("*.pickle"))) == 1
+        assert not (tmp_path / ".loops" / ".cache").exists()
+
+    def test_entries_live_in_a_private_user_directory(self, tmp_path: Path) -> None:
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+
+        load_and_validate(loop)
+
+        assert loop_cache.cache_root() == tmp_path / "xdg-cache" / "little-loops" / "loops"
+        assert _compiled_dir(tmp_path).stat().st_mode & 0o077 == 0
+
+    def test_relative_xdg_cache_home_is_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", "relative/cache")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+
+        assert loop_cache.cache_root() == tmp_path / "home" / ".cache" / "little-loops" / "loops"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership check")
+    def test_directory_owned_by_another_user_is_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compile_calls: list[Path]
+    ) -> None:
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+        load_and_validate(loop)
+        loop_cache.clear_memory_cache()
+        monkeypatch.setattr(os, "getuid", lambda: _compiled_dir(tmp_path).stat().st_uid + 1)
+
+        load_and_validate(loop)
+
+        assert len(compile_calls) == 2
+
+    def test_schema_file_is_part_of_the_code_fingerprint(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        package = tmp_path / "fsm"
+        package.mkdir()
+        (package / "loop_cache.py").write_text("")
+        schema = package / "fsm-loop-schema.json"
+        schema.write_text("{}")
+        monkeypatch.setattr(loop_cache, "__file__", str(package / "loop_cache.py"))
+        loop_cache._code_fingerprint.cache_clear()
+        try:
+            before = loop_cache._code_fingerprint()
+            loop_cache._code_fingerprint.cache_clear()
+            schema.write_text('{"type": "object"}')
+            assert loop_cache._code_fingerprint() != before
+        finally:
+            loop_cache._code_fingerprint.cache_clear()
+
+    def test_superseded_entries_are_pruned(self, tmp_path: Path) -> None:
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+        load_and_validate(loop)
+
+        loop.write_text(_LOOP.replace("echo hi", "echo bye"))
+        load_and_validate(loop)
+
+        assert len(list(_compiled_dir(tmp_path).glob("*.pickle"))) == 1
+
+    def test_corrupt_entry_is_recompiled(self, tmp_path: Path, compile_calls: list[Path]) -> None:
+        (tmp_path / ".loops").mkdir()
+        loop = tmp_path / "loop.yaml"
+        loop.write_text(_LOOP)
+        load_and_validate(loop)
+        for entry in _compiled_dir(tmp_path).glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+        loop_cache.clear_memory_cache()
+
+        fsm, _ = load_and_validate(loop)
+
+        assert fsm.name == "cached-loop"
+        assert len(compile_calls) == 2
+
+
+class TestLoopSpec:
+    def test_is_runnable_loop_tracks_parent_changes(self, tmp_path: Path) -> None:
+        (tmp_path / "base.yaml").write_text(_LOOP)
+        child = tmp_path / "child.yaml"
+        child.write_text("from: base\nname: child\n")
+        assert is_runnable_loop(child) is True
+
+        (tmp_path / "base.yaml").write_text("fragments: {}\n")
+
+        assert is_runnable_loop(child) is False
+
+    def test_load_loop_spec_reports_failed_inheritance(self, tmp_path: Path) -> None:
+        child = tmp_path / "child.yaml"
+        child.write_text("from: missing-parent\nname: child\n")
+
+        raw, resolved = load_loop_spec(child)
+
+        assert raw == {"from": "missing-parent", "name": "child"}
+        assert resolved is None
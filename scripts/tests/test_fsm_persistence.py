@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from little_loops.config import JsonlEventsConfig
 from little_loops.fsm.executor import ActionResult
 from little_loops.fsm.persistence import (
     LoopState,
@@ -368,8 +369,11 @@ class TestStatePersistence:
         real_open = persistence.open if hasattr(persistence, "open") else open
 
         class _TrackingFile:
+            # The events writer keeps one long-lived handle (no ``with``), so
+            # the proxy must work without ``__enter__`` having been called.
             def __init__(self, real: Any) -> None:
                 self._real = real
+                self._inner = real
 
             def __enter__(self) -> _TrackingFile:
                 self._cm = self._real.__enter__()
@@ -422,6 +426,41 @@ class TestStatePersistence:
                 f"after {i + 1} append(s), separate fd saw {len(lines)} lines"
             )
 
+    def test_on_state_transition_buffers_until_transition(self, tmp_loops_dir: Path) -> None:
+        """Non-transition rows wait for the next transition event, which is durable."""
+        persistence = StatePersistence(
+            "test-loop",
+            tmp_loops_dir,
+            jsonl_config=JsonlEventsConfig(durability="on_state_transition"),
+        )
+        persistence.initialize()
+
+        persistence.append_event({"event": "action_output", "line": "building"})
+        assert persistence.events_file.read_text() == ""
+
+        persistence.append_event({"event": "state_enter", "state": "check"})
+        lines = persistence.events_file.read_text().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["action_output", "state_enter"]
+        persistence.close()
+
+    def test_read_events_includes_buffered_rows(self, tmp_loops_dir: Path) -> None:
+        """read_events() and archive_run() sync rows still held by the writer."""
+        persistence = StatePersistence(
+            "test-loop",
+            tmp_loops_dir,
+            jsonl_config=JsonlEventsConfig(durability="every_n", every_n=100),
+        )
+        persistence.initialize()
+        persistence.append_event({"event": "action_output", "ts": "2024-01-15T10:30:00Z"})
+
+        assert [e["event"] for e in persistence.read_events()] == ["action_output"]
+
+        persistence.append_event({"event": "action_output", "ts": "2024-01-15T10:30:01Z"})
+        archive_path = persistence.archive_run()
+        assert archive_path is not None
+        assert len((archive_path / "events.jsonl").read_text().splitlines()) == 2
+        persistence.close()
+
     def test_read_events_returns_empty_if_missing(self, tmp_loops_dir: Path) -> None:
         """read_events() returns empty list if no file exists."""
         persistence = StatePersistence("test-loop", tmp_loops_dir)
@@ -3182,3 +3221,183 @@ class TestListRunningLoopsCrossInstanceSuppression:
         assert names.count("myloop") == 1, (
             "Same-stem PID and state file must produce exactly one entry"
         )
+
+
+class TestStateJournal:
+    """Tests for journal-mode state persistence (append deltas, fold periodically)."""
+
+    @pytest.fixture
+    def persistence(self, tmp_path: Path) -> StatePersistence:
+        p = StatePersistence(
+            "test-loop",
+            tmp_path / ".loops",
+            instance_id="test-loop-20260101T000000",
+            state_persistence="journal",
+            journal_fold_every=100,
+        )
+        p.initialize()
+        return p
+
+    @staticmethod
+    def _state(iteration: int, status: str = "running") -> LoopState:
+        return LoopState(
+            loop_name="test-loop",
+            current_state="fix" if iteration % 2 else "check",
+            iteration=iteration,
+            captured={"out": {"output": str(iteration)}},
+            prev_result=None,
+            last_result=None,
+            started_at="2026-01-01T00:00:00Z",
+            updated_at="",
+            status=status,
+            messages=[f"message {n}" for n in range(iteration)],
+            context={"input": "x", "step": iteration},
+        )
+
+    def test_saves_after_the_first_append_to_the_journal(
+        self, persistence: StatePersistence
+    ) -> None:
+        for iteration in range(1, 6):
+            persistence.save_state(self._state(iteration))
+
+        snapshot = json.loads(persistence.state_file.read_text())
+        assert snapshot["iteration"] == 1
+        assert persistence.journal_file.exists()
+
+        loaded = persistence.load_state()
+        assert loaded is not None
+        assert loaded.iteration == 5
+        assert loaded.current_state == "fix"
+        assert loaded.messages == [f"message {n}" for n in range(5)]
+        assert loaded.captured == {"out": {"output": "5"}}
+        assert loaded.context == {"input": "x", "step": 5}
+
+    def test_journal_is_far_smaller_than_repeated_snapshots(
+        self, persistence: StatePersistence
+    ) -> None:
+        for iteration in range(1, 51):
+            persistence.save_state(self._state(iteration))
+
+        snapshot_size = len(json.dumps(self._state(50).to_dict(include_context=True), indent=2))
+        assert persistence.journal_file.stat().st_size < 10 * snapshot_size
+
+    def test_in_place_mutation_is_journaled(self, persistence: StatePersistence) -> None:
+        state = self._state(1)
+        persistence.save_state(state)
+        state.captured["out"]["output"] = "changed"
+        state.context.pop("step")
+        persistence.save_state(state)
+
+        loaded = persistence.load_state()
+        assert loaded is not None
+        assert loaded.captured == {"out": {"output": "changed"}}
+        assert loaded.context == {"input": "x"}
+
+    def test_folds_every_n_saves(self, tmp_path: Path) -> None:
+        persistence = StatePersistence(
+            "test-loop", tmp_path / ".loops", state_persistence="journal", journal_fold_every=3
+        )
+        persistence.initialize()
+        for iteration in range(1, 6):
+            persistence.save_state(self._state(iteration))
+
+        # saves 1 and 5 are snapshots; 2-4 were journaled and then folded away
+        assert json.loads(persistence.state_file.read_text())["iteration"] == 5
+        assert not persistence.journal_file.exists()
+
+    def test_non_running_status_writes_a_snapshot(self, persistence: StatePersistence) -> None:
+        persistence.save_state(self._state(1))
+        persistence.save_state(self._state(2))
+        persistence.save_state(self._state(3, status="completed"))
+
+        assert json.loads(persistence.state_file.read_text())["status"] == "completed"
+        assert not persistence.journal_file.exists()
+
+    def test_torn_tail_record_is_ignored(self, persistence: StatePersistence) -> None:
+        persistence.save_state(self._state(1))
+        persistence.save_state(self._state(2))
+        with open(persistence.journal_file, "ab") as f:
+            f.write(b'\x00\x00\x01\x00{"set":')
+
+        loaded = persistence.load_state()
+        assert loaded is not None
+        assert loaded.iteration == 2
+
+    def test_external_snapshot_is_not_overridden_by_a_stale_base(
+        self, persistence: StatePersistence, tmp_path: Path
+    ) -> None:
+        persistence.save_state(self._state(1))
+        persistence.save_state(self._state(2))
+        other = StatePersistence(
+            "test-loop", tmp_path / ".loops", instance_id="test-loop-20260101T000000"
+        )
+        stopped = other.load_state()
+        assert stopped is not None
+        stopped.status = "user_stopped"
+        other.save_state(stopped)
+
+        persistence.save_state(self._state(3))
+
+        loaded = persistence.load_state()
+        assert loaded is not None
+        assert (loaded.iteration, loaded.status) == (3, "running")
+
+    def test_crash_before_journal_unlink_keeps_the_new_snapshot(
+        self, persistence: StatePersistence
+    ) -> None:
+        """A journal surviving its fold (crash after os.replace) is not replayed."""
+        for iteration in range(1, 4):
+            persistence.save_state(self._state(iteration))
+        stale_journal = persistence.journal_file.read_bytes()
+
+        persistence.save_state(self._state(8, status="interrupted"))
+        # The crash window: state.json was replaced but the unlink never ran.
+        persistence.journal_file.write_bytes(stale_journal)
+
+        loaded = persistence.load_state()
+        assert loaded is not None
+        assert (loaded.iteration, loaded.status) == (8, "interrupted")
+        assert loaded.messages == [f"message {n}" for n in range(8)]
+
+    def test_readers_replay_the_journal(self, persistence: StatePersistence) -> None:
+        for iteration in range(1, 4):
+            persistence.save_state(self._state(iteration))
+
+        [state] = list_running_loops(persistence.loops_dir)
+        assert state.iteration == 3
+
+    def test_archive_folds_the_journal(self, persistence: StatePersistence) -> None:
+        for iteration in range(1, 4):
+            persistence.save_state(self._state(iteration))
+
+        archive_dir = persistence.archive_run()
+
+        assert archive_dir is not None
+        assert json.loads((archive_dir / "state.json").read_text())["iteration"] == 3
+        assert not persistence.journal_file.exists()
+
+    def test_executor_run_in_journal_mode(self, tmp_path: Path) -> None:
+        fsm = FSMLoop(
+            name="test-loop",
+            initial="check",
+            states={
+                "check": StateConfig(action="echo check", on_yes="done", on_no="fix"),
+                "fix": StateConfig(action="echo fix", next="check"),
+                "done": StateConfig(terminal=True),
+            },
+        )
+        results = [ActionResult(output="", stderr="", exit_code=1, duration_ms=1)] * 6
+        executor = PersistentExecutor(
+            fsm,
+            loops_dir=tmp_path / ".loops",
+            action_runner=MockActionRunner(results),
+            state_persistence="journal",
+        )
+
+        result = executor.run()
+
+        state = executor.persistence.load_state()
+        assert state is not None
+        assert (state.current_state, state.iteration) == (result.final_state, result.iterations)
+        assert state.status == "completed"
+        assert not executor.persistence.journal_file.exists()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
+from little_loops import history_reader
 from little_loops.history_reader import (
     FileEvent,
     IssueEvent,
@@ -16,6 +19,7 @@ from little_loops.history_reader import (
     issue_effort,
     lookup_session_metadata,
     project_digest,
+    read_connection,
     recent_file_events,
     recent_issue_velocity,
     related_issue_events,
@@ -1502,6 +1506,111 @@ class TestSummaryDagRetrieval:
         assert len(auth_results) == 5, f"Expected 5 auth matches via root, got {len(auth_results)}"
 
 
+class TestLlGrepTrigramPrefilter:
+    """ll_grep narrows candidates through the message_trigrams index."""
+
+    _MESSAGES = [
+        "Connection timeout while fetching BUG-101",
+        "connection REFUSED by upstream",
+        "the İndex was rebuilt",
+        "nothing interesting here",
+        "ab",
+    ]
+
+    def _make_db(self, tmp_path: Path) -> Path:
+        from little_loops.session_store import connect
+
+        db = tmp_path / "history.db"
+        conn = connect(db)
+        try:
+            for n, content in enumerate(self._MESSAGES):
+                conn.execute(
+                    "INSERT INTO message_events(ts, session_id, content) VALUES(?, ?, ?)",
+                    (f"2026-01-01T00:00:0{n}Z", "s1", content),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        return db
+
+    def test_trigram_query_extracts_required_literals(self) -> None:
+        from little_loops.history_reader import _trigram_query
+
+        assert _trigram_query("FSM runner") == '"FSM runner"'
+        assert _trigram_query(r"BUG-\d+") == '"BUG-"'
+        assert _trigram_query("error: (closed|refused)") == '"error: " AND ("closed" OR "refused")'
+        assert _trigram_query("(fetch)?ing") is None
+        assert _trigram_query(r"\d{3}") is None
+        assert _trigram_query("abc|.*") is None
+        assert _trigram_query("unbalanced(") is None
+        # i/I also match Turkish İ/ı under re.IGNORECASE, so they split a run.
+        assert _trigram_query("index") == '"ndex"'
+
+    def test_prefiltered_results_match_a_full_scan(self, tmp_path: Path) -> None:
+        from little_loops.history_reader import ll_grep
+
+        db = self._make_db(tmp_path)
+        patterns = [
+            "connection",
+            r"BUG-\d+",
+            "(timeout|refused)",
+            "index",
+            "ab",
+            r"\w+ing",
+            "upstream$",
+            "zzz-no-match",
+        ]
+        for pattern in patterns:
+            prefiltered = ll_grep(pattern, db=db)
+            with patch.object(history_reader, "_trigram_query", return_value=None):
+                scanned = ll_grep(pattern, db=db)
+            assert [r.message_event_id for r in prefiltered] == [
+                r.message_event_id for r in scanned
+            ], pattern
+        assert [r.content for r in ll_grep("index", db=db)] == ["the İndex was rebuilt"]
+
+    def test_unqueryable_index_falls_back_to_scan(self, tmp_path: Path) -> None:
+        from little_loops.history_reader import ll_grep
+
+        db = self._make_db(tmp_path)
+        with patch.object(history_reader, "_trigram_query", return_value='"unterminated'):
+            results = ll_grep("refused", db=db)
+        assert [r.content for r in results] == ["connection REFUSED by upstream"]
+
+    def test_old_sqlite_migrates_without_the_index_and_scans(self, tmp_path: Path) -> None:
+        """Before SQLite 3.34 v43 records the index as unavailable; ll_grep scans."""
+        import sqlite3
+
+        from little_loops.history_reader import ll_grep
+        from little_loops.session_store import SCHEMA_VERSION
+
+        with patch.object(sqlite3, "sqlite_version_info", (3, 31, 1)):
+            db = self._make_db(tmp_path)
+
+        conn = sqlite3.connect(str(db))
+        try:
+            assert conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone() == (str(SCHEMA_VERSION),)
+            assert conn.execute(
+                "SELECT value FROM meta WHERE key = 'message_trigrams'"
+            ).fetchone() == ("unavailable",)
+            assert (
+                conn.execute(
+                    "SELECT name FROM sqlite_master WHERE name = 'message_trigrams'"
+                ).fetchone()
+                is None
+            )
+        finally:
+            conn.close()
+        with patch.object(
+            history_reader, "_ll_grep_rows", wraps=history_reader._ll_grep_rows
+        ) as rows:
+            results = ll_grep(r"BUG-\d+", db=db)
+        assert [r.content for r in results] == ["Connection timeout while fetching BUG-101"]
+        assert [call.args[-1] for call in rows.call_args_list] == [None]
+
+
 class TestCondensedNodesForIssue:
     """condensed_nodes_for_issue() returns level-0 condensed nodes for an issue's sessions (ENH-2231)."""
 
@@ -3145,3 +3254,80 @@ class TestReadBaseDirty:
         db = tmp_path / "history.db"
         db.write_text("this is not a sqlite database")
         assert read_base_dirty("ENH-3142", db=db) is None
+
+
+class TestReadConnectionCache:
+    """Cached, schema-checked-once read connections and read_connection()."""
+
+    def _add_correction(self, db: Path, content: str) -> None:
+        conn = connect(db)
+        try:
+            ts = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+            conn.execute(
+                "INSERT INTO user_corrections(ts, session_id, content, source) VALUES(?, ?, ?, ?)",
+                (ts, "sess-a", content, "user"),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_schema_is_ensured_once_per_database(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        with patch.object(history_reader, "ensure_db", wraps=ensure_db) as ensure:
+            find_user_corrections("x", db=db)
+            search("x", db=db)
+            recent_file_events("x", db=db)
+        assert ensure.call_count == 1
+
+    def test_cached_handle_sees_later_writes(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        self._add_correction(db, "use a set")
+        assert len(find_user_corrections("set", db=db)) == 1
+        self._add_correction(db, "use a set, really")
+        assert len(find_user_corrections("set", db=db)) == 2
+
+    def test_replaced_database_is_reopened(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        self._add_correction(db, "old database row")
+        assert len(find_user_corrections("old", db=db)) == 1
+        for path in tmp_path.glob("test.db*"):
+            path.unlink()
+        self._add_correction(db, "new database row")
+        assert find_user_corrections("old", db=db) == []
+        assert len(find_user_corrections("new", db=db)) == 1
+
+    def test_close_leaves_cached_handle_usable(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        conn = history_reader._connect_readonly(db)
+        assert conn is not None
+        conn.close()
+        assert history_reader._connect_readonly(db) is conn
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_read_connection_shares_one_snapshot(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        self._add_correction(db, "first fix")
+        with read_connection(db) as conn:
+            assert conn is not None
+            assert history_reader._connect_readonly(db) is conn
+            assert len(find_user_corrections("fix", db=db)) == 1
+            self._add_correction(db, "second fix")
+            assert len(find_user_corrections("fix", db=db)) == 1
+        assert len(find_user_corrections("fix", db=db)) == 2
+
+    def test_cache_is_bounded(self, tmp_path: Path) -> None:
+        for n in range(history_reader._READ_POOL_SIZE + 3):
+            find_user_corrections("x", db=tmp_path / f"db{n}.db")
+        assert len(history_reader._read_handles()) <= history_reader._READ_POOL_SIZE
+
+    def test_handles_are_per_thread(self, tmp_path: Path) -> None:
+        db = tmp_path / "test.db"
+        self._add_correction(db, "threaded fix")
+        find_user_corrections("fix", db=db)
+        results: list[int] = []
+        worker = threading.Thread(
+            target=lambda: results.append(len(find_user_corrections("fix", db=db)))
+        )
+        worker.start()
+        worker.join()
+        assert results == [1]
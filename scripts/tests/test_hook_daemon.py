@@ -0,0 +1,558 @@
+"""Tests for the resident hook daemon and its client shim (little_loops.hooks.daemon/client)."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from little_loops import hooks as hooks_pkg
+from little_loops.hooks import client, daemon
+from little_loops.hooks.types import LLHookEvent, LLHookResult
+from little_loops.session_store import schema
+
+_POST_TOOL_USE = json.dumps(
+    {
+        "session_id": "s1",
+        "tool_name": "Read",
+        "tool_input": {"file_path": "src/app.py"},
+        "tool_response": {"ok": True},
+    }
+)
+
+
+def _run_client(cwd: Path, intent: str, stdin: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-m", "little_loops.hooks.client", intent],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=str(cwd),
+    )
+
+
+def _wait_until_stopped(cwd: Path, timeout: float = 15.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        path = client.socket_path(str(cwd))
+        if not daemon.is_running(cwd) and not (path and os.path.exists(path)):
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def _enable(cwd: Path) -> str:
+    """Mark ``cwd`` enabled as SessionStart would; returns its socket path."""
+    marker = client.enabled_marker(str(cwd), create=True)
+    assert marker is not None
+    Path(marker).touch()
+    socket_file = client.socket_path(str(cwd))
+    assert socket_file is not None
+    return socket_file
+
+
+@pytest.fixture(autouse=True)
+def runtime_base(monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Short private ``XDG_RUNTIME_DIR`` (inherited by spawned daemons), so
+    sockets stay under the ``AF_UNIX`` limit and tests never share a daemon."""
+    base = Path(tempfile.mkdtemp(prefix="ll-"))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(base))
+    try:
+        yield base
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".ll").mkdir()
+    (tmp_path / ".ll" / "ll-config.json").write_text(
+        json.dumps({"analytics": {"enabled": True}}), encoding="utf-8"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def running(project: Path) -> Iterator[Path]:
+    assert daemon.start_daemon(project, idle_timeout=60, wait=20)
+    yield project
+    daemon.stop_daemon(project)
+    _wait_until_stopped(project)
+
+
+class TestDaemonSettings:
+    def test_disabled_by_default(self) -> None:
+        assert daemon.daemon_settings({}) == (False, daemon.DEFAULT_IDLE_TIMEOUT)
+
+    def test_enabled_with_idle_timeout(self) -> None:
+        config = {"hooks": {"daemon": {"enabled": True, "idle_timeout_seconds": 30}}}
+
+        assert daemon.daemon_settings(config) == (True, 30.0)
+
+    @pytest.mark.parametrize(
+        "section",
+        [
+            {"enabled": "yes"},
+            {"enabled": True, "idle_timeout_seconds": "soon"},
+            {"enabled": True, "idle_timeout_seconds": 0},
+            "on",
+        ],
+    )
+    def test_malformed_section_disables(self, section: object) -> None:
+        assert daemon.daemon_settings({"hooks": {"daemon": section}})[0] is False
+
+
+class TestSocketPath:
+    def test_socket_in_private_runtime_dir(self, tmp_path: Path, runtime_base: Path) -> None:
+        path = _enable(tmp_path)
+
+        assert path is not None
+        assert os.path.dirname(path) == str(runtime_base / "little-loops")
+        assert re.fullmatch(r"hookd-[0-9a-f]{16}\.sock", os.path.basename(path))
+        assert client.enabled_marker(str(tmp_path)) == path[: -len(".sock")] + ".enabled"
+
+    def test_long_project_path_fits(self) -> None:
+        client.runtime_dir(create=True)
+        path = client.socket_path("/" + "x" * 200)
+
+        assert path is not None
+        assert len(path) <= 100
+
+    def test_runtime_dir_created_owner_only(self, runtime_base: Path) -> None:
+        assert client.runtime_dir() is None  # not created by lookups alone
+
+        path = client.runtime_dir(create=True)
+
+        assert path == str(runtime_base / "little-loops")
+        assert os.stat(path).st_mode & 0o777 == 0o700
+
+    def test_uid_named_dir_without_xdg_runtime_dir(
+        self, runtime_base: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        monkeypatch.setattr(tempfile, "tempdir", str(runtime_base))
+
+        assert client.runtime_dir(create=True) == str(runtime_base / f"little-loops-{os.getuid()}")
+
+    def test_group_accessible_dir_is_refused(self, tmp_path: Path) -> None:
+        path = client.runtime_dir(create=True)
+        assert path is not None
+        os.chmod(path, 0o770)
+
+        assert client.runtime_dir(create=True) is None
+        assert client.socket_path(str(tmp_path)) is None
+        assert daemon.start_daemon(tmp_path) is False
+
+    def test_dir_owned_by_another_user_is_refused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        assert client.runtime_dir(create=True) is not None
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+        assert client.runtime_dir() is None
+
+    def test_symlinked_dir_is_refused(self, runtime_base: Path, tmp_path: Path) -> None:
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        (runtime_base / "little-loops").symlink_to(target)
+
+        assert client.runtime_dir(create=True) is None
+
+
+class TestPeerUid:
+    def test_own_socket_pair(self) -> None:
+        a, b = socket.socketpair(socket.AF_UNIX)
+        with a, b:
+            if client.peer_uid(a) is None:
+                pytest.skip("no peer credentials on this platform")
+
+            assert client.peer_uid(a) == os.getuid()
+
+
+class TestForward:
+    def test_no_socket_returns_none(self, project: Path) -> None:
+        _enable(project)
+
+        assert client.forward("post_tool_use", _POST_TOOL_USE, str(project)) is None
+
+    def test_stale_socket_file_returns_none(self, project: Path) -> None:
+        Path(_enable(project)).write_text("")
+
+        assert client.forward("post_tool_use", _POST_TOOL_USE, str(project)) is None
+
+    def test_disabled_project_is_not_forwarded(self, running: Path) -> None:
+        marker = client.enabled_marker(str(running))
+        assert marker is not None
+        os.unlink(marker)
+
+        assert client.forward("post_tool_use", _POST_TOOL_USE, str(running)) is None
+        assert not (running / ".ll" / "history.db").exists()
+
+    def test_listener_of_another_user_is_sent_nothing(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        socket_file = _enable(project)
+        received: list[bytes] = []
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_file)
+            server.listen(1)
+
+            def accept() -> None:
+                conn, _ = server.accept()
+                with conn:
+                    received.append(client.recv_all(conn))
+
+            thread = threading.Thread(target=accept)
+            thread.start()
+            monkeypatch.setattr(client, "peer_uid", lambda sock: os.getuid() + 1)
+
+            assert client.forward("post_tool_use", _POST_TOOL_USE, str(project)) is None
+            thread.join(timeout=10)
+
+        assert received == [b""]
+
+
+class TestResponseTimeout:
+    def test_client_gives_up_before_the_host_kills_the_hook(self) -> None:
+        root = Path(__file__).resolve().parents[2]
+        hooks_json = json.loads((root / "hooks" / "hooks.json").read_text(encoding="utf-8"))
+        checked = 0
+        for groups in hooks_json["hooks"].values():
+            for hook in (h for group in groups for h in group["hooks"]):
+                script = re.search(r"\$\{CLAUDE_PLUGIN_ROOT\}/(\S+\.sh)", hook["command"])
+                assert script, hook["command"]
+                text = (root / script.group(1)).read_text(encoding="utf-8")
+                for intent in re.findall(r"little_loops\.hooks\.client (\w+)", text):
+                    budget = client._RESPONSE_TIMEOUTS.get(intent, client._RESPONSE_TIMEOUT)
+                    assert budget < hook["timeout"], (intent, hook["timeout"])
+                    checked += 1
+
+        assert checked
+
+
+class TestHandleRequest:
+    def _request(self, cwd: Path, **overrides: object) -> dict:
+        request = {
+            "protocol": client.PROTOCOL_VERSION,
+            "version": client.package_version(),
+            "intent": "stub",
+            "stdin": "{}",
+            "cwd": str(cwd),
+            "env": {"LL_HOOK_HOST": "codex", "LL_MARK": "from-client"},
+        }
+        request.update(overrides)
+        return request
+
+    @pytest.fixture
+    def served(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> daemon.HookDaemon:
+        def stub(event: LLHookEvent) -> LLHookResult:
+            print("printed by handler")
+            if event.payload.get("boom"):
+                raise RuntimeError("handler exploded")
+            return LLHookResult(
+                exit_code=2,
+                feedback=f"{event.host} {os.environ.get('LL_MARK')}",
+                stdout="out",
+            )
+
+        monkeypatch.setattr(hooks_pkg, "_dispatch_table", lambda: {"stub": stub})
+        monkeypatch.chdir(tmp_path)
+        return daemon.HookDaemon(tmp_path)
+
+    def test_runs_intent_with_client_environment(
+        self, served: daemon.HookDaemon, tmp_path: Path
+    ) -> None:
+        os.environ.pop("LL_MARK", None)
+
+        reply = served.handle_request(self._request(tmp_path))
+
+        assert reply == {
+            "exit_code": 2,
+            "stdout": "printed by handler\nout",
+            "stderr": "codex from-client\n",
+        }
+        assert "LL_MARK" not in os.environ
+
+    def test_handler_exception_is_exit_one(self, served: daemon.HookDaemon, tmp_path: Path) -> None:
+        reply = served.handle_request(self._request(tmp_path, stdin='{"boom": true}'))
+
+        assert reply["exit_code"] == 1
+        assert "handler exploded" in reply["stderr"]
+
+    def test_connection_from_another_user_is_dropped(
+        self, served: daemon.HookDaemon, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(daemon, "peer_uid", lambda sock: os.getuid() + 1)
+        conn, peer = socket.socketpair(socket.AF_UNIX)
+        with peer:
+            peer.sendall(json.dumps(self._request(tmp_path)).encode())
+            peer.shutdown(socket.SHUT_WR)
+
+            assert served._serve_connection(conn) is False
+        assert conn.fileno() == -1  # closed unread
+        assert served._worker is None
+
+    def test_other_project_is_rejected(self, served: daemon.HookDaemon, tmp_path: Path) -> None:
+        reply = served.handle_request(self._request(tmp_path / "elsewhere"))
+
+        assert reply == {"rejected": "cwd"}
+
+    def test_other_version_is_rejected_and_stops(
+        self, served: daemon.HookDaemon, tmp_path: Path
+    ) -> None:
+        reply = served.handle_request(self._request(tmp_path, version="0.0.0"))
+
+        assert reply == {"rejected": "version"}
+        assert served._stopping
+
+    def test_package_proven_between_requests_is_allowed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The learning gate's per-fire cache does not outlive a request."""
+        (tmp_path / ".ll").mkdir()
+        (tmp_path / ".ll" / "ll-config.json").write_text(
+            json.dumps({"learning_tests": {"enabled": True, "discoverability": {"mode": "block"}}}),
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        served = daemon.HookDaemon(tmp_path)
+        write = json.dumps(
+            {
+                "tool_name": "Write",
+                "tool_input": {"file_path": "pay.py", "content": "import stripe\n"},
+            }
+        )
+        request = self._request(tmp_path, intent="pre_tool_use", stdin=write, env={})
+
+        assert served.handle_request(request)["exit_code"] == 2
+
+        records = tmp_path / ".ll" / "learning-tests"
+        records.mkdir()
+        (records / "stripe.md").write_text(
+            f"---\ntarget: stripe\ndate: '{time.strftime('%Y-%m-%d')}'\n"
+            "status: proven\nassertions: []\n---\n",
+            encoding="utf-8",
+        )
+
+        assert served.handle_request(request)["exit_code"] == 0
+
+
+class TestBusy:
+    @pytest.fixture
+    def gate(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[tuple[threading.Event, threading.Event]]:
+        """Serve ``tmp_path`` from a thread; ``block`` sets ``entered``, then waits for ``release``."""
+        entered, release = threading.Event(), threading.Event()
+
+        def block(event: LLHookEvent) -> LLHookResult:
+            entered.set()
+            assert release.wait(20)
+            return LLHookResult(exit_code=0, stdout="done")
+
+        monkeypatch.setattr(hooks_pkg, "_dispatch_table", lambda: {"block": block})
+        monkeypatch.chdir(tmp_path)
+        _enable(tmp_path)
+        served = daemon.HookDaemon(tmp_path, idle_timeout=60)
+        thread = threading.Thread(target=served.serve_forever, daemon=True)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 20
+            while not daemon.is_running(tmp_path) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            yield entered, release
+        finally:
+            release.set()
+            daemon.stop_daemon(tmp_path)
+            thread.join(20)
+            schema.remember_ensured_schemas(False)
+
+    def test_request_during_another_is_rejected_without_running(
+        self, gate: tuple[threading.Event, threading.Event], tmp_path: Path
+    ) -> None:
+        entered, release = gate
+        replies: list[dict | None] = []
+        first = threading.Thread(
+            target=lambda: replies.append(client.forward("block", "{}", str(tmp_path)))
+        )
+        first.start()
+        assert entered.wait(20)
+
+        started = time.monotonic()
+        assert client.forward("block", "{}", str(tmp_path)) is None
+        assert time.monotonic() - started < client._RESPONSE_TIMEOUT
+
+        release.set()
+        first.join(20)
+        assert replies == [{"exit_code": 0, "stdout": "done", "stderr": ""}]
+
+    def test_serves_again_once_idle(
+        self, gate: tuple[threading.Event, threading.Event], tmp_path: Path
+    ) -> None:
+        gate[1].set()
+
+        assert client.forward("block", "{}", str(tmp_path)) == {
+            "exit_code": 0,
+            "stdout": "done",
+            "stderr": "",
+        }
+        assert client.forward("block", "{}", str(tmp_path)) is not None
+
+
+class TestEndToEnd:
+    def test_daemon_matches_in_process_output(self, running: Path, project: Path) -> None:
+        via_daemon = _run_client(running, "pre_tool_use", "{}")
+        subprocess.run(
+            [sys.executable, "-m", "little_loops.hooks.daemon", "--stop"],
+            cwd=str(project),
+            check=True,
+            timeout=30,
+        )
+        assert _wait_until_stopped(project)
+        in_process = _run_client(project, "pre_tool_use", "{}")
+
+        assert (via_daemon.returncode, via_daemon.stdout, via_daemon.stderr) == (
+            in_process.returncode,
+            in_process.stdout,
+            in_process.stderr,
+        )
+
+    def test_post_tool_use_writes_through_daemon(self, running: Path) -> None:
+        for _ in range(2):
+            result = _run_client(running, "post_tool_use", _POST_TOOL_USE)
+            assert result.returncode == 0, result.stderr
+
+        conn = sqlite3.connect(running / ".ll" / "history.db")
+        try:
+            rows = conn.execute("SELECT tool_name FROM tool_events").fetchall()
+        finally:
+            conn.close()
+        assert rows == [("Read",), ("Read",)]
+
+    def test_unknown_intent_through_daemon(self, running: Path) -> None:
+        result = _run_client(running, "no_such_intent", "{}")
+
+        assert result.returncode == 1
+        assert "Unknown intent: 'no_such_intent'" in result.stderr
+
+    def test_second_daemon_exits_while_first_holds_lock(self, running: Path) -> None:
+        second = subprocess.run(
+            [sys.executable, "-m", "little_loops.hooks.daemon", "--idle-timeout", "60"],
+            cwd=str(running),
+            timeout=30,
+        )
+
+        assert second.returncode == 0
+        assert daemon.is_running(running)
+
+    def test_idle_timeout_exits_and_removes_socket(self, project: Path) -> None:
+        assert daemon.start_daemon(project, idle_timeout=0.5, wait=20)
+
+        assert _wait_until_stopped(project)
+
+
+class TestSessionStartStartsDaemon:
+    def test_enabled_config_starts_daemon(self, project: Path) -> None:
+        (project / ".ll" / "ll-config.json").write_text(
+            json.dumps({"hooks": {"daemon": {"enabled": True, "idle_timeout_seconds": 60}}}),
+            encoding="utf-8",
+        )
+        env = {**os.environ, "LL_NON_INTERACTIVE": "1"}
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "little_loops.hooks.client", "session_start"],
+                input="{}",
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=str(project),
+                env=env,
+                check=True,
+            )
+            deadline = time.monotonic() + 20
+            while not daemon.is_running(project) and time.monotonic() < deadline:
+                time.sleep(0.1)
+
+            assert daemon.is_running(project)
+        finally:
+            daemon.stop_daemon(project)
+            _wait_until_stopped(project)
+
+    def test_disabled_config_does_not_start_daemon(self, project: Path) -> None:
+        result = _run_client(project, "session_start", "{}")
+
+        assert result.returncode == 0
+        assert client.socket_path(str(project)) is None  # runtime dir never created
+
+    def test_disabled_config_stops_earlier_daemon(self, running: Path) -> None:
+        result = _run_client(running, "session_start", "{}")
+
+        assert result.returncode == 0
+        assert _wait_until_stopped(running)
+        marker = client.enabled_marker(str(running))
+        assert marker is not None
+        assert not os.path.exists(marker)
+
+
+class TestSourceStamp:
+    @pytest.mark.parametrize("package", ["hooks", "config", "session_store"])
+    def test_edit_in_kept_imported_package_changes_stamp(
+        self, package: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for name in daemon._STAMPED_PACKAGES:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "module.py").write_text("")
+            os.utime(tmp_path / name / "module.py", (1000, 1000))
+        monkeypatch.setattr(daemon, "__file__", str(tmp_path / "hooks" / "daemon.py"))
+        assert daemon._source_stamp() == 1000
+
+        os.utime(tmp_path / package / "module.py", (2000, 2000))
+
+        assert daemon._source_stamp() == 2000
+
+
+class TestEnsuredSchemaMemo:
+    @pytest.fixture(autouse=True)
+    def _memo(self) -> Iterator[None]:
+        schema.remember_ensured_schemas(True)
+        yield
+        schema.remember_ensured_schemas(False)
+
+    def test_repeat_ensure_skips_migration_check(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = tmp_path / "history.db"
+        schema.ensure_db(db)
+        calls: list[object] = []
+        monkeypatch.setattr(schema, "_apply_migrations", lambda conn: calls.append(conn))
+
+        schema.ensure_db(db)
+
+        assert calls == []
+
+    def test_replaced_database_is_checked_again(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = tmp_path / "history.db"
+        schema.ensure_db(db)
+        db.unlink()
+
+        schema.ensure_db(db)
+
+        conn = sqlite3.connect(db)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM tool_events").fetchone() == (0,)
+        finally:
+            conn.close()
@@ -307,7 +307,7 @@ class TestSessionStartBackfillThread:
 
 
 class TestSessionStartRebuild:
-    """ENH-2581: --rebuild is passed only when SCHEMA_VERSION > last_rebuild_version."""
+    """ENH-2581: the worker always rebuilds; rebuild(incremental=True) decides full vs. delta."""
 
     def _mock_popen(self, monkeypatch: pytest.MonkeyPatch) -> list[list]:
         calls: list[list] = []
@@ -338,17 +338,74 @@ class TestSessionStartRebuild:
         assert len(calls) == 1
         assert "--rebuild" in calls[0]
 
-    def test_rebuild_flag_omitted_when_already_current(
+    def test_rebuild_flag_added_when_already_current(
         self, in_tmp: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """After a rebuild() call, last_rebuild_version matches SCHEMA_VERSION — no flag."""
+        """A current DB still gets --rebuild: the worker's rebuild is incremental."""
         from little_loops.session_store import rebuild
 
         rebuild(in_tmp / ".ll" / "history.db")
         calls = self._setup(in_tmp, monkeypatch)
         handle(_event())
         assert len(calls) == 1
-        assert "--rebuild" not in calls[0]
+        assert "--rebuild" in calls[0]
+
+    def test_two_session_starts_do_not_double_count_live_rows(
+        self, in_tmp: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The second session's incremental rebuild adopts the hook-written row."""
+        from little_loops.cli import backfill_worker
+        from little_loops.session_store import _hash_args, connect
+
+        db = in_tmp / ".ll" / "history.db"
+        transcript = in_tmp / "s1.jsonl"
+        self._setup(in_tmp, monkeypatch)
+
+        class _InlineWorker:
+            def __init__(self_inner, args, **kw):
+                backfill_worker.main(list(args[3:]))
+
+        monkeypatch.setattr("little_loops.hooks.session_start.subprocess.Popen", _InlineWorker)
+
+        def _tool_call(ts: str, tool: str) -> None:
+            # The transcript line plus the row post_tool_use writes live for it.
+            record = {
+                "type": "assistant",
+                "sessionId": "s1",
+                "timestamp": ts,
+                "message": {"content": [{"type": "tool_use", "name": tool, "input": {}}]},
+            }
+            with transcript.open("a", encoding="utf-8") as handle_:
+                handle_.write(json.dumps(record) + "\n")
+            conn = connect(db)
+            try:
+                conn.execute(
+                    "INSERT INTO tool_events(ts, session_id, tool_name, args_hash, bytes_in) "
+                    "VALUES(?, 's1', ?, ?, 2)",
+                    (ts, tool, _hash_args({})),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        def _tool_count(where: str = "1") -> int:
+            conn = connect(db)
+            try:
+                return int(
+                    conn.execute(f"SELECT COUNT(*) FROM tool_events WHERE {where}").fetchone()[0]
+                )
+            finally:
+                conn.close()
+
+        _tool_call("2026-05-22T00:00:00Z", "Read")
+        handle(_event())
+        assert _tool_count() == 1
+
+        _tool_call("2026-05-22T00:01:00Z", "Grep")
+        handle(_event())
+        assert _tool_count() == 2
+        # The Grep row kept its live-only columns: it was adopted, not wiped and re-derived.
+        assert _tool_count("tool_name = 'Grep' AND bytes_in = 2 AND derived = 1") == 1
 
 
 class TestSessionStartCodexTranscriptPath:
@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from little_loops.fsm.executor import FSMExecutor
 from little_loops.fsm.host_guard import (
     GuardDecision,
     HostGuard,
     HostGuardConfig,
+    ProcessTreeSampler,
+    ProcessTreeUsage,
     RssSampler,
+    list_descendants,
     parse_meminfo,
     parse_vm_stat,
     read_memory_pressure,
+    sample_process_tree,
     sample_rss_mb,
 )
 from little_loops.fsm.runners import DefaultActionRunner
@@ -57,6 +68,9 @@ class RssActionRunner:
 
     peak_rss_mb: float | None = 500.0
     exit_code: int = 0
+    cpu_seconds: float | None = None
+    read_bytes: int | None = None
+    write_bytes: int | None = None
     calls: list[str] = field(default_factory=list)
 
     def run(self, action: str, timeout: int, is_slash_command: bool, **kwargs: Any) -> ActionResult:
@@ -69,9 +83,80 @@ class RssActionRunner:
             exit_code=self.exit_code,
             duration_ms=10,
             peak_rss_mb=self.peak_rss_mb,
+            cpu_seconds=self.cpu_seconds,
+            read_bytes=self.read_bytes,
+            write_bytes=self.write_bytes,
         )
 
 
+# Each child of the forked tree holds this much freshly touched memory.
+TREE_CHILDREN = 3
+TREE_CHILD_MB = 40
+
+_TREE_SCRIPT = f"""
+import os, sys, time
+pids = []
+for _ in range({TREE_CHILDREN}):
+    pid = os.fork()
+    if pid == 0:
+        block = bytearray({TREE_CHILD_MB} * 1024 * 1024)
+        for i in range(0, len(block), 4096):
+            block[i] = 1
+        deadline = time.process_time() + 0.2
+        while time.process_time() < deadline:
+            pass
+        os.write(1, b"r")
+        time.sleep(60)
+        os._exit(0)
+    pids.append(pid)
+sys.stdin.read()
+"""
+
+
+@pytest.fixture
+def forked_tree() -> Iterator[subprocess.Popen[bytes]]:
+    """A parent with ``TREE_CHILDREN`` forked children, each ``TREE_CHILD_MB`` resident.
+
+    Yields once every child has touched its memory and burned ~0.2s of CPU;
+    Linux only (the children are found through ``/proc``).
+    """
+    if not Path("/proc/self/stat").exists():
+        pytest.skip("needs /proc")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _TREE_SCRIPT],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        start_new_session=True,
+    )
+    assert proc.stdout is not None
+    try:
+        assert proc.stdout.read(TREE_CHILDREN) == b"r" * TREE_CHILDREN
+        yield proc
+    finally:
+        import signal
+
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+
+
+def make_fake_proc(root: Path, tree: dict[int, tuple[int, list[int]]]) -> Path:
+    """Write a minimal ``/proc`` for ``{pid: (rss_kb, children)}`` under ``root``.
+
+    Every process gets ``utime=100`` / ``stime=50`` ticks and 1 MiB read /
+    2 MiB written.
+    """
+    for pid, (rss_kb, children) in tree.items():
+        pdir = root / str(pid)
+        (pdir / "task" / str(pid)).mkdir(parents=True)
+        (pdir / "task" / str(pid) / "children").write_text(" ".join(map(str, children)))
+        (pdir / "status").write_text(f"Name:\tx\nVmRSS:\t{rss_kb} kB\n")
+        ppid = next((p for p, (_, kids) in tree.items() if pid in kids), 1)
+        fields = ["S", str(ppid)] + ["0"] * 10 + ["100", "50", "0", "0"] + ["0"] * 10
+        (pdir / "stat").write_text(f"{pid} (a b) " + " ".join(fields))
+        (pdir / "io").write_text(f"rchar: 5\nread_bytes: {1 << 20}\nwrite_bytes: {2 << 20}\n")
+    return root
+
+
 def make_prompt_fsm(host_guard: HostGuardConfig, **extra_states: StateConfig) -> FSMLoop:
     """Build a minimal FSM with one prompt-mode state routing to done."""
     states: dict[str, StateConfig] = {
@@ -119,6 +204,21 @@ class TestHostGuardConfig:
     def test_to_dict_skips_defaults(self) -> None:
         assert HostGuardConfig().to_dict() == {}
 
+    def test_accounting_fields_roundtrip(self) -> None:
+        cfg = HostGuardConfig(
+            max_cumulative_cpu_seconds=120.5,
+            max_cumulative_io_mb=2048,
+            account_actions=True,
+            budget_state="out_of_resources",
+        )
+        assert cfg.to_dict() == {
+            "max_cumulative_cpu_seconds": 120.5,
+            "max_cumulative_io_mb": 2048,
+            "account_actions": True,
+            "budget_state": "out_of_resources",
+        }
+        assert HostGuardConfig.from_dict(cfg.to_dict()) == cfg
+
     def test_roundtrip(self) -> None:
         cfg = HostGuardConfig(
             enabled=False,
@@ -261,6 +361,102 @@ class TestRssSampling:
         assert sampler.stop() is None
 
 
+# ---------------------------------------------------------------------------
+# Process-tree accounting
+# ---------------------------------------------------------------------------
+
+
+class TestProcessTreeSampling:
+    """list_descendants, sample_process_tree and ProcessTreeSampler."""
+
+    TREE = {100: (1024, [101, 102]), 101: (2048, [103]), 102: (512, []), 103: (256, [])}
+
+    def test_list_descendants_fake_proc(self, tmp_path: Path) -> None:
+        proc_root = make_fake_proc(tmp_path, self.TREE)
+        assert sorted(list_descendants(100, proc_root)) == [101, 102, 103]
+        assert list_descendants(102, proc_root) == []
+
+    def test_list_descendants_without_children_files(self, tmp_path: Path) -> None:
+        proc_root = make_fake_proc(tmp_path, self.TREE)
+        for children in proc_root.glob("*/task/*/children"):
+            children.unlink()
+        # Falls back to the ppid field of every /proc/<pid>/stat.
+        assert sorted(list_descendants(100, proc_root)) == [101, 102, 103]
+
+    def test_sample_process_tree_sums_fake_proc(self, tmp_path: Path) -> None:
+        proc_root = make_fake_proc(tmp_path, self.TREE)
+        usage = sample_process_tree(100, proc_root)
+        assert usage is not None
+        assert usage.peak_rss_mb == (1024 + 2048 + 512 + 256) / 1024.0
+        assert usage.cpu_seconds == pytest.approx(4 * 150 / os.sysconf("SC_CLK_TCK"))
+        assert usage.read_bytes == 4 << 20
+        assert usage.write_bytes == 8 << 20
+
+    def test_sample_process_tree_unreadable_io(self, tmp_path: Path) -> None:
+        proc_root = make_fake_proc(tmp_path, {100: (1024, [])})
+        (proc_root / "100" / "io").unlink()
+        usage = sample_process_tree(100, proc_root)
+        assert usage is not None
+        assert usage.peak_rss_mb == 1.0
+        assert usage.read_bytes is None and usage.write_bytes is None
+
+    def test_sample_process_tree_gone(self, tmp_path: Path) -> None:
+        assert sample_process_tree(4242, make_fake_proc(tmp_path, {})) is None
+
+    def test_sample_process_tree_ps_fallback(self, tmp_path: Path) -> None:
+        ps_out = "  10     1  1024\n  11    10  2048\n  12    11   512\n  13     1  9999\n"
+        completed = MagicMock(returncode=0, stdout=ps_out)
+        with patch("little_loops.fsm.host_guard.subprocess.run", return_value=completed):
+            usage = sample_process_tree(10, tmp_path / "no-proc")
+        assert usage == ProcessTreeUsage(peak_rss_mb=(1024 + 2048 + 512) / 1024.0)
+
+    def test_forked_tree_is_measured(self, forked_tree: subprocess.Popen[bytes]) -> None:
+        children = list_descendants(forked_tree.pid)
+        assert len(children) == TREE_CHILDREN
+        usage = sample_process_tree(forked_tree.pid)
+        assert usage is not None
+        assert usage.peak_rss_mb is not None
+        assert usage.peak_rss_mb >= TREE_CHILDREN * TREE_CHILD_MB
+        # Each child burned >= 0.2s; the root alone would report ~0.
+        assert usage.cpu_seconds is not None
+        assert usage.cpu_seconds >= TREE_CHILDREN * 0.2 * 0.9
+        root_only = sample_rss_mb(forked_tree.pid)
+        assert root_only is not None and root_only < TREE_CHILD_MB
+
+    def test_sampler_keeps_max_of_each_field(self) -> None:
+        samples = iter(
+            [
+                ProcessTreeUsage(peak_rss_mb=100.0, cpu_seconds=1.0, read_bytes=10),
+                ProcessTreeUsage(peak_rss_mb=300.0, cpu_seconds=2.0, read_bytes=5),
+                None,
+                ProcessTreeUsage(peak_rss_mb=200.0, cpu_seconds=3.0, write_bytes=7),
+            ]
+        )
+        sampler = ProcessTreeSampler(pid=1, interval=60, sample_fn=lambda pid: next(samples))
+        for _ in range(3):
+            sampler._record_sample()
+        usage = sampler.stop()
+        assert usage == ProcessTreeUsage(
+            peak_rss_mb=300.0, cpu_seconds=3.0, read_bytes=10, write_bytes=7
+        )
+        assert sampler.peak_mb == 300.0
+
+    def test_sampler_all_samples_fail(self) -> None:
+        sampler = ProcessTreeSampler(pid=1, interval=0.01, sample_fn=lambda pid: None)
+        sampler.start()
+        assert sampler.stop() == ProcessTreeUsage()
+
+    def test_usage_payload_omits_unmeasured(self) -> None:
+        usage = ProcessTreeUsage(peak_rss_mb=12.345, cpu_seconds=1.006, write_bytes=3 << 20)
+        assert usage.to_payload() == {
+            "peak_rss_mb": 12.3,
+            "cpu_seconds": 1.01,
+            "write_bytes": 3 << 20,
+        }
+        assert usage.io_mb == 3.0
+        assert ProcessTreeUsage().to_payload() == {}
+
+
 # ---------------------------------------------------------------------------
 # HostGuard decisions
 # ---------------------------------------------------------------------------
@@ -331,6 +527,29 @@ class TestHostGuardDecisions:
         assert guard.budget_enabled is False
         assert guard.record_subproc_rss("a", 99999.0) is False
 
+    def test_cpu_and_io_budgets_fire_once(self) -> None:
+        cfg = HostGuardConfig(max_cumulative_cpu_seconds=10, max_cumulative_io_mb=100)
+        guard = HostGuard(cfg, probe=lambda: 10.0)
+        assert guard.budget_enabled is True
+        assert guard.record_action_usage("a", ProcessTreeUsage(cpu_seconds=6.0)) is False
+        assert guard.record_action_usage("b", ProcessTreeUsage(cpu_seconds=6.0)) is True
+        assert guard.exceeded_budgets() == ["cpu"]
+        big_write = ProcessTreeUsage(write_bytes=200 << 20)
+        assert guard.record_action_usage("c", big_write) is False  # fires only once
+        assert guard.exceeded_budgets() == ["cpu", "io"]
+        assert guard.cumulative_cpu_seconds == 12.0
+        assert guard.cumulative_io_mb == 200.0
+
+    def test_action_usage_feeds_rss_budget(self) -> None:
+        guard = HostGuard(HostGuardConfig(max_cumulative_subproc_mb=100), probe=lambda: 10.0)
+        assert guard.record_action_usage("a", ProcessTreeUsage(peak_rss_mb=150.0)) is True
+        assert guard.subproc_samples == [("a", 150.0)]
+
+    def test_account_actions_enables_sampling_without_budget(self) -> None:
+        guard = HostGuard(HostGuardConfig(account_actions=True), probe=lambda: 10.0)
+        assert guard.budget_enabled is False
+        assert guard.accounting_enabled is True
+
 
 # ---------------------------------------------------------------------------
 # Executor integration (ENH-2452)
@@ -572,6 +791,50 @@ class TestExecutorRssBudget:
         assert isinstance(executor.action_runner, DefaultActionRunner)
         assert executor.action_runner.sample_rss is False
 
+    def test_account_actions_enables_runner_sampling(self) -> None:
+        executor = FSMExecutor(make_budget_fsm(HostGuardConfig(account_actions=True)))
+        assert isinstance(executor.action_runner, DefaultActionRunner)
+        assert executor.action_runner.sample_rss is True
+
+    def test_action_complete_carries_tree_usage(self) -> None:
+        runner = RssActionRunner(250.0, cpu_seconds=1.5, read_bytes=4096, write_bytes=8192)
+        executor = FSMExecutor(
+            make_budget_fsm(HostGuardConfig(account_actions=True)), action_runner=runner
+        )
+        events = collect_events(executor)
+        self._low_pressure(executor)
+
+        result = executor.run()
+
+        assert result.final_state == "done"
+        completes = [e for e in events if e["event"] == "action_complete"]
+        assert len(completes) == 3
+        assert completes[0]["peak_rss_mb"] == 250.0
+        assert completes[0]["cpu_seconds"] == 1.5
+        assert completes[0]["read_bytes"] == 4096
+        assert completes[0]["write_bytes"] == 8192
+        # No budget: figures are recorded but never accumulated or enforced.
+        assert not [e for e in events if e["event"] == "host_subproc_rss"]
+
+    def test_cpu_budget_abort(self) -> None:
+        cfg = HostGuardConfig(max_cumulative_cpu_seconds=5, on_budget_exceeded="abort")
+        runner = RssActionRunner(None, cpu_seconds=3.0)
+        executor = FSMExecutor(make_budget_fsm(cfg), action_runner=runner)
+        events = collect_events(executor)
+        self._low_pressure(executor)
+
+        result = executor.run()
+
+        # 3 + 3 = 6 s > 5 s after the second action.
+        assert result.terminated_by == "host_budget_exceeded"
+        assert len(runner.calls) == 2
+        assert result.error is not None
+        assert "CPU 6.0 s exceeded budget of 5 s" in result.error
+        exceeded = [e for e in events if e["event"] == "host_budget_exceeded"]
+        assert exceeded[0]["exceeded"] == ["cpu"]
+        assert exceeded[0]["cumulative_cpu_seconds"] == 6.0
+        assert not [e for e in events if e["event"] == "host_subproc_rss"]
+
 
 class TestDefaultRunnerRssSampling:
     """DefaultActionRunner reports peak RSS when sampling is enabled."""
@@ -589,6 +852,52 @@ class TestDefaultRunnerRssSampling:
         runner = DefaultActionRunner()
         result = runner.run("echo hi", timeout=10, is_slash_command=False)
         assert result.peak_rss_mb is None
+        assert result.cpu_seconds is None
+
+    def test_shell_action_counts_child_processes(self) -> None:
+        if not Path("/proc").exists():  # pragma: no cover - needs /proc
+            return
+        # The python child is short-lived and exits before the shell does; its
+        # CPU still reaches the tree total through the shell's reaped-children
+        # counters.
+        script = "import time; d = time.process_time() + 0.3\nwhile time.process_time() < d: pass"
+        runner = DefaultActionRunner(sample_rss=True)
+        result = runner.run(
+            f"{sys.executable} -c '{script}'; true", timeout=30, is_slash_command=False
+        )
+        assert result.exit_code == 0
+        assert result.cpu_seconds is not None
+        assert result.cpu_seconds >= 0.25
+
+    def test_prompt_action_counts_child_processes(self) -> None:
+        if not Path("/proc").exists():  # pragma: no cover - needs /proc
+            return
+        from little_loops.host_runner import HostInvocation
+
+        # A stand-in for `claude -p`: runs a CPU-bound child, then ends its turn
+        # with a result event and exits. The sampler must be stopped before
+        # run_claude_command reaps it, or the child's CPU is lost.
+        burn = "import time; d = time.process_time() + 0.3\nwhile time.process_time() < d: pass"
+        script = (
+            "import json, subprocess, sys\n"
+            f"subprocess.run([sys.executable, '-c', {burn!r}])\n"
+            "print(json.dumps({'type': 'result', 'result': 'ok'}), flush=True)\n"
+        )
+        host = MagicMock()
+        host.build_streaming.return_value = HostInvocation(
+            binary=sys.executable, args=["-c", script], env={}
+        )
+        runner = DefaultActionRunner(sample_rss=True)
+        # No periodic samples: only the first and the final one count.
+        slow_sampler = functools.partial(ProcessTreeSampler, interval=60)
+        with (
+            patch("little_loops.subprocess_utils.resolve_host", return_value=host),
+            patch("little_loops.fsm.runners.ProcessTreeSampler", slow_sampler),
+        ):
+            result = runner.run("/ll:noop", timeout=30, is_slash_command=True)
+        assert result.exit_code == 0
+        assert result.cpu_seconds is not None
+        assert result.cpu_seconds >= 0.25
 
 
 # ---------------------------------------------------------------------------
@@ -648,6 +957,17 @@ class TestHostGuardValidation:
         msgs = self._messages(HostGuardConfig(on_pressure="abort", on_abort_route="ghost"))
         assert any("on_abort_route" in m for m in msgs)
 
+    def test_cpu_budget_route_requires_budget_state(self) -> None:
+        msgs = self._messages(HostGuardConfig(max_cumulative_cpu_seconds=60))
+        assert any("budget_state is required" in m for m in msgs)
+
+    def test_negative_accounting_budgets(self) -> None:
+        msgs = self._messages(
+            HostGuardConfig(max_cumulative_cpu_seconds=-1, max_cumulative_io_mb=-1)
+        )
+        assert any("max_cumulative_cpu_seconds must be >= 0" in m for m in msgs)
+        assert any("max_cumulative_io_mb must be >= 0" in m for m in msgs)
+
     def test_invalid_on_budget_exceeded(self) -> None:
         msgs = self._messages(
             HostGuardConfig(max_cumulative_subproc_mb=100, on_budget_exceeded="explode")
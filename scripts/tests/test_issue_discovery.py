@@ -357,6 +357,23 @@ class TestSearchIssuesByContent:
             scores = [r[1] for r in results]
             assert scores == sorted(scores, reverse=True)
 
+    def test_limit_keeps_best_matches(
+        self, temp_project_dir: Path, sample_config_with_enh: dict[str, Any]
+    ) -> None:
+        """Test that limit keeps only the best-ranked matches."""
+        (temp_project_dir / ".ll" / "ll-config.json").write_text(json.dumps(sample_config_with_enh))
+        bugs_dir = temp_project_dir / ".issues" / "bugs"
+        bugs_dir.mkdir(parents=True)
+        for n, title in enumerate(["Cache eviction race", "Cache warmup", "Cache"], start=1):
+            (bugs_dir / f"P2-BUG-00{n}-cache.md").write_text(f"# BUG-00{n}: {title}\n")
+        config = BRConfig(temp_project_dir)
+
+        results = search_issues_by_content(config, ["cache eviction race"])
+        limited = search_issues_by_content(config, ["cache eviction race"], limit=1)
+
+        assert len(results) == 3
+        assert [r[0].name for r in limited] == ["P2-BUG-001-cache.md"]
+
 
 class TestFindExistingIssue:
     """Tests for find_existing_issue function."""
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from datetime import date, datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -15,9 +16,12 @@ from little_loops.issue_history import (
     scan_completed_issues,
 )
 from little_loops.issue_history.parsing import (
+    _batch_completion_dates,
     _parse_completion_date,
     _parse_discovered_date,
 )
+from little_loops.issue_index import IssueIndex
+from tests.helpers import copy_git_template
 
 
 class TestParseCompletedIssue:
@@ -354,6 +358,98 @@ class TestScanCompletedIssues:
         assert issues[0].issue_id == "BUG-001"
 
 
+def _commit(repo: Path, message: str, day: str) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": f"{day}T12:00:00",
+        "GIT_COMMITTER_DATE": f"{day}T12:00:00",
+    }
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-qm", message], cwd=repo, check=True, env=env)
+
+
+def _git_log_calls(mock_run: MagicMock) -> list[list[str]]:
+    return [c.args[0] for c in mock_run.call_args_list if "log" in c.args[0]]
+
+
+class TestBatchCompletionDates:
+    """Tests for the single ``git log`` completion-date fallback."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        repo = copy_git_template(tmp_path / "repo")
+        (repo / ".ll").mkdir()
+        bugs = repo / ".issues" / "bugs"
+        bugs.mkdir(parents=True)
+        (bugs / "P1-BUG-001-a.md").write_text("---\nstatus: done\n---\n\n# BUG-001\n")
+        (bugs / "P1-BUG-002-b.md").write_text("---\nstatus: done\n---\n\n# BUG-002\n")
+        _commit(repo, "add", "2026-01-10")
+        (bugs / "P1-BUG-002-b.md").write_text("---\nstatus: done\n---\n\n# BUG-002 edited\n")
+        _commit(repo, "edit", "2026-02-20")
+        return repo
+
+    def test_matches_per_file_git_log(self, repo: Path) -> None:
+        issues_dir = repo / ".issues"
+
+        dates = _batch_completion_dates(issues_dir)
+
+        for path in (issues_dir / "bugs").glob("*.md"):
+            assert dates[path.name] == _parse_completion_date(path.read_text(), path)
+        assert dates["P1-BUG-002-b.md"] == date(2026, 2, 20)
+
+    def test_not_a_git_repo_returns_empty(self, tmp_path: Path) -> None:
+        assert _batch_completion_dates(tmp_path) == {}
+
+    def test_cached_by_head_and_extended_incrementally(self, repo: Path) -> None:
+        issues_dir = repo / ".issues"
+        with IssueIndex.for_project(repo) as index:
+            _batch_completion_dates(issues_dir, index=index)
+
+        with patch(
+            "little_loops.issue_history.parsing.subprocess.run", wraps=subprocess.run
+        ) as run:
+            with IssueIndex.for_project(repo) as index:
+                dates = _batch_completion_dates(issues_dir, index=index)
+        assert _git_log_calls(run) == []
+        assert dates["P1-BUG-001-a.md"] == date(2026, 1, 10)
+
+        (issues_dir / "bugs" / "P1-BUG-001-a.md").write_text("---\nstatus: done\n---\n\nx\n")
+        _commit(repo, "close", "2026-03-05")
+        with patch(
+            "little_loops.issue_history.parsing.subprocess.run", wraps=subprocess.run
+        ) as run:
+            with IssueIndex.for_project(repo) as index:
+                dates = _batch_completion_dates(issues_dir, index=index)
+        [log_call] = _git_log_calls(run)
+        assert any(arg.endswith("..HEAD") for arg in log_call)
+        assert dates == {"P1-BUG-001-a.md": date(2026, 3, 5), "P1-BUG-002-b.md": date(2026, 2, 20)}
+
+    def test_scan_runs_git_log_once(self, repo: Path) -> None:
+        with patch(
+            "little_loops.issue_history.parsing.subprocess.run", wraps=subprocess.run
+        ) as run:
+            issues = scan_completed_issues(repo / ".issues")
+
+        assert len(_git_log_calls(run)) == 1
+        assert {i.issue_id: i.completed_date for i in issues} == {
+            "BUG-001": date(2026, 1, 10),
+            "BUG-002": date(2026, 2, 20),
+        }
+
+    def test_scan_skips_git_when_every_issue_has_a_date(self, tmp_path: Path) -> None:
+        bugs = tmp_path / ".issues" / "bugs"
+        bugs.mkdir(parents=True)
+        (bugs / "P1-BUG-001-a.md").write_text(
+            "---\nstatus: done\ncompleted_at: 2026-04-01T10:00:00\n---\n\n# BUG-001\n"
+        )
+
+        with patch("little_loops.issue_history.parsing.subprocess.run") as run:
+            issues = scan_completed_issues(tmp_path / ".issues")
+
+        run.assert_not_called()
+        assert issues[0].completed_date == date(2026, 4, 1)
+
+
 class TestScanActiveIssues:
     """Tests for scan_active_issues function."""
 
@@ -0,0 +1,329 @@
+"""Tests for little_loops.issue_index - the persistent stat-keyed issue index."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from little_loops import issue_index
+from little_loops.config import BRConfig
+from little_loops.issue_index import INDEX_DB_NAME, IssueIndex
+from little_loops.issue_parser import IssueParser, find_issues
+from little_loops.text_utils import calculate_word_overlap, extract_words
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Backdate *path* past the racy window so the index will store it."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _write_issue(bugs_dir: Path, name: str, body: str, *, aged: bool = True) -> Path:
+    path = bugs_dir / name
+    path.write_text(body)
+    if aged:
+        _age(path)
+    return path
+
+
+def _project(temp_project_dir: Path, sample_config: dict[str, Any]) -> tuple[BRConfig, Path]:
+    (temp_project_dir / ".ll" / "ll-config.json").write_text(json.dumps(sample_config))
+    bugs_dir = temp_project_dir / ".issues" / "bugs"
+    bugs_dir.mkdir(parents=True, exist_ok=True)
+    return BRConfig(temp_project_dir), bugs_dir
+
+
+def _row_count(project_root: Path, table: str = "issue_index") -> int:
+    conn = sqlite3.connect(project_root / ".ll" / INDEX_DB_NAME)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _count_tokenize(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the content of every file the search index (re-)tokenizes."""
+    seen: list[str] = []
+    real = issue_index._tokenize
+
+    def counting(content: str) -> Any:
+        seen.append(content)
+        return real(content)
+
+    monkeypatch.setattr(issue_index, "_tokenize", counting)
+    return seen
+
+
+class TestIssueIndexParse:
+    def test_warm_parse_matches_cold_parse(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(
+            bugs_dir,
+            "P1-BUG-001-crash.md",
+            "---\nstatus: open\nbase_branch: release\nlabels: [a, b]\n---\n"
+            "# BUG-001: Crash\n\n## Blocked By\n\n- BUG-002\n",
+        )
+        parser = IssueParser(config)
+
+        with IssueIndex.for_project(temp_project_dir) as cold:
+            cold_info = cold.parse(parser, path)
+        assert cold.misses == 1
+
+        with IssueIndex.for_project(temp_project_dir) as warm:
+            warm_info = warm.parse(parser, path)
+        assert warm.hits == 1
+        assert warm_info == cold_info
+        assert warm_info.path is path
+
+    def test_modified_file_is_reparsed(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(bugs_dir, "P1-BUG-001-crash.md", "# BUG-001: Crash\n")
+        parser = IssueParser(config)
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.parse(parser, path)
+
+        _write_issue(bugs_dir, "P1-BUG-001-crash.md", "---\nstatus: done\n---\n# BUG-001: Fixed\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            info = index.parse(parser, path)
+        assert index.misses == 1
+        assert info.status == "done"
+        assert info.title == "Fixed"
+
+    def test_recently_modified_file_is_not_stored(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        """Same-size rewrites within one mtime tick must never reuse a stale row."""
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(
+            bugs_dir, "P1-BUG-001-crash.md", "---\nstatus: open\n---\n# BUG-001: X\n", aged=False
+        )
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.parse(IssueParser(config), path)
+        assert _row_count(temp_project_dir) == 0
+
+    def test_config_change_invalidates_info_but_not_frontmatter(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(bugs_dir, "P1-BUG-001-crash.md", "---\nstatus: open\n---\n# BUG-001\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.parse(IssueParser(config), path)
+            index.frontmatter(path)
+
+        sample_config["issues"]["priorities"] = ["P0", "P1"]
+        config, _ = _project(temp_project_dir, sample_config)
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.frontmatter(path)
+            index.parse(IssueParser(config), path)
+        assert (index.hits, index.misses) == (1, 1)
+
+    def test_deprecated_key_file_is_not_stored(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        """Warnings stay visible on every run instead of vanishing once warm."""
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(
+            bugs_dir, "P1-BUG-001-crash.md", "---\nparent_issue: EPIC-9\n---\n# BUG-001: X\n"
+        )
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.parse(IssueParser(config), path)
+        assert _row_count(temp_project_dir) == 0
+
+    def test_file_with_parser_warning_is_not_stored(
+        self,
+        temp_project_dir: Path,
+        sample_config: dict[str, Any],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A relationship conflict is warned about on every parse, not just the cold one."""
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(
+            bugs_dir,
+            "P1-BUG-001-crash.md",
+            "---\nblocked_by: BUG-002\n---\n# BUG-001: X\n\n## Blocked By\n\n- BUG-003\n",
+        )
+        for _ in range(2):
+            caplog.clear()
+            with (
+                caplog.at_level("WARNING", logger="little_loops.issue_parser"),
+                IssueIndex.for_project(temp_project_dir) as index,
+            ):
+                info = index.parse(IssueParser(config), path)
+
+            assert info.blocked_by == ["BUG-002"]
+            assert "conflicts with body section" in caplog.text
+        assert _row_count(temp_project_dir) == 0
+
+    def test_pass_through_without_ll_dir(self, tmp_path: Path) -> None:
+        path = tmp_path / "P1-BUG-001-crash.md"
+        path.write_text("---\nstatus: open\n---\n")
+        _age(path)
+        with IssueIndex.for_project(tmp_path) as index:
+            assert index.db_path is None
+            assert index.frontmatter(path) == {"status": "open"}
+        assert not (tmp_path / ".ll").exists()
+
+    def test_deleted_files_are_pruned(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(bugs_dir, "P1-BUG-001-crash.md", "# BUG-001: X\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.parse(IssueParser(config), path)
+        assert _row_count(temp_project_dir) == 1
+
+        path.unlink()
+        IssueIndex.for_project(temp_project_dir).close()
+        assert _row_count(temp_project_dir) == 0
+
+    def test_corrupt_database_degrades_to_parsing(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        (temp_project_dir / ".ll" / INDEX_DB_NAME).write_text("not a database")
+        path = _write_issue(bugs_dir, "P1-BUG-001-crash.md", "# BUG-001: Crash\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            assert index.parse(IssueParser(config), path).title == "Crash"
+
+
+class TestFindIssuesUsesIndex:
+    def test_warm_listing_matches_cold_listing(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        for n in range(1, 6):
+            _write_issue(bugs_dir, f"P{n % 3}-BUG-00{n}-issue.md", f"# BUG-00{n}: Issue {n}\n")
+        _write_issue(bugs_dir, "P1-BUG-009-done.md", "---\nstatus: done\n---\n# BUG-009: Done\n")
+
+        cold = find_issues(config)
+        assert _row_count(temp_project_dir) == 6
+        warm = find_issues(config)
+        assert [i.to_dict() for i in warm] == [i.to_dict() for i in cold]
+
+    def test_skip_blocked_resolves_done_blocker_from_index(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        config, bugs_dir = _project(temp_project_dir, sample_config)
+        _write_issue(bugs_dir, "P0-BUG-540-done.md", "---\nstatus: done\n---\n# BUG-540: Done\n")
+        _write_issue(
+            bugs_dir,
+            "P0-BUG-541-unblocked.md",
+            "---\nstatus: open\nblocked_by:\n  - BUG-540\n---\n# BUG-541: Unblocked\n",
+        )
+        for _ in range(2):
+            ids = [i.issue_id for i in find_issues(config, skip_blocked=True)]
+            assert ids == ["BUG-541"]
+
+
+class TestIssueIndexSearch:
+    _DOCS = {
+        "P1-BUG-001-auth.md": "# BUG-001: Auth token refresh fails\n\nToken refresh token expiry.\n",
+        "P2-BUG-002-cache.md": "# BUG-002: Cache eviction race\n\nEviction under load.\n",
+        "P3-BUG-003-docs.md": "# BUG-003: Refresh docs\n\nDocs mention the cache.\n",
+    }
+
+    def _paths(self, bugs_dir: Path) -> list[Path]:
+        return [_write_issue(bugs_dir, name, body) for name, body in self._DOCS.items()]
+
+    def test_overlap_matches_word_overlap_and_bm25_orders(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        paths = self._paths(bugs_dir)
+        query = {"token", "refresh", "cache"}
+
+        with IssueIndex.for_project(temp_project_dir) as index:
+            hits = index.search(paths, query)
+
+        assert [h.path for h in hits] == [paths[0], paths[2], paths[1]]
+        assert hits[0].path is paths[0]
+        assert hits[0].matched == ("refresh", "token")
+        for hit in hits:
+            expected = calculate_word_overlap(query, extract_words(hit.path.read_text()))
+            assert hit.overlap == pytest.approx(expected)
+
+    def test_title_search_only_matches_title_words(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        paths = self._paths(bugs_dir)
+
+        with IssueIndex.for_project(temp_project_dir) as index:
+            hits = index.search(paths, {"cache", "eviction"}, title=True)
+
+        assert [h.path for h in hits] == [paths[1]]
+        assert hits[0].overlap == pytest.approx(2 / 3)
+
+    def test_warm_search_reads_only_changed_files(
+        self, temp_project_dir: Path, sample_config: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        paths = self._paths(bugs_dir)
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.search(paths, {"cache"})
+        assert _row_count(temp_project_dir, "search_docs") == 3
+
+        seen = _count_tokenize(monkeypatch)
+        _write_issue(bugs_dir, paths[0].name, "# BUG-001: Cache stampede\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            hits = index.search(paths, {"cache"})
+
+        assert seen == ["# BUG-001: Cache stampede\n"]
+        assert {h.path for h in hits} == set(paths)
+        assert _row_count(temp_project_dir, "search_docs") == 3
+
+    def test_recently_modified_file_is_searched_but_not_stored(
+        self, temp_project_dir: Path, sample_config: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        path = _write_issue(bugs_dir, "P1-BUG-001-x.md", "# BUG-001: Cache\n", aged=False)
+        seen = _count_tokenize(monkeypatch)
+        for _ in range(2):
+            with IssueIndex.for_project(temp_project_dir) as index:
+                assert [h.path for h in index.search([path], {"cache"})] == [path]
+        assert len(seen) == 2
+        assert _row_count(temp_project_dir, "search_docs") == 0
+
+    def test_deleted_files_are_pruned(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        paths = self._paths(bugs_dir)
+        with IssueIndex.for_project(temp_project_dir) as index:
+            index.search(paths, {"cache"})
+
+        paths[1].unlink()
+        with IssueIndex.for_project(temp_project_dir) as index:
+            hits = index.search(paths[:1], {"cache"})
+        assert hits == []
+        assert _row_count(temp_project_dir, "search_docs") == 2
+        assert _row_count(temp_project_dir, "search_postings") == sum(
+            len(extract_words(p.read_text())) for p in (paths[0], paths[2])
+        )
+
+    def test_pass_through_searches_in_memory(self, tmp_path: Path) -> None:
+        path = tmp_path / "P1-BUG-001-x.md"
+        path.write_text("# BUG-001: Cache eviction\n")
+        _age(path)
+        with IssueIndex.for_project(tmp_path) as index:
+            assert index.db_path is None
+            assert [h.overlap for h in index.search([path], {"cache"})] == [pytest.approx(1 / 3)]
+
+    def test_corrupt_database_searches_in_memory(
+        self, temp_project_dir: Path, sample_config: dict[str, Any]
+    ) -> None:
+        _, bugs_dir = _project(temp_project_dir, sample_config)
+        (temp_project_dir / ".ll" / INDEX_DB_NAME).write_text("not a database")
+        path = _write_issue(bugs_dir, "P1-BUG-001-x.md", "# BUG-001: Cache eviction\n")
+        with IssueIndex.for_project(temp_project_dir) as index:
+            assert [h.overlap for h in index.search([path], {"cache"})] == [pytest.approx(1 / 3)]
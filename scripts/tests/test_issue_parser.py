@@ -4299,6 +4299,7 @@ class TestCheckFormatGapsMalformedDepId:
 class TestCorpusHasNoMalformedDepIds:
     """BUG-3059: the corpus defect this gap kind was built to catch stays fixed."""
 
+    @pytest.mark.usefixtures("passthrough_issue_index")
     def test_no_malformed_dependency_entries_in_repo(self) -> None:
         from little_loops.config.core import BRConfig
         from little_loops.issue_parser import check_format_gaps, find_issues
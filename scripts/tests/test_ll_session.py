@@ -1100,6 +1100,16 @@ class TestRebuildSubcommand:
         out = capsys.readouterr().out
         assert '"tools"' in out
 
+    def test_rebuild_timings_flag_reports_per_extractor_timings(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        db = tmp_path / "history.db"
+        with patch("sys.argv", ["ll-session", "--db", str(db), "rebuild", "--timings", "--json"]):
+            result = main_session()
+        assert result == 0
+        payload = json.loads(capsys.readouterr().out)
+        assert {"decode", "sessions", "tools", "summaries"} <= set(payload["timings_ms"])
+
 
 class TestCompactSubcommand:
     """ll-session compact [--and-prune] — retention lifecycle (ENH-2581)."""
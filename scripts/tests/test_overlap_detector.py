@@ -1,10 +1,12 @@
 """Tests for overlap detector."""
 
+import random
 from pathlib import Path
 from unittest.mock import Mock
 
 from little_loops.issue_parser import IssueInfo
-from little_loops.parallel.overlap_detector import OverlapDetector, OverlapResult
+from little_loops.parallel.file_hints import FileHints
+from little_loops.parallel.overlap_detector import OverlapDetector, OverlapResult, _PathIndex
 
 
 def make_issue(issue_id: str, content: str = "") -> IssueInfo:
@@ -196,6 +198,72 @@ class TestOverlapDetector:
         assert len(errors) == 0
 
 
+class TestPathIndex:
+    """Tests for the inverted index behind check_overlap."""
+
+    def test_file_in_active_directory_found_by_lookup(self) -> None:
+        """A new file under an active directory (and vice versa) is detected."""
+        detector = OverlapDetector()
+        detector.register_issue(make_issue("ENH-001", "Modify scripts/little_loops/cli.py"))
+        detector.register_issue(make_issue("ENH-002", "Rework scripts/little_loops/fsm/ here"))
+
+        result = detector.check_overlap(make_issue("ENH-003", "Touch scripts/little_loops/ all"))
+
+        assert result.overlapping_issues == ["ENH-001", "ENH-002"]
+
+    def test_reregister_keeps_order_and_replaces_hints(self) -> None:
+        """Re-registering an issue replaces its indexed hints in place."""
+        detector = OverlapDetector()
+        detector.register_issue(make_issue("ENH-001", "Modify src/a.py and src/b.py"))
+        detector.register_issue(make_issue("ENH-002", "Modify src/a.py and src/b.py"))
+        detector.register_issue(make_issue("ENH-001", "Modify lib/c.py"))
+
+        result = detector.check_overlap(make_issue("ENH-003", "Modify src/a.py and src/b.py"))
+        assert result.overlapping_issues == ["ENH-002"]
+        assert detector.get_active_issues() == ["ENH-001", "ENH-002"]
+
+    def test_unregister_leaves_index_empty(self) -> None:
+        """Removing every issue drops every index entry."""
+        index = _PathIndex()
+        hints = FileHints(
+            files={"src/pkg/a.py"}, directories={"src/pkg/sub/"}, scopes={"cli"}, issue_id="A"
+        )
+        index.add("A", hints)
+        index.add("B", hints)
+        index.remove("A", hints)
+        index.remove("B", hints)
+
+        assert not (index._files or index._scopes or index._dirs or index._under)
+
+    def test_candidates_superset_of_full_scan(self) -> None:
+        """Every issue a full contends_with scan reports is an index candidate."""
+        rng = random.Random(1234)
+        parts = ["src", "lib", "pkg", "sub", ""]
+
+        def path(directory: bool) -> str:
+            base = "/".join(rng.choice(parts) for _ in range(rng.randint(1, 4)))
+            return base + "/" if directory else f"{base}/{rng.choice(['a.py', 'b.py'])}"
+
+        def hints(issue_id: str) -> FileHints:
+            return FileHints(
+                files={path(False) for _ in range(rng.randint(0, 3))},
+                directories={path(True) for _ in range(rng.randint(0, 3))},
+                scopes={rng.choice("pqrs") for _ in range(rng.randint(0, 1))},
+                issue_id=issue_id,
+            )
+
+        for _ in range(100):
+            active = {f"A{i}": hints(f"A{i}") for i in range(15)}
+            index = _PathIndex()
+            for issue_id, h in active.items():
+                index.add(issue_id, h)
+            for issue_id in list(active)[:4]:
+                index.remove(issue_id, active.pop(issue_id))
+            new = hints("NEW")
+            expected = {i for i, h in active.items() if new.contends_with(h)}
+            assert expected <= index.candidates(new)
+
+
 class TestOverlapResult:
     """Tests for OverlapResult dataclass."""
 
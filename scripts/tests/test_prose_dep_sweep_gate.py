@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from little_loops.config.core import BRConfig
 from little_loops.issue_parser import check_format_gaps, find_issues
 from little_loops.issue_progress import _ALL_STATUSES
@@ -20,6 +22,7 @@ from little_loops.issue_template import resolve_templates_dir
 _REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
+@pytest.mark.usefixtures("passthrough_issue_index")
 def test_no_prose_dependency_drift_in_repo() -> None:
     config = BRConfig(_REPO_ROOT)
     all_issues = find_issues(config, status_filter=set(_ALL_STATUSES))
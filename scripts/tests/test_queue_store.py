@@ -16,6 +16,7 @@ from little_loops.queue_store import (
     AmbiguousEntryIdError,
     add_entry,
     claim_entry,
+    claim_next,
     connect,
     ensure_db,
     get_entry,
@@ -324,6 +325,102 @@ class TestClaimEntry:
         assert get_entry(entry.id, db).status == "running"
 
 
+class TestClaimNext:
+    def test_returns_none_when_nothing_pending(self, tmp_path: Path) -> None:
+        db = tmp_path / "queue.db"
+        entry = add_entry(_spec(), db_path=db)
+        update_entry_result(entry.id, "done", None, db_path=db)
+
+        assert claim_next(db) is None
+
+    def test_claims_in_priority_then_fifo_order(self, tmp_path: Path) -> None:
+        db = tmp_path / "queue.db"
+        low = add_entry(_spec("low"), "P4", db_path=db)
+        high = add_entry(_spec("high"), "P0", db_path=db)
+
+        first = claim_next(db, owner_pid=4242)
+        second = claim_next(db)
+
+        assert first is not None and first.id == high.id
+        assert first.status == "running"
+        assert first.owner_pid == 4242
+        assert first.claimed_at is not None
+        assert second is not None and second.id == low.id
+        assert claim_next(db) is None
+
+    def test_concurrent_claims_get_distinct_entries(self, tmp_path: Path) -> None:
+        db = tmp_path / "queue.db"
+        ids = {add_entry(_spec(f"e{i}"), db_path=db).id for i in range(6)}
+
+        claimed: list[str] = []
+        claimed_lock = threading.Lock()
+        barrier = threading.Barrier(4)
+
+        def drain() -> None:
+            barrier.wait()
+            while (entry := claim_next(db)) is not None:
+                with claimed_lock:
+                    claimed.append(entry.id)
+
+        threads = [threading.Thread(target=drain) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(claimed) == sorted(ids)
+
+    def test_fallback_without_returning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """SQLite < 3.35 takes the SELECT-then-UPDATE path with the same result."""
+        import little_loops.queue_store as queue_store
+
+        monkeypatch.setattr(queue_store, "_HAS_RETURNING", False)
+        db = tmp_path / "queue.db"
+        low = add_entry(_spec("low"), "P4", db_path=db)
+        high = add_entry(_spec("high"), "P0", db_path=db)
+
+        first = claim_next(db, owner_pid=4242)
+        second = claim_next(db)
+
+        assert first is not None and first.id == high.id
+        assert first.status == "running"
+        assert first.owner_pid == 4242
+        assert second is not None and second.id == low.id
+        assert claim_next(db) is None
+
+    def test_claim_index_exists(self, tmp_path: Path) -> None:
+        db = ensure_db(tmp_path / "queue.db")
+        conn = sqlite3.connect(str(db))
+        try:
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(queue_entries)")}
+            plan = " ".join(
+                str(row[3])
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id FROM queue_entries WHERE status = 'pending' "
+                    "ORDER BY priority ASC, enqueued_at ASC LIMIT 1"
+                )
+            )
+        finally:
+            conn.close()
+
+        assert "idx_queue_entries_claim" in indexes
+        assert "idx_queue_entries_claim" in plan
+
+
+class TestListEntriesStatusFilter:
+    def test_filters_by_status(self, tmp_path: Path) -> None:
+        db = tmp_path / "queue.db"
+        done = add_entry(_spec("done"), db_path=db)
+        pending = add_entry(_spec("pending"), db_path=db)
+        update_entry_result(done.id, "done", None, db_path=db)
+
+        assert [e.id for e in list_entries(db, status="pending")] == [pending.id]
+        assert [e.id for e in list_entries(db, status="done")] == [done.id]
+        assert len(list_entries(db)) == 2
+
+
 class TestConnect:
     def test_returns_row_factory_connection(self, tmp_path: Path) -> None:
         db = tmp_path / "queue.db"
@@ -569,6 +569,111 @@ class TestBackfillIncremental:
         assert count == 1
 
 
+class TestRawEventCursor:
+    """backfill_raw_events() resumes each transcript from its byte-offset cursor."""
+
+    @staticmethod
+    def _line(n: int, session_id: str = "sess-c") -> str:
+        return json.dumps(
+            {
+                "type": "user",
+                "sessionId": session_id,
+                "timestamp": f"2026-05-22T00:00:{n:02d}Z",
+                "message": {"content": f"line {n}"},
+            }
+        )
+
+    def _write(self, path: Path, lines: range, *, mode: str = "w") -> None:
+        with path.open(mode, encoding="utf-8") as fh:
+            for n in lines:
+                fh.write(self._line(n) + "\n")
+
+    @staticmethod
+    def _line_nos(db: Path) -> list[int]:
+        conn = connect(db)
+        try:
+            rows = conn.execute("SELECT line_no FROM raw_events ORDER BY line_no").fetchall()
+        finally:
+            conn.close()
+        return [r[0] for r in rows]
+
+    def test_appended_lines_only_are_parsed(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        self._write(jsonl, range(1, 4))
+        assert backfill_raw_events(db, jsonl_files=[jsonl]) == 3
+
+        self._write(jsonl, range(4, 6), mode="a")
+        with patch("little_loops.session_store.lifecycle._pack_payload", wraps=_pack_payload) as p:
+            assert backfill_raw_events(db, jsonl_files=[jsonl]) == 2
+        # raw_line + parsed_json per genuinely new line — none for the old prefix.
+        assert p.call_count == 4
+        assert self._line_nos(db) == [1, 2, 3, 4, 5]
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        self._write(jsonl, range(1, 3))
+        backfill_raw_events(db, jsonl_files=[jsonl])
+        with patch("little_loops.session_store.lifecycle.json.loads") as loads:
+            assert backfill_raw_events(db, jsonl_files=[jsonl]) == 0
+        loads.assert_not_called()
+
+    def test_blank_and_invalid_lines_keep_line_numbering(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        jsonl.write_text(self._line(1) + "\n\nnot json\n", encoding="utf-8")
+        backfill_raw_events(db, jsonl_files=[jsonl])
+        with jsonl.open("a", encoding="utf-8") as fh:
+            fh.write(self._line(4) + "\n")
+        backfill_raw_events(db, jsonl_files=[jsonl])
+        assert self._line_nos(db) == [1, 4]
+
+    def test_unterminated_tail_is_reread_once_complete(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        partial = self._line(2)
+        jsonl.write_text(self._line(1) + "\n" + partial[:10], encoding="utf-8")
+        assert backfill_raw_events(db, jsonl_files=[jsonl]) == 1
+
+        with jsonl.open("a", encoding="utf-8") as fh:
+            fh.write(partial[10:] + "\n")
+        assert backfill_raw_events(db, jsonl_files=[jsonl]) == 1
+        assert self._line_nos(db) == [1, 2]
+
+    def test_in_place_rewrite_falls_back_to_full_replay(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        self._write(jsonl, range(1, 3))
+        backfill_raw_events(db, jsonl_files=[jsonl])
+
+        # Same inode, larger size, different bytes at the cursor's tail line.
+        with jsonl.open("w", encoding="utf-8") as fh:
+            for n in range(10, 14):
+                fh.write(self._line(n, session_id="rewritten") + "\n")
+        assert backfill_raw_events(db, jsonl_files=[jsonl]) == 2
+        assert self._line_nos(db) == [1, 2, 3, 4]
+
+    def test_truncation_resets_cursor(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        db = tmp_path / "history.db"
+        self._write(jsonl, range(1, 4))
+        backfill_raw_events(db, jsonl_files=[jsonl])
+        self._write(jsonl, range(1, 2))
+        backfill_raw_events(db, jsonl_files=[jsonl])
+
+        conn = connect(db)
+        try:
+            row = conn.execute(
+                "SELECT offset, line_no FROM raw_event_cursors WHERE source_path = ?",
+                (str(jsonl),),
+            ).fetchone()
+        finally:
+            conn.close()
+        assert row["line_no"] == 1
+        assert row["offset"] == jsonl.stat().st_size
+
+
 class TestBackfillSkillEvents:
     """BUG-2283: _backfill_skill_events() seeds skill_events from JSONL user records."""
 
@@ -1509,6 +1614,377 @@ class TestRebuild:
         assert n == 1
 
 
+def _mixed_transcript_records() -> list[dict]:
+    """One transcript exercising every rebuild extractor."""
+    return [
+        {
+            "type": "user",
+            "sessionId": "s1",
+            "timestamp": "2026-05-22T00:00:00Z",
+            "message": {"content": "<command-name>/ll:scan-codebase</command-name>"},
+        },
+        {
+            "type": "assistant",
+            "sessionId": "s1",
+            "timestamp": "2026-05-22T00:00:01Z",
+            "message": {
+                "model": "claude-sonnet-4-5",
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+                "content": [
+                    {"type": "text", "text": "Scanning now."},
+                    {"type": "tool_use", "name": "Read", "input": {"file_path": "a.py"}},
+                    {"type": "tool_use", "name": "Grep", "input": {"pattern": "x"}},
+                ],
+            },
+        },
+        {
+            "type": "user",
+            "sessionId": "s1",
+            "timestamp": "2026-05-22T00:00:02Z",
+            "message": {"content": "no, that's wrong"},
+        },
+    ]
+
+
+class TestRebuildSinglePass:
+    """rebuild() decodes each raw_events row once and fans it out to every extractor."""
+
+    _TABLES = (
+        "sessions",
+        "tool_events",
+        "message_events",
+        "assistant_messages",
+        "skill_events",
+        "usage_events",
+    )
+
+    def _seed(self, tmp_path: Path, db: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        jsonl.write_text(
+            "".join(json.dumps(r) + "\n" for r in _mixed_transcript_records()),
+            encoding="utf-8",
+        )
+        backfill_raw_events(db, jsonl_files=[jsonl], since_ts=0.0)
+
+    def _snapshot(self, db: Path) -> dict[str, list[tuple]]:
+        conn = connect(db)
+        try:
+            return {
+                table: sorted(
+                    tuple(row)[1:] if table != "sessions" else tuple(row)
+                    for row in conn.execute(f"SELECT * FROM {table}").fetchall()
+                )
+                for table in self._TABLES
+            }
+        finally:
+            conn.close()
+
+    def test_each_raw_row_is_decoded_once(self, tmp_path: Path) -> None:
+        from little_loops.session_store import lifecycle
+
+        db = tmp_path / "history.db"
+        self._seed(tmp_path, db)
+        real_decode = lifecycle._decode_raw_event
+        with patch.object(
+            lifecycle, "_decode_raw_event", side_effect=real_decode, autospec=True
+        ) as decode:
+            counts = rebuild(db)
+        assert decode.call_count == len(_mixed_transcript_records())
+        assert counts["sessions"] == 1
+        assert counts["tools"] == 2
+        assert counts["messages"] == 2
+        assert counts["assistant_messages"] == 1
+        assert counts["skill_events"] == 1
+        assert counts["usage_events"] == 1
+
+    def test_matches_per_table_backfill(self, tmp_path: Path) -> None:
+        """The fan-out produces exactly the rows the standalone _backfill_* passes do."""
+        from little_loops.session_store.lifecycle import _backfill_sessions
+        from little_loops.session_store.writers import (
+            _backfill_assistant_messages,
+            _backfill_messages,
+            _backfill_skill_events,
+            _backfill_tool_events,
+            _backfill_usage_events,
+        )
+
+        db = tmp_path / "history.db"
+        self._seed(tmp_path, db)
+        rebuild(db)
+        single_pass = self._snapshot(db)
+
+        conn = connect(db)
+        try:
+            for table in self._TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            for backfill_fn in (
+                _backfill_sessions,
+                _backfill_tool_events,
+                _backfill_messages,
+                _backfill_assistant_messages,
+                _backfill_skill_events,
+                _backfill_usage_events,
+            ):
+                backfill_fn(
+                    conn, conn.execute("SELECT raw_line, source_path, host FROM raw_events")
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        assert self._snapshot(db) == single_pass
+
+    def test_replay_pages_through_every_row_in_order(self, tmp_path: Path) -> None:
+        from little_loops.session_store.lifecycle import _replay_raw_events
+
+        db = tmp_path / "history.db"
+        self._seed(tmp_path, db)
+        seen: list[str] = []
+
+        def first(record: dict, source_label: str) -> int:
+            seen.append(f"first:{record['timestamp']}")
+            return 1
+
+        def second(record: dict, source_label: str) -> int:
+            seen.append(f"second:{record['timestamp']}")
+            return 0
+
+        conn = connect(db)
+        try:
+            counts, timings = _replay_raw_events(
+                conn, [("first", first), ("second", second)], batch_size=2
+            )
+        finally:
+            conn.close()
+        stamps = [r["timestamp"] for r in _mixed_transcript_records()]
+        assert seen == [f"{sink}:{ts}" for ts in stamps for sink in ("first", "second")]
+        assert counts == {"first": 3, "second": 0}
+        assert set(timings) == {"decode", "first", "second"}
+
+    def test_timings_recorded_in_meta(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        self._seed(tmp_path, db)
+        rebuild(db)
+        conn = connect(db)
+        try:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'last_rebuild_timings'"
+            ).fetchone()
+        finally:
+            conn.close()
+        timings = json.loads(row["value"])
+        assert {"decode", "sessions", "tools", "corrections", "summaries"} <= set(timings)
+        assert all(ms >= 0 for ms in timings.values())
+
+
+class TestIncrementalRebuild:
+    """rebuild(incremental=True) derives only raw_events rows past the watermark."""
+
+    def _append(self, jsonl: Path, db: Path, *records: dict) -> None:
+        with jsonl.open("a", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+        backfill_raw_events(db, jsonl_files=[jsonl], since_ts=0.0)
+
+    def _count(self, db: Path, sql: str) -> int:
+        conn = connect(db)
+        try:
+            return int(conn.execute(sql).fetchone()[0])
+        finally:
+            conn.close()
+
+    def _user(self, ts: str, text: str) -> dict:
+        return {"type": "user", "sessionId": "s1", "timestamp": ts, "message": {"content": text}}
+
+    def test_only_new_rows_are_derived(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        self._append(jsonl, db, *_mixed_transcript_records())
+        rebuild(db)
+
+        self._append(jsonl, db, self._user("2026-05-22T00:00:03Z", "one more thing"))
+        counts = rebuild(db, incremental=True)
+
+        assert counts["messages"] == 1
+        assert counts["tools"] == 0
+        assert counts["sessions"] == 0
+        assert self._count(db, "SELECT COUNT(*) FROM message_events") == 3
+        assert self._count(db, "SELECT COUNT(*) FROM tool_events") == 2
+        assert self._count(db, "SELECT COUNT(*) FROM search_index WHERE kind = 'tool'") == 2
+
+    def test_incremental_result_matches_full_rebuild(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        records = _mixed_transcript_records()
+        self._append(jsonl, db, *records[:1])
+        rebuild(db, incremental=True)
+        self._append(jsonl, db, *records[1:])
+        rebuild(db, incremental=True)
+        incremental = TestRebuildSinglePass()._snapshot(db)
+
+        rebuild(db)
+        assert TestRebuildSinglePass()._snapshot(db) == incremental
+
+    def test_steady_state_replays_nothing(self, tmp_path: Path) -> None:
+        from little_loops.session_store import lifecycle
+
+        db = tmp_path / "history.db"
+        self._append(tmp_path / "s.jsonl", db, *_mixed_transcript_records())
+        rebuild(db)
+        with patch.object(lifecycle, "_decode_raw_event", autospec=True) as decode:
+            counts = rebuild(db, incremental=True)
+        assert decode.call_count == 0
+        assert sum(counts.values()) == 0
+
+    def test_schema_version_change_forces_full_rebuild(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        self._append(tmp_path / "s.jsonl", db, *_mixed_transcript_records())
+        rebuild(db)
+        conn = connect(db)
+        try:
+            conn.execute(
+                "INSERT INTO message_events(ts, session_id, content) VALUES('x', 'stale', 'x')"
+            )
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE key = 'last_rebuild_version'",
+                (str(SCHEMA_VERSION - 1),),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        counts = rebuild(db, incremental=True)
+        assert counts["messages"] == 2
+        assert self._count(db, "SELECT COUNT(*) FROM message_events") == 2
+
+    def test_interrupted_run_resumes_without_duplicates(self, tmp_path: Path) -> None:
+        """Replayed pages commit with their watermark; post-passes catch up next run."""
+        from little_loops.session_store import lifecycle
+
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        self._append(jsonl, db, self._user("2026-05-22T00:00:00Z", "hello"))
+        rebuild(db)
+
+        self._append(jsonl, db, self._user("2026-05-22T00:00:01Z", "no, that's wrong"))
+        with patch.object(
+            lifecycle, "mine_corrections_from_messages", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError):
+                rebuild(db, incremental=True)
+
+        counts = rebuild(db, incremental=True)
+        assert counts["messages"] == 0
+        assert counts["corrections"] == 1
+        assert self._count(db, "SELECT COUNT(*) FROM message_events") == 2
+
+    def test_live_tool_and_skill_rows_are_adopted_not_duplicated(self, tmp_path: Path) -> None:
+        """Rows the hooks wrote live are stamped derived instead of inserted again (v44)."""
+        from little_loops.session_store import _hash_args, record_skill_event
+
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        self._append(jsonl, db, self._user("2026-05-22T00:00:00Z", "hello"))
+        rebuild(db)
+
+        # What post_tool_use and user_prompt_submit write while the session runs.
+        conn = connect(db)
+        try:
+            for tool, args in (("Read", {"file_path": "a.py"}), ("Grep", {"pattern": "x"})):
+                conn.execute(
+                    "INSERT INTO tool_events(ts, session_id, tool_name, args_hash, bytes_in) "
+                    "VALUES('2026-05-22T00:00:09Z', 's1', ?, ?, 42)",
+                    (tool, _hash_args(args)),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        record_skill_event(db, "s1", "scan-codebase", "")
+
+        self._append(jsonl, db, *_mixed_transcript_records())
+        counts = rebuild(db, incremental=True)
+
+        assert counts["tools"] == 0
+        assert counts["skill_events"] == 0
+        assert self._count(db, "SELECT COUNT(*) FROM tool_events") == 2
+        assert self._count(db, "SELECT COUNT(*) FROM tool_events WHERE derived = 1") == 2
+        assert self._count(db, "SELECT COUNT(*) FROM tool_events WHERE bytes_in = 42") == 2
+        assert self._count(db, "SELECT COUNT(*) FROM skill_events") == 1
+        assert self._count(db, "SELECT COUNT(*) FROM search_index WHERE kind = 'tool'") == 0
+
+    def test_repeated_call_adopts_one_live_row_each(self, tmp_path: Path) -> None:
+        """Two identical calls with one live row leave two rows, not one or three."""
+        from little_loops.session_store import _hash_args
+
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        self._append(jsonl, db, self._user("2026-05-22T00:00:00Z", "hello"))
+        rebuild(db)
+        conn = connect(db)
+        try:
+            conn.execute(
+                "INSERT INTO tool_events(ts, session_id, tool_name, args_hash) "
+                "VALUES('2026-05-22T00:00:09Z', 's1', 'Bash', ?)",
+                (_hash_args({"command": "ls"}),),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        call = {"type": "tool_use", "name": "Bash", "input": {"command": "ls"}}
+        self._append(
+            jsonl,
+            db,
+            *(
+                {
+                    "type": "assistant",
+                    "sessionId": "s1",
+                    "timestamp": ts,
+                    "message": {"content": [call]},
+                }
+                for ts in ("2026-05-22T00:00:01Z", "2026-05-22T00:00:02Z")
+            ),
+        )
+        counts = rebuild(db, incremental=True)
+
+        assert counts["tools"] == 1
+        assert self._count(db, "SELECT COUNT(*) FROM tool_events") == 2
+
+    def test_live_loop_run_usage_is_not_double_counted(self, tmp_path: Path) -> None:
+        """Per-turn usage inside a run with live usage rows is skipped."""
+        from little_loops.session_store import record_usage_event
+
+        db = tmp_path / "history.db"
+        jsonl = tmp_path / "s.jsonl"
+        self._append(jsonl, db, self._user("2026-05-22T00:00:00Z", "hello"))
+        rebuild(db)
+        conn = connect(db)
+        try:
+            conn.execute(
+                "INSERT INTO loop_runs(run_id, loop_name, started_at, ended_at) "
+                "VALUES('run-1', 'demo', '2026-05-22T00:00:00Z', '2026-05-22T00:00:05Z')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        record_usage_event(
+            db,
+            run_id="run-1",
+            ts="2026-05-22T00:00:05Z",
+            state="work",
+            model="claude-sonnet-4-5",
+            input_tokens=10,
+            output_tokens=5,
+            cache_read_tokens=0,
+            cache_creation_tokens=0,
+        )
+
+        self._append(jsonl, db, *_mixed_transcript_records())
+        counts = rebuild(db, incremental=True)
+
+        assert counts["usage_events"] == 0
+        assert self._count(db, "SELECT COUNT(*) FROM usage_events") == 1
+
+
 class TestBackfillUsageEvents:
     """_backfill_usage_events parses real LLM token usage from raw_events (ENH-2461)."""
 
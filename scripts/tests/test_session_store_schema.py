@@ -647,7 +647,7 @@ class TestSchemaV6:
         finally:
             conn.close()
         assert int(row[0]) == SCHEMA_VERSION
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
 
 
 class TestSchemaV9:
@@ -661,8 +661,8 @@ class TestSchemaV9:
             row = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()
         finally:
             conn.close()
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_idx_corrections_dedup_exists(self, tmp_path: Path) -> None:
         db = tmp_path / "history.db"
@@ -713,8 +713,8 @@ class TestSchemaV10:
             row = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()
         finally:
             conn.close()
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_summary_nodes_table_exists(self, tmp_path: Path) -> None:
         db = tmp_path / "history.db"
@@ -792,7 +792,7 @@ class TestSchemaV10:
             }
         finally:
             conn.close()
-        assert int(version[0]) == 41
+        assert int(version[0]) == 44
         assert "summary_nodes" in names
         assert "summary_spans" in names
         assert "assistant_messages" in names
@@ -809,8 +809,8 @@ class TestSchemaV12:
             row = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()
         finally:
             conn.close()
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_summary_nodes_has_level_column(self, tmp_path: Path) -> None:
         db = tmp_path / "history.db"
@@ -1005,6 +1005,8 @@ class TestSchemaV20UsageEvents:
             "provider_vendor",
             # v29 (ENH-2723) run_id join key
             "run_id",
+            # v44 live/derived marker
+            "derived",
         }
 
 
@@ -1031,8 +1033,8 @@ class TestSchemaV13:
             row = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()
         finally:
             conn.close()
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_correction_retirements_table_exists(self, tmp_path: Path) -> None:
         db = tmp_path / "history.db"
@@ -1072,8 +1074,8 @@ class TestSchemaV14:
             row = conn.execute("SELECT value FROM meta WHERE key='schema_version'").fetchone()
         finally:
             conn.close()
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_issue_snapshots_table_exists(self, tmp_path: Path) -> None:
         db = tmp_path / "history.db"
@@ -1127,7 +1129,7 @@ class TestSchemaV14:
             }
         finally:
             conn.close()
-        assert int(version[0]) == 41
+        assert int(version[0]) == 44
         assert "issue_snapshots" in names
 
 
@@ -1410,7 +1412,7 @@ class TestSchemaV27:
         assert cols == {"id", "ts", "session_id", "event", "detail", "head_sha", "branch"}
 
     def test_v26_db_upgrades_gains_session_lifecycle_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 26)
         ensure_db(db)
@@ -1450,7 +1452,7 @@ class TestSchemaV28:
         }
 
     def test_v27_db_upgrades_gains_subagent_runs(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 27)
         ensure_db(db)
@@ -1494,7 +1496,7 @@ class TestSchemaV29:
         assert "idx_usage_events_run_id" in names
 
     def test_v28_db_upgrades_gains_run_id_column(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 28)
         ensure_db(db)
@@ -1544,7 +1546,7 @@ class TestSchemaV30HookEvents:
         assert {"idx_hook_event_name", "idx_hook_session", "idx_hook_exit"} <= names
 
     def test_v29_db_upgrades_gains_hook_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 29)
         ensure_db(db)
@@ -1619,7 +1621,7 @@ class TestSchemaV31HarnessEvents:
         } <= names
 
     def test_v30_db_upgrades_gains_harness_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 30)
         ensure_db(db)
@@ -1679,7 +1681,7 @@ class TestSchemaV32PromptOptEvents:
         assert {"idx_prompt_opt_events_session", "idx_prompt_opt_events_mode"} <= names
 
     def test_v31_db_upgrades_gains_prompt_opt_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 31)
         ensure_db(db)
@@ -1747,7 +1749,7 @@ class TestSchemaV33VerdictEvents:
         assert {"idx_verdict_kind", "idx_verdict_target", "idx_verdict_session"} <= names
 
     def test_v32_db_upgrades_gains_verdict_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 32)
         ensure_db(db)
@@ -1812,7 +1814,7 @@ class TestSchemaV34ContextPressureEvents:
         assert {"idx_pressure_session", "idx_pressure_ts", "idx_pressure_crossed"} <= names
 
     def test_v33_db_upgrade_gains_context_pressure_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 33)
         ensure_db(db)
@@ -1880,7 +1882,7 @@ class TestSchemaV35ReviewEvents:
         assert {"idx_review_skill", "idx_review_target", "idx_review_session"} <= names
 
     def test_v34_db_upgrade_gains_review_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 34)
         ensure_db(db)
@@ -1925,7 +1927,7 @@ class TestSchemaV38BaseShaColumns:
 
     def test_v37_db_upgrades_preserving_unstamped_rows(self, tmp_path: Path) -> None:
         """Pre-migration orchestration rows survive with NULL stamp columns."""
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 37)
         conn = sqlite3.connect(str(db))
@@ -1980,7 +1982,7 @@ class TestSchemaV39HarnessContentPin:
 
     def test_v38_db_upgrades_preserving_unpinned_rows(self, tmp_path: Path) -> None:
         """Pre-v39 harness rows survive with NULL content-pin columns."""
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 38)
         conn = sqlite3.connect(str(db))
@@ -2009,6 +2011,102 @@ class TestSchemaV39HarnessContentPin:
         assert row["dirty"] is None
 
 
+class TestSchemaV43MessageTrigrams:
+    """v43 migration: trigram FTS5 shadow of message_events for ll_grep."""
+
+    @staticmethod
+    def _matches(conn: sqlite3.Connection, phrase: str) -> list[int]:
+        return [
+            r[0]
+            for r in conn.execute(
+                "SELECT rowid FROM message_trigrams WHERE message_trigrams MATCH ? ORDER BY rowid",
+                (f'"{phrase}"',),
+            )
+        ]
+
+    def test_triggers_track_insert_update_delete(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        ensure_db(db)
+        conn = sqlite3.connect(str(db))
+        try:
+            conn.execute(
+                "INSERT INTO message_events(ts, session_id, content) VALUES(?, ?, ?)",
+                ("2026-06-01T00:00:00Z", "s1", "Refactor the FSM runner"),
+            )
+            row_id = conn.execute("SELECT id FROM message_events").fetchone()[0]
+            assert self._matches(conn, "fsm run") == [row_id]
+
+            conn.execute(
+                "UPDATE message_events SET content = 'rename the parser' WHERE id = ?", (row_id,)
+            )
+            assert self._matches(conn, "fsm run") == []
+            assert self._matches(conn, "parser") == [row_id]
+
+            conn.execute("DELETE FROM message_events")
+            assert self._matches(conn, "parser") == []
+        finally:
+            conn.close()
+
+    def test_v42_db_upgrade_indexes_existing_messages(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        _bootstrap_schema_at(db, 42)
+        conn = sqlite3.connect(str(db))
+        try:
+            conn.execute(
+                "INSERT INTO message_events(ts, session_id, content) VALUES(?, ?, ?)",
+                ("2026-06-01T00:00:00Z", "s1", "pre-upgrade message body"),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        ensure_db(db)
+
+        conn = sqlite3.connect(str(db))
+        try:
+            assert self._matches(conn, "upgrade message") == [1]
+        finally:
+            conn.close()
+
+    def test_trigger_bodies_split_as_single_statements(self) -> None:
+        from little_loops.session_store import _MIGRATIONS, _split_sql_statements
+
+        statements = _split_sql_statements(_MIGRATIONS[42])
+        triggers = [s for s in statements if s.startswith("CREATE TRIGGER")]
+        assert len(triggers) == 3
+        assert all(s.endswith("END") for s in triggers)
+
+
+class TestSchemaV44DerivedFlag:
+    """v44 migration: derived marker on the tables rebuild() shares with live writers."""
+
+    def test_v43_db_upgrades_with_existing_rows_marked_live(self, tmp_path: Path) -> None:
+        db = tmp_path / "history.db"
+        _bootstrap_schema_at(db, 43)
+        conn = sqlite3.connect(str(db))
+        try:
+            conn.execute(
+                "INSERT INTO tool_events(ts, session_id, tool_name) VALUES('t', 's', 'Read')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        ensure_db(db)
+        conn = connect(db)
+        try:
+            for table in ("tool_events", "skill_events", "usage_events"):
+                cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+                assert "derived" in cols
+            row = conn.execute("SELECT derived FROM tool_events").fetchone()
+            names = {
+                r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+        finally:
+            conn.close()
+        assert row[0] == 0
+        assert {"idx_tool_events_live", "idx_skill_events_live"} <= names
+
+
 class TestPackageReexportSurface:
     """ENH-2890: session_store.py -> session_store/ package split.
 
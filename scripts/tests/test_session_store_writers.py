@@ -246,6 +246,102 @@ class TestSQLiteTransportIssueEvents:
         assert len(rows) == 1
 
 
+class TestSQLiteTransportBatching:
+    """Queue-backed writer: batched commits, flush/close barriers, stats."""
+
+    @staticmethod
+    def _count(db: Path, table: str) -> int:
+        conn = connect(db)
+        try:
+            return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        finally:
+            conn.close()
+
+    def test_groups_events_into_one_transaction(self, tmp_path: Path) -> None:
+        db = tmp_path / "session.db"
+        transport = SQLiteTransport(db, batch_size=50, flush_ms=60_000)
+        for n in range(50):
+            transport.send({"event": "state_enter", "loop_name": "x", "state": f"s{n}"})
+        assert transport.flush()
+        stats = transport.get_stats()
+        transport.close()
+        assert stats["events_written"] == 50
+        assert stats["batches"] == 1
+        assert stats["backlog"] == 0
+        assert self._count(db, "loop_events") == 50
+
+    def test_flush_makes_rows_visible_without_waiting_for_interval(self, tmp_path: Path) -> None:
+        db = tmp_path / "session.db"
+        transport = SQLiteTransport(db, flush_ms=60_000)
+        transport.send({"event": "loop_start", "loop_name": "x"})
+        assert transport.flush(timeout=5)
+        assert self._count(db, "loop_events") == 1
+        transport.close()
+
+    def test_close_commits_queued_events(self, tmp_path: Path) -> None:
+        db = tmp_path / "session.db"
+        transport = SQLiteTransport(db, batch_size=1000, flush_ms=60_000)
+        for _ in range(10):
+            transport.send({"event": "state_enter", "loop_name": "x", "state": "s"})
+        transport.close()
+        assert self._count(db, "loop_events") == 10
+
+    def test_unrecognised_events_are_not_queued(self, tmp_path: Path) -> None:
+        transport = SQLiteTransport(tmp_path / "session.db")
+        transport.send({"event": "action_output", "loop_name": "x"})
+        transport.flush()
+        assert transport.get_stats()["events_written"] == 0
+        transport.close()
+
+    def test_full_queue_drops_newest_and_counts(self, tmp_path: Path) -> None:
+        transport = SQLiteTransport(tmp_path / "session.db", max_queue=1)
+        transport._queue.put(None)  # stop the writer so the queue cannot drain
+        transport._thread.join(timeout=5)  # type: ignore[union-attr]
+        transport.send({"event": "loop_start", "loop_name": "kept"})
+        transport.send({"event": "loop_start", "loop_name": "dropped"})
+        assert transport.get_stats()["events_dropped"] == 1
+        assert transport.get_stats()["backlog"] == 1
+        transport.close()
+
+    def test_failing_event_does_not_lose_its_batch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from little_loops.session_store import writers
+
+        db = tmp_path / "session.db"
+        real_write = SQLiteTransport._write_event
+
+        def flaky(conn: sqlite3.Connection, pending: writers._PendingWrite) -> None:
+            if pending.event.get("loop_name") == "bad":
+                raise sqlite3.OperationalError("boom")
+            real_write(conn, pending)
+
+        monkeypatch.setattr(SQLiteTransport, "_write_event", staticmethod(flaky))
+        transport = SQLiteTransport(db, batch_size=3, flush_ms=60_000)
+        for name in ("good-1", "bad", "good-2"):
+            transport.send({"event": "loop_start", "loop_name": name})
+        transport.flush()
+        stats = transport.get_stats()
+        transport.close()
+        assert stats["events_written"] == 2
+        assert stats["write_errors"] == 1
+        assert self._count(db, "loop_events") == 2
+
+    def test_snapshot_shares_writer_connection(self, tmp_path: Path) -> None:
+        """The snapshot is read at send() time and written in the event's batch."""
+        issue_file = tmp_path / "P2-BUG-41-moved.md"
+        issue_file.write_text("---\nid: BUG-41\ntitle: Moved\n---\n# body\n", encoding="utf-8")
+        db = tmp_path / "session.db"
+        transport = SQLiteTransport(db, flush_ms=60_000)
+        transport.send(
+            {"event": "issue.completed", "issue_id": "BUG-41", "file_path": str(issue_file)}
+        )
+        issue_file.unlink()  # a move right after emit must not lose the snapshot
+        transport.close()
+        assert self._count(db, "issue_events") == 1
+        assert self._count(db, "issue_snapshots") == 1
+
+
 class TestIsCorrectionHeuristic:
     """ENH-1831: correction-detection heuristic."""
 
@@ -467,8 +563,8 @@ class TestCliEventContext:
         finally:
             conn.close()
         assert "cli_events" in names
-        assert SCHEMA_VERSION == 41
-        assert int(row[0]) == 41
+        assert SCHEMA_VERSION == 44
+        assert int(row[0]) == 44
 
     def test_cli_event_context_respects_LL_HISTORY_DB(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -1150,7 +1246,7 @@ class TestOrchestrationRuns:
         return recorder
 
     def test_v21_db_upgrades_gains_orchestration_runs(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 21)
         ensure_db(db)
@@ -1280,7 +1376,7 @@ class TestPrepatchEvidence:
     """ENH-2997: prepatch_evidence table, writer, and reader round trip."""
 
     def test_v39_db_upgrades_gains_prepatch_evidence(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 39)
         ensure_db(db)
@@ -1537,7 +1633,7 @@ class TestLoopRuns:
         return updater
 
     def test_v22_db_upgrades_gains_loop_runs(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 22)
         ensure_db(db)
@@ -1735,7 +1831,7 @@ class TestRecordLearningTestEvent:
         assert recent(db, kind="learning_test") == []
 
     def test_v25_db_upgrades_gains_learning_test_events(self, tmp_path: Path) -> None:
-        assert SCHEMA_VERSION == 41
+        assert SCHEMA_VERSION == 44
         db = tmp_path / "history.db"
         _bootstrap_schema_at(db, 25)
         ensure_db(db)
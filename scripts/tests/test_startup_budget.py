@@ -0,0 +1,240 @@
+"""Tests for little_loops.startup_budget and the lazy package re-exports."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from little_loops.cli.doctor import main_doctor
+from little_loops.host_runner import CapabilityEntry, CapabilityReport
+from little_loops.startup_budget import (
+    _MARKER,
+    DEFAULT_BUDGET_MS,
+    ImportProfile,
+    budget_for,
+    check_startup_budgets,
+    console_scripts,
+    measure,
+    parse_importtime,
+)
+
+_LAZY_PACKAGES = (
+    "little_loops",
+    "little_loops.cli",
+    "little_loops.fsm",
+    "little_loops.parallel",
+)
+
+_IMPORTTIME = "\n".join(
+    [
+        "import time: self [us] | cumulative | imported package",
+        "import time:      2000 |       2000 |   site",
+        _MARKER,
+        "import time:       100 |        100 |     json.decoder",
+        "import time:       300 |       1500 |   json",
+        "import time:       200 |       5000 | little_loops.cli",
+        "import time:       900 |        900 |     rich.console",
+        "import time:       400 |       2500 | little_loops.fsm",
+    ]
+)
+
+
+def _modules_after(statement: str) -> set[str]:
+    """``sys.modules`` keys after running ``statement`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return set(result.stdout.split())
+
+
+class TestParseImporttime:
+    def test_counts_only_top_level_imports_after_marker(self) -> None:
+        total, top_level, _ = parse_importtime(_IMPORTTIME)
+
+        assert top_level == {"little_loops.cli": 5.0, "little_loops.fsm": 2.5}
+        assert total == 7.5
+
+    def test_packages_include_nested_imports(self) -> None:
+        _, _, packages = parse_importtime(_IMPORTTIME)
+
+        assert packages == {"json", "little_loops", "rich"}
+
+    def test_without_marker_parses_everything(self) -> None:
+        total, top_level, _ = parse_importtime(_IMPORTTIME.replace(_MARKER, ""))
+
+        assert "site" not in top_level  # indented: nested under the interpreter
+        assert total == 7.5
+
+
+class TestBudgets:
+    def test_default_budget(self) -> None:
+        assert budget_for("ll-no-such-command") == DEFAULT_BUDGET_MS
+
+    def test_scale_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("LL_STARTUP_BUDGET_SCALE", "2.5")
+
+        assert budget_for("ll-no-such-command") == DEFAULT_BUDGET_MS * 2.5
+
+    @pytest.mark.parametrize("raw", ["fast", "0", "-1"])
+    def test_invalid_scale_falls_back_to_one(
+        self, raw: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("LL_STARTUP_BUDGET_SCALE", raw)
+
+        assert budget_for("ll-no-such-command") == DEFAULT_BUDGET_MS
+
+    def test_profile_ok(self) -> None:
+        assert ImportProfile("ll-x", "m:f", 10.0, 20.0).ok
+        assert not ImportProfile("ll-x", "m:f", 30.0, 20.0).ok
+        assert not ImportProfile("ll-x", "m:f", 10.0, 20.0, deferred_leaks=("rich",)).ok
+        assert not ImportProfile("ll-x", "m:f", 0.0, 20.0, error="ImportError").ok
+
+
+class TestMeasure:
+    def test_reports_import_failure(self) -> None:
+        profile = measure("ll-broken", "little_loops.no_such_module:main", runs=1)
+
+        assert not profile.ok
+        assert "ModuleNotFoundError" in profile.error
+
+    def test_measures_real_entry_point(self) -> None:
+        profile = measure("ll-loop", "little_loops.cli:main_loop", runs=1)
+
+        assert profile.error == ""
+        assert profile.total_ms > 0
+        assert profile.slowest
+
+
+class TestLazyPackages:
+    @pytest.mark.parametrize("package", _LAZY_PACKAGES)
+    def test_exports_match_all(self, package: str) -> None:
+        module = importlib.import_module(package)
+
+        assert set(module._EXPORTS) == set(module.__all__)
+
+    @pytest.mark.parametrize("package", _LAZY_PACKAGES)
+    def test_every_export_resolves(self, package: str) -> None:
+        module = importlib.import_module(package)
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None, f"{package}.{name}"
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_unknown_attribute_raises(self) -> None:
+        import little_loops.cli
+
+        with pytest.raises(AttributeError, match="no_such_name"):
+            little_loops.cli.no_such_name  # noqa: B018
+
+    def test_package_import_defers_submodules(self) -> None:
+        loaded = _modules_after("import little_loops, little_loops.cli")
+
+        for heavy in (
+            "little_loops.fsm.executor",
+            "little_loops.parallel.orchestrator",
+            "little_loops.issue_manager",
+            "little_loops.cli.sprint",
+        ):
+            assert heavy not in loaded
+
+    def test_entry_point_loads_only_its_own_command(self) -> None:
+        loaded = _modules_after("from little_loops.cli import main_history")
+
+        assert "little_loops.cli.history" in loaded
+        assert "little_loops.cli.loop" not in loaded
+
+
+@pytest.fixture
+def scripts() -> dict[str, str]:
+    found = console_scripts()
+    if not found:
+        pytest.skip("little-loops is not installed; no console_scripts metadata")
+    return found
+
+
+class TestConsoleScripts:
+    def test_no_entry_point_imports_deferred_modules(self, scripts: dict[str, str]) -> None:
+        profiles = check_startup_budgets(scripts, runs=1)
+
+        assert [p.command for p in profiles if p.error] == []
+        assert {p.command: p.deferred_leaks for p in profiles if p.deferred_leaks} == {}
+
+    @pytest.mark.no_parallel
+    def test_entry_points_fit_import_budget(self, scripts: dict[str, str]) -> None:
+        """Timing gate; run serially (``-n 0``) so parallel workers do not skew it."""
+        over = [
+            f"{p.command}: {p.total_ms:.0f}ms > {p.budget_ms:.0f}ms (slowest: {p.slowest[:2]})"
+            for p in check_startup_budgets(scripts)
+            if not p.ok
+        ]
+
+        assert over == []
+
+
+class TestDoctorStartup:
+    def _run(self, profiles: list[ImportProfile], *argv: str) -> tuple[int, list[str]]:
+        runner = MagicMock()
+        runner.describe_capabilities.return_value = CapabilityReport(
+            host="claude-code",
+            binary="claude",
+            version="",
+            capabilities=[CapabilityEntry("streaming", "full")],
+        )
+        runner.detect.return_value = False
+        config = MagicMock()
+        config.analytics_capture.skills = ["*"]
+        config.analytics_capture.cli_commands = ["*"]
+        config.analytics_capture.corrections = True
+        config.analytics_capture.file_events = True
+        config.analytics_capture.correction_patterns = []
+        config.issues.auto_commit = False
+        config.issues.auto_commit_prefix = "chore(issues)"
+        lines: list[str] = []
+        with (
+            patch("little_loops.host_runner.resolve_host", return_value=runner),
+            patch("little_loops.host_runner.apply_host_cli_from_config"),
+            patch("little_loops.config.BRConfig", return_value=config),
+            patch("little_loops.cli.doctor.check_startup_budgets", return_value=profiles),
+            patch("builtins.print", side_effect=lambda *a: lines.append(str(a[0]) if a else "")),
+        ):
+            code = main_doctor(["--startup", *argv])
+        return code, lines
+
+    def test_within_budget_exits_zero(self) -> None:
+        code, lines = self._run([ImportProfile("ll-loop", "little_loops.cli:main_loop", 90, 400)])
+
+        assert code == 0
+        assert "Startup Budget (--startup)" in lines
+        assert any("ll-loop" in line and "90ms / 400ms budget" in line for line in lines)
+
+    def test_over_budget_exits_one(self) -> None:
+        profile = ImportProfile(
+            "ll-loop", "little_loops.cli:main_loop", 900, 400, slowest=(("rich", 700.0),)
+        )
+
+        code, lines = self._run([profile])
+
+        assert code == 1
+        assert any("slowest import: rich (700ms)" in line for line in lines)
+
+    def test_json_includes_startup_rows(self) -> None:
+        profile = ImportProfile(
+            "ll-loop", "little_loops.cli:main_loop", 90, 400, deferred_leaks=("rich",)
+        )
+
+        code, lines = self._run([profile], "--json")
+
+        data = json.loads("\n".join(lines))
+        assert code == 1
+        assert data["startup"][0]["command"] == "ll-loop"
+        assert data["startup"][0]["ok"] is False
+        assert data["startup"][0]["deferred_leaks"] == ["rich"]
@@ -268,7 +268,7 @@ class TestSweepStaleRefsAutoFix:
 
 
 class TestSweepStaleRefsGracefulDegradation:
-    def test_exits_zero_with_no_cwd(self) -> None:
+    def test_exits_zero_with_no_cwd(self, in_tmp: Path) -> None:
         """Handler must not raise and must return exit_code=0 when cwd is empty."""
         event = LLHookEvent(host="claude-code", intent="session_end", payload={}, cwd=None)
         result = handle(event)
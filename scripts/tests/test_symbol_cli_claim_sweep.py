@@ -29,6 +29,7 @@ _REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 @pytest.mark.timeout(180)
+@pytest.mark.usefixtures("passthrough_issue_index")
 def test_symbol_and_cli_flag_claim_sweep_report_only() -> None:
     config = BRConfig(_REPO_ROOT)
     ref_index = build_ref_index(config.project_root)
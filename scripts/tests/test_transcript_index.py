@@ -0,0 +1,238 @@
+"""Tests for little_loops.transcript_index (the ll-logs transcript index)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from little_loops.session_store import host_layout_for
+from little_loops.transcript_index import INDEX_DB_NAME, TranscriptIndex
+
+
+def _line(record: dict[str, Any]) -> str:
+    return json.dumps(record) + "\n"
+
+
+def _skill(name: str, ts: str, sid: str = "s1") -> dict[str, Any]:
+    return {
+        "type": "user",
+        "cwd": "/work/project",
+        "timestamp": ts,
+        "sessionId": sid,
+        "message": {"content": f"<command-name>/ll:{name}</command-name>"},
+    }
+
+
+def _bash_call(tool_id: str, command: str) -> dict[str, Any]:
+    return {
+        "type": "assistant",
+        "timestamp": "2026-03-01T10:00:00Z",
+        "sessionId": "s1",
+        "message": {
+            "content": [
+                {"type": "tool_use", "id": tool_id, "name": "Bash", "input": {"command": command}}
+            ]
+        },
+    }
+
+
+def _bash_result(tool_id: str, text: str, *, is_error: bool) -> dict[str, Any]:
+    return {
+        "type": "user",
+        "timestamp": "2026-03-01T10:00:05Z",
+        "sessionId": "s1",
+        "message": {
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "is_error": is_error,
+                    "content": text,
+                }
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> Iterator[TranscriptIndex]:
+    idx = TranscriptIndex(tmp_path / INDEX_DB_NAME)
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    folder = tmp_path / "projects" / "-work-project"
+    folder.mkdir(parents=True)
+    return folder
+
+
+LAYOUT = host_layout_for("claude-code")
+
+
+def _offset(index: TranscriptIndex, path: Path) -> int:
+    conn = sqlite3.connect(index.db_path)
+    try:
+        return conn.execute(
+            "SELECT offset FROM transcripts WHERE path = ?", (str(path),)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestRefresh:
+    def test_summary_reports_cwd_and_activity(self, index: TranscriptIndex, project: Path) -> None:
+        (project / "a.jsonl").write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+        (project / "agent-x.jsonl").write_text(_line(_skill("ignored", "2026-03-01T09:00:00Z")))
+        (project / "b.jsonl").write_text(_line({"type": "user", "message": {"content": "hi"}}))
+
+        summaries = {s.path.name: s for s in index.refresh(project, LAYOUT)}
+
+        assert set(summaries) == {"a.jsonl", "b.jsonl"}
+        assert summaries["a.jsonl"].cwd == "/work/project"
+        assert summaries["a.jsonl"].ll_activity
+        assert not summaries["b.jsonl"].ll_activity
+
+    def test_appended_lines_are_read_from_the_stored_offset(
+        self, index: TranscriptIndex, project: Path
+    ) -> None:
+        path = project / "a.jsonl"
+        path.write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+        index.refresh(project, LAYOUT)
+        first_size = path.stat().st_size
+        assert _offset(index, path) == first_size
+
+        with path.open("a") as f:
+            f.write(_line(_skill("manage-issue", "2026-03-01T09:05:00Z")))
+            f.write('{"type": "user", "mess')  # a line the host is still writing
+        index.refresh(project, LAYOUT)
+
+        assert [row[0] for row in index.invocations([path])] == ["scan-codebase", "manage-issue"]
+        complete = first_size + len(_line(_skill("manage-issue", "2026-03-01T09:05:00Z")))
+        assert _offset(index, path) == complete
+
+        with path.open("a") as f:
+            f.write('age": {"content": "<command-name>/ll:ready-issue</command-name>"}}\n')
+        index.refresh(project, LAYOUT)
+
+        assert [row[0] for row in index.invocations([path])] == [
+            "scan-codebase",
+            "manage-issue",
+            "ready-issue",
+        ]
+
+    def test_rewritten_file_is_reindexed_from_scratch(
+        self, index: TranscriptIndex, project: Path
+    ) -> None:
+        path = project / "a.jsonl"
+        path.write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+        index.refresh(project, LAYOUT)
+
+        path.write_text(
+            _line(_skill("manage-issue", "2026-03-02T09:00:00Z", sid="s2"))
+            + _line(_skill("ready-issue", "2026-03-02T09:01:00Z", sid="s2"))
+        )
+        index.refresh(project, LAYOUT)
+
+        assert [row[0] for row in index.invocations([path])] == ["manage-issue", "ready-issue"]
+
+    def test_deleted_files_are_pruned(self, index: TranscriptIndex, project: Path) -> None:
+        path = project / "a.jsonl"
+        path.write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+        index.refresh(project, LAYOUT)
+
+        path.unlink()
+
+        assert index.refresh(project, LAYOUT) == []
+        assert index.invocations([path]) == []
+
+    def test_index_persists_across_instances(self, tmp_path: Path, project: Path) -> None:
+        path = project / "a.jsonl"
+        path.write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+        with TranscriptIndex(tmp_path / INDEX_DB_NAME) as first:
+            first.refresh(project, LAYOUT)
+
+        with TranscriptIndex(tmp_path / INDEX_DB_NAME) as second:
+            assert [row[0] for row in second.invocations([path])] == ["scan-codebase"]
+
+
+class TestFailures:
+    def test_result_in_a_later_append_pairs_with_its_call(
+        self, index: TranscriptIndex, project: Path
+    ) -> None:
+        path = project / "a.jsonl"
+        path.write_text(
+            _line(_bash_call("t1", "ll-issues list"))
+            + _line(_bash_call("t2", "ls -la"))
+            + _line(_bash_call("t3", "ll-sprint run x"))
+        )
+        index.refresh(project, LAYOUT)
+
+        with path.open("a") as f:
+            f.write(_line(_bash_result("t1", "Error: no such issue", is_error=True)))
+            f.write(_line(_bash_result("t2", "Traceback (most recent call last):", is_error=True)))
+            f.write(_line(_bash_result("t3", "ok", is_error=False)))
+        index.refresh(project, LAYOUT)
+
+        failures = index.failures([path])
+        assert [(f.tool_name, f.error_text, f.is_error) for f in failures] == [
+            ("ll-issues", "Error: no such issue", True)
+        ]
+
+
+class TestLoopTerminal:
+    def test_terminal_event_is_found_after_the_run_completes(
+        self, index: TranscriptIndex, tmp_path: Path
+    ) -> None:
+        events = tmp_path / "events.jsonl"
+        events.write_text(_line({"event": "state_enter", "state": "a"}))
+
+        assert index.loop_terminal(events) is None
+
+        with events.open("a") as f:
+            f.write(_line({"event": "loop_complete", "final_state": "done", "iterations": 3}))
+            f.write(_line({"event": "loop_complete", "final_state": "later"}))
+
+        assert index.loop_terminal(events) == {
+            "event": "loop_complete",
+            "final_state": "done",
+            "iterations": 3,
+        }
+
+    def test_completed_run_is_not_reread(self, index: TranscriptIndex, tmp_path: Path) -> None:
+        events = tmp_path / "events.jsonl"
+        events.write_text(_line({"event": "loop_complete", "final_state": "done"}))
+        index.loop_terminal(events)
+
+        # Appending to an archived run never changes its first terminal event.
+        with events.open("a") as f:
+            f.write("not json\n")
+
+        assert index.loop_terminal(events) == {"event": "loop_complete", "final_state": "done"}
+
+
+class TestLocation:
+    def test_default_lives_under_home_ll(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("LL_TRANSCRIPT_INDEX")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        with TranscriptIndex.default() as idx:
+            assert idx.db_path == str(tmp_path / ".ll" / INDEX_DB_NAME)
+        assert (tmp_path / ".ll" / INDEX_DB_NAME).exists()
+
+    def test_unopenable_path_degrades_to_memory(self, tmp_path: Path, project: Path) -> None:
+        (project / "a.jsonl").write_text(_line(_skill("scan-codebase", "2026-03-01T09:00:00Z")))
+
+        with TranscriptIndex(tmp_path) as idx:  # a directory, not a database file
+            summaries = idx.refresh(project, LAYOUT)
+            assert [row[0] for row in idx.invocations([s.path for s in summaries])] == [
+                "scan-codebase"
+            ]
@@ -8,6 +8,7 @@ import re
 import shutil
 import socket
 import tempfile
+import threading
 import time
 from collections.abc import Iterator
 from pathlib import Path
@@ -27,6 +28,7 @@ from little_loops.session_store import recent
 from little_loops.transport import (
     JsonlTransport,
     OTelTransport,
+    QueuedTransport,
     Transport,
     UnixSocketTransport,
     WebhookTransport,
@@ -246,6 +248,94 @@ class TestEventBusTransports:
         bus.close_transports()
         assert closed == ["a", "b"]
 
+    def test_async_dispatch_does_not_block_emit(self) -> None:
+        """A slow async transport delivers in order on its own thread."""
+        release = threading.Event()
+        received: list[str] = []
+
+        class SlowTransport:
+            def send(self, event: dict[str, Any]) -> None:
+                release.wait(5)
+                received.append(event["event"])
+
+            def close(self) -> None:
+                pass
+
+        bus = EventBus()
+        bus.add_transport(SlowTransport(), async_dispatch=True)
+
+        start = time.monotonic()
+        for i in range(5):
+            bus.emit({"event": f"e{i}", "ts": "t"})
+        assert time.monotonic() - start < 1.0
+        assert received == []
+
+        release.set()
+        bus.close_transports()
+        assert received == ["e0", "e1", "e2", "e3", "e4"]
+
+    def test_async_dispatch_drops_newest_when_queue_full(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A full queue drops events for that sink only, with a warning."""
+        release = threading.Event()
+        slow: list[str] = []
+        fast: list[str] = []
+
+        class SlowTransport:
+            def send(self, event: dict[str, Any]) -> None:
+                release.wait(5)
+                slow.append(event["event"])
+
+            def close(self) -> None:
+                pass
+
+        class FastTransport:
+            def send(self, event: dict[str, Any]) -> None:
+                fast.append(event["event"])
+
+            def close(self) -> None:
+                pass
+
+        bus = EventBus()
+        bus.add_transport(SlowTransport(), async_dispatch=True, max_queue=2)
+        bus.add_transport(FastTransport())
+
+        with caplog.at_level(logging.WARNING):
+            for i in range(10):
+                bus.emit({"event": f"e{i}", "ts": "t"})
+        (queued,) = [t for t in bus._transports if isinstance(t, QueuedTransport)]
+        release.set()
+        assert queued.flush(5)
+        stats = queued.get_stats()
+        bus.close_transports()
+
+        assert len(fast) == 10
+        assert slow[0] == "e0"
+        assert len(slow) + stats["queue_dropped"] == 10
+        assert stats["queue_dropped"] > 0
+        assert any("QueuedTransport" in record.message for record in caplog.records)
+
+    def test_queued_transport_isolates_send_exceptions(self) -> None:
+        """An exception in the wrapped transport does not kill the delivery thread."""
+        received: list[str] = []
+
+        class FlakyTransport:
+            def send(self, event: dict[str, Any]) -> None:
+                if event["event"] == "bad":
+                    raise RuntimeError("boom")
+                received.append(event["event"])
+
+            def close(self) -> None:
+                pass
+
+        transport = QueuedTransport(FlakyTransport())
+        for name in ("a", "bad", "b"):
+            transport.send({"event": name})
+        transport.close()
+
+        assert received == ["a", "b"]
+
 
 class TestWireTransports:
     """Tests for the wire_transports() registry helper."""
@@ -386,6 +476,18 @@ class TestWireTransports:
             with pytest.raises(RuntimeError, match="AF_UNIX"):
                 wire_transports(bus, config, log_dir=tmp_path)
 
+    def test_async_transports_are_wrapped(self, tmp_path: Path) -> None:
+        """Transports named in async_transports are registered behind a queue."""
+        bus = EventBus()
+        config = EventsConfig(transports=["jsonl", "sqlite"], async_transports=["sqlite"])
+        wire_transports(bus, config, log_dir=tmp_path)
+
+        kinds = [type(t).__name__ for t in bus._transports]
+        assert kinds == ["JsonlTransport", "QueuedTransport"]
+        bus.emit({"event": "state_enter", "loop_name": "wired", "state": "go"})
+        bus.close_transports()
+        assert (tmp_path / "history.db").exists()
+
 
 @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX not available")
 class TestUnixSocketTransport:
@@ -1326,6 +1326,40 @@ class TestLinkSessions:
         assert "entity_overlap" in evidence
         assert len(evidence) == 3
 
+    def test_handoff_links_every_later_session_in_order(self) -> None:
+        """A handoff session links to each later session, in session order."""
+        sessions = {
+            "session-0": [{"content": "Unrelated", "uuid": "msg-0"}],
+            "session-1": [{"content": "/ll:handoff", "uuid": "msg-1"}],
+            "session-2": [{"content": "Next", "uuid": "msg-2"}],
+            "session-3": [{"content": "Later", "uuid": "msg-3"}],
+        }
+        result = _link_sessions(sessions)
+        pairs = [
+            (link.sessions[0]["session_id"], link.sessions[1]["session_id"]) for link in result
+        ]
+        assert pairs == [("session-1", "session-2"), ("session-1", "session-3")]
+        assert [link.link_id for link in result] == ["link-001", "link-002"]
+
+    def test_branch_link_compares_last_branch_to_later_first_branch(self) -> None:
+        """Only a's last branch vs b's first branch counts, and only for a before b."""
+        sessions = {
+            "session-1": [
+                {"content": "Start", "uuid": "msg-1", "git_branch": "main"},
+                {"content": "Switch", "uuid": "msg-2", "git_branch": "feat"},
+            ],
+            "session-2": [
+                {"content": "Resume", "uuid": "msg-3", "git_branch": "feat"},
+                {"content": "Back", "uuid": "msg-4", "git_branch": "main"},
+            ],
+            "session-3": [{"content": "Other", "uuid": "msg-5", "git_branch": "main"}],
+        }
+        result = _link_sessions(sessions)
+        pairs = [
+            (link.sessions[0]["session_id"], link.sessions[1]["session_id"]) for link in result
+        ]
+        assert pairs == [("session-1", "session-2"), ("session-2", "session-3")]
+
 
 class TestClusterByEntities:
     """Tests for _cluster_by_entities internal function."""
@@ -0,0 +1,217 @@
+"""Tests for little_loops.parallel.worktree_pool and worktree_utils.sync_copy_files.
+
+Runs against real ``git`` repositories (see test_worktree_utils.py) so that
+``git worktree move`` / ``checkout -B`` / ``clean`` behavior is exercised, not
+mocked.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from little_loops.parallel.git_lock import GitLock
+from little_loops.parallel.worktree_pool import READY_MARKER, PoolStats, WorktreePool
+from little_loops.worktree_utils import _is_ll_worktree, clone_file, sync_copy_files
+from tests.helpers import copy_git_template
+
+COPY_FILES = [".claude/settings.local.json", ".env", ".ll/ll.local.md"]
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Main repo with one commit, a gitignored worktree base and copy files."""
+    path = copy_git_template(tmp_path / "repo")
+    (path / "README.md").write_text("hello\n")
+    (path / ".gitignore").write_text(".worktrees/\n.env\n.ll/\n.claude/settings.local.json\n")
+    _git(path, "add", "README.md", ".gitignore")
+    _git(path, "commit", "-m", "initial")
+    (path / ".env").write_text("TOKEN=1\n")
+    (path / ".claude").mkdir()
+    (path / ".claude" / "settings.local.json").write_text("{}\n")
+    (path / ".ll").mkdir()
+    (path / ".ll" / "ll.local.md").write_text("local\n")
+    (path / ".worktrees").mkdir()
+    monkeypatch.setenv("LL_HISTORY_DB", str(tmp_path / "history.db"))
+    return path
+
+
+def _pool(repo: Path, size: int = 1) -> WorktreePool:
+    logger = MagicMock()
+    return WorktreePool(repo, Path(".worktrees"), size, COPY_FILES, logger, GitLock(logger))
+
+
+class TestPoolStats:
+    def test_hit_rate(self) -> None:
+        assert PoolStats().hit_rate == 0.0
+        assert PoolStats(hits=3, misses=1).hit_rate == 0.75
+
+
+class TestWarm:
+    def test_warm_creates_ready_detached_worktrees(self, repo: Path) -> None:
+        pool = _pool(repo, size=2)
+
+        assert pool.warm() == 2
+        idle = pool.idle_worktrees()
+        assert len(idle) == 2
+        for path in idle:
+            assert (path / READY_MARKER).exists()
+            assert (path / ".env").read_text() == "TOKEN=1\n"
+            assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "HEAD"
+            assert not _is_ll_worktree(path.name)
+        assert pool.warm() == 0
+
+    def test_disabled_pool_trims_leftovers(self, repo: Path) -> None:
+        _pool(repo, size=1).warm()
+
+        assert _pool(repo, size=0).warm() == 0
+        assert _pool(repo, size=1).idle_worktrees() == []
+
+    def test_abandoned_unready_dir_is_removed(self, repo: Path) -> None:
+        stale = repo / ".worktrees" / "pool-deadbeef"
+        stale.mkdir()
+        (stale / ".ll-session-999999999").write_text("999999999")
+
+        _pool(repo, size=0).warm()
+
+        assert not stale.exists()
+
+    def test_idle_scan_skips_marker_removed_mid_scan(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A marker another worker's claim unlinks during the scan drops that entry."""
+        import little_loops.parallel.worktree_pool as worktree_pool
+
+        pool = _pool(repo, size=2)
+        pool.warm()
+        first, second = pool.idle_worktrees()
+        real = worktree_pool.is_pool_worktree
+
+        def claimed_during_scan(name: str) -> bool:
+            if name == first.name:
+                (first / READY_MARKER).unlink()
+            return real(name)
+
+        monkeypatch.setattr(worktree_pool, "is_pool_worktree", claimed_during_scan)
+
+        assert pool.idle_worktrees() == [second]
+
+
+class TestAcquireRelease:
+    def test_disabled_pool_never_acquires(self, repo: Path) -> None:
+        pool = _pool(repo, size=0)
+
+        assert not pool.acquire(repo / ".worktrees" / "worker-x", "parallel/x", None)
+        assert pool.stats.misses == 0
+
+    def test_empty_pool_is_a_miss(self, repo: Path) -> None:
+        pool = _pool(repo)
+
+        assert not pool.acquire(repo / ".worktrees" / "worker-x", "parallel/x", None)
+        assert pool.stats.misses == 1
+
+    def test_unexpected_error_is_a_miss(self, repo: Path) -> None:
+        pool = _pool(repo)
+        pool.warm()
+        pool._acquire = MagicMock(side_effect=FileNotFoundError("marker gone"))  # type: ignore[method-assign]
+
+        assert not pool.acquire(repo / ".worktrees" / "worker-x", "parallel/x", None)
+        assert pool.stats.misses == 1
+
+    def test_acquire_moves_and_branches_from_main_head(self, repo: Path) -> None:
+        pool = _pool(repo)
+        pool.warm()
+        (repo / "NEW.md").write_text("new\n")
+        _git(repo, "add", "NEW.md")
+        _git(repo, "commit", "-m", "advance main")
+        target = repo / ".worktrees" / "worker-bug-1-20260101-000000"
+
+        assert pool.acquire(target, "parallel/bug-1", None)
+
+        assert pool.stats.hits == 1
+        assert pool.idle_worktrees() == []
+        assert _git(target, "rev-parse", "--abbrev-ref", "HEAD") == "parallel/bug-1"
+        assert _git(target, "rev-parse", "HEAD") == _git(repo, "rev-parse", "HEAD")
+        assert (target / "NEW.md").exists()
+        assert (target / f".ll-session-{os.getpid()}").exists()
+        assert not (target / READY_MARKER).exists()
+
+    def test_existing_branch_is_not_reset(self, repo: Path) -> None:
+        pool = _pool(repo)
+        pool.warm()
+        _git(repo, "branch", "feature/keep")
+
+        assert not pool.acquire(repo / ".worktrees" / "worker-y", "feature/keep", "main")
+        assert len(pool.idle_worktrees()) == 1
+
+    def test_release_then_reacquire_scrubs_previous_issue(self, repo: Path) -> None:
+        pool = _pool(repo)
+        pool.warm()
+        first = repo / ".worktrees" / "worker-bug-1-20260101-000000"
+        assert pool.acquire(first, "parallel/bug-1", None)
+        (first / "scratch.txt").write_text("junk\n")
+        (first / ".ll" / "leftover.db").write_text("x")
+        (first / "README.md").write_text("edited\n")
+        _git(first, "commit", "-am", "work")
+
+        assert pool.release(first)
+        assert not first.exists()
+        assert pool.stats.recycled == 1
+        _git(repo, "branch", "-D", "parallel/bug-1")
+
+        (repo / ".env").write_text("TOKEN=2\n")
+        second = repo / ".worktrees" / "worker-bug-2-20260101-000001"
+        assert pool.acquire(second, "parallel/bug-2", "main")
+
+        assert (second / "README.md").read_text() == "hello\n"
+        assert not (second / "scratch.txt").exists()
+        assert not (second / ".ll" / "leftover.db").exists()
+        assert (second / ".ll" / "ll.local.md").read_text() == "local\n"
+        assert (second / ".env").read_text() == "TOKEN=2\n"
+
+    def test_release_declines_when_pool_full(self, repo: Path) -> None:
+        pool = _pool(repo)
+        pool.warm()
+        other = repo / ".worktrees" / "worker-z"
+        _git(repo, "worktree", "add", "-b", "parallel/z", str(other))
+
+        assert not pool.release(other)
+        assert other.exists()
+
+
+class TestSyncCopyFiles:
+    def test_skips_unchanged_and_mirrors_claude_dir(self, repo: Path, tmp_path: Path) -> None:
+        dest = tmp_path / "wt"
+        dest.mkdir()
+        logger = MagicMock()
+
+        assert sync_copy_files(repo, dest, COPY_FILES, logger) == 3
+        assert sync_copy_files(repo, dest, COPY_FILES, logger) == 0
+
+        (dest / ".claude" / "stale.json").write_text("old")
+        (repo / ".env").write_text("TOKEN=changed\n")
+        assert sync_copy_files(repo, dest, COPY_FILES, logger) == 1
+        assert (dest / ".env").read_text() == "TOKEN=changed\n"
+        assert not (dest / ".claude" / "stale.json").exists()
+
+    def test_clone_file_copies_content_and_mtime(self, tmp_path: Path) -> None:
+        src = tmp_path / "src.txt"
+        src.write_text("payload")
+        os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+        dest = tmp_path / "dest.txt"
+
+        clone_file(src, dest)
+
+        assert dest.read_text() == "payload"
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+        assert dest.stat().st_ino != src.stat().st_ino